@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CodifierConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'codifier'
+
+    def ready(self):
+        from infrastructure.signals import codifier_rollups  # noqa: F401
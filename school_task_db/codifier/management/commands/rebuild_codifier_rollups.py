@@ -0,0 +1,29 @@
+"""Команда пересчёта сводок заданий по элементам кодификаторов"""
+
+from django.core.management.base import BaseCommand
+
+from infrastructure.services.codifier_rollups import rebuild_codifier_rollups
+
+
+class Command(BaseCommand):
+    help = (
+        'Пересчёт числа заданий и покрытия по элементам содержания '
+        'и требованиям всех кодификаторов'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Сколько строк пересчитывать за один запрос',
+        )
+
+    def handle(self, *args, **options):
+        written = rebuild_codifier_rollups(batch_size=options['batch_size'])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'✅ Элементов содержания: {written["entries"]}, '
+                f'требований: {written["requirements"]}'
+            )
+        )
@@ -0,0 +1,103 @@
+# Generated by Django 5.2.3 on 2026-10-19 18:08
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_codifier_rollups(apps, schema_editor):
+    alias = schema_editor.connection.alias
+    ContentEntry = apps.get_model('codifier', 'ContentEntry')
+    Requirement = apps.get_model('codifier', 'Requirement')
+    ContentEntryRollup = apps.get_model('codifier', 'ContentEntryRollup')
+    RequirementRollup = apps.get_model('codifier', 'RequirementRollup')
+    Task = apps.get_model('tasks', 'Task')
+
+    def task_counts(field):
+        return dict(
+            Task.objects.using(alias).order_by().values(field).annotate(
+                total=Count('pk'),
+            ).values_list(field, 'total')
+        )
+
+    topic_counts = task_counts('topic_id')
+    subtopic_counts = task_counts('subtopic_id')
+
+    # Frozen copy of the counting rule: the migration must not follow
+    # later changes to the live rollup service.
+    def entry_task_count(entry):
+        if entry.subtopic_id:
+            return subtopic_counts.get(entry.subtopic_id, 0)
+        if entry.topic_id:
+            return topic_counts.get(entry.topic_id, 0)
+        return 0
+
+    ContentEntryRollup.objects.using(alias).bulk_create(
+        [
+            ContentEntryRollup(
+                entry_id=entry.pk,
+                codifier_id=entry.codifier_id,
+                is_leaf=not entry.child_count,
+                task_count=entry_task_count(entry),
+            )
+            for entry in ContentEntry.objects.using(alias).annotate(
+                child_count=Count('children'),
+            )
+        ],
+        batch_size=200,
+    )
+    RequirementRollup.objects.using(alias).bulk_create(
+        [
+            RequirementRollup(requirement_id=pk, task_count=task_count)
+            for pk, task_count in Requirement.objects.using(alias).annotate(
+                task_count=Count('tasks'),
+            ).values_list('pk', 'task_count')
+        ],
+        batch_size=200,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('codifier', '0003_contententry_tasks'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RequirementRollup',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Создано')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Обновлено')),
+                ('task_count', models.PositiveIntegerField(default=0, verbose_name='Заданий')),
+                ('requirement', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='rollup', to='codifier.requirement', verbose_name='Требование')),
+            ],
+            options={
+                'verbose_name': 'Сводка требования',
+                'verbose_name_plural': 'Сводки требований',
+            },
+        ),
+        migrations.CreateModel(
+            name='ContentEntryRollup',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Создано')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Обновлено')),
+                ('is_leaf', models.BooleanField(default=True, verbose_name='Лист дерева')),
+                ('task_count', models.PositiveIntegerField(default=0, verbose_name='Заданий')),
+                ('codifier', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='content_entry_rollups', to='codifier.codifierspec', verbose_name='Кодификатор')),
+                ('entry', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='rollup', to='codifier.contententry', verbose_name='Элемент содержания')),
+            ],
+            options={
+                'verbose_name': 'Сводка элемента содержания',
+                'verbose_name_plural': 'Сводки элементов содержания',
+                'indexes': [models.Index(fields=['codifier', 'is_leaf'], name='content_rollup_codifier_leaf')],
+            },
+        ),
+        migrations.RunPython(
+            backfill_codifier_rollups,
+            migrations.RunPython.noop,
+        ),
+    ]
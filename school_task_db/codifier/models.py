@@ -142,3 +142,48 @@ class Requirement(BaseModel):
 
     def __str__(self):
         return f'{self.codifier.short_name} Тр.{self.code} {self.name[:60]}'
+
+
+class ContentEntryRollup(BaseModel):
+    """Число заданий и покрытие элемента содержания.
+
+    Строки поддерживаются сигналами при изменении заданий и привязок к
+    curriculum, поэтому страница кодификатора читает готовые числа, а не
+    соединяет элементы с заданиями при каждом просмотре.
+    """
+    entry = models.OneToOneField(
+        ContentEntry, on_delete=models.CASCADE,
+        related_name='rollup',
+        verbose_name='Элемент содержания',
+    )
+    codifier = models.ForeignKey(
+        CodifierSpec, on_delete=models.CASCADE,
+        related_name='content_entry_rollups',
+        verbose_name='Кодификатор',
+    )
+    is_leaf = models.BooleanField('Лист дерева', default=True)
+    task_count = models.PositiveIntegerField('Заданий', default=0)
+
+    class Meta:
+        verbose_name = 'Сводка элемента содержания'
+        verbose_name_plural = 'Сводки элементов содержания'
+        indexes = [
+            models.Index(
+                fields=['codifier', 'is_leaf'],
+                name='content_rollup_codifier_leaf',
+            ),
+        ]
+
+
+class RequirementRollup(BaseModel):
+    """Число заданий, проверяющих требование."""
+    requirement = models.OneToOneField(
+        Requirement, on_delete=models.CASCADE,
+        related_name='rollup',
+        verbose_name='Требование',
+    )
+    task_count = models.PositiveIntegerField('Заданий', default=0)
+
+    class Meta:
+        verbose_name = 'Сводка требования'
+        verbose_name_plural = 'Сводки требований'
@@ -4,7 +4,12 @@ from django.core.management import call_command
 from django.test import TestCase
 from django.urls import reverse
 
-from codifier.models import CodifierSpec, ContentEntry, Requirement
+from codifier.models import (
+    CodifierSpec,
+    ContentEntry,
+    ContentEntryRollup,
+    Requirement,
+)
 from curriculum.models import Topic
 from tasks.models import Task
 
@@ -170,3 +175,22 @@ class BuiltInCodifierImportCommandTests(TestCase):
         self.assertEqual(ContentEntry.objects.count(), 0)
         self.assertIn('Проблемы:', output.getvalue())
         self.assertIn('ОГЭ 2026 1.1 — не найден', output.getvalue())
+
+    def test_rebuild_rollups_command_recounts_imported_codifiers(self):
+        call_command('load_codifier_oge', stdout=StringIO())
+        call_command('load_physics_topics', stdout=StringIO())
+        expected = {
+            'entries': ContentEntry.objects.count(),
+            'requirements': Requirement.objects.count(),
+        }
+        ContentEntryRollup.objects.all().delete()
+        output = StringIO()
+
+        call_command('rebuild_codifier_rollups', stdout=output)
+
+        self.assertEqual(ContentEntryRollup.objects.count(), expected['entries'])
+        self.assertIn(
+            f'Элементов содержания: {expected["entries"]}, '
+            f'требований: {expected["requirements"]}',
+            output.getvalue(),
+        )
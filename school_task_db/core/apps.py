@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        from infrastructure.signals import reference_data  # noqa: F401
+        from infrastructure.signals import search_suggestions  # noqa: F401
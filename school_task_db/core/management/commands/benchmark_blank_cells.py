@@ -0,0 +1,145 @@
+"""Compare per-cell and compact blank-cell grid rendering."""
+
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core_logic.entities.document import Document, DocumentSection
+from core_logic.value_objects.document_recipes import BLANK_CELLS_SECTION
+from core_logic.value_objects.document_render_options import RenderTarget
+from core_logic.value_objects.document_render_requests import DocumentRenderRequest
+from infrastructure.services.blank_cells_payload import (
+    BLANK_CELLS_RENDER_CELLS,
+    BLANK_CELLS_RENDER_COMPACT,
+    build_blank_cells_payload,
+)
+from infrastructure.services.rendered_document_file_store import (
+    RenderedDocumentFileStore,
+)
+from infrastructure.services.sectioned_document_renderer_factory import (
+    build_template_sectioned_text_document_renderer,
+)
+from infrastructure.services.sectioned_document_templates import (
+    WORK_HTML_SECTION_TEMPLATES,
+    WORK_HTML_WRAPPER_TEMPLATE,
+)
+
+BENCHMARK_MODES = (BLANK_CELLS_RENDER_CELLS, BLANK_CELLS_RENDER_COMPACT)
+
+
+class Command(BaseCommand):
+    help = 'Сравнение размера HTML и времени печати сетки клеток'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--area',
+            type=int,
+            default=500,
+            help='Площадь поля для ответа одного задания, см²',
+        )
+        parser.add_argument(
+            '--tasks',
+            type=int,
+            default=20,
+            help='Количество полей в документе',
+        )
+        parser.add_argument(
+            '--pdf',
+            action='store_true',
+            help='Дополнительно замерить печать в PDF через Playwright',
+        )
+        parser.add_argument(
+            '--output-dir',
+            default='',
+            help='Сохранить HTML и PDF в каталог вместо временного',
+        )
+
+    def handle(self, *args, **options):
+        if options['area'] < 1 or options['tasks'] < 1:
+            raise CommandError('--area и --tasks должны быть положительными')
+        pdf_renderer = self._pdf_renderer() if options['pdf'] else None
+
+        if options['output_dir']:
+            output_dir = Path(options['output_dir'])
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._run(output_dir, options, pdf_renderer)
+            return
+        with TemporaryDirectory() as temp_dir:
+            self._run(Path(temp_dir), options, pdf_renderer)
+
+    def _run(self, output_dir, options, pdf_renderer):
+        self.stdout.write(
+            f'📐 Сетка: {options["tasks"]} × {options["area"]} см²'
+        )
+        for mode in BENCHMARK_MODES:
+            html_path, seconds = render_blank_cells_document(
+                output_dir,
+                mode=mode,
+                area_cm2=options['area'],
+                tasks=options['tasks'],
+            )
+            size_kb = html_path.stat().st_size / 1024
+            line = f'  {mode}: HTML {size_kb:.1f} KB за {seconds * 1000:.0f} мс'
+            if pdf_renderer is not None:
+                started = time.perf_counter()
+                try:
+                    pdf_path = pdf_renderer.generate_pdf(
+                        html_path,
+                        output_dir / f'{html_path.stem}.pdf',
+                    )
+                except Exception as exc:
+                    raise CommandError(
+                        f'Печать в PDF не удалась: {exc}',
+                    ) from exc
+                pdf_seconds = time.perf_counter() - started
+                line += (
+                    f', PDF {pdf_path.stat().st_size / 1024:.1f} KB '
+                    f'за {pdf_seconds * 1000:.0f} мс'
+                )
+            self.stdout.write(line)
+
+    @staticmethod
+    def _pdf_renderer():
+        try:
+            from infrastructure.services.html_to_pdf_renderer import (
+                HtmlToPdfRenderer,
+            )
+        except ImportError as exc:
+            raise CommandError(f'Playwright недоступен: {exc}') from exc
+        return HtmlToPdfRenderer(wait_for_mathjax=False)
+
+
+def render_blank_cells_document(output_dir, mode, area_cm2, tasks):
+    """Render a work-styled HTML file with ``tasks`` grids in ``mode``."""
+    filename = f'blank_cells_{mode}.html'
+    renderer = build_template_sectioned_text_document_renderer(
+        renderer_type='html',
+        section_templates=WORK_HTML_SECTION_TEMPLATES,
+        filename_builder=lambda request: filename,
+        file_store=RenderedDocumentFileStore(
+            output_dirs={'html': str(output_dir)},
+        ),
+        wrapper_template_name=WORK_HTML_WRAPPER_TEMPLATE,
+    )
+    payload = build_blank_cells_payload({
+        'area_cm2': area_cm2,
+        'render_mode': mode,
+    })
+    document = Document(
+        title='Сетка клеток',
+        document_type='work',
+        sections=[
+            DocumentSection(section_type=BLANK_CELLS_SECTION, payload=payload)
+            for _ in range(tasks)
+        ],
+    )
+    started = time.perf_counter()
+    renderer.render(
+        DocumentRenderRequest(
+            document=document,
+            render_target=RenderTarget(renderer_type='html'),
+        )
+    )
+    return Path(output_dir) / filename, time.perf_counter() - started
@@ -0,0 +1,71 @@
+"""Compare latest-attempt resolution strategies on seeded revisions."""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from infrastructure.services.latest_attempt_benchmark import (
+    measure_latest_attempt_strategies,
+    seed_attempt_revisions,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Сравнивает выбор последних попыток по флагу is_latest '
+        'и по подзапросу с максимальной ревизией'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--attempts', type=int, default=100_000,
+                            help='Снимков попыток')
+        parser.add_argument('--revisions', type=int, default=5,
+                            help='Ревизий на участие')
+        parser.add_argument('--students', type=int, default=40,
+                            help='Участников в событии')
+        parser.add_argument('--repeat', type=int, default=3)
+        parser.add_argument(
+            '--keep-data',
+            action='store_true',
+            help='Сохранить созданные снимки вместо отката',
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            started = time.perf_counter()
+            try:
+                dataset = seed_attempt_revisions(
+                    options['attempts'],
+                    revisions=options['revisions'],
+                    students_per_event=options['students'],
+                )
+            except ValueError as exc:
+                raise CommandError(str(exc)) from exc
+            self.stdout.write(
+                f'🗂 {dataset.attempts} снимков, '
+                f'{dataset.participations} участий, '
+                f'{len(dataset.participation_ids_by_event)} событий '
+                f'({time.perf_counter() - started:.1f} с)'
+            )
+            try:
+                results = measure_latest_attempt_strategies(
+                    dataset,
+                    repeat=options['repeat'],
+                )
+            except RuntimeError as exc:
+                raise CommandError(str(exc)) from exc
+            for result in results:
+                self.stdout.write(
+                    f'  {result.name}: {result.seconds * 1000:.0f} мс, '
+                    f'{result.queries} запр.'
+                )
+            if not options['keep_data']:
+                transaction.set_rollback(True)
+
+        baseline, *others = results
+        for result in others:
+            ratio = result.seconds / baseline.seconds if baseline.seconds else 0
+            self.stdout.write(self.style.SUCCESS(
+                f'{baseline.name} быстрее {result.name} в {ratio:.1f} раза'
+            ))
@@ -0,0 +1,150 @@
+"""Benchmark report use cases on a synthetic school."""
+
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from infrastructure.container import container
+from infrastructure.services.report_benchmarks import (
+    compare_report_benchmarks,
+    measure_report_case,
+    report_benchmark_cases,
+    reset_report_caches,
+)
+from infrastructure.services.synthetic_school import (
+    SyntheticSchoolSpec,
+    build_synthetic_school,
+)
+
+DEFAULT_OUTPUT = Path('report_benchmark.json')
+
+
+class Command(BaseCommand):
+    help = (
+        'Время, число SQL-запросов и пик памяти отчётов '
+        'на синтетической школе'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--groups', type=int, default=4)
+        parser.add_argument('--students', type=int, default=25,
+                            help='Учеников в классе')
+        parser.add_argument('--weeks', type=int, default=34,
+                            help='Учебных недель, по работе в неделю')
+        parser.add_argument('--topics', type=int, default=12)
+        parser.add_argument('--tasks', type=int, default=8,
+                            help='Заданий в работе')
+        parser.add_argument('--seed', type=int, default=2026)
+        parser.add_argument('--repeat', type=int, default=3,
+                            help='Повторных (тёплых) запусков каждого отчёта')
+        parser.add_argument(
+            '--output',
+            default=str(DEFAULT_OUTPUT),
+            help='JSON-файл с результатами',
+        )
+        parser.add_argument(
+            '--baseline',
+            default='',
+            help='Сравнить с ранее сохранёнными результатами',
+        )
+        parser.add_argument(
+            '--tolerance',
+            type=float,
+            default=0.5,
+            help='Допустимый рост времени и памяти относительно baseline',
+        )
+        parser.add_argument(
+            '--keep-data',
+            action='store_true',
+            help='Сохранить синтетические данные вместо отката',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            spec = SyntheticSchoolSpec(
+                groups=options['groups'],
+                students_per_group=options['students'],
+                weeks=options['weeks'],
+                topics=options['topics'],
+                tasks_per_work=options['tasks'],
+                seed=options['seed'],
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+        baseline = self._read_baseline(options['baseline'])
+
+        with transaction.atomic():
+            try:
+                school = build_synthetic_school(spec)
+            except ValueError as exc:
+                raise CommandError(str(exc)) from exc
+            self.stdout.write('🏫 ' + ', '.join(
+                f'{name}={count}' for name, count in school.counts.items()
+            ))
+            results = {}
+            for case in report_benchmark_cases(container, school):
+                result = measure_report_case(
+                    case,
+                    repeat=options['repeat'],
+                    reset=lambda: reset_report_caches(school.event_ids),
+                )
+                results[case.name] = result.to_mapping()
+                self.stdout.write(
+                    f'  {case.name}: '
+                    f'{result.cold_seconds * 1000:.0f} мс / '
+                    f'{result.queries} запр. холодный, '
+                    f'{result.warm_seconds * 1000:.0f} мс / '
+                    f'{result.warm_queries} запр. тёплый, '
+                    f'пик {result.peak_memory_kib:.0f} KiB'
+                )
+            if not options['keep_data']:
+                transaction.set_rollback(True)
+
+        output = Path(options['output'])
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(
+            json.dumps(
+                {
+                    'created_at': timezone.now().isoformat(),
+                    'spec': spec.to_mapping(),
+                    'dataset': school.counts,
+                    'results': results,
+                },
+                ensure_ascii=False,
+                indent=2,
+            ),
+            encoding='utf-8',
+        )
+        self.stdout.write(f'💾 Результаты: {output}')
+
+        if baseline is not None:
+            self._compare(spec, results, baseline, options['tolerance'])
+
+    @staticmethod
+    def _read_baseline(path):
+        if not path:
+            return None
+        try:
+            return json.loads(Path(path).read_text(encoding='utf-8'))
+        except (OSError, json.JSONDecodeError) as exc:
+            raise CommandError(f'Не удалось прочитать baseline: {exc}') from exc
+
+    def _compare(self, spec, results, baseline, tolerance):
+        if baseline.get('spec') != spec.to_mapping():
+            self.stdout.write(self.style.WARNING(
+                'Параметры baseline отличаются: число запросов несравнимо.'
+            ))
+        regressions = compare_report_benchmarks(
+            results,
+            baseline.get('results', {}),
+            tolerance=tolerance,
+        )
+        if regressions:
+            raise CommandError(
+                'Регрессии относительно baseline:\n  '
+                + '\n  '.join(regressions)
+            )
+        self.stdout.write(self.style.SUCCESS('Регрессий нет.'))
@@ -0,0 +1,107 @@
+"""Generate a seeded synthetic school for load testing."""
+
+import json
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from infrastructure.services.synthetic_school import (
+    SYNTHETIC_SCHOOL_PRESETS,
+    SyntheticSchoolBuilder,
+    synthetic_school_spec,
+)
+
+VOLUME_OPTIONS = (
+    ('groups', 'Классов'),
+    ('students_per_group', 'Учеников в классе'),
+    ('weeks', 'Учебных недель, по работе в неделю у каждого класса'),
+    ('topics', 'Тем'),
+    ('tasks', 'Заданий в банке (0 — по 6 на тему)'),
+    ('analog_groups', 'Групп аналогов (0 — по одной на тему)'),
+    ('works', 'Работ (0 — по одной на неделю)'),
+    ('variants_per_work', 'Вариантов в работе'),
+    ('tasks_per_work', 'Заданий в работе'),
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Создаёт синтетическую школу (банк заданий, работы, классы, '
+        'проверенные попытки) и при необходимости JSON-файл для импорта'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--preset',
+            choices=sorted(SYNTHETIC_SCHOOL_PRESETS),
+            default='small',
+            help='Базовый набор объёмов; отдельные параметры переопределяют его',
+        )
+        for name, help_text in VOLUME_OPTIONS:
+            parser.add_argument(
+                f'--{name.replace("_", "-")}',
+                dest=name,
+                type=int,
+                help=help_text,
+            )
+        parser.add_argument('--image-rate', dest='image_rate', type=float,
+                            help='Доля заданий с рисунком')
+        parser.add_argument('--absence-rate', dest='absence_rate',
+                            type=float, help='Доля пропусков')
+        parser.add_argument('--seed', type=int)
+        parser.add_argument(
+            '--transfer-file',
+            default='',
+            help='Записать банк заданий в формате import_tasks',
+        )
+        parser.add_argument(
+            '--transfer-only',
+            action='store_true',
+            help='Только записать JSON-файл, не изменяя базу данных',
+        )
+
+    def handle(self, *args, **options):
+        if options['transfer_only'] and not options['transfer_file']:
+            raise CommandError('--transfer-only требует --transfer-file')
+        try:
+            spec = synthetic_school_spec(
+                options['preset'],
+                seed=options['seed'],
+                image_rate=options['image_rate'],
+                absence_rate=options['absence_rate'],
+                **{name: options[name] for name, _ in VOLUME_OPTIONS},
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+        builder = SyntheticSchoolBuilder(spec)
+
+        if options['transfer_file']:
+            started = time.perf_counter()
+            payload = builder.transfer_payload()
+            output = Path(options['transfer_file'])
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_text(
+                json.dumps(payload, ensure_ascii=False),
+                encoding='utf-8',
+            )
+            self.stdout.write(
+                f'💾 {output}: {len(payload["tasks"])} заданий, '
+                f'{len(payload["task_images"])} рисунков '
+                f'({time.perf_counter() - started:.1f} с)'
+            )
+        if options['transfer_only']:
+            return
+
+        started = time.perf_counter()
+        try:
+            school = builder.build()
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+        self.stdout.write('🏫 ' + ', '.join(
+            f'{name}={count}' for name, count in school.counts.items()
+        ))
+        self.stdout.write(self.style.SUCCESS(
+            f'Учебный год {school.year.name} создан за '
+            f'{time.perf_counter() - started:.1f} с'
+        ))
@@ -1,7 +1,16 @@
+import random
+
+from django.core.exceptions import MiddlewareNotUsed
+
 from core_logic.use_cases.resolve_academic_year import (
     ResolveAcademicYearRequest,
 )
 from infrastructure.container import container
+from infrastructure.services.request_profiling import (
+    instrument_template_rendering,
+    profile_request,
+    request_profiling_settings,
+)
 
 
 class AcademicYearMiddleware:
@@ -24,3 +33,38 @@ class AcademicYearMiddleware:
         else:
             request.session.pop('academic_year_id', None)
         return self.get_response(request)
+
+
+class RequestProfilingMiddleware:
+    """Профилирует выборку запросов, если включено REQUEST_PROFILING.
+
+    Время запроса, SQL, шаблонов и этапов document engine видно на
+    странице core:request-profiles.
+    """
+
+    def __init__(self, get_response):
+        self.options = request_profiling_settings()
+        if not self.options['ENABLED']:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.store = container.request_profile_store
+        self.store.resize(self.options['BUFFER_SIZE'])
+        instrument_template_rendering()
+
+    def __call__(self, request):
+        if not self._sampled(request):
+            return self.get_response(request)
+        with profile_request(
+            request.method,
+            request.path,
+            store=self.store,
+            options=self.options,
+        ) as profile:
+            response = self.get_response(request)
+            profile.status_code = response.status_code
+        return response
+
+    def _sampled(self, request):
+        if request.path.startswith(tuple(self.options['EXCLUDE_PREFIXES'])):
+            return False
+        return random.random() < self.options['SAMPLE_RATE']
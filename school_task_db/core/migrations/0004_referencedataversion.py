@@ -0,0 +1,28 @@
+from django.db import migrations, models
+
+
+def create_version_row(apps, schema_editor):
+    ReferenceDataVersion = apps.get_model('core', 'ReferenceDataVersion')
+    ReferenceDataVersion.objects.get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_academicyear_unique_active_academic_year'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReferenceDataVersion',
+            fields=[
+                ('id', models.PositiveSmallIntegerField(default=1, editable=False, primary_key=True, serialize=False)),
+                ('version', models.PositiveBigIntegerField(default=0, verbose_name='Версия')),
+            ],
+            options={
+                'verbose_name': 'Версия справочных данных',
+                'verbose_name_plural': 'Версии справочных данных',
+            },
+        ),
+        migrations.RunPython(create_version_row, migrations.RunPython.noop),
+    ]
@@ -67,6 +67,27 @@ class AcademicYear(BaseModel):
     def __str__(self):
         return self.name
 
+class ReferenceDataVersion(models.Model):
+    """Singleton — счётчик изменений справочных данных.
+
+    Процессы сверяют с ним свой кэш справочников, поэтому запись
+    справочника в любом процессе видна всем после коммита.
+    """
+
+    SINGLETON_ID = 1
+
+    id = models.PositiveSmallIntegerField(
+        primary_key=True, default=SINGLETON_ID, editable=False,
+    )
+    version = models.PositiveBigIntegerField('Версия', default=0)
+
+    class Meta:
+        verbose_name = 'Версия справочных данных'
+        verbose_name_plural = 'Версии справочных данных'
+
+    def __str__(self):
+        return f'Справочные данные v{self.version}'
+
 class ImportLog(BaseModel):
     """Лог операции импорта заданий"""
     
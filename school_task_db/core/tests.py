@@ -30,10 +30,143 @@ from core.management.commands.html_to_pdf import (
 
 
 class CoreViewsTests(TestCase):
+    def setUp(self):
+        artifact_dir = TemporaryDirectory()
+        self.addCleanup(artifact_dir.cleanup)
+        artifact_settings = self.settings(
+            TASK_IMPORT_ARTIFACT_DIR=artifact_dir.name,
+        )
+        artifact_settings.enable()
+        self.addCleanup(artifact_settings.disable)
+
     def test_html_to_pdf_command_rejects_missing_path(self):
         with self.assertRaises(CommandError):
             call_command('html_to_pdf', 'missing.html')
 
+    def test_blank_cells_benchmark_compares_html_size_of_render_modes(self):
+        with TemporaryDirectory() as temp_dir:
+            output = StringIO()
+
+            call_command(
+                'benchmark_blank_cells',
+                area=500,
+                tasks=2,
+                output_dir=temp_dir,
+                stdout=output,
+            )
+
+            cells_html = Path(temp_dir, 'blank_cells_cells.html').read_text(
+                encoding='utf-8',
+            )
+            compact_html = Path(
+                temp_dir,
+                'blank_cells_compact.html',
+            ).read_text(encoding='utf-8')
+        self.assertIn('cells: HTML', output.getvalue())
+        self.assertIn('compact: HTML', output.getvalue())
+        self.assertEqual(cells_html.count('<span></span>'), 2 * 2035)
+        self.assertNotIn('<span></span>', compact_html)
+        self.assertIn('--grid-rows: 55', compact_html)
+        self.assertLess(len(compact_html) * 5, len(cells_html))
+
+    def test_report_benchmark_writes_results_and_compares_baseline(self):
+        options = {'groups': 1, 'students': 3, 'weeks': 2, 'repeat': 1}
+        with TemporaryDirectory() as temp_dir:
+            results_path = Path(temp_dir, 'results.json')
+            call_command(
+                'benchmark_reports',
+                output=str(results_path),
+                stdout=StringIO(),
+                **options,
+            )
+            results = json.loads(results_path.read_text(encoding='utf-8'))
+            results['results']['journal']['queries'] -= 1
+            baseline_path = Path(temp_dir, 'baseline.json')
+            baseline_path.write_text(json.dumps(results), encoding='utf-8')
+
+            with self.assertRaisesMessage(CommandError, 'journal.queries'):
+                call_command(
+                    'benchmark_reports',
+                    output=str(Path(temp_dir, 'current.json')),
+                    baseline=str(baseline_path),
+                    stdout=StringIO(),
+                    **options,
+                )
+
+        self.assertEqual(results['spec']['students_per_group'], 3)
+        self.assertIn('student_digests', results['results'])
+        self.assertEqual(results['dataset']['event'], 2)
+        # Synthetic rows are rolled back after measuring.
+        self.assertFalse(
+            AcademicYear.objects.filter(name__startswith='synthetic-').exists()
+        )
+
+    def test_latest_attempt_benchmark_compares_strategies_and_rolls_back(self):
+        output = StringIO()
+
+        call_command(
+            'benchmark_latest_attempts',
+            attempts=20,
+            revisions=4,
+            repeat=1,
+            stdout=output,
+        )
+
+        self.assertIn('20 снимков, 5 участий', output.getvalue())
+        self.assertIn('revision_subquery', output.getvalue())
+        self.assertFalse(Event.objects.exists())
+        with self.assertRaisesMessage(CommandError, 'положительными'):
+            call_command('benchmark_latest_attempts', attempts=0)
+
+    def test_synthetic_dataset_transfer_file_imports_as_task_bank(self):
+        with TemporaryDirectory() as temp_dir:
+            transfer_path = Path(temp_dir, 'synthetic.json')
+            output = StringIO()
+
+            call_command(
+                'generate_synthetic_dataset',
+                topics=2,
+                tasks=5,
+                tasks_per_work=2,
+                transfer_file=str(transfer_path),
+                transfer_only=True,
+                stdout=output,
+            )
+            self.assertFalse(Task.objects.exists())
+            call_command(
+                'import_tasks',
+                str(transfer_path),
+                create_topics=True,
+                create_groups=True,
+                stdout=StringIO(),
+            )
+
+        self.assertIn('5 заданий', output.getvalue())
+        self.assertEqual(Task.objects.count(), 5)
+        self.assertEqual(TaskGroup.objects.count(), 5)
+
+    def test_synthetic_dataset_command_builds_school(self):
+        output = StringIO()
+
+        call_command(
+            'generate_synthetic_dataset',
+            groups=1,
+            students_per_group=2,
+            weeks=2,
+            topics=2,
+            tasks_per_work=2,
+            seed=7,
+            stdout=output,
+        )
+
+        self.assertTrue(AcademicYear.objects.filter(name='synthetic-7').exists())
+        self.assertEqual(Event.objects.count(), 2)
+        self.assertIn('eventparticipation=4', output.getvalue())
+        with self.assertRaisesMessage(CommandError, 'уже существует'):
+            call_command('generate_synthetic_dataset', seed=7, stdout=StringIO())
+        with self.assertRaisesMessage(CommandError, '--transfer-file'):
+            call_command('generate_synthetic_dataset', transfer_only=True)
+
     def test_html_to_pdf_helpers_build_valid_file_pairs(self):
         with TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -305,6 +438,45 @@ class CoreViewsTests(TestCase):
         self.assertTrue(Task.objects.filter(text='Задача на силу').exists())
         self.assertTrue(ImportLog.objects.filter(pk=payload['log_id']).exists())
 
+    def test_execute_import_reuses_validation_of_previewed_file(self):
+        topic_id = '660e8400-e29b-41d4-a716-446655440001'
+        content = json.dumps({
+            'topics': [{
+                'id': topic_id,
+                'name': 'Динамика',
+                'subject': 'Физика',
+                'grade_level': 9,
+            }],
+            'tasks': [{
+                'id': '550e8400-e29b-41d4-a716-446655440001',
+                'text': 'Задача на силу',
+                'answer': 'Ответ',
+                'task_type': 'computational',
+                'difficulty': 2,
+                'topic': {'id': topic_id},
+            }],
+        }).encode('utf-8')
+        self.client.post(
+            reverse('core:import-validate'),
+            {'json_file': SimpleUploadedFile('tasks.json', content)},
+        )
+
+        with patch(
+            'core_logic.use_cases.execute_task_import.'
+            'ValidateTaskImportJsonUseCase.execute',
+        ) as validate, patch(
+            'core_logic.use_cases.prepare_task_import_file.'
+            'PrepareTaskImportFileUseCase.execute',
+        ) as parse:
+            response = self.client.post(
+                reverse('core:import-execute'),
+                {'json_file': SimpleUploadedFile('tasks.json', content)},
+            )
+
+        self.assertEqual(response.json()['status'], 'success')
+        validate.assert_not_called()
+        parse.assert_not_called()
+        self.assertTrue(Task.objects.filter(text='Задача на силу').exists())
 
     def test_import_tasks_command_uses_clean_import_service(self):
         topic_id = '660e8400-e29b-41d4-a716-446655440001'
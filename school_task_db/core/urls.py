@@ -9,6 +9,8 @@ app_name = 'core'
 urlpatterns = [
     path('', views.IndexView.as_view(), name='index'),
     path('search/', views.global_search, name='search'), 
+    path('search/suggest/', views.search_suggestions, name='search-suggestions'),
+    path('profiling/', views.request_profiles, name='request-profiles'),
     
     # Импорт
     path('import/', views_import.ImportPageView.as_view(), name='import'),
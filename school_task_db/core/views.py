@@ -1,6 +1,11 @@
-from django.shortcuts import render
+from django.http import JsonResponse
+from django.shortcuts import redirect, render
 from django.views.generic import TemplateView
 from infrastructure.container import container
+from infrastructure.services.request_profiling import (
+    request_profiling_settings,
+    summarize_request_profiles,
+)
 
 
 class IndexView(TemplateView):
@@ -25,3 +30,35 @@ def global_search(request):
         'core/search_results.html',
         container.core_form_adapter.global_search_context(search_data),
     )
+
+
+def search_suggestions(request):
+    """Подсказки поиска по названиям для ввода в строке поиска"""
+    suggestions_data = container.get_search_suggestions_use_case().execute(
+        container.core_form_adapter.search_suggestions_request_from_query(
+            request.GET,
+        ),
+    )
+    return JsonResponse(
+        container.core_form_adapter.search_suggestions_response_data(
+            suggestions_data,
+        ),
+    )
+
+
+def request_profiles(request):
+    """Последние профили запросов из кольцевого буфера"""
+    store = container.request_profile_store
+    if request.method == 'POST':
+        store.clear()
+        return redirect('core:request-profiles')
+    profiles = store.recent()
+    return render(
+        request,
+        'core/request_profiles.html',
+        {
+            'profiling': request_profiling_settings(),
+            'profiles': profiles,
+            'summaries': summarize_request_profiles(profiles),
+        },
+    )
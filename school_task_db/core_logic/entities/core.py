@@ -168,6 +168,21 @@ class GlobalSearchData:
     search_mode: Optional[str] = None
     found_text: str = ''
 
+
+@dataclass(frozen=True)
+class SearchSuggestion:
+    kind: str
+    pk: str
+    title: str
+    subtitle: str = ''
+
+
+@dataclass(frozen=True)
+class SearchSuggestionsData:
+    query: str = ''
+    suggestions: tuple[SearchSuggestion, ...] = field(default_factory=tuple)
+
+
 @dataclass(frozen=True)
 class ImportPageData:
     recent_imports: List[ImportLogItem] = field(default_factory=list)
@@ -12,6 +12,7 @@ from core_logic.entities.report_refs import (
     ReportTaskRef,
     ReportWorkRef,
 )
+from core_logic.value_objects.score_matrix import ScoreMatrix
 
 
 @dataclass(frozen=True)
@@ -31,9 +32,16 @@ class HeatmapScoreFact:
 
 @dataclass(frozen=True)
 class HeatmapMatrixSource:
+    """Matrix input; ``matrix`` rows/columns follow ``students``/``columns``.
+
+    Adapters that can code facts by position pass a prebuilt ``matrix``;
+    otherwise the service aggregates ``scores`` itself.
+    """
+
     students: tuple[ReportStudentRef, ...]
     columns: tuple[ReportHeatmapColumnRef, ...]
-    scores: tuple[HeatmapScoreFact, ...]
+    scores: tuple[HeatmapScoreFact, ...] = ()
+    matrix: Optional[ScoreMatrix] = None
 
 
 @dataclass(frozen=True)
@@ -166,6 +166,27 @@ class ReviewScoreCalculation:
     percentage: float
 
 
+@dataclass(frozen=True)
+class ReviewGradingRules:
+    """Scale and task maximums the review page scores against locally."""
+
+    score_thresholds: tuple[tuple[float, int], ...]
+    fallback_score: int
+    task_max_points: tuple[tuple[str, int], ...] = ()
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            'score_thresholds',
+            tuple(self.score_thresholds),
+        )
+        object.__setattr__(
+            self,
+            'task_max_points',
+            tuple(self.task_max_points),
+        )
+
+
 @dataclass(frozen=True)
 class NormalizedReviewTaskScores:
     task_scores: tuple[ReviewTaskScoreValue, ...]
@@ -221,13 +242,121 @@ class ReviewSaveNavigation:
     event_id: str
     next_participation: Optional[ReviewParticipationRef] = None
     all_checked: bool = False
+    next_participation_id: str = ''
+
+    def __post_init__(self):
+        if not self.next_participation_id and self.next_participation:
+            object.__setattr__(
+                self,
+                'next_participation_id',
+                str(self.next_participation.pk),
+            )
+
+
+@dataclass(frozen=True)
+class ReviewQueueEntry:
+    participation_id: str
+    graded: bool = False
+
+
+@dataclass(frozen=True)
+class ReviewQueue:
+    """Ordered non-absent participations of an event with graded flags."""
+
+    event_id: str
+    entries: tuple[ReviewQueueEntry, ...] = ()
+
+    def __post_init__(self):
+        object.__setattr__(self, 'event_id', str(self.event_id))
+        object.__setattr__(self, 'entries', tuple(self.entries))
+
+    def index_of(self, participation_id: str) -> int:
+        participation_id = str(participation_id)
+        return next(
+            (
+                index
+                for index, entry in enumerate(self.entries)
+                if entry.participation_id == participation_id
+            ),
+            -1,
+        )
+
+    def with_graded(self, participation_id: str, graded: bool = True):
+        participation_id = str(participation_id)
+        return ReviewQueue(
+            event_id=self.event_id,
+            entries=tuple(
+                ReviewQueueEntry(participation_id, bool(graded))
+                if entry.participation_id == participation_id
+                else entry
+                for entry in self.entries
+            ),
+        )
+
+    def save_navigation(self, participation_id: str) -> ReviewSaveNavigation:
+        """Next ungraded work after the current one, else the next in order."""
+        current_index = self.index_of(participation_id)
+        following = self.entries[current_index + 1:]
+        next_entry = next(
+            (entry for entry in following if not entry.graded),
+            None,
+        )
+        if next_entry is None and following:
+            next_entry = following[0]
+        return ReviewSaveNavigation(
+            event_id=self.event_id,
+            all_checked=next_entry is None,
+            next_participation_id=(
+                next_entry.participation_id if next_entry else ''
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class ReviewDraftTaskScore:
+    """Autosaved task fields; None means the field was never autosaved.
+
+    ``points_cleared`` marks points the teacher erased, which must reload
+    as an empty field rather than fall back to the saved points.
+    """
+
+    score_key: str
+    points: Optional[int] = None
+    comment: Optional[str] = None
+    points_cleared: bool = False
+
+    def __post_init__(self):
+        object.__setattr__(self, 'score_key', str(self.score_key).strip())
+        if not self.score_key:
+            raise ValueError('score_key is required')
+
+
+@dataclass(frozen=True)
+class ReviewDraft:
+    participation_id: str
+    task_scores: tuple[ReviewDraftTaskScore, ...] = ()
+    updated_at: Optional[datetime] = None
+
+    def __post_init__(self):
+        object.__setattr__(self, 'task_scores', tuple(self.task_scores))
+
+    def task_score(self, score_key: str) -> Optional[ReviewDraftTaskScore]:
+        return next(
+            (
+                score
+                for score in self.task_scores
+                if score.score_key == str(score_key)
+            ),
+            None,
+        )
 
 
 @dataclass(frozen=True)
 class ReviewTaskScoreRow:
     task: ReviewTaskRef
     number: int
-    points: int
+    # None only for points erased in an autosaved draft.
+    points: Optional[int]
     max_points: int
     variant_task_id: str = ''
     comment: str = ''
@@ -347,6 +476,8 @@ class ParticipationReviewData:
     current_position: int
     total_positions: int
     navigation_progress: float
+    grading_rules: Optional[ReviewGradingRules] = None
+    draft: Optional[ReviewDraft] = None
 
     def __post_init__(self):
         object.__setattr__(
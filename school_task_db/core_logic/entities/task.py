@@ -4,6 +4,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
+from core_logic.value_objects.task_fingerprint import DUPLICATE_TASK_THRESHOLD
 from core_logic.value_objects.task_print_settings import (
     TASK_BANK_ROLE_CONTROL,
     TASK_BANK_ROLE_LABELS,
@@ -332,9 +333,11 @@ class AddTasksToGroupTask:
 class TaskDetailData:
     task: Optional["TaskDetailTask"] = None
     task_groups: tuple["TaskDetailGroup", ...] = field(default_factory=tuple)
+    similar_tasks: tuple["SimilarTask", ...] = field(default_factory=tuple)
 
     def __post_init__(self):
         object.__setattr__(self, 'task_groups', tuple(self.task_groups))
+        object.__setattr__(self, 'similar_tasks', tuple(self.similar_tasks))
 
 
 @dataclass(frozen=True)
@@ -401,6 +404,23 @@ class TaskDetailGroup:
     name: str
 
 
+@dataclass(frozen=True)
+class SimilarTask:
+    pk: str
+    short_uuid: str
+    text: str
+    similarity: float
+    topic: str = ''
+
+    @property
+    def similarity_percent(self) -> int:
+        return round(self.similarity * 100)
+
+    @property
+    def is_likely_duplicate(self) -> bool:
+        return self.similarity >= DUPLICATE_TASK_THRESHOLD
+
+
 @dataclass(frozen=True)
 class TaskSaveParams:
     text: str
@@ -3,6 +3,9 @@
 from dataclasses import dataclass, field
 from typing import Any, Dict, Mapping, Optional, Sequence
 
+from core_logic.entities.core import ImportJsonValidationData
+from core_logic.entities.task import SimilarTask
+
 
 @dataclass(frozen=True)
 class TaskImportRequest:
@@ -12,6 +15,7 @@ class TaskImportRequest:
     mode: str = 'update'
     dry_run: bool = False
     create_missing: bool = True
+    validation: Optional[ImportJsonValidationData] = None
 
 
 @dataclass(frozen=True)
@@ -32,12 +36,22 @@ class TaskImportFileResult:
     file_size: int = 0
     data: Dict[str, Any] = field(default_factory=dict)
     error: str = ''
+    content_hash: str = ''
 
     @property
     def success(self) -> bool:
         return not self.error
 
 
+@dataclass(frozen=True)
+class TaskImportArtifact:
+    """Parsed and validated upload kept between preview and execution."""
+
+    content_hash: str
+    data: Dict[str, Any]
+    validation: ImportJsonValidationData
+
+
 @dataclass(frozen=True)
 class TaskImportExecutionSubmissionRequest:
     filename: str
@@ -224,6 +238,7 @@ class TaskImportPreviewLookup:
     classifications: tuple[TaskImportClassificationKey, ...] = field(
         default_factory=tuple,
     )
+    task_texts: tuple[tuple[str, str], ...] = field(default_factory=tuple)
 
     def __post_init__(self):
         for field_name in (
@@ -232,6 +247,7 @@ class TaskImportPreviewLookup:
             'topic_ids',
             'subtopic_ids',
             'classifications',
+            'task_texts',
         ):
             object.__setattr__(self, field_name, tuple(getattr(self, field_name)))
 
@@ -245,6 +261,9 @@ class TaskImportPreviewFacts:
     existing_classifications: frozenset[TaskImportClassificationKey] = field(
         default_factory=frozenset,
     )
+    similar_tasks: Mapping[str, tuple[SimilarTask, ...]] = field(
+        default_factory=dict,
+    )
 
     def __post_init__(self):
         for field_name in (
@@ -263,3 +282,11 @@ class TaskImportPreviewFacts:
             'subtopic_topic_ids',
             dict(self.subtopic_topic_ids),
         )
+        object.__setattr__(
+            self,
+            'similar_tasks',
+            {
+                key: tuple(similar)
+                for key, similar in self.similar_tasks.items()
+            },
+        )
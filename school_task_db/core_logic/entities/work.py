@@ -267,6 +267,7 @@ class WorkFormData:
     analog_group_options: tuple[WorkAnalogGroupOption, ...] = field(
         default_factory=tuple,
     )
+    work: Optional["WorkDetailWork"] = None
 
     def __post_init__(self):
         object.__setattr__(
@@ -10,3 +10,10 @@ class IAttemptSnapshotRepository(ABC):
     def capture_mark(self, mark_id: str) -> AttemptSnapshotRef:
         """Capture the current checked mark as a new immutable revision."""
 
+
+    @abstractmethod
+    def capture_event_marks(
+        self,
+        event_id: str,
+    ) -> tuple[AttemptSnapshotRef, ...]:
+        """Capture every checked mark of an event not yet captured as is."""
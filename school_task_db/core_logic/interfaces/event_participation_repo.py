@@ -17,7 +17,10 @@ class IEventParticipationRepository(ABC):
         event_id: str,
         assignments: Mapping[str, str],
     ) -> int:
-        """Assign variants and return the number changed."""
+        """Assign variants of the event's work; return the number assigned.
+
+        Variants that do not belong to the event's work are ignored.
+        """
 
     @abstractmethod
     def assign_variant(
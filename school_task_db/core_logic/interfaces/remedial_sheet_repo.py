@@ -1,7 +1,7 @@
 """Repository interface for remedial sheet document sources."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterable, Optional
 
 from core_logic.entities.work import RemedialSheetSource
 
@@ -24,3 +24,10 @@ class IRemedialSheetRepository(ABC):
         variant_id: str,
     ) -> Optional[RemedialSheetSource]:
         """Return normalized remedial facts, if the variant exists."""
+
+    @abstractmethod
+    def get_remedial_sheet_sources(
+        self,
+        variant_ids: Iterable[str],
+    ) -> dict[str, RemedialSheetSource]:
+        """Return sources of existing variants keyed by variant ID."""
@@ -0,0 +1,27 @@
+"""Persistence port for autosaved review drafts."""
+
+from abc import ABC, abstractmethod
+from typing import Optional, Sequence
+
+from core_logic.entities.review import ReviewDraft, ReviewDraftTaskScore
+
+
+class IReviewDraftRepository(ABC):
+    @abstractmethod
+    def get_draft(self, participation_id: str) -> Optional[ReviewDraft]:
+        """Return the autosaved draft of a participation, if any."""
+
+    @abstractmethod
+    def merge_draft(
+        self,
+        participation_id: str,
+        task_scores: Sequence[ReviewDraftTaskScore],
+    ) -> Optional[ReviewDraft]:
+        """Merge changed task fields into the draft and return it.
+
+        Return None when the participation does not exist.
+        """
+
+    @abstractmethod
+    def delete_draft(self, participation_id: str) -> None:
+        """Drop the draft once the work is saved."""
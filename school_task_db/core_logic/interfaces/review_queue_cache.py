@@ -0,0 +1,20 @@
+"""Port for the cached review queue of an event."""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from core_logic.entities.review import ReviewQueue
+
+
+class IReviewQueueCache(ABC):
+    @abstractmethod
+    def get(self, event_id: str) -> Optional[ReviewQueue]:
+        """Return the cached queue of an event, or None."""
+
+    @abstractmethod
+    def set(self, queue: ReviewQueue) -> None:
+        """Store the queue for the rest of the review session."""
+
+    @abstractmethod
+    def invalidate(self, *event_ids: str) -> None:
+        """Drop queues whose participant list changed."""
@@ -9,6 +9,7 @@ from core_logic.entities.review import (
     ReviewMarkRef,
     ReviewParticipationAbsenceContext,
     ReviewParticipationRef,
+    ReviewQueue,
     ReviewSaveNavigation,
 )
 
@@ -59,3 +60,7 @@ class IReviewWorkflowRepository(ABC):
     @abstractmethod
     def get_save_navigation(self, participation_id: str) -> ReviewSaveNavigation:
         """Return where the review screen should go after save-and-next."""
+
+    @abstractmethod
+    def get_review_queue(self, event_id: str) -> ReviewQueue:
+        """Return ordered non-absent participation ids with graded flags."""
@@ -0,0 +1,16 @@
+"""Read port for search-as-you-type suggestions."""
+
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+from core_logic.entities.core import SearchSuggestion
+
+
+class ISearchSuggestionIndex(ABC):
+    @abstractmethod
+    def suggest(
+        self,
+        prefixes: Sequence[str],
+        limit: int,
+    ) -> tuple[SearchSuggestion, ...]:
+        """Return entities with a title word starting with every prefix."""
@@ -0,0 +1,10 @@
+"""Port for timing stages of long-running pipelines."""
+
+from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
+
+
+class IStageTimer(ABC):
+    @abstractmethod
+    def measure(self, stage: str) -> AbstractContextManager:
+        """Return a context manager that times its block as ``stage``."""
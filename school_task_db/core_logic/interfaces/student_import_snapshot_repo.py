@@ -1,11 +1,22 @@
 """Read-only port for planning a student import."""
 
 from abc import ABC, abstractmethod
+from typing import Sequence
 
-from core_logic.entities.student_import import StudentImportSnapshot
+from core_logic.entities.student_import import (
+    StudentImportRow,
+    StudentImportSnapshot,
+)
 
 
 class IStudentImportSnapshotRepository(ABC):
     @abstractmethod
-    def get_student_import_snapshot(self) -> StudentImportSnapshot:
-        """Return current years, groups, students and memberships."""
+    def get_student_import_snapshot(
+        self,
+        rows: Sequence[StudentImportRow],
+    ) -> StudentImportSnapshot:
+        """Return years, groups and the students the rows could match.
+
+        Students are limited to candidates sharing a row's email or last
+        name; memberships are limited to those students.
+        """
@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from typing import Any, Mapping, Sequence
 
 from core_logic.entities.task_import import (
+    TaskImportArtifact,
     TaskImportPreviewRequest,
     TaskImportPreviewFacts,
     TaskImportPreviewLookup,
@@ -102,3 +103,15 @@ class ITaskImportPreviewRepository(ABC):
         lookup: TaskImportPreviewLookup,
     ) -> TaskImportPreviewFacts:
         """Return existing database identities needed for a dry-run."""
+
+
+class ITaskImportArtifactStore(ABC):
+    """Keep validated uploads so execution can skip parsing them again."""
+
+    @abstractmethod
+    def load(self, content_hash: str) -> TaskImportArtifact | None:
+        """Return an unexpired artifact for the file hash, if any."""
+
+    @abstractmethod
+    def save(self, artifact: TaskImportArtifact) -> None:
+        """Persist an artifact under its content hash."""
@@ -0,0 +1,31 @@
+"""Repository interface for near-duplicate task lookup."""
+
+from abc import ABC, abstractmethod
+from typing import Mapping
+
+from core_logic.entities.task import SimilarTask
+
+
+class ITaskSimilarityRepository(ABC):
+    @abstractmethod
+    def get_similar_tasks(
+        self,
+        task_id: str,
+        *,
+        threshold: float,
+        limit: int,
+    ) -> tuple[SimilarTask, ...]:
+        """Return stored tasks whose text resembles the given task."""
+
+    @abstractmethod
+    def get_similar_tasks_for_texts(
+        self,
+        texts: Mapping[str, str],
+        *,
+        threshold: float,
+        limit: int,
+    ) -> dict[str, tuple[SimilarTask, ...]]:
+        """Return similar stored tasks per text key.
+
+        A key equal to a stored task id never matches that task itself.
+        """
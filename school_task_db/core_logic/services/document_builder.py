@@ -10,6 +10,7 @@ from core_logic.entities.document import (
     DocumentSection,
     DocumentSourceRef,
 )
+from core_logic.services.stage_timing import NULL_STAGE_TIMER
 from core_logic.value_objects.document_build_plan import (
     DocumentSectionPayloadBuildRequest,
 )
@@ -68,8 +69,13 @@ class DocumentSectionPayloadBuilderRegistry:
 
 
 class RecipeDocumentBuilder(IDocumentBuilder):
-    def __init__(self, section_payload_builder_registry=None):
+    def __init__(
+        self,
+        section_payload_builder_registry=None,
+        stage_timer=None,
+    ):
         self.section_payload_builder_registry = section_payload_builder_registry
+        self.stage_timer = stage_timer or NULL_STAGE_TIMER
 
     def build(
         self,
@@ -78,6 +84,15 @@ class RecipeDocumentBuilder(IDocumentBuilder):
         render_target=None,
     ) -> Document:
         build_context = {}
+        with self.stage_timer.measure('document.payload'):
+            return self._document(
+                source,
+                recipe,
+                render_target,
+                build_context,
+            )
+
+    def _document(self, source, recipe, render_target, build_context):
         return Document(
             title=source.title,
             document_type=recipe.document_type,
@@ -1,5 +1,8 @@
 """Pure event screen calculations."""
 
+import random
+from typing import Mapping
+
 from core_logic.entities.event import (
     EventDetailData,
     EventListItem,
@@ -11,6 +14,14 @@ from core_logic.entities.event import (
 )
 
 
+VARIANT_DISTRIBUTION_EVEN = 'even'
+VARIANT_DISTRIBUTION_RANDOM = 'random'
+VARIANT_DISTRIBUTIONS = (
+    VARIANT_DISTRIBUTION_EVEN,
+    VARIANT_DISTRIBUTION_RANDOM,
+)
+
+
 class EventService:
     STATUS_FLOW = [
         ('planned', 'Запланировано', 'secondary'),
@@ -51,6 +62,9 @@ class EventService:
         'closed': ['graded'],
     }
 
+    def __init__(self, shuffle=None):
+        self.shuffle = shuffle or random.shuffle
+
     @staticmethod
     def progress_percentage(
         participants_count: int,
@@ -168,3 +182,33 @@ class EventService:
                 )
             )
         return tuple(steps)
+
+    def distribute_variants(
+        self,
+        participations: tuple[EventParticipationRow, ...],
+        variants: tuple[EventVariantRef, ...],
+        mode: str,
+    ) -> Mapping[str, str]:
+        """Cycle variants over present participants in list or random order.
+
+        Variant counts differ by at most one; in list order neighbours in the
+        class list get different variants.
+        """
+        if mode not in VARIANT_DISTRIBUTIONS:
+            raise ValueError(f'Неизвестный способ распределения: {mode}')
+        ordered_variants = sorted(variants, key=lambda variant: variant.number)
+        if not ordered_variants:
+            return {}
+        participation_ids = [
+            participation.pk
+            for participation in participations
+            if participation.status != 'absent'
+        ]
+        if mode == VARIANT_DISTRIBUTION_RANDOM:
+            self.shuffle(participation_ids)
+        return {
+            participation_id: ordered_variants[
+                index % len(ordered_variants)
+            ].pk
+            for index, participation_id in enumerate(participation_ids)
+        }
@@ -12,6 +12,7 @@ from core_logic.entities.heatmap import (
     HeatmapSubtopicMatrixData,
     HeatmapTopicMatrixData,
 )
+from core_logic.value_objects.score_matrix import ScoreMatrix, percent
 
 
 def performance_color_class(pct):
@@ -84,28 +85,27 @@ class HeatmapMatrixService:
         if not source.columns:
             return (), (), ()
 
-        aggregated = defaultdict(lambda: {'points': 0, 'max_points': 0})
-        for score in source.scores:
-            key = (score.student_id, score.column_id)
-            aggregated[key]['points'] += score.points
-            aggregated[key]['max_points'] += score.max_points
-
+        matrix = source.matrix or self.score_matrix(source)
         rows = []
-        for student in source.students:
+        for row_index, student in enumerate(source.students):
+            row_points, row_max_points = matrix.row_slices(row_index)
             cells = []
             total_points = 0
             total_max = 0
-            for column in source.columns:
-                data = aggregated.get((student.pk, column.pk))
-                if data and data['max_points'] > 0:
-                    pct = round(data['points'] / data['max_points'] * 100)
-                    total_points += data['points']
-                    total_max += data['max_points']
+            for column, points, max_points in zip(
+                source.columns,
+                row_points,
+                row_max_points,
+            ):
+                if max_points > 0:
+                    pct = percent(points, max_points)
+                    total_points += points
+                    total_max += max_points
                     cells.append(HeatmapMatrixCell(
                         column=column,
                         pct=pct,
-                        points=data['points'],
-                        max_points=data['max_points'],
+                        points=points,
+                        max_points=max_points,
                         css=self.color_class(pct),
                     ))
                 else:
@@ -115,7 +115,7 @@ class HeatmapMatrixService:
                         css='no-data',
                     ))
 
-            avg = round(total_points / total_max * 100) if total_max > 0 else None
+            avg = percent(total_points, total_max)
             rows.append(HeatmapMatrixRow(
                 student=student,
                 cells=tuple(cells),
@@ -124,16 +124,8 @@ class HeatmapMatrixService:
             ))
 
         col_averages = []
-        for column in source.columns:
-            points = sum(
-                aggregated.get((student.pk, column.pk), {}).get('points', 0)
-                for student in source.students
-            )
-            max_points = sum(
-                aggregated.get((student.pk, column.pk), {}).get('max_points', 0)
-                for student in source.students
-            )
-            avg = round(points / max_points * 100) if max_points > 0 else None
+        for points, max_points in zip(*matrix.column_totals()):
+            avg = percent(points, max_points)
             col_averages.append(HeatmapColumnAverage(
                 pct=avg,
                 css=self.color_class(avg),
@@ -141,6 +133,26 @@ class HeatmapMatrixService:
 
         return source.columns, tuple(rows), tuple(col_averages)
 
+    @staticmethod
+    def score_matrix(source: HeatmapMatrixSource) -> ScoreMatrix:
+        """Code score facts by student/column position and sum them."""
+        student_codes = {
+            student.pk: index
+            for index, student in enumerate(source.students)
+        }
+        column_codes = {
+            column.pk: index
+            for index, column in enumerate(source.columns)
+        }
+        matrix = ScoreMatrix(len(student_codes), len(column_codes))
+        for score in source.scores:
+            row = student_codes.get(score.student_id)
+            column = column_codes.get(score.column_id)
+            if row is None or column is None:
+                continue
+            matrix.add(row, column, score.points, score.max_points)
+        return matrix
+
     @staticmethod
     def color_class(pct):
         return performance_color_class(pct)
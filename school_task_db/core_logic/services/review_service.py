@@ -1,14 +1,17 @@
 """Pure helpers for the participation review screen."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Mapping, Optional, Sequence
 
 from core_logic.entities.review import (
     EventReviewData,
     EventReviewParticipationRow,
     ReviewDashboardData,
+    ReviewDraft,
+    ReviewDraftTaskScore,
     ReviewEventProgress,
     ReviewFileValidationResult,
+    ReviewGradingRules,
     ReviewParticipationRef,
     ReviewScoreCalculation,
     ReviewSubmissionData,
@@ -37,6 +40,10 @@ class ReviewService:
         'image/png',
         'image/webp',
     }
+    # Minimum percentage for each mark, best first; lower results get
+    # FALLBACK_SCORE. The review page receives the same scale as JSON.
+    SCORE_SCALE = ((85, 5), (70, 4), (50, 3))
+    FALLBACK_SCORE = 2
 
     @staticmethod
     def default_max_points(work, assessable_variant_tasks) -> Optional[int]:
@@ -55,21 +62,33 @@ class ReviewService:
 
     def calculate_score(self, points: int, max_points: int) -> ReviewScoreCalculation:
         percentage = self.score_percentage(points, max_points)
-
-        if percentage >= 85:
-            score = 5
-        elif percentage >= 70:
-            score = 4
-        elif percentage >= 50:
-            score = 3
-        else:
-            score = 2
-
+        score = next(
+            (
+                score
+                for threshold, score in self.SCORE_SCALE
+                if percentage >= threshold
+            ),
+            self.FALLBACK_SCORE,
+        )
         return ReviewScoreCalculation(
             score=score,
             percentage=percentage,
         )
 
+    def grading_rules(
+        self,
+        task_rows: Sequence[ReviewTaskScoreRow] = (),
+    ) -> ReviewGradingRules:
+        """Return the rules ``calculate_score`` applies, for local scoring."""
+        return ReviewGradingRules(
+            score_thresholds=self.SCORE_SCALE,
+            fallback_score=self.FALLBACK_SCORE,
+            task_max_points=tuple(
+                (row.score_key, row.max_points)
+                for row in task_rows
+            ),
+        )
+
     def parse_submission(self, data: Mapping[str, object]) -> ReviewSubmissionData:
         task_scores = []
         for key, value in data.items():
@@ -107,6 +126,81 @@ class ReviewService:
             task_scores=tuple(task_scores),
         )
 
+    def parse_draft_patch(
+        self,
+        data: Mapping[str, object],
+    ) -> tuple[ReviewDraftTaskScore, ...]:
+        """Parse ``{"task_scores": {key: {"points", "comment"}}}``.
+
+        Only the fields present are returned, so a patch never clears what
+        an earlier autosave stored for the other field. Empty ``points``
+        mean the teacher erased them and are returned as ``points_cleared``.
+        """
+        task_scores = data.get('task_scores') if isinstance(data, Mapping) else None
+        if not isinstance(task_scores, Mapping) or not task_scores:
+            raise ValueError('Черновик не содержит баллов по заданиям')
+
+        patch = []
+        for score_key, fields in task_scores.items():
+            if not str(score_key).strip() or not isinstance(fields, Mapping):
+                raise ValueError(f'Некорректные данные задания {score_key}')
+            points = None
+            points_cleared = 'points' in fields and fields['points'] in (None, '')
+            if 'points' in fields and not points_cleared:
+                points = self._int_or_none(fields['points'])
+                if points is None or points < 0:
+                    raise ValueError(
+                        f'Баллы задания {score_key} должны быть '
+                        'неотрицательным числом'
+                    )
+            comment = fields.get('comment')
+            if points is None and not points_cleared and comment is None:
+                continue
+            patch.append(
+                ReviewDraftTaskScore(
+                    score_key=score_key,
+                    points=points,
+                    comment=None if comment is None else str(comment),
+                    points_cleared=points_cleared,
+                )
+            )
+        if not patch:
+            raise ValueError('Черновик не содержит баллов по заданиям')
+        return tuple(patch)
+
+    def apply_review_draft(
+        self,
+        rows: Sequence[ReviewTaskScoreRow],
+        draft: Optional[ReviewDraft],
+    ) -> tuple[ReviewTaskScoreRow, ...]:
+        """Overlay autosaved points and comments on the saved task rows."""
+        if draft is None:
+            return tuple(rows)
+        applied = []
+        for row in rows:
+            draft_score = draft.task_score(row.score_key)
+            if draft_score is None:
+                applied.append(row)
+                continue
+            if draft_score.points_cleared:
+                points = None
+            elif draft_score.points is None:
+                points = row.points
+            else:
+                points = min(max(draft_score.points, 0), row.max_points)
+            applied.append(
+                replace(
+                    row,
+                    points=points,
+                    comment=(
+                        row.comment
+                        if draft_score.comment is None
+                        else draft_score.comment
+                    ),
+                )
+            )
+        return tuple(applied)
+
     def validate_work_scan(
         self,
         size: int,
@@ -1,5 +1,6 @@
 """Compose document content from section renderers."""
 
+from core_logic.services.stage_timing import NULL_STAGE_TIMER
 from core_logic.value_objects.document_render_requests import (
     DocumentContentWrapRequest,
     DocumentRenderRequest,
@@ -8,21 +9,28 @@ from core_logic.value_objects.document_render_requests import (
 
 
 class SectionedDocumentContentRenderer:
-    def __init__(self, section_renderer_registry, section_separator='\n'):
+    def __init__(
+        self,
+        section_renderer_registry,
+        section_separator='\n',
+        stage_timer=None,
+    ):
         self.section_renderer_registry = section_renderer_registry
         self.section_separator = section_separator
+        self.stage_timer = stage_timer or NULL_STAGE_TIMER
 
     def render_content(self, request: DocumentRenderRequest) -> str:
-        rendered_sections = [
-            self.section_renderer_registry.render_section(
-                DocumentSectionRenderRequest(
-                    document=request.document,
-                    section=section,
-                    render_target=request.render_target,
+        with self.stage_timer.measure('document.sections'):
+            rendered_sections = [
+                self.section_renderer_registry.render_section(
+                    DocumentSectionRenderRequest(
+                        document=request.document,
+                        section=section,
+                        render_target=request.render_target,
+                    )
                 )
-            )
-            for section in request.document.sections
-        ]
+                for section in request.document.sections
+            ]
         return self.section_separator.join(rendered_sections)
 
 
@@ -0,0 +1,13 @@
+"""Default stage timer for pipelines that are not being profiled."""
+
+from contextlib import nullcontext
+
+from core_logic.interfaces.stage_timer import IStageTimer
+
+
+class NullStageTimer(IStageTimer):
+    def measure(self, stage: str):
+        return nullcontext()
+
+
+NULL_STAGE_TIMER = NullStageTimer()
@@ -17,12 +17,67 @@ from core_logic.entities.student_import import (
 
 @dataclass
 class _StudentState:
+    position: int
     token: str
     last_name: str
     first_name: str
     middle_name: str
     email: str
 
+    @property
+    def email_key(self):
+        return self.email.lower() if self.email else ''
+
+    @property
+    def name_key(self):
+        return (self.last_name, self.first_name, self.middle_name)
+
+
+class _StudentLookup:
+    """Find the earliest student matching a row by email, then by name.
+
+    Keys are indexed as students are added or renamed; stale entries are
+    skipped on lookup, so matches equal a scan in snapshot order.
+    """
+
+    def __init__(self):
+        self._by_email = {}
+        self._by_name = {}
+
+    def add(self, student):
+        if student.email_key:
+            self._index(self._by_email, student.email_key, student)
+        self._index(self._by_name, student.name_key, student)
+
+    def find(self, row):
+        if row.email:
+            email = row.email.lower()
+            student = self._earliest(
+                self._by_email.get(email, ()),
+                lambda item: item.email_key == email,
+            )
+            if student is not None:
+                return student
+        name = (row.last_name, row.first_name, row.middle_name)
+        return self._earliest(
+            self._by_name.get(name, ()),
+            lambda item: item.name_key == name,
+        )
+
+    @staticmethod
+    def _index(index, key, student):
+        students = index.setdefault(key, [])
+        if student not in students:
+            students.append(student)
+
+    @staticmethod
+    def _earliest(students, matches):
+        return min(
+            (item for item in students if matches(item)),
+            key=lambda item: item.position,
+            default=None,
+        )
+
 
 class StudentImportPlanner:
     def build(
@@ -40,16 +95,18 @@ class StudentImportPlanner:
             (group.name, group.academic_year_name): f'existing:{group.pk}'
             for group in snapshot.groups
         }
-        students = [
-            _StudentState(
+        students = _StudentLookup()
+        student_count = 0
+        for student in snapshot.students:
+            students.add(_StudentState(
+                position=student_count,
                 token=f'existing:{student.pk}',
                 last_name=student.last_name,
                 first_name=student.first_name,
                 middle_name=student.middle_name,
                 email=student.email,
-            )
-            for student in snapshot.students
-        ]
+            ))
+            student_count += 1
         memberships = {
             (f'existing:{item.group_id}', f'existing:{item.student_id}')
             for item in snapshot.memberships
@@ -98,9 +155,10 @@ class StudentImportPlanner:
                     )
                 )
 
-            student = self._find_student(students, row)
+            student = students.find(row)
             if student is None:
                 student = _StudentState(
+                    position=student_count,
                     token=f'new-student:{next_student_number}',
                     last_name=row.last_name,
                     first_name=row.first_name,
@@ -108,7 +166,8 @@ class StudentImportPlanner:
                     email=row.email,
                 )
                 next_student_number += 1
-                students.append(student)
+                student_count += 1
+                students.add(student)
                 student_mutations.append(
                     self._student_mutation(student, operation='create')
                 )
@@ -118,6 +177,7 @@ class StudentImportPlanner:
                 student.first_name = row.first_name
                 student.middle_name = row.middle_name
                 student.email = row.email
+                students.add(student)
                 student_mutations.append(
                     self._student_mutation(student, operation='update')
                 )
@@ -149,31 +209,6 @@ class StudentImportPlanner:
             stats=stats,
         )
 
-    @staticmethod
-    def _find_student(students, row):
-        if row.email:
-            email = row.email.lower()
-            student = next(
-                (
-                    item
-                    for item in students
-                    if item.email and item.email.lower() == email
-                ),
-                None,
-            )
-            if student is not None:
-                return student
-        return next(
-            (
-                item
-                for item in students
-                if item.last_name == row.last_name
-                and item.first_name == row.first_name
-                and item.middle_name == row.middle_name
-            ),
-            None,
-        )
-
     @staticmethod
     def _student_has_changes(student, row):
         return (
@@ -52,6 +52,11 @@ class TaskImportPreviewService:
                 for task in tasks
                 for key in self._classification_keys(task)
             ))),
+            task_texts=tuple(
+                (self._task_key(task, index), task['text'])
+                for index, task in enumerate(tasks)
+                if isinstance(task.get('text'), str) and task['text']
+            ),
         )
 
     def build(self, data, facts: TaskImportPreviewFacts):
@@ -83,8 +88,35 @@ class TaskImportPreviewService:
             'task_uuid_counts': task_counts,
             'group_uuid_counts': group_counts,
             'dependency_counts': dependencies,
+            'likely_duplicates': self._likely_duplicates(tasks, facts),
         }
 
+    def _likely_duplicates(self, tasks, facts):
+        duplicates = []
+        for index, task in enumerate(tasks):
+            key = self._task_key(task, index)
+            similar = facts.similar_tasks.get(key)
+            if not similar:
+                continue
+            match = similar[0]
+            label = key[-8:] if not key.startswith('#') else key
+            duplicates.append({
+                'task': key,
+                'similar_task_id': match.pk,
+                'similar_short_uuid': match.short_uuid,
+                'similarity': match.similarity,
+                'message': (
+                    f'Задание {label} похоже на существующее '
+                    f'[{match.short_uuid}] (сходство '
+                    f'{match.similarity_percent}%)'
+                ),
+            })
+        return duplicates
+
+    @classmethod
+    def _task_key(cls, task, index):
+        return cls._normalize_uuid(task.get('id')) or f'#{index + 1}'
+
     def _dependencies(self, tasks, groups, topics, facts):
         declared_groups = set(self._valid_ids(
             group.get('id') for group in groups
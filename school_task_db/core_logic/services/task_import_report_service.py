@@ -75,6 +75,9 @@ class TaskImportReportService:
             f"{dependencies.get('broken_references', 0)}",
             '  Классификаций не найдено: '
             f"{dependencies.get('missing_classifications', 0)}",
+            '',
+            '♻️ Похожи на существующие задания: '
+            f"{len(preview.get('likely_duplicates', ()))}",
         ])
 
     @staticmethod
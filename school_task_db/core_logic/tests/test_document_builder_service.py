@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from unittest import TestCase
 
 from core_logic.entities.document import (
@@ -185,6 +186,18 @@ class RecipeDocumentBuilderTests(TestCase):
             {'include_hints': True},
         )
 
+    def test_reports_payload_build_to_stage_timer(self):
+        stage_timer = FakeStageTimer()
+        builder = RecipeDocumentBuilder(stage_timer=stage_timer)
+        recipe = DocumentRecipe(
+            document_type='work',
+            sections=[DocumentSectionSpec(section_type='header')],
+        )
+
+        builder.build(DocumentSourceRef(source_type='work'), recipe)
+
+        self.assertEqual(stage_timer.stages, ['document.payload'])
+
 
 class DocumentSectionPayloadBuilderRegistryTests(TestCase):
     def test_registers_and_delegates_to_payload_builder(self):
@@ -272,6 +285,16 @@ class FakeSectionPayloadBuilder:
         return self.payload
 
 
+class FakeStageTimer:
+    def __init__(self):
+        self.stages = []
+
+    @contextmanager
+    def measure(self, stage):
+        yield
+        self.stages.append(stage)
+
+
 def payload_build_request(source, recipe, section):
     return DocumentSectionPayloadBuildRequest(
         source=source,
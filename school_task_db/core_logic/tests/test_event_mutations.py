@@ -1,7 +1,12 @@
 from unittest import TestCase
 from types import SimpleNamespace
 
-from core_logic.entities.event import EventVariantAssignmentResult
+from core_logic.entities.event import (
+    EventParticipationRow,
+    EventStudentRef,
+    EventVariantAssignmentResult,
+    EventVariantRef,
+)
 from core_logic.services.event_service import EventService
 from core_logic.use_cases.add_event_participants import (
     AddEventParticipantsRequest,
@@ -10,6 +15,8 @@ from core_logic.use_cases.add_event_participants import (
 from core_logic.use_cases.assign_event_variants import (
     AssignEventVariantsRequest,
     AssignEventVariantsUseCase,
+    DistributeEventVariantsRequest,
+    DistributeEventVariantsUseCase,
 )
 from core_logic.use_cases.assign_single_event_variant import (
     AssignSingleEventVariantRequest,
@@ -29,6 +36,22 @@ class FakeMutationEventRepository:
         self.status = 'completed'
         self.saved_status = None
         self.requires_variants = True
+        self.variants = (
+            EventVariantRef(pk='v1', number=1),
+            EventVariantRef(pk='v2', number=2),
+        )
+        self.participations = tuple(
+            EventParticipationRow(
+                pk=f'p{index}',
+                status='assigned',
+                student=EventStudentRef(
+                    pk=f's{index}',
+                    first_name='Имя',
+                    last_name='Фамилия',
+                ),
+            )
+            for index in range(1, 4)
+        )
 
     def add_participants(self, event_id, student_ids):
         self.student_ids = student_ids
@@ -38,6 +61,12 @@ class FakeMutationEventRepository:
         self.assignments = assignments
         return len(assignments)
 
+    def get_available_variants(self, event_id):
+        return self.variants
+
+    def get_detail_participations(self, event_id):
+        return self.participations
+
     def assign_variant(self, event_id, participation_id, variant_id):
         self.single_assignment = (event_id, participation_id, variant_id)
         return EventVariantAssignmentResult(
@@ -131,6 +160,52 @@ class EventMutationUseCaseTests(TestCase):
         self.assertEqual(result.assigned_count, 0)
         self.assertEqual(repo.assignments, {})
 
+    def test_distribute_event_variants_assigns_through_bulk_path(self):
+        repo = FakeMutationEventRepository()
+        use_case = DistributeEventVariantsUseCase(
+            event_repo=repo,
+            event_participation_repo=repo,
+            event_service=EventService(),
+        )
+
+        result = use_case.execute(
+            DistributeEventVariantsRequest(event_id='event-1', mode='even')
+        )
+
+        self.assertEqual(result.status, 'assigned')
+        self.assertEqual(result.assigned_count, 3)
+        self.assertEqual(repo.assignments, {'p1': 'v1', 'p2': 'v2', 'p3': 'v1'})
+
+    def test_distribute_event_variants_reports_missing_variants(self):
+        repo = FakeMutationEventRepository()
+        repo.variants = ()
+        use_case = DistributeEventVariantsUseCase(
+            event_repo=repo,
+            event_participation_repo=repo,
+            event_service=EventService(),
+        )
+
+        result = use_case.execute(
+            DistributeEventVariantsRequest(event_id='event-1', mode='random')
+        )
+
+        self.assertEqual(result.status, 'no_variants')
+        self.assertEqual(repo.assignments, {})
+
+    def test_distribute_event_variants_rejects_unknown_mode(self):
+        repo = FakeMutationEventRepository()
+        use_case = DistributeEventVariantsUseCase(
+            event_repo=repo,
+            event_participation_repo=repo,
+            event_service=EventService(),
+        )
+
+        result = use_case.execute(
+            DistributeEventVariantsRequest(event_id='event-1', mode='magic')
+        )
+
+        self.assertEqual(result.status, 'invalid_mode')
+
     def test_assign_single_variant_requires_selection(self):
         repo = FakeMutationEventRepository()
         use_case = AssignSingleEventVariantUseCase(
@@ -7,7 +7,11 @@ from core_logic.entities.event import (
     EventStudentRef,
     EventVariantRef,
 )
-from core_logic.services.event_service import EventService
+from core_logic.services.event_service import (
+    VARIANT_DISTRIBUTION_EVEN,
+    VARIANT_DISTRIBUTION_RANDOM,
+    EventService,
+)
 from core_logic.value_objects.work_assessment import (
     WORK_ASSESSMENT_MODE_AGGREGATE,
 )
@@ -101,3 +105,63 @@ class EventServiceTests(TestCase):
         self.assertFalse(service.can_change_status('completed', 'closed'))
         self.assertEqual(service.status_label('reviewing'), 'На проверке')
         self.assertEqual(service.status_label('unknown'), 'unknown')
+
+    def test_distribute_variants_cycles_variants_in_list_order(self):
+        participations = tuple(
+            EventParticipationRow(
+                pk=f'p{index}',
+                status='absent' if index == 2 else 'assigned',
+                student=EventStudentRef(
+                    pk=f's{index}',
+                    first_name='Имя',
+                    last_name=f'Фамилия {index}',
+                ),
+            )
+            for index in range(1, 6)
+        )
+        variants = (
+            EventVariantRef(pk='v2', number=2),
+            EventVariantRef(pk='v1', number=1),
+        )
+
+        assignments = EventService().distribute_variants(
+            participations,
+            variants,
+            VARIANT_DISTRIBUTION_EVEN,
+        )
+
+        self.assertEqual(
+            assignments,
+            {'p1': 'v1', 'p3': 'v2', 'p4': 'v1', 'p5': 'v2'},
+        )
+
+    def test_distribute_variants_randomly_keeps_counts_balanced(self):
+        participations = tuple(
+            EventParticipationRow(
+                pk=f'p{index}',
+                status='assigned',
+                student=EventStudentRef(
+                    pk=f's{index}',
+                    first_name='Имя',
+                    last_name='Фамилия',
+                ),
+            )
+            for index in range(1, 4)
+        )
+        variants = (
+            EventVariantRef(pk='v1', number=1),
+            EventVariantRef(pk='v2', number=2),
+        )
+        service = EventService(shuffle=lambda items: items.reverse())
+
+        assignments = service.distribute_variants(
+            participations,
+            variants,
+            VARIANT_DISTRIBUTION_RANDOM,
+        )
+
+        self.assertEqual(assignments, {'p3': 'v1', 'p2': 'v2', 'p1': 'v1'})
+
+    def test_distribute_variants_rejects_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            EventService().distribute_variants((), (), 'alphabetical')
@@ -1,5 +1,7 @@
+from dataclasses import replace
 from unittest import TestCase
 
+from core_logic.entities.core import ImportJsonValidationData
 from core_logic.entities.task_import import (
     TaskImportRequest,
     TaskImportRunSummary,
@@ -37,6 +39,11 @@ class FakeTaskImportLogRepository:
         self.failed.append((log_id, error, duration_ms))
 
 
+class FailingValidateJsonUseCase:
+    def execute(self, request):
+        raise AssertionError('validation must not run twice')
+
+
 class ExecuteTaskImportUseCaseTests(TestCase):
     def test_executes_and_journals_normalized_summary(self):
         summary = TaskImportRunSummary(
@@ -166,6 +173,26 @@ class ExecuteTaskImportUseCaseTests(TestCase):
         self.assertIsNone(runner.request)
         self.assertEqual(log_repo.started, [])
 
+    def test_reuses_validation_attached_by_preview(self):
+        runner = FakeTaskImportRunner()
+        log_repo = FakeTaskImportLogRepository()
+        request = replace(
+            self._request(data={'tasks': 'not validated again'}),
+            validation=ImportJsonValidationData(
+                warnings=['Задание #1: нет ответа'],
+            ),
+        )
+
+        result = ExecuteTaskImportUseCase(
+            runner,
+            log_repo,
+            validate_json_use_case=FailingValidateJsonUseCase(),
+        ).execute(request)
+
+        self.assertTrue(result.success)
+        self.assertEqual(runner.request, request)
+        self.assertIn('Задание #1: нет ответа', result.message)
+
     @staticmethod
     def _request(data=None):
         return TaskImportRequest(
@@ -104,6 +104,14 @@ class GetParticipationReviewUseCaseTests(TestCase):
         self.assertEqual(result.typical_comments[0].text, 'Хорошо')
         self.assertEqual(result.current_position, 1)
         self.assertEqual(result.total_positions, 1)
+        self.assertEqual(
+            result.grading_rules.score_thresholds,
+            ReviewService.SCORE_SCALE,
+        )
+        self.assertEqual(
+            result.grading_rules.task_max_points,
+            (('variant-task-1', 2), ('variant-task-2', 3)),
+        )
 
     def test_aggregate_review_uses_work_scoring_scale(self):
         repo = FakeReviewRepository()
@@ -0,0 +1,47 @@
+from unittest import TestCase
+
+from core_logic.entities.core import SearchSuggestion
+from core_logic.use_cases.get_search_suggestions import (
+    MAX_SUGGESTION_LIMIT,
+    GetSearchSuggestionsUseCase,
+    SearchSuggestionsRequest,
+)
+from core_logic.value_objects.search_terms import search_terms
+
+
+class FakeSuggestionIndex:
+    def __init__(self):
+        self.calls = []
+
+    def suggest(self, prefixes, limit):
+        self.calls.append((prefixes, limit))
+        return (SearchSuggestion(kind='student', pk='1', title='Ёлкин Пётр'),)
+
+
+class GetSearchSuggestionsUseCaseTests(TestCase):
+    def test_short_query_does_not_touch_index(self):
+        index = FakeSuggestionIndex()
+
+        data = GetSearchSuggestionsUseCase(index).execute(
+            SearchSuggestionsRequest(raw_query=' а! '),
+        )
+
+        self.assertEqual(data.query, 'а!')
+        self.assertEqual(data.suggestions, ())
+        self.assertEqual(index.calls, [])
+
+    def test_passes_normalized_prefixes_and_clamped_limit(self):
+        index = FakeSuggestionIndex()
+
+        data = GetSearchSuggestionsUseCase(index).execute(
+            SearchSuggestionsRequest(raw_query='Ёлкин, П', limit=1000),
+        )
+
+        self.assertEqual(index.calls, [(('елкин', 'п'), MAX_SUGGESTION_LIMIT)])
+        self.assertEqual(data.suggestions[0].title, 'Ёлкин Пётр')
+
+    def test_search_terms_split_words_and_fold_case(self):
+        self.assertEqual(
+            search_terms('«Контрольная» №3: ЁЖ-1'),
+            ('контрольная', '3', 'еж', '1'),
+        )
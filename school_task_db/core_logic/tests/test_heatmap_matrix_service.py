@@ -12,6 +12,7 @@ from core_logic.services.heatmap_matrix_service import (
     HeatmapMatrixService,
     performance_color_class,
 )
+from core_logic.value_objects.score_matrix import ScoreMatrix
 
 
 class HeatmapMatrixServiceTests(TestCase):
@@ -62,6 +63,55 @@ class HeatmapMatrixServiceTests(TestCase):
         self.assertIsNone(data.col_averages[1].pct)
         self.assertEqual(data.col_averages[1].css, 'no-data')
 
+    def test_uses_prebuilt_score_matrix_from_adapter(self):
+        matrix = ScoreMatrix.from_codes(
+            2,
+            2,
+            row_codes=(0, 0, 1),
+            column_codes=(1, 1, 0),
+            points=(1, 2, 4),
+            max_points=(2, 2, 5),
+        )
+        source = HeatmapMatrixSource(
+            students=(
+                ReportStudentRef(pk='student-1', full_name='Иванов Иван'),
+                ReportStudentRef(pk='student-2', full_name='Петров Пётр'),
+            ),
+            columns=(
+                ReportHeatmapColumnRef(pk='topic-1', name='Кинематика'),
+                ReportHeatmapColumnRef(pk='topic-2', name='Динамика'),
+            ),
+            matrix=matrix,
+        )
+
+        data = HeatmapMatrixService().build_topic_matrix(source)
+
+        self.assertIsNone(data.rows[0].cells[0].pct)
+        self.assertEqual(data.rows[0].cells[1].pct, 75)
+        self.assertEqual(data.rows[1].cells[0].pct, 80)
+        self.assertEqual(data.col_averages[0].pct, 80)
+        self.assertEqual(data.col_averages[1].pct, 75)
+
+    def test_ignores_facts_for_unknown_students_or_columns(self):
+        source = HeatmapMatrixSource(
+            students=(
+                ReportStudentRef(pk='student-1', full_name='Иванов Иван'),
+            ),
+            columns=(
+                ReportHeatmapColumnRef(pk='topic-1', name='Кинематика'),
+            ),
+            scores=(
+                HeatmapScoreFact('student-1', 'topic-1', 1, 2),
+                HeatmapScoreFact('student-9', 'topic-1', 2, 2),
+                HeatmapScoreFact('student-1', 'topic-9', 2, 2),
+            ),
+        )
+
+        data = HeatmapMatrixService().build_topic_matrix(source)
+
+        self.assertEqual(data.rows[0].cells[0].pct, 50)
+        self.assertEqual(data.col_averages[0].pct, 50)
+
     def test_returns_empty_matrix_when_source_has_no_columns(self):
         source = HeatmapMatrixSource(
             students=(
@@ -1,6 +1,8 @@
 from unittest import TestCase
 
+from core_logic.entities.core import ImportJsonValidationData
 from core_logic.entities.task_import import (
+    TaskImportArtifact,
     TaskImportExecutionSubmissionRequest,
     TaskImportFileRequest,
 )
@@ -9,6 +11,21 @@ from core_logic.use_cases.prepare_task_import_file import (
     PrepareTaskImportExecutionSubmissionUseCase,
     PrepareTaskImportFileUseCase,
 )
+from core_logic.value_objects.task_import import task_import_content_hash
+
+
+class FakeArtifactStore:
+    def __init__(self, artifacts=()):
+        self.artifacts = {
+            artifact.content_hash: artifact
+            for artifact in artifacts
+        }
+
+    def load(self, content_hash):
+        return self.artifacts.get(content_hash)
+
+    def save(self, artifact):
+        self.artifacts[artifact.content_hash] = artifact
 
 
 class PrepareTaskImportFileUseCaseTests(TestCase):
@@ -28,6 +45,10 @@ class PrepareTaskImportFileUseCaseTests(TestCase):
         self.assertEqual(result.filename, 'tasks.json')
         self.assertEqual(result.file_size, 13)
         self.assertEqual(result.data, {'tasks': []})
+        self.assertEqual(
+            result.content_hash,
+            task_import_content_hash(b'{"tasks": []}'),
+        )
 
     def test_execute_rejects_large_file(self):
         result = self.use_case.execute(
@@ -121,3 +142,46 @@ class PrepareTaskImportExecutionSubmissionUseCaseTests(TestCase):
         self.assertFalse(result.success)
         self.assertIsNone(result.import_request)
         self.assertEqual(result.error, 'Файл не в кодировке UTF-8')
+
+    def test_execute_reuses_previewed_artifact(self):
+        # The bytes are not JSON: a hit must skip parsing altogether.
+        content = b'previewed upload'
+        validation = ImportJsonValidationData(warnings=['Массив "tasks" пуст'])
+        store = FakeArtifactStore([
+            TaskImportArtifact(
+                content_hash=task_import_content_hash(content),
+                data={'tasks': []},
+                validation=validation,
+            ),
+        ])
+
+        result = PrepareTaskImportExecutionSubmissionUseCase(
+            artifact_store=store,
+        ).execute(
+            TaskImportExecutionSubmissionRequest(
+                filename='tasks.json',
+                file_size=len(content),
+                content=content,
+                form_data={'mode': ['skip']},
+            )
+        )
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.import_request.data, {'tasks': []})
+        self.assertIs(result.import_request.validation, validation)
+        self.assertEqual(result.import_request.mode, 'skip')
+
+    def test_execute_parses_file_missing_from_artifact_store(self):
+        result = PrepareTaskImportExecutionSubmissionUseCase(
+            artifact_store=FakeArtifactStore(),
+        ).execute(
+            TaskImportExecutionSubmissionRequest(
+                filename='tasks.json',
+                file_size=13,
+                content=b'{"tasks": []}',
+                form_data={},
+            )
+        )
+
+        self.assertEqual(result.import_request.data, {'tasks': []})
+        self.assertIsNone(result.import_request.validation)
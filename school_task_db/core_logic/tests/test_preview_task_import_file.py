@@ -8,6 +8,7 @@ from core_logic.entities.task_import import (
 from core_logic.use_cases.preview_task_import_file import (
     PreviewTaskImportFileUseCase,
 )
+from core_logic.value_objects.task_import import task_import_content_hash
 
 
 class FakePreviewTaskImportUseCase:
@@ -20,6 +21,14 @@ class FakePreviewTaskImportUseCase:
         return self.result
 
 
+class FakeArtifactStore:
+    def __init__(self):
+        self.saved = []
+
+    def save(self, artifact):
+        self.saved.append(artifact)
+
+
 class PreviewTaskImportFileUseCaseTests(TestCase):
     def test_returns_file_error_without_preview(self):
         preview_use_case = FakePreviewTaskImportUseCase(
@@ -97,6 +106,27 @@ class PreviewTaskImportFileUseCaseTests(TestCase):
         self.assertTrue(result.success)
         self.assertIn('Preview unavailable', result.validation['warnings'])
 
+    def test_saves_artifact_only_for_valid_file(self):
+        store = FakeArtifactStore()
+        use_case = PreviewTaskImportFileUseCase(
+            preview_task_import_use_case=FakePreviewTaskImportUseCase(
+                TaskImportPreviewResult(preview={}),
+            ),
+            artifact_store=store,
+        )
+        valid = self._request({'tasks': []})
+
+        use_case.execute(valid)
+        use_case.execute(self._request({'tasks': {}}))
+
+        self.assertEqual(len(store.saved), 1)
+        self.assertEqual(
+            store.saved[0].content_hash,
+            task_import_content_hash(valid.content),
+        )
+        self.assertEqual(store.saved[0].data, {'tasks': []})
+        self.assertTrue(store.saved[0].validation.is_valid)
+
     def _request(self, data):
         content = json.dumps(data).encode('utf-8')
         return TaskImportFileRequest(
@@ -1,8 +1,11 @@
 from unittest import TestCase
 
 from core_logic.entities.review import (
+    ReviewDraft,
     ReviewEventRef,
     ReviewParticipationAbsenceContext,
+    ReviewQueue,
+    ReviewQueueEntry,
     ReviewSaveNavigation,
     ReviewSessionRef,
 )
@@ -27,6 +30,10 @@ from core_logic.use_cases.prepare_participation_review_submission import (
     PrepareParticipationReviewSubmissionRequest,
     PrepareParticipationReviewSubmissionUseCase,
 )
+from core_logic.use_cases.save_review_draft import (
+    SaveReviewDraftRequest,
+    SaveReviewDraftUseCase,
+)
 from core_logic.use_cases.sync_review_session import (
     SyncReviewSessionRequest,
     SyncReviewSessionUseCase,
@@ -73,6 +80,17 @@ class FakeReviewActionRepository:
         self.navigation_participation_id = participation_id
         return ReviewSaveNavigation(event_id='event-1', all_checked=True)
 
+    def get_review_queue(self, event_id):
+        self.queue_loads = getattr(self, 'queue_loads', 0) + 1
+        return ReviewQueue(
+            event_id=event_id,
+            entries=(
+                ReviewQueueEntry('p1'),
+                ReviewQueueEntry('p2', graded=True),
+                ReviewQueueEntry('p3'),
+            ),
+        )
+
     def get_recent_sessions(self, reviewer_id, limit=5):
         self.recent_sessions_reviewer_id = reviewer_id
         return [
@@ -107,6 +125,50 @@ class FakeReviewActionRepository:
         )
 
 
+class FakeReviewQueueCache:
+    def __init__(self):
+        self.queues = {}
+
+    def get(self, event_id):
+        return self.queues.get(event_id)
+
+    def set(self, queue):
+        self.queues[queue.event_id] = queue
+
+    def invalidate(self, *event_ids):
+        for event_id in event_ids:
+            self.queues.pop(event_id, None)
+
+
+class FakeReviewDraftRepository:
+    def __init__(self):
+        self.merged = None
+        self.missing_participation_ids = set()
+
+    def merge_draft(self, participation_id, task_scores):
+        self.merged = (participation_id, task_scores)
+        if participation_id in self.missing_participation_ids:
+            return None
+        return ReviewDraft(
+            participation_id=participation_id,
+            task_scores=task_scores,
+        )
+
+
+class FakeAttemptSnapshotRepository:
+    def __init__(self, review_repo):
+        self.review_repo = review_repo
+        self.captured_event_id = None
+        self.finalized_before_capture = None
+
+    def capture_event_marks(self, event_id):
+        self.captured_event_id = event_id
+        self.finalized_before_capture = (
+            self.review_repo.finalized_event_id is not None
+        )
+        return ()
+
+
 class ReviewActionUseCaseTests(TestCase):
     def test_calculate_review_score_parses_values_and_uses_service(self):
         use_case = CalculateReviewScoreUseCase(review_service=ReviewService())
@@ -137,6 +199,20 @@ class ReviewActionUseCaseTests(TestCase):
         self.assertEqual(result.name, 'КР 9А')
         self.assertEqual(repo.finalized_event_id, 'event-1')
 
+    def test_finalize_review_event_captures_event_marks_first(self):
+        repo = FakeReviewActionRepository()
+        snapshot_repo = FakeAttemptSnapshotRepository(repo)
+        use_case = FinalizeReviewEventUseCase(
+            review_repo=repo,
+            attempt_snapshot_repo=snapshot_repo,
+        )
+
+        use_case.execute(FinalizeReviewEventRequest(event_id='event-1'))
+
+        self.assertEqual(snapshot_repo.captured_event_id, 'event-1')
+        self.assertFalse(snapshot_repo.finalized_before_capture)
+        self.assertEqual(repo.finalized_event_id, 'event-1')
+
     def test_toggle_participation_absent_delegates_to_repository(self):
         repo = FakeReviewActionRepository()
         use_case = ToggleParticipationAbsentUseCase(review_repo=repo)
@@ -215,6 +291,106 @@ class ReviewActionUseCaseTests(TestCase):
         self.assertTrue(result.all_checked)
         self.assertEqual(repo.navigation_participation_id, 'participation-1')
 
+    def test_get_review_save_navigation_reuses_cached_queue(self):
+        repo = FakeReviewActionRepository()
+        cache = FakeReviewQueueCache()
+        use_case = GetReviewSaveNavigationUseCase(
+            review_repo=repo,
+            review_queue_cache=cache,
+        )
+
+        first = use_case.execute(
+            GetReviewSaveNavigationRequest(
+                participation_id='p1',
+                event_id='event-1',
+            )
+        )
+        second = use_case.execute(
+            GetReviewSaveNavigationRequest(
+                participation_id='p3',
+                event_id='event-1',
+            )
+        )
+
+        self.assertEqual(first.next_participation_id, 'p3')
+        self.assertTrue(second.all_checked)
+        self.assertEqual(repo.queue_loads, 1)
+        self.assertIsNone(repo.navigation_participation_id)
+        self.assertTrue(
+            all(entry.graded for entry in cache.get('event-1').entries),
+        )
+
+    def test_get_review_save_navigation_reloads_queue_without_participation(self):
+        repo = FakeReviewActionRepository()
+        cache = FakeReviewQueueCache()
+        cache.set(ReviewQueue(event_id='event-1', entries=()))
+        use_case = GetReviewSaveNavigationUseCase(
+            review_repo=repo,
+            review_queue_cache=cache,
+        )
+
+        result = use_case.execute(
+            GetReviewSaveNavigationRequest(
+                participation_id='p1',
+                event_id='event-1',
+            )
+        )
+
+        self.assertEqual(result.next_participation_id, 'p3')
+        self.assertEqual(repo.queue_loads, 1)
+
+    def test_save_review_draft_merges_parsed_patch(self):
+        draft_repo = FakeReviewDraftRepository()
+        use_case = SaveReviewDraftUseCase(
+            draft_repo=draft_repo,
+            review_service=ReviewService(),
+        )
+
+        result = use_case.execute(
+            SaveReviewDraftRequest(
+                participation_id='p1',
+                data={'task_scores': {'vt-1': {'points': 2}}},
+            )
+        )
+
+        self.assertEqual(result.status, 'saved')
+        self.assertEqual(draft_repo.merged[0], 'p1')
+        self.assertEqual(result.draft.task_scores[0].points, 2)
+
+    def test_save_review_draft_reports_invalid_patch(self):
+        draft_repo = FakeReviewDraftRepository()
+        use_case = SaveReviewDraftUseCase(
+            draft_repo=draft_repo,
+            review_service=ReviewService(),
+        )
+
+        result = use_case.execute(
+            SaveReviewDraftRequest(participation_id='p1', data={}),
+        )
+
+        self.assertEqual(result.status, 'invalid')
+        self.assertTrue(result.errors)
+        self.assertIsNone(draft_repo.merged)
+
+    def test_save_review_draft_reports_missing_participation(self):
+        draft_repo = FakeReviewDraftRepository()
+        draft_repo.missing_participation_ids.add('gone')
+        use_case = SaveReviewDraftUseCase(
+            draft_repo=draft_repo,
+            review_service=ReviewService(),
+        )
+
+        result = use_case.execute(
+            SaveReviewDraftRequest(
+                participation_id='gone',
+                data={'task_scores': {'vt-1': {'points': 2}}},
+            )
+        )
+
+        self.assertEqual(result.status, 'not_found')
+        self.assertIsNone(result.draft)
+        self.assertTrue(result.errors)
+
     def test_get_recent_review_sessions_delegates_to_repository(self):
         repo = FakeReviewActionRepository()
         use_case = GetRecentReviewSessionsUseCase(session_repo=repo)
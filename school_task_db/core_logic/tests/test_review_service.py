@@ -2,12 +2,17 @@ from unittest import TestCase
 
 from core_logic.entities.review import (
     EventReviewParticipationRow,
+    ReviewDraft,
+    ReviewDraftTaskScore,
     ReviewEventProgress,
     ReviewEventRef,
     ReviewMarkRef,
     ReviewParticipationRef,
+    ReviewQueue,
+    ReviewQueueEntry,
     ReviewStudentRef,
     ReviewTaskRef,
+    ReviewTaskScoreRow,
     ReviewTaskScoreValue,
     ReviewVariantRef,
     ReviewVariantTaskRef,
@@ -30,6 +35,26 @@ class ReviewServiceTests(TestCase):
         self.assertEqual(service.calculate_score(4, 10).score, 2)
         self.assertEqual(service.calculate_score(1, 0).percentage, 0)
 
+    def test_grading_rules_reproduce_calculate_score(self):
+        service = ReviewService()
+        rules = service.grading_rules()
+
+        for points in range(0, 21):
+            percentage = service.score_percentage(points, 20)
+            local_score = next(
+                (
+                    score
+                    for threshold, score in rules.score_thresholds
+                    if percentage >= threshold
+                ),
+                rules.fallback_score,
+            )
+            self.assertEqual(
+                local_score,
+                service.calculate_score(points, 20).score,
+            )
+        self.assertEqual(rules.task_max_points, ())
+
     def test_score_percentage_handles_missing_and_zero_maximum(self):
         service = ReviewService()
 
@@ -383,3 +408,120 @@ class ReviewServiceTests(TestCase):
         self.assertEqual(nav.current_position, 2)
         self.assertEqual(nav.total_positions, 3)
         self.assertEqual(nav.navigation_progress, 66.7)
+
+    def test_parse_draft_patch_keeps_only_present_fields(self):
+        service = ReviewService()
+
+        patch = service.parse_draft_patch({
+            'task_scores': {
+                'vt-1': {'points': '2'},
+                'vt-2': {'comment': 'Нет единиц'},
+                'vt-3': {},
+                'vt-4': {'points': ''},
+            },
+        })
+
+        self.assertEqual(
+            patch,
+            (
+                ReviewDraftTaskScore(score_key='vt-1', points=2),
+                ReviewDraftTaskScore(score_key='vt-2', comment='Нет единиц'),
+                ReviewDraftTaskScore(score_key='vt-4', points_cleared=True),
+            ),
+        )
+
+    def test_parse_draft_patch_rejects_bad_points_and_empty_patch(self):
+        service = ReviewService()
+
+        for data in (
+            {'task_scores': {'vt-1': {'points': -1}}},
+            {'task_scores': {'vt-1': {'points': 'два'}}},
+            {'task_scores': {}},
+            {'points': 2},
+            ['vt-1'],
+        ):
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError):
+                    service.parse_draft_patch(data)
+
+    def test_apply_review_draft_overlays_points_and_comments(self):
+        service = ReviewService()
+        task = ReviewTaskRef(id='task-1', text='Задание')
+        rows = (
+            ReviewTaskScoreRow(
+                task=task,
+                number=1,
+                points=1,
+                max_points=2,
+                variant_task_id='vt-1',
+                comment='Было',
+            ),
+            ReviewTaskScoreRow(
+                task=ReviewTaskRef(id='task-2', text='Задание 2'),
+                number=2,
+                points=0,
+                max_points=3,
+                variant_task_id='vt-2',
+            ),
+            ReviewTaskScoreRow(
+                task=ReviewTaskRef(id='task-3', text='Задание 3'),
+                number=3,
+                points=2,
+                max_points=3,
+                variant_task_id='vt-3',
+            ),
+        )
+        draft = ReviewDraft(
+            participation_id='p1',
+            task_scores=(
+                ReviewDraftTaskScore(score_key='vt-1', points=5),
+                ReviewDraftTaskScore(score_key='vt-2', comment='Черновик'),
+                ReviewDraftTaskScore(score_key='vt-3', points_cleared=True),
+            ),
+        )
+
+        applied = service.apply_review_draft(rows, draft)
+
+        self.assertEqual(applied[0].points, 2)
+        self.assertEqual(applied[0].comment, 'Было')
+        self.assertEqual(applied[1].points, 0)
+        self.assertEqual(applied[1].comment, 'Черновик')
+        self.assertIsNone(applied[2].points)
+        self.assertEqual(service.apply_review_draft(rows, None), rows)
+
+
+class ReviewQueueTests(TestCase):
+    def queue(self, *graded):
+        return ReviewQueue(
+            event_id='event-1',
+            entries=tuple(
+                ReviewQueueEntry(f'p{index}', flag)
+                for index, flag in enumerate(graded, start=1)
+            ),
+        )
+
+    def test_save_navigation_skips_graded_works_after_current(self):
+        navigation = self.queue(False, False, True, False).save_navigation('p1')
+
+        self.assertEqual(navigation.event_id, 'event-1')
+        self.assertEqual(navigation.next_participation_id, 'p2')
+        navigation = self.queue(True, True, True, False).save_navigation('p2')
+        self.assertEqual(navigation.next_participation_id, 'p4')
+        self.assertFalse(navigation.all_checked)
+
+    def test_save_navigation_falls_back_to_next_and_reports_end(self):
+        queue = self.queue(True, True, True)
+
+        self.assertEqual(queue.save_navigation('p1').next_participation_id, 'p2')
+        self.assertTrue(queue.save_navigation('p3').all_checked)
+        self.assertEqual(queue.save_navigation('missing').next_participation_id, 'p1')
+
+    def test_with_graded_returns_updated_copy(self):
+        queue = self.queue(False, False)
+
+        updated = queue.with_graded('p1')
+
+        self.assertFalse(queue.entries[0].graded)
+        self.assertTrue(updated.entries[0].graded)
+        self.assertEqual(updated.index_of('p2'), 1)
+        self.assertEqual(updated.index_of('p3'), -1)
@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from unittest import TestCase
 
 from core_logic.entities.document import Document, DocumentSection
@@ -69,6 +70,23 @@ class SectionedDocumentContentRendererTests(TestCase):
 
         self.assertEqual(content, '<latex:header>\n\n<latex:task_list>')
 
+    def test_reports_section_rendering_to_stage_timer(self):
+        stage_timer = FakeStageTimer()
+        renderer = SectionedDocumentContentRenderer(
+            section_renderer_registry=FakeSectionRendererRegistry(),
+            stage_timer=stage_timer,
+        )
+
+        renderer.render_content(DocumentRenderRequest(
+            document=Document(
+                title='Контрольная',
+                sections=[DocumentSection(section_type='header')],
+            ),
+            render_target=RenderTarget(renderer_type='html'),
+        ))
+
+        self.assertEqual(stage_timer.stages, ['document.sections'])
+
 
 class WrappedDocumentContentRendererTests(TestCase):
     def test_wraps_rendered_body_content(self):
@@ -124,3 +142,13 @@ class FakeDocumentWrapper:
     def wrap_content(self, request):
         self.request = request
         return f'<html>{request.body_content}</html>'
+
+
+class FakeStageTimer:
+    def __init__(self):
+        self.stages = []
+
+    @contextmanager
+    def measure(self, stage):
+        yield
+        self.stages.append(stage)
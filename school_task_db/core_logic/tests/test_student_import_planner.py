@@ -149,7 +149,11 @@ class StudentImportPlannerTests(TestCase):
 
 
 class _SnapshotRepo:
-    def get_student_import_snapshot(self):
+    def __init__(self):
+        self.rows = None
+
+    def get_student_import_snapshot(self, rows):
+        self.rows = rows
         return StudentImportSnapshot()
 
 
@@ -191,10 +195,11 @@ class ImportStudentsUseCaseTests(TestCase):
         self.assertEqual(transaction_manager.entered, 0)
 
     def test_applies_plan_inside_transaction(self):
+        snapshot_repo = _SnapshotRepo()
         command_repo = _CommandRepo()
         transaction_manager = _TransactionManager()
         use_case = ImportStudentsUseCase(
-            snapshot_repo=_SnapshotRepo(),
+            snapshot_repo=snapshot_repo,
             command_repo=command_repo,
             transaction_manager=transaction_manager,
         )
@@ -204,5 +209,6 @@ class ImportStudentsUseCaseTests(TestCase):
         )
 
         self.assertEqual(result.status, 'imported')
+        self.assertEqual(snapshot_repo.rows, (_row(),))
         self.assertIsNotNone(command_repo.plan)
         self.assertEqual(transaction_manager.entered, 1)
@@ -2,6 +2,7 @@ from unittest import TestCase
 
 from core_logic.entities.task import (
     SelectOption,
+    SimilarTask,
     TaskClassificationOptions,
     TaskDetailGroup,
     TaskDetailTask,
@@ -44,6 +45,23 @@ class FakeTaskRepository:
         return [SelectOption(id='subtopic-1', name='Кинематика')]
 
 
+class FakeTaskSimilarityRepository:
+    def __init__(self):
+        self.calls = []
+        self.similar = (
+            SimilarTask(
+                pk='task-2',
+                short_uuid='ef56',
+                text='Задача',
+                similarity=0.9,
+            ),
+        )
+
+    def get_similar_tasks(self, task_id, *, threshold, limit):
+        self.calls.append((task_id, threshold, limit))
+        return self.similar
+
+
 class FakeTaskClassificationRepository:
     def __init__(self):
         self.topic_id = None
@@ -68,6 +86,20 @@ class TaskDetailAndReferenceUseCaseTests(TestCase):
         self.assertEqual(repo.detail_task_id, 'task-1')
         self.assertEqual(detail.task_groups, repo.groups)
 
+    def test_detail_use_case_adds_similar_tasks(self):
+        similarity_repo = FakeTaskSimilarityRepository()
+        use_case = GetTaskDetailUseCase(
+            task_repo=FakeTaskRepository(),
+            similarity_repo=similarity_repo,
+        )
+
+        detail = use_case.execute('task-1')
+
+        self.assertEqual(detail.similar_tasks, similarity_repo.similar)
+        self.assertEqual(similarity_repo.calls, [('task-1', 0.5, 5)])
+        self.assertTrue(detail.similar_tasks[0].is_likely_duplicate)
+        self.assertEqual(detail.similar_tasks[0].similarity_percent, 90)
+
     def test_detail_use_case_returns_empty_data_for_missing_task(self):
         repo = FakeTaskRepository()
         use_case = GetTaskDetailUseCase(task_repo=repo)
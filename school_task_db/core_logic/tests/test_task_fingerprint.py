@@ -0,0 +1,59 @@
+from unittest import TestCase
+
+from core_logic.value_objects.task_fingerprint import (
+    LSH_BANDS,
+    MINHASH_PERMUTATIONS,
+    normalize_task_text,
+    task_text_fingerprint,
+)
+
+TASK_TEXT = (
+    'Тело массой $m = 2\\,кг$ движется со скоростью 3,5 м/с. '
+    'Найдите кинетическую энергию тела $E = \\frac{mv^2}{2}$.'
+)
+
+
+class TaskFingerprintTests(TestCase):
+    def test_normalizes_case_spacing_and_formula_layout(self):
+        self.assertEqual(
+            normalize_task_text('Ёмкость  $C \\cdot U = q$, при t=2,5 с.'),
+            'емкость c*u=q при t=2.5 с',
+        )
+        self.assertEqual(
+            normalize_task_text('$E = m v^2 / 2$'),
+            normalize_task_text('$E=mv^2/2$'),
+        )
+
+    def test_retyped_text_is_near_duplicate(self):
+        retyped = (
+            'Тело массой $m=2$ кг движется со скоростью 3.5 м/с. '
+            'Найдите кинетическую энергию тела $E=\\frac{m v^2}{2}$'
+        )
+
+        original = task_text_fingerprint(TASK_TEXT)
+        copy = task_text_fingerprint(retyped)
+
+        self.assertEqual(len(original.signature), MINHASH_PERMUTATIONS)
+        self.assertEqual(len(original.buckets), LSH_BANDS)
+        self.assertGreaterEqual(original.similarity(copy), 0.8)
+        self.assertTrue(set(original.buckets) & set(copy.buckets))
+
+    def test_unrelated_text_shares_no_buckets(self):
+        original = task_text_fingerprint(TASK_TEXT)
+        other = task_text_fingerprint(
+            'Определите сопротивление проводника, если напряжение на нём '
+            '12 В, а сила тока 2 А.',
+        )
+
+        self.assertLess(original.similarity(other), 0.2)
+        self.assertFalse(set(original.buckets) & set(other.buckets))
+
+    def test_identical_text_has_identical_fingerprint(self):
+        self.assertEqual(
+            task_text_fingerprint(TASK_TEXT),
+            task_text_fingerprint(TASK_TEXT.upper()),
+        )
+
+    def test_short_text_has_no_fingerprint(self):
+        self.assertIsNone(task_text_fingerprint('См. рисунок'))
+        self.assertIsNone(task_text_fingerprint(''))
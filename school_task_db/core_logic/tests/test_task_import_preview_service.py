@@ -1,5 +1,6 @@
 from unittest import TestCase
 
+from core_logic.entities.task import SimilarTask
 from core_logic.entities.task_import import (
     TaskImportClassificationKey,
     TaskImportPreviewFacts,
@@ -106,6 +107,35 @@ class TaskImportPreviewServiceTests(TestCase):
             },
         )
 
+    def test_lookup_carries_task_texts_and_reports_likely_duplicates(self):
+        payload = self._payload()
+        payload['tasks'].append({'text': 'Вторая задача без UUID'})
+        similar = SimilarTask(
+            pk='existing-task',
+            short_uuid='ab12',
+            text='Задача',
+            similarity=0.91,
+        )
+
+        lookup = self.service.build_lookup(payload)
+        preview = self.service.build(
+            payload,
+            TaskImportPreviewFacts(similar_tasks={'#2': (similar,)}),
+        )
+
+        self.assertEqual(
+            lookup.task_texts,
+            ((self.TASK_ID, 'Задача'), ('#2', 'Вторая задача без UUID')),
+        )
+        self.assertEqual(len(preview['likely_duplicates']), 1)
+        duplicate = preview['likely_duplicates'][0]
+        self.assertEqual(duplicate['task'], '#2')
+        self.assertEqual(duplicate['similar_task_id'], 'existing-task')
+        self.assertEqual(
+            duplicate['message'],
+            'Задание #2 похоже на существующее [ab12] (сходство 91%)',
+        )
+
     def _payload(self):
         return {
             'sources': [],
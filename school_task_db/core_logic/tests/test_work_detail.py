@@ -239,6 +239,14 @@ class FakeWorkRepository:
         self.remedial_sheet_variant_id = variant_id
         return self.remedial_sheet_source
 
+    def get_remedial_sheet_sources(self, variant_ids):
+        self.remedial_sheet_variant_ids = tuple(variant_ids)
+        return {
+            variant_id: self.remedial_sheet_source
+            for variant_id in self.remedial_sheet_variant_ids
+            if variant_id != 'missing'
+        }
+
     def get_orphan_variants(self):
         return self.orphan_variants
 
@@ -546,6 +554,17 @@ class WorkDetailTests(TestCase):
         result = use_case.execute()
 
         self.assertEqual(result.analog_group_options, ('group-1',))
+        self.assertIsNone(result.work)
+
+    def test_get_work_form_data_use_case_loads_edited_work(self):
+        repo = FakeWorkRepository()
+        use_case = GetWorkFormDataUseCase(work_read_repo=repo)
+
+        result = use_case.execute(repo.work_detail.pk)
+        missing = use_case.execute('missing-work')
+
+        self.assertEqual(result.work, repo.work_detail)
+        self.assertIsNone(missing.work)
 
     def test_get_variant_detail_use_case_builds_detail_context_data(self):
         repo = FakeWorkRepository()
@@ -595,6 +614,18 @@ class WorkDetailTests(TestCase):
         self.assertEqual(result.original_tasks[0].status, 'partial')
         self.assertEqual(result.new_tasks, repo.remedial_sheet_source.new_tasks)
 
+    def test_get_remedial_sheet_data_use_case_loads_many_variants_at_once(self):
+        repo = FakeWorkRepository()
+        use_case = GetRemedialSheetDataUseCase(remedial_repo=repo)
+
+        result = use_case.execute_many(['variant-1', 'missing', 'variant-1'])
+
+        self.assertEqual(repo.remedial_sheet_variant_ids, ('variant-1', 'missing'))
+        self.assertIsNone(repo.remedial_sheet_variant_id)
+        self.assertEqual(list(result), ['variant-1', 'missing'])
+        self.assertEqual(result['variant-1'].mark.score, 3)
+        self.assertEqual(result['missing'].status, 'not_found')
+
     def test_get_remedial_sheet_data_use_case_handles_missing_variant(self):
         repo = FakeWorkRepository()
         repo.remedial_sheet_source = None
@@ -8,6 +8,10 @@ from core_logic.interfaces.event_participation_repo import (
     IEventParticipationRepository,
 )
 from core_logic.interfaces.event_read_repo import IEventReadRepository
+from core_logic.services.event_service import (
+    VARIANT_DISTRIBUTIONS,
+    EventService,
+)
 
 
 @dataclass(frozen=True)
@@ -64,3 +68,61 @@ class AssignEventVariantsUseCase:
                 assignments=assignments,
             )
         )
+
+
+@dataclass(frozen=True)
+class DistributeEventVariantsRequest:
+    event_id: str
+    mode: str
+
+
+class DistributeEventVariantsUseCase:
+    """Assign all present participants at once, evenly or at random."""
+
+    def __init__(
+        self,
+        event_repo: IEventReadRepository,
+        event_participation_repo: IEventParticipationRepository,
+        event_service: EventService,
+    ):
+        self.event_repo = event_repo
+        self.event_participation_repo = event_participation_repo
+        self.event_service = event_service
+
+    def execute(
+        self,
+        request: DistributeEventVariantsRequest,
+    ) -> AssignEventVariantsResult:
+        if request.mode not in VARIANT_DISTRIBUTIONS:
+            return AssignEventVariantsResult(
+                assigned_count=0,
+                status='invalid_mode',
+            )
+        event = self.event_repo.get_by_id(request.event_id)
+        if event is None:
+            return AssignEventVariantsResult(
+                assigned_count=0,
+                status='not_found',
+            )
+        if not event.requires_variants:
+            return AssignEventVariantsResult(
+                assigned_count=0,
+                status='variants_not_required',
+            )
+        variants = self.event_repo.get_available_variants(request.event_id)
+        if not variants:
+            return AssignEventVariantsResult(
+                assigned_count=0,
+                status='no_variants',
+            )
+        assignments = self.event_service.distribute_variants(
+            self.event_repo.get_detail_participations(request.event_id),
+            variants,
+            request.mode,
+        )
+        return AssignEventVariantsResult(
+            assigned_count=self.event_participation_repo.assign_variants(
+                event_id=request.event_id,
+                assignments=assignments,
+            )
+        )
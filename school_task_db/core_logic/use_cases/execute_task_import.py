@@ -35,9 +35,12 @@ class ExecuteTaskImportUseCase:
         self.clock = clock
 
     def execute(self, request: TaskImportRequest) -> TaskImportResult:
-        validation = self.validate_json_use_case.execute(
-            ValidateTaskImportJsonRequest(data=request.data),
-        )
+        # Previewed uploads arrive with the validation of that preview.
+        validation = request.validation
+        if validation is None:
+            validation = self.validate_json_use_case.execute(
+                ValidateTaskImportJsonRequest(data=request.data),
+            )
         if not validation.is_valid:
             return TaskImportResult(
                 status='error',
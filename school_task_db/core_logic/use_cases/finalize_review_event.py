@@ -3,6 +3,9 @@
 from dataclasses import dataclass
 
 from core_logic.entities.review import ReviewEventRef
+from core_logic.interfaces.attempt_snapshot_repo import (
+    IAttemptSnapshotRepository,
+)
 from core_logic.interfaces.review_workflow_repo import IReviewWorkflowRepository
 
 
@@ -12,8 +15,15 @@ class FinalizeReviewEventRequest:
 
 
 class FinalizeReviewEventUseCase:
-    def __init__(self, review_repo: IReviewWorkflowRepository):
+    def __init__(
+        self,
+        review_repo: IReviewWorkflowRepository,
+        attempt_snapshot_repo: IAttemptSnapshotRepository | None = None,
+    ):
         self.review_repo = review_repo
+        self.attempt_snapshot_repo = attempt_snapshot_repo
 
     def execute(self, request: FinalizeReviewEventRequest) -> ReviewEventRef:
+        if self.attempt_snapshot_repo is not None:
+            self.attempt_snapshot_repo.capture_event_marks(request.event_id)
         return self.review_repo.finalize_event(request.event_id)
@@ -1,6 +1,7 @@
 """Build data for checking a student's work."""
 
 from core_logic.entities.review import ParticipationReviewData
+from core_logic.interfaces.review_draft_repo import IReviewDraftRepository
 from core_logic.interfaces.review_workflow_repo import IReviewWorkflowRepository
 from core_logic.interfaces.review_task_repo import IReviewTaskRepository
 from core_logic.services.review_service import ReviewService
@@ -12,10 +13,12 @@ class GetParticipationReviewUseCase:
         review_repo: IReviewWorkflowRepository,
         review_task_repo: IReviewTaskRepository,
         review_service: ReviewService,
+        draft_repo: IReviewDraftRepository | None = None,
     ):
         self.review_repo = review_repo
         self.review_task_repo = review_task_repo
         self.review_service = review_service
+        self.draft_repo = draft_repo
 
     def execute(self, participation_id: str) -> ParticipationReviewData:
         participation = self.review_repo.get_participation(participation_id)
@@ -40,17 +43,27 @@ class GetParticipationReviewUseCase:
             current_participation_id=participation_id,
         )
 
-        return ParticipationReviewData(
-            participation=participation,
-            mark=mark,
-            tasks_with_scores=self.review_service.build_task_score_rows(
+        draft = None
+        if self.draft_repo is not None:
+            draft = self.draft_repo.get_draft(participation_id)
+        tasks_with_scores = self.review_service.apply_review_draft(
+            self.review_service.build_task_score_rows(
                 variant_tasks=assessable_variant_tasks,
                 existing_scores=mark.task_scores,
             ),
+            draft,
+        )
+
+        return ParticipationReviewData(
+            participation=participation,
+            mark=mark,
+            tasks_with_scores=tasks_with_scores,
             typical_comments=self.review_repo.get_typical_comments(limit=10),
             previous_participation=navigation.previous_participation,
             next_participation=navigation.next_participation,
             current_position=navigation.current_position,
             total_positions=navigation.total_positions,
             navigation_progress=navigation.navigation_progress,
+            grading_rules=self.review_service.grading_rules(tasks_with_scores),
+            draft=draft,
         )
@@ -1,5 +1,7 @@
 """Build data for rendering a remedial sheet."""
 
+from typing import Iterable
+
 from core_logic.entities.work import RemedialSheetData
 from core_logic.interfaces.remedial_sheet_repo import IRemedialSheetRepository
 from core_logic.services.remedial_sheet_service import RemedialSheetService
@@ -15,7 +17,23 @@ class GetRemedialSheetDataUseCase:
         self.sheet_service = sheet_service or RemedialSheetService()
 
     def execute(self, variant_id: str) -> RemedialSheetData:
-        source = self.remedial_repo.get_remedial_sheet_source(variant_id)
+        return self._sheet_data(
+            self.remedial_repo.get_remedial_sheet_source(variant_id),
+        )
+
+    def execute_many(
+        self,
+        variant_ids: Iterable[str],
+    ) -> dict[str, RemedialSheetData]:
+        """Build sheets of many variants from one batched source load."""
+        variant_ids = tuple(dict.fromkeys(map(str, variant_ids)))
+        sources = self.remedial_repo.get_remedial_sheet_sources(variant_ids)
+        return {
+            variant_id: self._sheet_data(sources.get(variant_id))
+            for variant_id in variant_ids
+        }
+
+    def _sheet_data(self, source) -> RemedialSheetData:
         if source is None:
             return RemedialSheetData(
                 variant=None,
@@ -3,20 +3,36 @@
 from dataclasses import dataclass
 
 from core_logic.entities.review import ReviewSaveNavigation
+from core_logic.interfaces.review_queue_cache import IReviewQueueCache
 from core_logic.interfaces.review_workflow_repo import IReviewWorkflowRepository
 
 
 @dataclass(frozen=True)
 class GetReviewSaveNavigationRequest:
     participation_id: str
+    event_id: str = ''
+    graded: bool = True
 
 
 class GetReviewSaveNavigationUseCase:
-    def __init__(self, review_repo: IReviewWorkflowRepository):
+    def __init__(
+        self,
+        review_repo: IReviewWorkflowRepository,
+        review_queue_cache: IReviewQueueCache | None = None,
+    ):
         self.review_repo = review_repo
+        self.review_queue_cache = review_queue_cache
 
     def execute(
         self,
         request: GetReviewSaveNavigationRequest,
     ) -> ReviewSaveNavigation:
-        return self.review_repo.get_save_navigation(request.participation_id)
+        if self.review_queue_cache is None or not request.event_id:
+            return self.review_repo.get_save_navigation(request.participation_id)
+
+        queue = self.review_queue_cache.get(request.event_id)
+        if queue is None or queue.index_of(request.participation_id) < 0:
+            queue = self.review_repo.get_review_queue(request.event_id)
+        queue = queue.with_graded(request.participation_id, request.graded)
+        self.review_queue_cache.set(queue)
+        return queue.save_navigation(request.participation_id)
@@ -0,0 +1,37 @@
+"""Build search-as-you-type suggestions."""
+
+from dataclasses import dataclass
+
+from core_logic.entities.core import SearchSuggestionsData
+from core_logic.interfaces.search_suggestion_index import (
+    ISearchSuggestionIndex,
+)
+from core_logic.value_objects.search_terms import (
+    MIN_SUGGESTION_QUERY_LENGTH,
+    search_terms,
+)
+
+DEFAULT_SUGGESTION_LIMIT = 10
+MAX_SUGGESTION_LIMIT = 25
+
+
+@dataclass(frozen=True)
+class SearchSuggestionsRequest:
+    raw_query: str = ''
+    limit: int = DEFAULT_SUGGESTION_LIMIT
+
+
+class GetSearchSuggestionsUseCase:
+    def __init__(self, suggestion_index: ISearchSuggestionIndex):
+        self.suggestion_index = suggestion_index
+
+    def execute(self, request: SearchSuggestionsRequest) -> SearchSuggestionsData:
+        raw_query = request.raw_query.strip()
+        prefixes = search_terms(raw_query)
+        if sum(len(prefix) for prefix in prefixes) < MIN_SUGGESTION_QUERY_LENGTH:
+            return SearchSuggestionsData(query=raw_query)
+        limit = min(max(request.limit, 1), MAX_SUGGESTION_LIMIT)
+        return SearchSuggestionsData(
+            query=raw_query,
+            suggestions=self.suggestion_index.suggest(prefixes, limit),
+        )
@@ -1,12 +1,26 @@
 """Build task detail screen data."""
 
+from typing import Optional
+
 from core_logic.entities.task import TaskDetailData
 from core_logic.interfaces.task_read_repo import ITaskReadRepository
+from core_logic.interfaces.task_similarity_repo import (
+    ITaskSimilarityRepository,
+)
+from core_logic.value_objects.task_fingerprint import (
+    SIMILAR_TASK_THRESHOLD,
+    SIMILAR_TASKS_LIMIT,
+)
 
 
 class GetTaskDetailUseCase:
-    def __init__(self, task_repo: ITaskReadRepository):
+    def __init__(
+        self,
+        task_repo: ITaskReadRepository,
+        similarity_repo: Optional[ITaskSimilarityRepository] = None,
+    ):
         self.task_repo = task_repo
+        self.similarity_repo = similarity_repo
 
     def execute(self, task_id: str) -> TaskDetailData:
         task = self.task_repo.get_task(task_id)
@@ -16,4 +30,13 @@ class GetTaskDetailUseCase:
         return TaskDetailData(
             task=task,
             task_groups=self.task_repo.get_task_detail_groups(task_id),
+            similar_tasks=(
+                self.similarity_repo.get_similar_tasks(
+                    task_id,
+                    threshold=SIMILAR_TASK_THRESHOLD,
+                    limit=SIMILAR_TASKS_LIMIT,
+                )
+                if self.similarity_repo is not None
+                else ()
+            ),
         )
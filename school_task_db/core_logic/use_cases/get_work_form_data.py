@@ -8,9 +8,16 @@ class GetWorkFormDataUseCase:
     def __init__(self, work_read_repo: IWorkReadRepository):
         self.work_read_repo = work_read_repo
 
-    def execute(self) -> WorkFormData:
+    def execute(self, work_id: str | None = None) -> WorkFormData:
+        # The edit form needs only the work header; the full detail use
+        # case would also load variants, spec rows and content blocks.
         return WorkFormData(
             analog_group_options=(
                 self.work_read_repo.get_work_form_analog_group_options()
             ),
+            work=(
+                self.work_read_repo.get_work_detail(work_id)
+                if work_id is not None
+                else None
+            ),
         )
@@ -14,6 +14,7 @@ from core_logic.interfaces.participation_grading_repo import (
 from core_logic.interfaces.attempt_snapshot_repo import (
     IAttemptSnapshotRepository,
 )
+from core_logic.interfaces.review_draft_repo import IReviewDraftRepository
 from core_logic.interfaces.review_task_repo import IReviewTaskRepository
 from core_logic.interfaces.transaction_manager import ITransactionManager
 from core_logic.services.grading_service import GradingService
@@ -56,12 +57,14 @@ class GradeStudentWorkUseCase:
         grading_service: GradingService,
         transaction_manager: ITransactionManager,
         attempt_snapshot_repo: IAttemptSnapshotRepository | None = None,
+        draft_repo: IReviewDraftRepository | None = None,
     ):
         self.grading_repo = grading_repo
         self.review_task_repo = review_task_repo
         self.grading_service = grading_service
         self.transaction_manager = transaction_manager
         self.attempt_snapshot_repo = attempt_snapshot_repo
+        self.draft_repo = draft_repo
 
     def execute(self, request: GradeStudentWorkRequest) -> GradeStudentWorkResult:
         checked_by = self.grading_service.checked_by_name(
@@ -132,6 +135,8 @@ class GradeStudentWorkUseCase:
                     grade.mark_id,
                 )
                 attempt_snapshot_id = attempt_snapshot.pk
+            if self.draft_repo is not None:
+                self.draft_repo.delete_draft(request.participation_id)
             return GradeStudentWorkResult(
                 status='saved',
                 grade=grade,
@@ -44,5 +44,5 @@ class ImportStudentsUseCase:
     def _build_plan(self, request: ImportStudentsRequest) -> StudentImportPlan:
         return self.planner.build(
             request.rows,
-            self.snapshot_repo.get_student_import_snapshot(),
+            self.snapshot_repo.get_student_import_snapshot(request.rows),
         )
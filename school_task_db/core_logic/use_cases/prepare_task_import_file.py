@@ -9,6 +9,8 @@ from core_logic.entities.task_import import (
     TaskImportFileResult,
     TaskImportRequest,
 )
+from core_logic.interfaces.task_import import ITaskImportArtifactStore
+from core_logic.value_objects.task_import import task_import_content_hash
 
 
 MAX_TASK_IMPORT_FILE_SIZE = 50 * 1024 * 1024
@@ -47,32 +49,52 @@ class PrepareTaskImportFileUseCase:
             filename=request.filename,
             file_size=request.file_size,
             data=data,
+            content_hash=task_import_content_hash(request.content),
         )
 
 
 class PrepareTaskImportExecutionSubmissionUseCase:
-    def __init__(self):
+    def __init__(
+        self,
+        artifact_store: ITaskImportArtifactStore | None = None,
+    ):
         self.file_use_case = PrepareTaskImportFileUseCase()
+        self.artifact_store = artifact_store
 
     def execute(
         self,
         request: TaskImportExecutionSubmissionRequest,
     ) -> TaskImportExecutionSubmissionResult:
-        prepared_file = self.file_use_case.execute(
-            TaskImportFileRequest(
-                filename=request.filename,
-                file_size=request.file_size,
-                content=request.content,
-            )
+        # A file previewed moments ago is taken from its artifact: the
+        # upload is neither parsed nor validated a second time.
+        artifact = (
+            self.artifact_store.load(task_import_content_hash(request.content))
+            if self.artifact_store is not None
+            else None
         )
-        if not prepared_file.success:
-            return TaskImportExecutionSubmissionResult(error=prepared_file.error)
+        if artifact is not None:
+            data = artifact.data
+            validation = artifact.validation
+        else:
+            prepared_file = self.file_use_case.execute(
+                TaskImportFileRequest(
+                    filename=request.filename,
+                    file_size=request.file_size,
+                    content=request.content,
+                )
+            )
+            if not prepared_file.success:
+                return TaskImportExecutionSubmissionResult(
+                    error=prepared_file.error,
+                )
+            data = prepared_file.data
+            validation = None
 
         return TaskImportExecutionSubmissionResult(
             import_request=TaskImportRequest(
-                data=prepared_file.data,
-                filename=prepared_file.filename,
-                file_size=prepared_file.file_size,
+                data=data,
+                filename=request.filename,
+                file_size=request.file_size,
                 mode=_first(request.form_data, 'mode', 'update'),
                 dry_run=_first(request.form_data, 'dry_run') == 'true',
                 create_missing=_first(
@@ -80,6 +102,7 @@ class PrepareTaskImportExecutionSubmissionUseCase:
                     'create_missing',
                     'true',
                 ) == 'true',
+                validation=validation,
             ),
         )
 
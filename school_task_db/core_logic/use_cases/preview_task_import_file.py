@@ -1,10 +1,12 @@
 """Validate an uploaded task import file and build a dry-run preview."""
 
 from core_logic.entities.task_import import (
+    TaskImportArtifact,
     TaskImportFileRequest,
     TaskImportPreviewRequest,
     TaskImportValidationPreviewResult,
 )
+from core_logic.interfaces.task_import import ITaskImportArtifactStore
 from core_logic.use_cases.prepare_task_import_file import (
     PrepareTaskImportFileUseCase,
 )
@@ -21,6 +23,7 @@ class PreviewTaskImportFileUseCase:
         preview_task_import_use_case: PreviewTaskImportUseCase,
         prepare_file_use_case: PrepareTaskImportFileUseCase | None = None,
         validate_json_use_case: ValidateTaskImportJsonUseCase | None = None,
+        artifact_store: ITaskImportArtifactStore | None = None,
     ):
         self.preview_task_import_use_case = preview_task_import_use_case
         self.prepare_file_use_case = (
@@ -29,6 +32,7 @@ class PreviewTaskImportFileUseCase:
         self.validate_json_use_case = (
             validate_json_use_case or ValidateTaskImportJsonUseCase()
         )
+        self.artifact_store = artifact_store
 
     def execute(
         self,
@@ -42,9 +46,18 @@ class PreviewTaskImportFileUseCase:
                 error=prepared_file.error,
             )
 
-        validation = self.validate_json_use_case.execute(
+        validation_data = self.validate_json_use_case.execute(
             ValidateTaskImportJsonRequest(data=prepared_file.data),
-        ).to_dict()
+        )
+        if validation_data.is_valid and self.artifact_store is not None:
+            self.artifact_store.save(
+                TaskImportArtifact(
+                    content_hash=prepared_file.content_hash,
+                    data=prepared_file.data,
+                    validation=validation_data,
+                )
+            )
+        validation = validation_data.to_dict()
 
         preview = None
         if validation['is_valid']:
@@ -54,6 +67,10 @@ class PreviewTaskImportFileUseCase:
             preview = preview_result.preview
             if not preview_result.success:
                 validation['warnings'].append(preview_result.warning)
+            validation['warnings'].extend(
+                duplicate['message']
+                for duplicate in (preview or {}).get('likely_duplicates', ())
+            )
 
         return TaskImportValidationPreviewResult(
             filename=prepared_file.filename,
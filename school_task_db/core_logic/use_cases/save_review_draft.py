@@ -0,0 +1,47 @@
+"""Autosave changed task scores of a work under review."""
+
+from dataclasses import dataclass
+from typing import Mapping, Optional
+
+from core_logic.entities.review import ReviewDraft
+from core_logic.interfaces.review_draft_repo import IReviewDraftRepository
+from core_logic.services.review_service import ReviewService
+
+
+@dataclass(frozen=True)
+class SaveReviewDraftRequest:
+    participation_id: str
+    data: Mapping[str, object]
+
+
+@dataclass(frozen=True)
+class SaveReviewDraftResult:
+    status: str
+    draft: Optional[ReviewDraft] = None
+    errors: tuple[str, ...] = ()
+
+
+class SaveReviewDraftUseCase:
+    def __init__(
+        self,
+        draft_repo: IReviewDraftRepository,
+        review_service: ReviewService,
+    ):
+        self.draft_repo = draft_repo
+        self.review_service = review_service
+
+    def execute(self, request: SaveReviewDraftRequest) -> SaveReviewDraftResult:
+        try:
+            task_scores = self.review_service.parse_draft_patch(request.data)
+        except ValueError as error:
+            return SaveReviewDraftResult(status='invalid', errors=(str(error),))
+        draft = self.draft_repo.merge_draft(
+            request.participation_id,
+            task_scores,
+        )
+        if draft is None:
+            return SaveReviewDraftResult(
+                status='not_found',
+                errors=('Участие не найдено',),
+            )
+        return SaveReviewDraftResult(status='saved', draft=draft)
@@ -0,0 +1,74 @@
+"""Dense points/max-points matrices over integer-coded rows and columns."""
+
+from array import array
+from typing import Iterable, Optional
+
+
+def _zeros(size: int) -> array:
+    return array('d', bytes(8 * size))
+
+
+class ScoreMatrix:
+    """Row-major grouped sums of points and max points.
+
+    Rows and columns are integer codes assigned by the caller (for example,
+    student and topic positions in the report), so aggregation is a pair of
+    flat array additions instead of per-cell objects and dict lookups.
+    """
+
+    __slots__ = ('row_count', 'column_count', 'points', 'max_points')
+
+    def __init__(self, row_count: int, column_count: int):
+        self.row_count = row_count
+        self.column_count = column_count
+        self.points = _zeros(row_count * column_count)
+        self.max_points = _zeros(row_count * column_count)
+
+    @classmethod
+    def from_codes(
+        cls,
+        row_count: int,
+        column_count: int,
+        row_codes: Iterable[int],
+        column_codes: Iterable[int],
+        points: Iterable[float],
+        max_points: Iterable[float],
+    ) -> 'ScoreMatrix':
+        matrix = cls(row_count, column_count)
+        matrix_points = matrix.points
+        matrix_max_points = matrix.max_points
+        for row, column, value, max_value in zip(
+            row_codes,
+            column_codes,
+            points,
+            max_points,
+        ):
+            index = row * column_count + column
+            matrix_points[index] += value
+            matrix_max_points[index] += max_value
+        return matrix
+
+    def add(self, row: int, column: int, points: float, max_points: float):
+        index = row * self.column_count + column
+        self.points[index] += points
+        self.max_points[index] += max_points
+
+    def row_slices(self, row: int) -> tuple[array, array]:
+        start = row * self.column_count
+        end = start + self.column_count
+        return self.points[start:end], self.max_points[start:end]
+
+    def column_totals(self) -> tuple[list[float], list[float]]:
+        points = [0.0] * self.column_count
+        max_points = [0.0] * self.column_count
+        for row in range(self.row_count):
+            row_points, row_max_points = self.row_slices(row)
+            points = [a + b for a, b in zip(points, row_points)]
+            max_points = [a + b for a, b in zip(max_points, row_max_points)]
+        return points, max_points
+
+
+def percent(points: float, max_points: float) -> Optional[int]:
+    if max_points <= 0:
+        return None
+    return round(points / max_points * 100)
@@ -0,0 +1,13 @@
+"""Word normalization shared by search suggestions and their index."""
+
+import re
+
+MIN_SUGGESTION_QUERY_LENGTH = 2
+
+_WORD_PATTERN = re.compile(r'\w+')
+
+
+def search_terms(text: object) -> tuple[str, ...]:
+    """Return case-folded words of ``text`` with «ё» folded into «е»."""
+    folded = str(text or '').casefold().replace('ё', 'е')
+    return tuple(_WORD_PATTERN.findall(folded))
@@ -0,0 +1,150 @@
+"""MinHash fingerprints of task text for near-duplicate lookup.
+
+Text is normalized (case, ё, LaTeX spacing and delimiters, decimal commas,
+spaces around operators) and split into overlapping character shingles.
+A MinHash signature estimates the Jaccard similarity of two shingle sets;
+locality-sensitive hashing splits it into bands so that likely duplicates
+share at least one band bucket and can be found by an index lookup instead
+of comparing every pair of tasks.
+"""
+
+import hashlib
+import random
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Optional
+
+SHINGLE_SIZE = 5
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 16
+LSH_ROWS = MINHASH_PERMUTATIONS // LSH_BANDS
+# Shorter texts ("См. рисунок") collide without being duplicates.
+MIN_FINGERPRINT_LENGTH = 24
+
+DUPLICATE_TASK_THRESHOLD = 0.8
+SIMILAR_TASK_THRESHOLD = 0.5
+SIMILAR_TASKS_LIMIT = 5
+
+_MERSENNE_PRIME = (1 << 61) - 1
+# Stored signatures depend on these coefficients: changing the seed requires
+# rebuilding every fingerprint.
+_PERMUTATION_RANDOM = random.Random(20250601)
+_PERMUTATIONS = tuple(
+    (
+        _PERMUTATION_RANDOM.randrange(1, _MERSENNE_PRIME),
+        _PERMUTATION_RANDOM.randrange(0, _MERSENNE_PRIME),
+    )
+    for _ in range(MINHASH_PERMUTATIONS)
+)
+
+_LATEX_LAYOUT = re.compile(
+    r'\\(?:left|right|displaystyle|quad|qquad|[,;:! ])(?![a-z])',
+)
+_LATEX_SYMBOLS = {
+    r'\cdot': '*',
+    r'\times': '*',
+    r'\div': '/',
+    r'\le': '<=',
+    r'\leq': '<=',
+    r'\ge': '>=',
+    r'\geq': '>=',
+}
+_LATEX_COMMAND = re.compile(r'\\[a-z]+')
+_FORMULA = re.compile(r'\$+([^$]*)\$+')
+_DECIMAL_COMMA = re.compile(r'(?<=\d),(?=\d)')
+_PUNCTUATION_DOT = re.compile(r'(?<!\d)\.|\.(?!\d)')
+_NON_TOKEN = re.compile(r'[^\w.=+\-*/^<>]+')
+_OPERATOR_SPACING = re.compile(r'\s*([=+\-*/^<>])\s*')
+
+
+def normalize_task_text(text) -> str:
+    """Return lowercase word and formula tokens of ``text``.
+
+    Spacing inside formulas is dropped entirely, so ``$E=mv^2/2$`` and
+    ``$E = m v^2 / 2$`` normalize alike.
+    """
+    text = unicodedata.normalize('NFKC', str(text or '')).lower()
+    text = text.replace('ё', 'е')
+    text = _LATEX_LAYOUT.sub(' ', text)
+    text = _FORMULA.sub(
+        lambda match: f' {"".join(_tokens(match[1]).split())} ',
+        text,
+    )
+    text = _OPERATOR_SPACING.sub(r'\1', _tokens(text))
+    return ' '.join(text.split())
+
+
+def _tokens(text):
+    text = _LATEX_COMMAND.sub(
+        lambda match: f' {_LATEX_SYMBOLS.get(match[0], match[0][1:])} ',
+        text,
+    )
+    text = _DECIMAL_COMMA.sub('.', text)
+    text = _PUNCTUATION_DOT.sub(' ', text)
+    return _NON_TOKEN.sub(' ', text.replace('_', ' '))
+
+
+@dataclass(frozen=True)
+class TaskTextFingerprint:
+    signature: tuple[int, ...]
+    buckets: tuple[int, ...] = field(default_factory=tuple)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'signature', tuple(self.signature))
+        if not self.buckets:
+            object.__setattr__(
+                self,
+                'buckets',
+                signature_buckets(self.signature),
+            )
+        object.__setattr__(self, 'buckets', tuple(self.buckets))
+
+    def similarity(self, other: 'TaskTextFingerprint') -> float:
+        return signature_similarity(self.signature, other.signature)
+
+
+def task_text_fingerprint(text) -> Optional[TaskTextFingerprint]:
+    """Return the fingerprint of ``text``, or None when it is too short."""
+    normalized = normalize_task_text(text)
+    if len(normalized) < MIN_FINGERPRINT_LENGTH:
+        return None
+    hashes = {
+        _shingle_hash(normalized[start:start + SHINGLE_SIZE])
+        for start in range(len(normalized) - SHINGLE_SIZE + 1)
+    }
+    return TaskTextFingerprint(
+        signature=tuple(
+            min((a * value + b) % _MERSENNE_PRIME for value in hashes)
+            for a, b in _PERMUTATIONS
+        ),
+    )
+
+
+def signature_buckets(signature) -> tuple[int, ...]:
+    """Return one signed 64-bit bucket key per LSH band."""
+    return tuple(
+        int.from_bytes(
+            hashlib.blake2b(
+                repr((band, *signature[band * LSH_ROWS:(band + 1) * LSH_ROWS]))
+                .encode('ascii'),
+                digest_size=8,
+            ).digest(),
+            'little',
+            signed=True,
+        )
+        for band in range(LSH_BANDS)
+    )
+
+
+def signature_similarity(first, second) -> float:
+    if not first or len(first) != len(second):
+        return 0.0
+    return sum(a == b for a, b in zip(first, second)) / len(first)
+
+
+def _shingle_hash(shingle: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(),
+        'little',
+    )
@@ -1,5 +1,6 @@
 """Task import settings and portable reference values."""
 
+import hashlib
 from dataclasses import dataclass
 from typing import Any
 from uuid import UUID
@@ -30,6 +31,11 @@ TASK_IMPORT_ACTION_UPDATE = 'update'
 TASK_IMPORT_ACTION_SKIP = 'skip'
 
 
+def task_import_content_hash(content: bytes) -> str:
+    """Identify an uploaded import file by its bytes."""
+    return hashlib.sha256(content).hexdigest()
+
+
 class TaskImportConflictError(ValueError):
     """An imported UUID conflicts with an existing object in strict mode."""
 
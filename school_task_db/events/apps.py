@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class EventsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'events'
+
+    def ready(self):
+        from infrastructure.signals import attempt_cache  # noqa: F401
+        from infrastructure.signals import event_cache  # noqa: F401
+        from infrastructure.signals import event_report_cache  # noqa: F401
+        from infrastructure.signals import latest_attempts  # noqa: F401
+        from infrastructure.signals import participation_projections  # noqa: F401
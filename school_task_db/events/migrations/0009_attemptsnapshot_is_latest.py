@@ -0,0 +1,45 @@
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def mark_latest_attempt_snapshots(apps, schema_editor):
+    alias = schema_editor.connection.alias
+    AttemptSnapshot = apps.get_model('events', 'AttemptSnapshot')
+    attempts = AttemptSnapshot.objects.using(alias)
+    latest = attempts.values('participation_id').annotate(
+        latest_revision=Max('revision'),
+    ).values_list('participation_id', 'latest_revision')
+    for participation_id, revision in list(latest):
+        attempts.filter(
+            participation_id=participation_id,
+            revision=revision,
+        ).update(is_latest=True)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('events', '0008_attempttasksnapshot_source_selection_name_snapshot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attemptsnapshot',
+            name='is_latest',
+            field=models.BooleanField(
+                default=False,
+                verbose_name='Последняя ревизия',
+            ),
+        ),
+        migrations.RunPython(
+            mark_latest_attempt_snapshots,
+            migrations.RunPython.noop,
+        ),
+        migrations.AddConstraint(
+            model_name='attemptsnapshot',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(is_latest=True),
+                fields=('participation',),
+                name='unique_latest_attempt_snapshot',
+            ),
+        ),
+    ]
@@ -168,6 +168,7 @@ class AttemptSnapshot(BaseModel):
         verbose_name='Проверка-источник',
     )
     revision = models.PositiveIntegerField('Ревизия')
+    is_latest = models.BooleanField('Последняя ревизия', default=False)
 
     student_id_snapshot = models.CharField('ID ученика (снимок)', max_length=36)
     student_name_snapshot = models.CharField('Ученик (снимок)', max_length=300)
@@ -239,6 +240,12 @@ class AttemptSnapshot(BaseModel):
                 fields=['participation', 'revision'],
                 name='unique_attempt_snapshot_revision',
             ),
+            # Doubles as the partial index behind latest-attempt reads.
+            models.UniqueConstraint(
+                fields=['participation'],
+                condition=models.Q(is_latest=True),
+                name='unique_latest_attempt_snapshot',
+            ),
         ]
 
     def __str__(self):
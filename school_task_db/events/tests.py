@@ -364,6 +364,36 @@ class GradeParticipationViewTests(TestCase):
         self.participation.refresh_from_db()
         self.assertEqual(self.participation.variant, second_variant)
 
+    def test_assign_variants_view_distributes_variants_evenly(self):
+        second_student = Student.objects.create(
+            last_name='Сидоров',
+            first_name='Сидор',
+        )
+        second_participation = EventParticipation.objects.create(
+            event=self.event,
+            student=second_student,
+        )
+        second_variant = Variant.objects.create(
+            work=self.work,
+            number=2,
+            work_name_snapshot=self.work.name,
+        )
+
+        response = self.client.post(
+            reverse('events:assign-variants', args=[self.event.pk]),
+            {'distribute': 'even'},
+        )
+
+        self.assertRedirects(
+            response,
+            reverse('events:assign-variants', args=[self.event.pk]),
+            fetch_redirect_response=False,
+        )
+        self.participation.refresh_from_db()
+        second_participation.refresh_from_db()
+        self.assertEqual(self.participation.variant, self.variant)
+        self.assertEqual(second_participation.variant, second_variant)
+
     def test_assign_variants_view_uses_clean_assignment_form_data(self):
         group = StudentGroup.objects.create(name='9Б')
         group.students.add(self.student)
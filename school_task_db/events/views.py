@@ -9,6 +9,7 @@ from core_logic.use_cases.add_event_participants import (
 )
 from core_logic.use_cases.assign_event_variants import (
     AssignEventVariantsRequest,
+    DistributeEventVariantsRequest,
 )
 from core_logic.use_cases.prepare_event_action_submission import (
     PrepareEventActionSubmissionRequest,
@@ -204,6 +205,23 @@ def assign_variants(request, event_id):
         return redirect('events:detail', pk=event_id)
     event = assignment_data.event
 
+    distribution = request.POST.get('distribute', '')
+    if request.method == 'POST' and distribution:
+        result = container.distribute_event_variants_use_case().execute(
+            DistributeEventVariantsRequest(
+                event_id=str(event_id),
+                mode=distribution,
+            )
+        )
+        if result.status == 'assigned':
+            messages.success(
+                request,
+                f'Варианты распределены: {result.assigned_count}',
+            )
+        else:
+            messages.error(request, 'Не удалось распределить варианты')
+        return redirect('events:assign-variants', event_id=event_id)
+
     if request.method == 'POST':
         form = VariantAssignmentForm(assignment_data, request.POST)
         if form.is_valid():
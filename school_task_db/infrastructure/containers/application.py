@@ -6,6 +6,9 @@ from core_logic.use_cases.get_import_views import (
     GetImportHistoryUseCase,
     GetImportPageUseCase,
 )
+from core_logic.use_cases.get_search_suggestions import (
+    GetSearchSuggestionsUseCase,
+)
 from core_logic.use_cases.get_site_settings import GetSiteSettingsUseCase
 from core_logic.use_cases.save_site_settings import SaveSiteSettingsUseCase
 from infrastructure.forms.core_forms import CoreFormAdapter
@@ -25,6 +28,8 @@ from infrastructure.repositories.django_site_settings_command_repo import (
 from infrastructure.repositories.django_site_settings_query_repo import (
     DjangoSiteSettingsQueryRepository,
 )
+from infrastructure.services.request_profiling import request_profile_store
+from infrastructure.services.search_suggestions import search_suggestion_index
 
 
 class ApplicationCompositionMixin:
@@ -71,6 +76,14 @@ class ApplicationCompositionMixin:
             )
         return self._site_settings_command_repo
 
+    @property
+    def search_suggestion_index(self):
+        return search_suggestion_index
+
+    @property
+    def request_profile_store(self):
+        return request_profile_store
+
     @property
     def core_form_adapter(self):
         if self._core_form_adapter is None:
@@ -93,6 +106,11 @@ class ApplicationCompositionMixin:
             core_repo=self.global_search_repo,
         )
 
+    def get_search_suggestions_use_case(self):
+        return GetSearchSuggestionsUseCase(
+            suggestion_index=self.search_suggestion_index,
+        )
+
     def get_import_page_use_case(self):
         return GetImportPageUseCase(
             core_repo=self.import_log_repo,
@@ -138,10 +138,14 @@ class DocumentCompositionMixin:
     @property
     def document_engine(self):
         if self._document_engine is None:
+            remedial_sheet_data_use_case = (
+                self.get_remedial_sheet_data_use_case()
+            )
             components = build_sectioned_document_components(
                 work_document_repo=self.work_document_repo,
-                get_remedial_sheet_data=(
-                    self.get_remedial_sheet_data_use_case().execute
+                get_remedial_sheet_data=remedial_sheet_data_use_case.execute,
+                get_remedial_sheet_data_many=(
+                    remedial_sheet_data_use_case.execute_many
                 ),
                 get_event_report=(
                     self.get_event_performance_report_use_case().execute
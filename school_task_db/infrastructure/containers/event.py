@@ -2,7 +2,10 @@
 
 from core_logic.services.event_service import EventService
 from core_logic.use_cases.add_event_participants import AddEventParticipantsUseCase
-from core_logic.use_cases.assign_event_variants import AssignEventVariantsUseCase
+from core_logic.use_cases.assign_event_variants import (
+    AssignEventVariantsUseCase,
+    DistributeEventVariantsUseCase,
+)
 from core_logic.use_cases.assign_single_event_variant import (
     AssignSingleEventVariantUseCase,
 )
@@ -131,6 +134,13 @@ class EventCompositionMixin:
             event_participation_repo=self.event_participation_repo,
         )
 
+    def distribute_event_variants_use_case(self):
+        return DistributeEventVariantsUseCase(
+            event_repo=self.event_read_repo,
+            event_participation_repo=self.event_participation_repo,
+            event_service=self.event_service(),
+        )
+
     def assign_single_event_variant_use_case(self):
         return AssignSingleEventVariantUseCase(
             event_repo=self.event_read_repo,
@@ -19,6 +19,7 @@ from core_logic.use_cases.grade_student_work import GradeStudentWorkUseCase
 from core_logic.use_cases.prepare_participation_review_submission import (
     PrepareParticipationReviewSubmissionUseCase,
 )
+from core_logic.use_cases.save_review_draft import SaveReviewDraftUseCase
 from core_logic.use_cases.sync_review_session import SyncReviewSessionUseCase
 from core_logic.use_cases.toggle_participation_absent import (
     ToggleParticipationAbsentUseCase,
@@ -33,6 +34,9 @@ from infrastructure.repositories.django_attempt_snapshot_repo import (
 from infrastructure.repositories.django_participation_grading_repo import (
     DjangoParticipationGradingRepository,
 )
+from infrastructure.repositories.django_review_draft_repo import (
+    DjangoReviewDraftRepository,
+)
 from infrastructure.repositories.django_review_overview_repo import (
     DjangoReviewOverviewRepository,
 )
@@ -48,6 +52,7 @@ from infrastructure.repositories.django_review_task_repo import (
 from infrastructure.repositories.django_review_workflow_repo import (
     DjangoReviewWorkflowRepository,
 )
+from infrastructure.services.review_queue_cache import review_queue_cache
 
 
 class ReviewCompositionMixin:
@@ -56,7 +61,9 @@ class ReviewCompositionMixin:
     def _initialize_review_composition(self):
         self._attempt_snapshot_repo = None
         self._participation_grading_repo = None
+        self._review_draft_repo = None
         self._review_overview_repo = None
+        self._review_queue_cache = None
         self._review_workflow_repo = None
         self._review_session_query_repo = None
         self._review_session_command_repo = None
@@ -77,6 +84,18 @@ class ReviewCompositionMixin:
             )
         return self._participation_grading_repo
 
+    @property
+    def review_draft_repo(self):
+        if self._review_draft_repo is None:
+            self._review_draft_repo = DjangoReviewDraftRepository()
+        return self._review_draft_repo
+
+    @property
+    def review_queue_cache(self):
+        if self._review_queue_cache is None:
+            self._review_queue_cache = review_queue_cache
+        return self._review_queue_cache
+
     @property
     def review_overview_repo(self):
         if self._review_overview_repo is None:
@@ -130,6 +149,7 @@ class ReviewCompositionMixin:
             grading_service=self.grading_service(),
             transaction_manager=self.transaction_manager,
             attempt_snapshot_repo=self.attempt_snapshot_repo,
+            draft_repo=self.review_draft_repo,
         )
 
     def get_participation_review_use_case(self):
@@ -137,6 +157,13 @@ class ReviewCompositionMixin:
             review_repo=self.review_workflow_repo,
             review_task_repo=self.review_task_repo,
             review_service=self.review_service(),
+            draft_repo=self.review_draft_repo,
+        )
+
+    def save_review_draft_use_case(self):
+        return SaveReviewDraftUseCase(
+            draft_repo=self.review_draft_repo,
+            review_service=self.review_service(),
         )
 
     def get_review_dashboard_use_case(self):
@@ -160,6 +187,7 @@ class ReviewCompositionMixin:
     def finalize_review_event_use_case(self):
         return FinalizeReviewEventUseCase(
             review_repo=self.review_workflow_repo,
+            attempt_snapshot_repo=self.attempt_snapshot_repo,
         )
 
     def toggle_participation_absent_use_case(self):
@@ -180,6 +208,7 @@ class ReviewCompositionMixin:
     def get_review_save_navigation_use_case(self):
         return GetReviewSaveNavigationUseCase(
             review_repo=self.review_workflow_repo,
+            review_queue_cache=self.review_queue_cache,
         )
 
     def get_recent_review_sessions_use_case(self):
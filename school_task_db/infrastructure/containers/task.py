@@ -56,6 +56,9 @@ from infrastructure.repositories.django_task_read_repo import (
 from infrastructure.repositories.django_task_selection_repo import (
     DjangoTaskSelectionRepository,
 )
+from infrastructure.repositories.django_task_similarity_repo import (
+    DjangoTaskSimilarityRepository,
+)
 from infrastructure.repositories.django_task_taxonomy_repo import (
     DjangoTaskTaxonomyRepository,
 )
@@ -74,6 +77,7 @@ class TaskCompositionMixin:
         self._task_image_command_repo = None
         self._task_lifecycle_command_repo = None
         self._task_selection_repo = None
+        self._task_similarity_repo = None
         self._task_taxonomy_repo = None
         self._task_math_status_cache = None
         self._task_image_audit_query_repo = None
@@ -135,6 +139,12 @@ class TaskCompositionMixin:
             self._task_selection_repo = DjangoTaskSelectionRepository()
         return self._task_selection_repo
 
+    @property
+    def task_similarity_repo(self):
+        if self._task_similarity_repo is None:
+            self._task_similarity_repo = DjangoTaskSimilarityRepository()
+        return self._task_similarity_repo
+
     @property
     def task_taxonomy_repo(self):
         if self._task_taxonomy_repo is None:
@@ -186,6 +196,7 @@ class TaskCompositionMixin:
     def get_task_detail_use_case(self):
         return GetTaskDetailUseCase(
             task_repo=self.task_read_repo,
+            similarity_repo=self.task_similarity_repo,
         )
 
     def get_subtopic_options_use_case(self):
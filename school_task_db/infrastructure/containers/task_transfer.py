@@ -30,6 +30,9 @@ from infrastructure.repositories.django_task_import_log_repo import (
 from infrastructure.repositories.django_task_import_preview_repo import (
     DjangoTaskImportPreviewRepository,
 )
+from infrastructure.services.task_import_artifact_store import (
+    FileTaskImportArtifactStore,
+)
 
 
 class TaskTransferCompositionMixin:
@@ -41,6 +44,7 @@ class TaskTransferCompositionMixin:
         self._task_import_write_session_factory = None
         self._task_import_log_repo = None
         self._task_import_preview_repo = None
+        self._task_import_artifact_store = None
 
     @property
     def task_export_repo(self):
@@ -82,6 +86,12 @@ class TaskTransferCompositionMixin:
             )
         return self._task_import_preview_repo
 
+    @property
+    def task_import_artifact_store(self):
+        if self._task_import_artifact_store is None:
+            self._task_import_artifact_store = FileTaskImportArtifactStore()
+        return self._task_import_artifact_store
+
     def validate_task_import_json_use_case(self):
         return ValidateTaskImportJsonUseCase()
 
@@ -95,6 +105,9 @@ class TaskTransferCompositionMixin:
     def execute_task_import_submission_use_case(self):
         return ExecuteTaskImportSubmissionUseCase(
             execute_import_use_case=self.execute_task_import_use_case(),
+            prepare_submission_use_case=(
+                self.prepare_task_import_execution_submission_use_case()
+            ),
         )
 
     def preview_task_import_use_case(self):
@@ -105,13 +118,16 @@ class TaskTransferCompositionMixin:
     def preview_task_import_file_use_case(self):
         return PreviewTaskImportFileUseCase(
             preview_task_import_use_case=self.preview_task_import_use_case(),
+            artifact_store=self.task_import_artifact_store,
         )
 
     def prepare_task_import_file_use_case(self):
         return PrepareTaskImportFileUseCase()
 
     def prepare_task_import_execution_submission_use_case(self):
-        return PrepareTaskImportExecutionSubmissionUseCase()
+        return PrepareTaskImportExecutionSubmissionUseCase(
+            artifact_store=self.task_import_artifact_store,
+        )
 
     def get_task_import_sample_use_case(self):
         return GetTaskImportSampleUseCase()
@@ -1,5 +1,7 @@
 """Infrastructure helpers for Django core forms and query params."""
 
+from django.urls import reverse
+
 from core_logic.entities.task import TaskExportFilters
 from core_logic.entities.task_import import (
     TaskImportExecutionSubmissionRequest,
@@ -7,6 +9,32 @@ from core_logic.entities.task_import import (
 )
 from core_logic.use_cases.export_tasks import ExportTasksRequest
 from core_logic.use_cases.get_global_search import GlobalSearchRequest
+from core_logic.use_cases.get_search_suggestions import (
+    DEFAULT_SUGGESTION_LIMIT,
+    SearchSuggestionsRequest,
+)
+
+SEARCH_SUGGESTION_URLS = {
+    'student': 'students:detail',
+    'student_group': 'students:group-detail',
+    'event': 'events:detail',
+    'work': 'works:detail',
+    'analog_group': 'task_groups:detail',
+    'topic': 'curriculum:topic-detail',
+    'course': 'curriculum:course-detail',
+    'task': 'tasks:detail',
+}
+SEARCH_SUGGESTION_KIND_LABELS = {
+    'student': 'Ученик',
+    'student_group': 'Класс',
+    'event': 'Событие',
+    'work': 'Работа',
+    'analog_group': 'Группа аналогов',
+    'topic': 'Тема',
+    'course': 'Курс',
+    'source': 'Источник',
+    'task': 'Задание',
+}
 
 
 class CoreFormAdapter:
@@ -33,6 +61,40 @@ class CoreFormAdapter:
             'found_text': search_data.found_text,
         }
 
+    def search_suggestions_request_from_query(self, query):
+        try:
+            limit = int(query.get('limit', DEFAULT_SUGGESTION_LIMIT))
+        except (TypeError, ValueError):
+            limit = DEFAULT_SUGGESTION_LIMIT
+        return SearchSuggestionsRequest(
+            raw_query=query.get('q', ''),
+            limit=limit,
+        )
+
+    def search_suggestions_response_data(self, suggestions_data):
+        return {
+            'query': suggestions_data.query,
+            'suggestions': [
+                {
+                    'kind': suggestion.kind,
+                    'kind_label': SEARCH_SUGGESTION_KIND_LABELS[suggestion.kind],
+                    'title': suggestion.title,
+                    'subtitle': suggestion.subtitle,
+                    'url': self._search_suggestion_url(suggestion),
+                }
+                for suggestion in suggestions_data.suggestions
+            ],
+        }
+
+    @staticmethod
+    def _search_suggestion_url(suggestion):
+        if suggestion.kind == 'source':
+            return f"{reverse('tasks:source-list')}#source-{suggestion.pk}"
+        return reverse(
+            SEARCH_SUGGESTION_URLS[suggestion.kind],
+            args=[suggestion.pk],
+        )
+
     def task_import_file_request_from_upload(self, uploaded_file):
         return TaskImportFileRequest(
             filename=uploaded_file.name,
@@ -47,6 +47,31 @@ class ReviewFormAdapter:
             'current_position': review_data.current_position,
             'total_positions': review_data.total_positions,
             'navigation_progress': review_data.navigation_progress,
+            'grading_rules': self.grading_rules_payload(
+                review_data.grading_rules,
+            ),
+            'review_draft': review_data.draft,
+        }
+
+    def grading_rules_payload(self, rules):
+        if rules is None:
+            return None
+        return {
+            'scale': [
+                {'min_percentage': threshold, 'score': score}
+                for threshold, score in rules.score_thresholds
+            ],
+            'fallback_score': rules.fallback_score,
+            'task_max_points': dict(rules.task_max_points),
+        }
+
+    def draft_payload(self, draft):
+        return {
+            'status': 'saved',
+            'updated_at': (
+                draft.updated_at.isoformat() if draft.updated_at else None
+            ),
+            'task_count': len(draft.task_scores),
         }
 
     def score_calculation_payload(self, result):
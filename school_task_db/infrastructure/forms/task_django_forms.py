@@ -13,6 +13,13 @@ from infrastructure.services.task_image_presentation import (
 from infrastructure.services.django_task_classification_queries import (
     task_classification_querysets,
 )
+from infrastructure.services.reference_choices import (
+    codifier_choices,
+    source_choices,
+    subtopic_choices,
+    topic_choices,
+    use_cached_choices,
+)
 from tasks.models import Task, TaskImage, Source
 
 
@@ -97,6 +104,10 @@ class TaskForm(forms.ModelForm):
         self.fields['source'].empty_label = "--- Без источника ---"
         self.fields['source'].widget.attrs.update({'class': 'form-select'})
 
+        use_cached_choices(self.fields['topic'], topic_choices())
+        use_cached_choices(self.fields['subtopic'], subtopic_choices())
+        use_cached_choices(self.fields['source'], source_choices())
+
         self.fields['source_detail'].required = False
         self.fields['grade'].required = False
         self.fields['year'].required = False
@@ -166,6 +177,19 @@ class TaskForm(forms.ModelForm):
         self.fields['codifier_content_entries'].queryset = content_entries
         self.fields['codifier_requirements'].queryset = requirements
 
+        # Inactive codifier links are listed only for the task holding them,
+        # so such forms keep rendering from their querysets.
+        cached_content, cached_requirements = codifier_choices(
+            topic.subject if topic is not None else None,
+        )
+        for name, current_ids, choices in (
+            ('codifier_content_entries', current_content_ids, cached_content),
+            ('codifier_requirements', current_requirement_ids, cached_requirements),
+        ):
+            cached_ids = {value for value, _ in choices}
+            if {str(pk) for pk in current_ids} <= cached_ids:
+                use_cached_choices(self.fields[name], choices)
+
     def _selected_topic(self):
         topic_id = self.data.get('topic') if self.is_bound else None
         if topic_id:
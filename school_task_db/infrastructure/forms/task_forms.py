@@ -46,6 +46,7 @@ class TaskFormAdapter:
         return {
             'task': detail_data.task,
             'task_groups': detail_data.task_groups,
+            'similar_tasks': detail_data.similar_tasks,
         }
 
     def task_create_context(self, form, image_formset):
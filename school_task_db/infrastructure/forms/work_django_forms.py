@@ -6,6 +6,11 @@ from core_logic.value_objects.task_print_settings import (
     TASK_BANK_ROLE_ANY,
     TASK_RENDER_MODE_TASK_ONLY,
 )
+from infrastructure.services.reference_choices import (
+    analog_group_choices,
+    topic_choices,
+    use_cached_choices,
+)
 from works.models import Work, WorkAnalogGroup, WorkContentBlock
 from core_logic.value_objects.work_assessment import WORK_ASSESSMENT_MODE_VARIANT
 
@@ -91,6 +96,7 @@ class WorkAnalogGroupForm(forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        use_cached_choices(self.fields['analog_group'], analog_group_choices())
         self.fields['bank_role_filter'].required = False
         self.fields['render_mode'].required = False
         self.fields['blank_space_area_cm2'].required = False
@@ -156,6 +162,10 @@ class WorkContentBlockForm(forms.ModelForm):
             ),
         }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        use_cached_choices(self.fields['topics'], topic_choices())
+
     def clean(self):
         cleaned_data = super().clean()
         content_type = cleaned_data.get('content_type')
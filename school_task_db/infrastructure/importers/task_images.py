@@ -1,9 +1,8 @@
 """Django task image import component."""
 
+from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
-from django.core.files.base import ContentFile
-
 from core_logic.services.task_image_transfer_codec import (
     TaskImageTransferCodec,
 )
@@ -15,9 +14,22 @@ from core_logic.value_objects.task_import import (
 from infrastructure.services.django_image_asset_store import (
     DjangoImageAssetStore,
 )
+from infrastructure.services.image_ingestion import (
+    IMAGE_INGESTION_CHUNK_SIZE,
+    IMAGE_INGESTION_MAX_WORKERS,
+    ingest_images,
+)
 from tasks.models import Task, TaskImage
 
 
+@dataclass(frozen=True)
+class _ImagePlan:
+    task: Task
+    image_uuid: str
+    data: Dict[str, Any]
+    image: Optional[TaskImage] = None
+
+
 class TaskImageImporter:
     def __init__(
         self,
@@ -25,17 +37,22 @@ class TaskImageImporter:
         registry,
         transfer_codec=None,
         asset_store=None,
+        max_workers=IMAGE_INGESTION_MAX_WORKERS,
+        chunk_size=IMAGE_INGESTION_CHUNK_SIZE,
     ):
         self.runtime = runtime
         self.registry = registry
         self.transfer_codec = transfer_codec or TaskImageTransferCodec()
         self.asset_store = asset_store or DjangoImageAssetStore()
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
 
     def import_images(self, images_data):
         self.runtime.write('🖼️ Импорт изображений заданий...')
+        plans = []
         for image_data in images_data:
             try:
-                self._import_image(image_data)
+                plan = self._plan_image(image_data)
             except TaskImportConflictError:
                 raise
             except Exception as error:
@@ -43,8 +60,26 @@ class TaskImageImporter:
                     f'Ошибка импорта изображения: {error}',
                     error,
                 )
+                continue
+            if plan is not None:
+                plans.append(plan)
 
-    def _import_image(self, image_data: Dict[str, Any]):
+        for start in range(0, len(plans), self.chunk_size):
+            self._import_chunk(plans[start:start + self.chunk_size])
+
+    def _import_chunk(self, plans):
+        # Decoded bytes of the chunk are released once its rows are written.
+        assets = self._ingest_assets(plans)
+        for plan in plans:
+            try:
+                self._apply_image(plan, assets.get(id(plan)))
+            except Exception as error:
+                self.runtime.log_error(
+                    f'Ошибка импорта изображения: {error}',
+                    error,
+                )
+
+    def _plan_image(self, image_data: Dict[str, Any]):
         raw_task_uuid = (
             image_data.get('task_uuid') or image_data.get('task_id')
         )
@@ -56,14 +91,14 @@ class TaskImageImporter:
                 f'Некорректная ссылка на задание '
                 f'для изображения: {suffix}',
             )
-            return
+            return None
         task = self.registry.task(task_uuid)
         if task is None:
             suffix = task_uuid[-8:] if task_uuid else 'Unknown'
             self.runtime.log_warning(
                 f'Задание не найдено для изображения: {suffix}',
             )
-            return
+            return None
 
         image_uuid = self.runtime.generate_uuid_if_missing(image_data, 'id')
         existing_image = self.runtime.get_by_uuid(TaskImage, image_uuid)
@@ -72,32 +107,97 @@ class TaskImageImporter:
             image_data,
             'images',
         )
-        if existing_image:
-            if action == TASK_IMPORT_ACTION_UPDATE:
-                if self._update_image(existing_image, image_data):
-                    self.runtime.stats.record_updated(
-                        'images',
-                        existing_image.pk,
+        if existing_image and action != TASK_IMPORT_ACTION_UPDATE:
+            return None
+        return _ImagePlan(task, image_uuid, image_data, existing_image)
+
+    def _ingest_assets(self, plans):
+        """Decode, verify and store new content for a chunk of plans.
+
+        Only plans that carry content are ingested, so rows that are skipped
+        or whose metadata alone is updated leave no immutable asset behind.
+        """
+        pending = []
+        for plan in plans:
+            if plan.image is None:
+                if not plan.data.get('base64_data'):
+                    self.runtime.log_warning(
+                        'Нет данных изображения (поле base64_data)',
+                    )
+                    continue
+                filename = plan.data.get('filename', 'imported_image.jpg')
+            elif 'base64_data' in plan.data:
+                if not plan.data['base64_data']:
+                    self.runtime.log_warning(
+                        'Нет данных изображения (поле base64_data)',
                     )
+                    continue
+                filename = plan.data.get(
+                    'filename',
+                    f'updated_{plan.image.asset.original_filename}'
+                    if plan.image.asset_id
+                    else 'updated_image.jpg',
+                )
+            else:
+                continue
+            pending.append((plan, filename))
+        if not pending:
+            return {}
+
+        ingested = ingest_images(
+            (
+                (plan.data['base64_data'], filename)
+                for plan, filename in pending
+            ),
+            transfer_codec=self.transfer_codec,
+            max_workers=self.max_workers,
+        )
+        accepted = []
+        for (plan, _), image in zip(pending, ingested):
+            if image.error:
+                self.runtime.log_error(image.error)
+            else:
+                accepted.append((plan, image))
+        if not accepted:
+            return {}
+        try:
+            assets = self.asset_store.get_or_create_many(
+                (image for _, image in accepted),
+                max_workers=self.max_workers,
+            )
+        except Exception as error:
+            self.runtime.log_error(
+                f'Ошибка сохранения изображений: {error}',
+                error,
+            )
+            return {}
+        return {
+            id(plan): asset
+            for (plan, _), asset in zip(accepted, assets)
+        }
+
+    def _apply_image(self, plan, asset):
+        if plan.image is not None:
+            if self._update_image(plan.image, plan.data, asset):
+                self.runtime.stats.record_updated('images', plan.image.pk)
             return
 
-        if not existing_image:
-            image = self._create_image(task, image_uuid, image_data)
-            if image:
-                self.runtime.stats.record_created('images', image.pk)
-                self.runtime.log_success(
-                    'Создано изображение для задания '
-                    f'{task.get_short_uuid()}',
-                )
+        image = self._create_image(plan.task, plan.image_uuid, plan.data, asset)
+        if image:
+            self.runtime.stats.record_created('images', image.pk)
+            self.runtime.log_success(
+                'Создано изображение для задания '
+                f'{plan.task.get_short_uuid()}',
+            )
 
     def _create_image(
         self,
         task: Task,
         image_uuid: str,
         image_data: Dict[str, Any],
+        asset,
     ) -> Optional[TaskImage]:
-        image_content = self._decode_content(image_data)
-        if image_content is None:
+        if asset is None:
             return None
 
         try:
@@ -105,7 +205,7 @@ class TaskImageImporter:
             task_image = TaskImage.objects.create(
                 id=image_uuid,
                 task=task,
-                asset=self.asset_store.get_or_create(image_content),
+                asset=asset,
                 position=position,
                 caption=image_data.get('caption', ''),
                 order=image_data.get('order', 1),
@@ -129,23 +229,20 @@ class TaskImageImporter:
             )
         return task_image
 
-    def _update_image(self, image: TaskImage, image_data: Dict[str, Any]):
+    def _update_image(
+        self,
+        image: TaskImage,
+        image_data: Dict[str, Any],
+        asset,
+    ):
+        if 'base64_data' in image_data and asset is None:
+            return False
         try:
             image.position = image_data.get('position', image.position)
             image.caption = image_data.get('caption', image.caption)
             image.order = image_data.get('order', image.order)
-            if 'base64_data' in image_data:
-                image_content = self._decode_content(
-                    image_data,
-                    default_filename=(
-                        f'updated_{image.asset.original_filename}'
-                        if image.asset_id
-                        else 'updated_image.jpg'
-                    ),
-                )
-                if image_content is None:
-                    return False
-                image.asset = self.asset_store.get_or_create(image_content)
+            if asset is not None:
+                image.asset = asset
             image.save()
             self.runtime.log_success(
                 f'Обновлено изображение {image.get_short_uuid()}',
@@ -157,29 +254,3 @@ class TaskImageImporter:
                 error,
             )
             return False
-
-    def _decode_content(
-        self,
-        image_data: Dict[str, Any],
-        default_filename: str = 'imported_image.jpg',
-    ):
-        encoded = image_data.get('base64_data')
-        if not encoded:
-            self.runtime.log_warning(
-                'Нет данных изображения (поле base64_data)',
-            )
-            return None
-        if ',' in encoded:
-            encoded = encoded.split(',', 1)[1]
-        filename = image_data.get('filename', default_filename)
-        try:
-            return ContentFile(
-                self.transfer_codec.decode(encoded),
-                name=filename,
-            )
-        except Exception as error:
-            self.runtime.log_error(
-                f'Ошибка декодирования base64: {error}',
-                error,
-            )
-            return None
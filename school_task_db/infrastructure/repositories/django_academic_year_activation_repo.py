@@ -11,6 +11,7 @@ from core_logic.interfaces.academic_year_activation_repo import (
 from infrastructure.repositories.django_academic_year_support import (
     academic_year_to_ref,
 )
+from infrastructure.services.reference_data_cache import reference_data_cache
 
 
 class DjangoAcademicYearActivationRepository(
@@ -41,4 +42,7 @@ class DjangoAcademicYearActivationRepository(
         if not year.is_active:
             AcademicYear.objects.filter(pk=year.pk).update(is_active=True)
             year.is_active = True
+        # update() bypasses post_save, so cached year lists are refreshed
+        # here, together with the switch itself.
+        reference_data_cache.invalidate()
         return academic_year_to_ref(year)
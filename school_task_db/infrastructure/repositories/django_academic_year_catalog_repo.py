@@ -1,7 +1,5 @@
 """Django read adapter for academic years."""
 
-from django.core.exceptions import ValidationError
-
 from core.models import AcademicYear
 from core_logic.entities.academic_year import AcademicYearRef
 from core_logic.interfaces.academic_year_catalog_repo import (
@@ -10,24 +8,32 @@ from core_logic.interfaces.academic_year_catalog_repo import (
 from infrastructure.repositories.django_academic_year_support import (
     academic_year_to_ref,
 )
+from infrastructure.services.reference_data_cache import reference_data_cache
 
 
 class DjangoAcademicYearCatalogRepository(IAcademicYearCatalogRepository):
     def get_academic_year(self, year_id: str) -> AcademicYearRef | None:
         if not year_id:
             return None
-        try:
-            year = AcademicYear.objects.filter(pk=year_id).first()
-        except (ValidationError, ValueError):
-            return None
-        return academic_year_to_ref(year) if year else None
+        return next(
+            (year for year in self.get_academic_years() if year.pk == year_id),
+            None,
+        )
 
     def get_active_academic_year(self) -> AcademicYearRef | None:
-        year = AcademicYear.objects.filter(is_active=True).first()
-        return academic_year_to_ref(year) if year else None
+        return next(
+            (year for year in self.get_academic_years() if year.is_active),
+            None,
+        )
 
     def get_academic_years(self) -> tuple[AcademicYearRef, ...]:
-        return tuple(
-            academic_year_to_ref(year)
-            for year in AcademicYear.objects.all().order_by('-start_date')
-        )
+        # Every request resolves the year, so all three lookups share one
+        # cached list instead of querying per call.
+        return reference_data_cache.get('academic_years', _load_academic_years)
+
+
+def _load_academic_years():
+    return tuple(
+        academic_year_to_ref(year)
+        for year in AcademicYear.objects.all().order_by('-start_date')
+    )
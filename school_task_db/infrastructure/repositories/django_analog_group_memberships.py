@@ -0,0 +1,40 @@
+"""Shared loaders for the task bank of analog groups in a work spec."""
+
+from collections import defaultdict
+
+from django.db.models import Count
+
+from core_logic.entities.work_variant_composition import AvailableVariantTask
+from task_groups.models import TaskGroup
+
+
+def task_bank_roles_by_group(group_ids):
+    """Return each group's task bank roles from one grouped query.
+
+    Callers only count roles per filter, so roles are listed by group and
+    role rather than by membership order.
+    """
+    roles = defaultdict(list)
+    for group_id, bank_role, total in TaskGroup.objects.filter(
+        group_id__in=set(group_ids),
+    ).values('group_id', 'bank_role').annotate(
+        total=Count('pk'),
+    ).order_by('group_id', 'bank_role').values_list(
+        'group_id',
+        'bank_role',
+        'total',
+    ):
+        roles[group_id].extend([bank_role] * total)
+    return {group_id: tuple(items) for group_id, items in roles.items()}
+
+
+def available_tasks_by_group(group_ids):
+    """Return each group's tasks in membership order from one query."""
+    tasks = defaultdict(list)
+    for group_id, task_id, bank_role in TaskGroup.objects.filter(
+        group_id__in=set(group_ids),
+    ).order_by('pk').values_list('group_id', 'task_id', 'bank_role'):
+        tasks[group_id].append(
+            AvailableVariantTask(task_id=str(task_id), bank_role=bank_role),
+        )
+    return {group_id: tuple(items) for group_id, items in tasks.items()}
@@ -3,6 +3,7 @@
 from decimal import Decimal, InvalidOperation
 from uuid import UUID
 
+from django.db import transaction
 from django.db.models import Max
 
 from core_logic.entities.attempt_snapshot import AttemptSnapshotRef
@@ -10,13 +11,24 @@ from core_logic.interfaces.attempt_snapshot_repo import (
     IAttemptSnapshotRepository,
 )
 from core_logic.value_objects.task_scores import (
-    resolve_task_score_record,
+    normalize_task_scores,
+    resolve_normalized_task_score_record,
     task_score_records_for_attempt,
 )
 from core_logic.value_objects.task_content_snapshot import (
     task_content_snapshot_from_mapping,
 )
 from events.models import AttemptSnapshot, AttemptTaskSnapshot, Mark
+from infrastructure.services.cache_generations import (
+    CACHE_DOMAIN_ATTEMPTS,
+    cache_generations,
+)
+from infrastructure.services.event_report_cache import (
+    event_report_source_cache,
+)
+from infrastructure.services.participation_projections import (
+    refresh_participation_projections,
+)
 from infrastructure.services.task_content_snapshots import (
     build_task_content_snapshots,
 )
@@ -25,23 +37,99 @@ from tasks.models import Task
 from works.models import VariantTask, WorkAnalogGroup
 
 
+# SQLite limits bound parameters per statement; snapshot rows are wide.
+BULK_WRITE_BATCH_SIZE = 200
+
+
 class DjangoAttemptSnapshotRepository(IAttemptSnapshotRepository):
     def capture_mark(self, mark_id: str) -> AttemptSnapshotRef:
-        mark = Mark.objects.select_related(
+        mark = self._marks().get(pk=mark_id)
+        participation = mark.participation
+        with transaction.atomic():
+            previous = AttemptSnapshot.objects.filter(
+                participation=participation,
+            )
+            latest_revision = previous.aggregate(
+                value=Max('revision'),
+            )['value'] or 0
+            previous.filter(is_latest=True).update(is_latest=False)
+            snapshot = self._snapshot_for_mark(mark, latest_revision + 1)
+            snapshot.save(force_insert=True)
+            self._capture_task_results(
+                snapshot,
+                participation.variant,
+                mark.task_scores,
+            )
+        # Task rows are written after post_save, so project read models here.
+        refresh_participation_projections((participation.pk,))
+        return self._snapshot_ref(snapshot)
+
+    def capture_event_marks(
+        self,
+        event_id: str,
+    ) -> tuple[AttemptSnapshotRef, ...]:
+        with transaction.atomic():
+            captured = {
+                row['participation_id']: row
+                for row in AttemptSnapshot.objects.filter(
+                    participation__event_id=event_id,
+                ).values('participation_id').annotate(
+                    revision=Max('revision'),
+                    captured_at=Max('created_at'),
+                )
+            }
+            snapshots = []
+            for mark in self._marks().filter(
+                participation__event_id=event_id,
+                score__isnull=False,
+            ).order_by('participation_id'):
+                latest = captured.get(mark.participation_id)
+                if latest and latest['captured_at'] >= mark.updated_at:
+                    continue
+                revision = latest['revision'] + 1 if latest else 1
+                snapshots.append(self._snapshot_for_mark(mark, revision))
+            if not snapshots:
+                return ()
+
+            AttemptSnapshot.objects.filter(
+                participation_id__in=[
+                    snapshot.participation_id for snapshot in snapshots
+                ],
+                is_latest=True,
+            ).update(is_latest=False)
+            AttemptSnapshot.objects.bulk_create(
+                snapshots,
+                batch_size=BULK_WRITE_BATCH_SIZE,
+            )
+            AttemptTaskSnapshot.objects.bulk_create(
+                self._batch_task_rows(snapshots),
+                batch_size=BULK_WRITE_BATCH_SIZE,
+            )
+            refresh_participation_projections(
+                snapshot.participation_id for snapshot in snapshots
+            )
+        # bulk_create bypasses post_save, so the cache signals never fire.
+        cache_generations.bump(CACHE_DOMAIN_ATTEMPTS)
+        event_report_source_cache.invalidate(event_id)
+        return tuple(self._snapshot_ref(snapshot) for snapshot in snapshots)
+
+    @staticmethod
+    def _marks():
+        return Mark.objects.select_related(
             'participation__student',
             'participation__event__work',
             'participation__variant',
-        ).get(pk=mark_id)
+        )
+
+    def _snapshot_for_mark(self, mark, revision):
         participation = mark.participation
         event = participation.event
         variant = participation.variant
-        latest_revision = AttemptSnapshot.objects.filter(
-            participation=participation,
-        ).aggregate(value=Max('revision'))['value'] or 0
-        snapshot = AttemptSnapshot.objects.create(
+        return AttemptSnapshot(
             participation=participation,
             mark=mark,
-            revision=latest_revision + 1,
+            revision=revision,
+            is_latest=True,
             student_id_snapshot=str(participation.student_id),
             student_name_snapshot=participation.student.get_full_name(),
             event_id_snapshot=str(event.pk),
@@ -69,11 +157,13 @@ class DjangoAttemptSnapshotRepository(IAttemptSnapshotRepository):
             needs_attention=mark.needs_attention,
             task_scores_snapshot=dict(mark.task_scores or {}),
         )
-        self._capture_task_results(snapshot, variant, mark.task_scores)
+
+    @staticmethod
+    def _snapshot_ref(snapshot):
         return AttemptSnapshotRef(
             pk=str(snapshot.pk),
-            participation_id=str(participation.pk),
-            mark_id=str(mark.pk),
+            participation_id=str(snapshot.participation_id),
+            mark_id=str(snapshot.mark_id),
             revision=snapshot.revision,
         )
 
@@ -87,13 +177,87 @@ class DjangoAttemptSnapshotRepository(IAttemptSnapshotRepository):
             ).order_by('order', 'pk')
         )
         selection_names = self._selection_names_by_variant_task(variant_tasks)
+        AttemptTaskSnapshot.objects.bulk_create(
+            self._variant_task_rows(
+                snapshot,
+                variant_tasks,
+                selection_names,
+                task_scores,
+            )
+        )
+
+    def _batch_task_rows(self, snapshots):
+        variant_ids = {
+            snapshot.participation.variant_id
+            for snapshot in snapshots
+            if snapshot.participation.variant_id
+        }
+        variant_tasks_by_variant = {}
+        if variant_ids:
+            for variant_task in VariantTask.objects.filter(
+                variant_id__in=variant_ids,
+            ).order_by('variant_id', 'order', 'pk'):
+                variant_tasks_by_variant.setdefault(
+                    variant_task.variant_id,
+                    [],
+                ).append(variant_task)
+        selection_names = self._selection_names_by_variant_task([
+            variant_task
+            for variant_tasks in variant_tasks_by_variant.values()
+            for variant_task in variant_tasks
+        ])
+
         rows = []
+        unassigned = []
+        for snapshot in snapshots:
+            variant_id = snapshot.participation.variant_id
+            task_scores = snapshot.mark.task_scores
+            if variant_id is None:
+                unassigned.append(snapshot)
+                continue
+            rows.extend(self._variant_task_rows(
+                snapshot,
+                variant_tasks_by_variant.get(variant_id, ()),
+                selection_names,
+                task_scores,
+            ))
+        if unassigned:
+            records_by_snapshot = [
+                (snapshot, task_score_records_for_attempt(
+                    snapshot.mark.task_scores,
+                ))
+                for snapshot in unassigned
+            ]
+            task_snapshots = build_task_content_snapshots(
+                Task.objects.filter(pk__in={
+                    record.task_id
+                    for _, records in records_by_snapshot
+                    for record in records
+                })
+            )
+            for snapshot, records in records_by_snapshot:
+                rows.extend(self._unassigned_task_rows(
+                    snapshot,
+                    records,
+                    task_snapshots,
+                ))
+        return rows
+
+    def _variant_task_rows(
+        self,
+        snapshot,
+        variant_tasks,
+        selection_names,
+        task_scores,
+    ):
+        rows = []
+        records = normalize_task_scores(task_scores)
         for variant_task in variant_tasks:
             task = task_content_snapshot_from_mapping(
                 variant_task.task_snapshot,
             )
-            record = resolve_task_score_record(
-                task_scores,
+            record = resolve_normalized_task_score_record(
+                records,
                 variant_task_id=str(variant_task.pk),
                 task_id=task.task_id,
             )
@@ -119,7 +283,7 @@ class DjangoAttemptSnapshotRepository(IAttemptSnapshotRepository):
                 ),
                 comment=record.comment if record else '',
             ))
-        AttemptTaskSnapshot.objects.bulk_create(rows)
+        return rows
 
     @classmethod
     def _selection_names_by_variant_task(cls, variant_tasks):
@@ -185,14 +349,19 @@ class DjangoAttemptSnapshotRepository(IAttemptSnapshotRepository):
 
     def _capture_unassigned_task_results(self, snapshot, task_scores):
         records = task_score_records_for_attempt(task_scores)
-        snapshots = build_task_content_snapshots(
+        task_snapshots = build_task_content_snapshots(
             Task.objects.filter(
                 pk__in=[record.task_id for record in records],
             )
         )
+        AttemptTaskSnapshot.objects.bulk_create(
+            self._unassigned_task_rows(snapshot, records, task_snapshots)
+        )
+
+    def _unassigned_task_rows(self, snapshot, records, task_snapshots):
         rows = []
         for order, record in enumerate(records, start=1):
-            task_snapshot = snapshots.get(record.task_id)
+            task_snapshot = task_snapshots.get(record.task_id)
             if task_snapshot is None:
                 continue
             checked_max_points = self._decimal(record.max_points)
@@ -208,7 +377,7 @@ class DjangoAttemptSnapshotRepository(IAttemptSnapshotRepository):
                 checked_max_points=checked_max_points,
                 comment=record.comment,
             ))
-        AttemptTaskSnapshot.objects.bulk_create(rows)
+        return rows
 
     @staticmethod
     def _decimal(value):
@@ -2,7 +2,8 @@
 
 from collections import defaultdict
 
-from django.db.models import Count, Q
+from django.db.models import Count, Q, Value
+from django.db.models.functions import Coalesce
 
 from core_logic.entities.codifier import (
     CodifierContentEntry,
@@ -13,14 +14,18 @@ from core_logic.entities.codifier import (
 )
 from core_logic.interfaces.codifier_detail_repo import ICodifierDetailRepository
 from core_logic.services.codifier_service import CodifierService
-from codifier.models import CodifierSpec, ContentEntry, Requirement
+from codifier.models import (
+    CodifierSpec,
+    ContentEntry,
+    ContentEntryRollup,
+    Requirement,
+)
 
 
 class DjangoCodifierDetailRepository(ICodifierDetailRepository):
     def get_codifier(self, codifier_id: str):
-        codifier = CodifierSpec.objects.prefetch_related(
-            'content_entries',
-            'requirements',
+        codifier = CodifierSpec.objects.annotate(
+            content_entries_count=Count('content_entries'),
         ).filter(pk=codifier_id).first()
         if codifier is None:
             return None
@@ -29,7 +34,7 @@ class DjangoCodifierDetailRepository(ICodifierDetailRepository):
             pk=str(codifier.pk),
             short_name=codifier.short_name,
             name=codifier.name,
-            content_entries_count=codifier.content_entries.count(),
+            content_entries_count=codifier.content_entries_count,
         )
 
     def get_content_tree(self, codifier_id: str):
@@ -37,8 +42,7 @@ class DjangoCodifierDetailRepository(ICodifierDetailRepository):
             ContentEntry.objects.filter(codifier_id=codifier_id)
             .select_related('topic', 'subtopic')
             .annotate(
-                topic_task_count=Count('topic__task', distinct=True),
-                subtopic_task_count=Count('subtopic__task', distinct=True),
+                task_count=Coalesce('rollup__task_count', Value(0)),
             )
         )
         children_by_parent = defaultdict(list)
@@ -76,26 +80,20 @@ class DjangoCodifierDetailRepository(ICodifierDetailRepository):
             )
             for requirement in Requirement.objects.filter(
                 codifier_id=codifier_id,
-            ).annotate(task_count=Count('tasks'))
+            ).annotate(
+                task_count=Coalesce('rollup__task_count', Value(0)),
+            )
         )
 
     def get_coverage(self, codifier_id: str) -> dict:
-        leaves = ContentEntry.objects.filter(
+        counts = ContentEntryRollup.objects.filter(
             codifier_id=codifier_id,
-            children__isnull=True,
+            is_leaf=True,
+        ).aggregate(
+            total=Count('pk'),
+            covered=Count('pk', filter=Q(task_count__gt=0)),
         )
-        total = leaves.count()
-        covered = leaves.filter(
-            Q(
-                subtopic__isnull=False,
-                subtopic__task__isnull=False,
-            )
-            | Q(
-                subtopic__isnull=True,
-                topic__task__isnull=False,
-            )
-        ).distinct().count()
-        return CodifierService.coverage(total=total, covered=covered)
+        return CodifierService.coverage(**counts)
 
     def _build_content_entry(
         self,
@@ -118,11 +116,7 @@ class DjangoCodifierDetailRepository(ICodifierDetailRepository):
                 else None
             ),
             grade_studied=entry.grade_studied,
-            task_count=(
-                entry.subtopic_task_count
-                if entry.subtopic_id
-                else entry.topic_task_count
-            ),
+            task_count=entry.task_count,
             sibling_codes=tuple(
                 CodifierSiblingCode(
                     codifier=CodifierObjectRef(
@@ -5,6 +5,10 @@ from core_logic.entities.codifier_import import CodifierImportDefinition
 from core_logic.interfaces.codifier_import_repo import (
     ICodifierImportRepository,
 )
+from infrastructure.services.codifier_rollups import (
+    refresh_codifier_rollups,
+)
+from infrastructure.services.reference_data_cache import reference_data_cache
 
 
 class DjangoCodifierImportRepository(ICodifierImportRepository):
@@ -59,6 +63,10 @@ class DjangoCodifierImportRepository(ICodifierImportRepository):
             )
             for item in definition.requirements
         ])
+        # bulk_create bypasses post_save, so cached codifier options and
+        # requirement rollups are refreshed here.
+        reference_data_cache.invalidate()
+        refresh_codifier_rollups(codifier.pk)
         return str(codifier)
 
     @staticmethod
@@ -3,49 +3,104 @@
 from typing import Mapping, Sequence
 
 from django.db import transaction
+from django.utils import timezone
 
 from core_logic.entities.event import EventVariantAssignmentResult
 from core_logic.interfaces.event_participation_repo import (
     IEventParticipationRepository,
 )
 from events.models import EventParticipation
+from infrastructure.services.cache_generations import (
+    CACHE_DOMAIN_EVENTS,
+    cache_generations,
+)
+from infrastructure.services.review_queue_cache import review_queue_cache
 from works.models import Variant
 
 
+# SQLite limits bound parameters per statement; CASE-based bulk updates use
+# several parameters per row.
+BULK_WRITE_BATCH_SIZE = 200
+
+
 class DjangoEventParticipationRepository(IEventParticipationRepository):
     def add_participants(self, event_id: str, student_ids: Sequence[str]) -> int:
-        created_count = 0
         with transaction.atomic():
-            for student_id in student_ids:
-                _, created = EventParticipation.objects.get_or_create(
+            existing_student_ids = {
+                str(student_id)
+                for student_id in EventParticipation.objects.filter(
+                    event_id=event_id,
+                    student_id__in=student_ids,
+                ).values_list('student_id', flat=True)
+            }
+            new_participations = [
+                EventParticipation(
                     event_id=event_id,
                     student_id=student_id,
-                    defaults={'status': 'assigned'},
+                    status='assigned',
                 )
-                if created:
-                    created_count += 1
-        return created_count
+                for student_id in dict.fromkeys(map(str, student_ids))
+                if student_id not in existing_student_ids
+            ]
+            EventParticipation.objects.bulk_create(
+                new_participations,
+                batch_size=BULK_WRITE_BATCH_SIZE,
+            )
+        if new_participations:
+            # bulk_create bypasses post_save, so the cache signals never fire.
+            cache_generations.bump(CACHE_DOMAIN_EVENTS)
+            review_queue_cache.invalidate(event_id)
+        return len(new_participations)
 
     def assign_variants(
         self,
         event_id: str,
         assignments: Mapping[str, str],
     ) -> int:
-        assigned_count = 0
         with transaction.atomic():
+            allowed_variant_ids = self._event_variant_ids(
+                event_id,
+                set(assignments.values()),
+            )
             participations = EventParticipation.objects.filter(
                 event_id=event_id,
                 pk__in=assignments.keys(),
-            )
+            ).only('pk', 'variant_id')
+            now = timezone.now()
+            assigned_count = 0
+            changed = []
             for participation in participations:
                 variant_id = assignments.get(str(participation.pk))
-                if not variant_id:
+                if variant_id not in allowed_variant_ids:
                     continue
-                participation.variant_id = variant_id
-                participation.save()
                 assigned_count += 1
+                if str(participation.variant_id or '') == variant_id:
+                    continue
+                participation.variant_id = variant_id
+                participation.updated_at = now
+                changed.append(participation)
+            EventParticipation.objects.bulk_update(
+                changed,
+                ['variant_id', 'updated_at'],
+                batch_size=BULK_WRITE_BATCH_SIZE,
+            )
+        if changed:
+            cache_generations.bump(CACHE_DOMAIN_EVENTS)
         return assigned_count
 
+    @staticmethod
+    def _event_variant_ids(event_id, variant_ids):
+        """Return the subset of IDs that are variants of the event's work."""
+        if not variant_ids:
+            return set()
+        return {
+            str(variant_id)
+            for variant_id in Variant.objects.filter(
+                pk__in=variant_ids,
+                work__event__pk=event_id,
+            ).values_list('pk', flat=True)
+        }
+
     def assign_variant(
         self,
         event_id: str,
@@ -22,21 +22,27 @@ from core_logic.value_objects.attempt_status import (
 )
 from events.models import Event, EventParticipation
 from infrastructure.services.django_attempt_snapshot_queries import (
+    latest_attempt_revisions_for_event,
     latest_attempts_by_participation,
 )
 from infrastructure.services.django_captured_task_result_queries import (
     captured_task_result_snapshot,
 )
+from infrastructure.services.event_report_cache import (
+    CACHEABLE_EVENT_REPORT_STATUSES,
+    event_report_source_cache,
+)
 from reports.models import EventReportNarrativeModel
 
 
 class DjangoEventPerformanceReportQueryRepository(
     IEventPerformanceReportQueryRepository,
 ):
-    def __init__(self, task_fact_service=None):
+    def __init__(self, task_fact_service=None, source_cache=None):
         self.task_fact_service = (
             task_fact_service or EventReportTaskFactService()
         )
+        self.source_cache = source_cache or event_report_source_cache
 
     def get_event_report_source(self, event_id: str):
         event = Event.objects.select_related('work', 'course').filter(
@@ -44,7 +50,17 @@ class DjangoEventPerformanceReportQueryRepository(
         ).first()
         if event is None:
             return None
+        if event.status not in CACHEABLE_EVENT_REPORT_STATUSES:
+            return self._build_source(event)
+
+        revisions = latest_attempt_revisions_for_event(event.pk)
+        source = self.source_cache.get(event.pk, revisions)
+        if source is None:
+            source = self._build_source(event)
+            self.source_cache.set(event.pk, revisions, source)
+        return source
 
+    def _build_source(self, event):
         participations = list(
             EventParticipation.objects.filter(event=event)
             .select_related('student', 'variant')
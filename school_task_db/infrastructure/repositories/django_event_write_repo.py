@@ -8,6 +8,13 @@ from django.utils import timezone
 from core_logic.entities.event_commands import CreateEventParams
 from core_logic.interfaces.event_write_repo import IEventWriteRepository
 from events.models import Event
+from infrastructure.services.cache_generations import (
+    CACHE_DOMAIN_EVENTS,
+    cache_generations,
+)
+from infrastructure.services.participation_projections import (
+    refresh_event_participation_projections,
+)
 
 
 class DjangoEventWriteRepository(IEventWriteRepository):
@@ -41,6 +48,9 @@ class DjangoEventWriteRepository(IEventWriteRepository):
 
     def set_event_status(self, event_id: str, status: str) -> None:
         Event.objects.filter(pk=event_id).update(status=status)
+        # update() bypasses post_save; timelines only show graded events.
+        refresh_event_participation_projections(event_id)
+        cache_generations.bump(CACHE_DOMAIN_EVENTS)
 
     @staticmethod
     def _parse_planned_date(
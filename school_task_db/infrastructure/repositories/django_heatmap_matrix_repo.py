@@ -1,206 +1,219 @@
 """Django read adapter for heatmap matrices and timelines."""
 
+from array import array
+
+from django.db.models import Sum
 from django.shortcuts import get_object_or_404
 
 from core_logic.entities.heatmap import (
     HeatmapCourseTimelineSource,
     HeatmapMatrixSource,
-    HeatmapScoreFact,
     HeatmapTimelineEventRef,
     HeatmapTimelineMarkFact,
     ReportHeatmapColumnRef,
 )
 from core_logic.interfaces.heatmap_matrix_repo import IHeatmapMatrixRepository
+from core_logic.value_objects.score_matrix import ScoreMatrix
 from curriculum.models import SubTopic, Topic
-from events.models import Event, EventParticipation
 from infrastructure.repositories.django_heatmap_support import (
     latest_attempt_task_results,
     report_student_ref,
 )
-from infrastructure.services.django_attempt_snapshot_queries import (
-    latest_attempts_by_participation,
-)
+from reports.models import CourseTimelineEntryModel
 from students.models import Student
 
 
 class DjangoHeatmapMatrixRepository(IHeatmapMatrixRepository):
     def get_heatmap_topic_matrix_source(self, student_ids, section_filter=''):
-        students = list(
-            Student.objects.filter(pk__in=student_ids).order_by(
-                'last_name',
-                'first_name',
-            ),
-        )
+        students = self._students(student_ids)
         task_results = latest_attempt_task_results(student_ids)
         topic_sections = self._topic_sections(task_results)
         topic_orders = self._topic_orders(task_results)
-        columns = {}
-        scores = []
-        for result in task_results:
+
+        def topic_column(result):
             topic_id = result.task.topic_id
             section = (
                 result.task.topic_section
                 or topic_sections.get(topic_id, '')
             )
             if not topic_id or (section_filter and section != section_filter):
-                continue
-            columns.setdefault(
-                topic_id,
-                ReportHeatmapColumnRef(
-                    pk=topic_id,
-                    name=result.task.topic_name,
-                    section=section,
-                ),
+                return None
+            return topic_id, lambda: ReportHeatmapColumnRef(
+                pk=topic_id,
+                name=result.task.topic_name,
+                section=section,
             )
-            scores.append(HeatmapScoreFact(
-                student_id=result.student_id,
-                column_id=topic_id,
-                points=result.points,
-                max_points=result.max_points,
-            ))
-        return HeatmapMatrixSource(
-            students=tuple(report_student_ref(student) for student in students),
-            columns=tuple(sorted(
-                columns.values(),
-                key=lambda item: (
-                    item.section,
-                    topic_orders.get(item.pk, 0),
-                    item.name,
-                    item.pk,
-                ),
-            )),
-            scores=tuple(scores),
-        )
 
-    def get_heatmap_course_topic_matrix_source(self, student_ids, work_ids):
-        students = list(
-            Student.objects.filter(pk__in=student_ids).order_by(
-                'last_name',
-                'first_name',
+        return self._matrix_source(
+            students,
+            task_results,
+            topic_column,
+            sort_key=lambda item: (
+                item.section,
+                topic_orders.get(item.pk, 0),
+                item.name,
+                item.pk,
             ),
         )
+
+    def get_heatmap_course_topic_matrix_source(self, student_ids, work_ids):
+        students = self._students(student_ids)
         task_results = latest_attempt_task_results(
             student_ids,
             work_ids=work_ids,
         )
         topic_sections = self._topic_sections(task_results)
         topic_orders = self._topic_orders(task_results)
-        columns = {}
-        scores = []
-        for result in task_results:
+
+        def topic_column(result):
             topic_id = result.task.topic_id
             if not topic_id:
-                continue
-            section = (
-                result.task.topic_section
-                or topic_sections.get(topic_id, '')
-            )
-            columns.setdefault(
-                topic_id,
-                ReportHeatmapColumnRef(
-                    pk=topic_id,
-                    name=result.task.topic_name,
-                    section=section,
+                return None
+            return topic_id, lambda: ReportHeatmapColumnRef(
+                pk=topic_id,
+                name=result.task.topic_name,
+                section=(
+                    result.task.topic_section
+                    or topic_sections.get(topic_id, '')
                 ),
             )
-            scores.append(HeatmapScoreFact(
-                student_id=result.student_id,
-                column_id=topic_id,
-                points=result.points,
-                max_points=result.max_points,
-            ))
-        return HeatmapMatrixSource(
-            students=tuple(report_student_ref(student) for student in students),
-            columns=tuple(sorted(
-                columns.values(),
-                key=lambda item: (
-                    item.section,
-                    topic_orders.get(item.pk, 0),
-                    item.name,
-                    item.pk,
-                ),
-            )),
-            scores=tuple(scores),
+
+        return self._matrix_source(
+            students,
+            task_results,
+            topic_column,
+            sort_key=lambda item: (
+                item.section,
+                topic_orders.get(item.pk, 0),
+                item.name,
+                item.pk,
+            ),
         )
 
     def get_heatmap_course_timeline_source(self, student_ids, work_ids):
-        events = list(Event.objects.filter(
+        # Timeline rows are projected when attempts are captured; one
+        # grouped query yields a ready series per graded event.
+        points = CourseTimelineEntryModel.objects.filter(
+            student_id__in=student_ids,
             work_id__in=work_ids,
-            status='graded',
-        ).order_by('planned_date'))
-        participations = list(
-            EventParticipation.objects.filter(
-                event__in=events,
-                student_id__in=student_ids,
-            ).only('pk', 'event_id')
-        )
-        attempts = latest_attempts_by_participation(
-            (participation.pk for participation in participations),
-            include_task_results=False,
-        )
+        ).values(
+            'event_id',
+            'event_name',
+            'event_planned_at',
+        ).annotate(
+            points=Sum('points'),
+            max_points=Sum('max_points'),
+        ).order_by('event_planned_at', 'event_id')
 
+        events = []
+        marks = []
+        for point in points:
+            event_id = str(point['event_id'])
+            events.append(HeatmapTimelineEventRef(
+                pk=event_id,
+                name=point['event_name'],
+                planned_date=point['event_planned_at'],
+            ))
+            marks.append(HeatmapTimelineMarkFact(
+                event_id=event_id,
+                points=point['points'],
+                max_points=point['max_points'],
+            ))
         return HeatmapCourseTimelineSource(
-            events=tuple(
-                HeatmapTimelineEventRef(
-                    pk=str(event.pk),
-                    name=event.name,
-                    planned_date=event.planned_date,
-                )
-                for event in events
-            ),
-            marks=tuple(
-                HeatmapTimelineMarkFact(
-                    event_id=str(participation.event_id),
-                    points=attempt.points or 0,
-                    max_points=attempt.max_points or 0,
-                )
-                for participation in participations
-                if (attempt := attempts.get(participation.pk)) is not None
-            ),
+            events=tuple(events),
+            marks=tuple(marks),
         )
 
     def get_heatmap_subtopic_matrix_source(self, student_ids, topic_id):
         topic = get_object_or_404(Topic, pk=topic_id)
-        students = list(
+        students = self._students(student_ids)
+        task_results = latest_attempt_task_results(student_ids)
+        subtopic_orders = self._subtopic_orders(task_results)
+
+        def subtopic_column(result):
+            if result.task.topic_id != str(topic.pk):
+                return None
+            subtopic_id = result.task.subtopic_id
+            if not subtopic_id:
+                return None
+            return subtopic_id, lambda: ReportHeatmapColumnRef(
+                pk=subtopic_id,
+                name=result.task.subtopic_name,
+            )
+
+        return self._matrix_source(
+            students,
+            task_results,
+            subtopic_column,
+            sort_key=lambda item: (
+                subtopic_orders.get(item.pk, 0),
+                item.name,
+                item.pk,
+            ),
+        )
+
+    @staticmethod
+    def _students(student_ids):
+        return list(
             Student.objects.filter(pk__in=student_ids).order_by(
                 'last_name',
                 'first_name',
             ),
         )
-        task_results = latest_attempt_task_results(student_ids)
-        subtopic_orders = self._subtopic_orders(task_results)
-        columns = {}
-        scores = []
+
+    @staticmethod
+    def _matrix_source(students, task_results, column_for, *, sort_key):
+        """Code results by student/column position and sum them in place.
+
+        ``column_for`` returns ``None`` for skipped results or a pair of the
+        column id and a factory for its reference, called once per column.
+        """
+        student_refs = tuple(report_student_ref(student) for student in students)
+        student_codes = {
+            student.pk: index
+            for index, student in enumerate(student_refs)
+        }
+        columns = []
+        column_codes = {}
+        row_codes = array('l')
+        score_column_codes = array('l')
+        points = array('d')
+        max_points = array('d')
         for result in task_results:
-            if result.task.topic_id != str(topic.pk):
+            column = column_for(result)
+            if column is None:
                 continue
-            subtopic_id = result.task.subtopic_id
-            if not subtopic_id:
+            column_id, column_ref = column
+            column_code = column_codes.get(column_id)
+            if column_code is None:
+                column_code = column_codes[column_id] = len(columns)
+                columns.append(column_ref())
+            row_code = student_codes.get(result.student_id)
+            if row_code is None:
                 continue
-            columns.setdefault(
-                subtopic_id,
-                ReportHeatmapColumnRef(
-                    pk=subtopic_id,
-                    name=result.task.subtopic_name,
-                ),
-            )
-            scores.append(HeatmapScoreFact(
-                student_id=result.student_id,
-                column_id=subtopic_id,
-                points=result.points,
-                max_points=result.max_points,
-            ))
+            row_codes.append(row_code)
+            score_column_codes.append(column_code)
+            points.append(result.points)
+            max_points.append(result.max_points)
+
+        order = sorted(
+            range(len(columns)),
+            key=lambda code: sort_key(columns[code]),
+        )
+        position_by_code = [0] * len(columns)
+        for position, code in enumerate(order):
+            position_by_code[code] = position
         return HeatmapMatrixSource(
-            students=tuple(report_student_ref(student) for student in students),
-            columns=tuple(sorted(
-                columns.values(),
-                key=lambda item: (
-                    subtopic_orders.get(item.pk, 0),
-                    item.name,
-                    item.pk,
-                ),
-            )),
-            scores=tuple(scores),
+            students=student_refs,
+            columns=tuple(columns[code] for code in order),
+            matrix=ScoreMatrix.from_codes(
+                len(student_refs),
+                len(columns),
+                row_codes,
+                (position_by_code[code] for code in score_column_codes),
+                points,
+                max_points,
+            ),
         )
 
     @staticmethod
@@ -1,6 +1,7 @@
 """Django read adapter for personalized remedial sheet sources."""
 
-from typing import Optional
+from collections import defaultdict
+from typing import Iterable, Optional
 
 from django.db.models import Q
 
@@ -22,7 +23,8 @@ from core_logic.value_objects.task_content_snapshot import (
 from infrastructure.services.django_captured_task_result_queries import (
     captured_task_result_snapshot,
 )
-from works.models import Variant, VariantTask
+from events.models import AttemptTaskSnapshot
+from works.models import Variant, VariantContentBlockSnapshot, VariantTask
 
 
 class DjangoRemedialSheetRepository(IRemedialSheetRepository):
@@ -37,17 +39,78 @@ class DjangoRemedialSheetRepository(IRemedialSheetRepository):
         self,
         variant_id: str,
     ) -> Optional[RemedialSheetSource]:
-        variant = Variant.objects.select_related(
-            'assigned_student',
-            'source_work',
-            'source_attempt_snapshot',
-            'source_participation__event__work',
-            'source_participation__student',
-            'source_participation__variant',
-            'work',
-        ).filter(pk=variant_id).first()
-        if variant is None:
-            return None
+        return self.get_remedial_sheet_sources((variant_id,)).get(
+            str(variant_id),
+        )
+
+    def get_remedial_sheet_sources(
+        self,
+        variant_ids: Iterable[str],
+    ) -> dict[str, RemedialSheetSource]:
+        """Load sheet sources of many variants in four queries."""
+        variant_ids = tuple(dict.fromkeys(map(str, variant_ids)))
+        if not variant_ids:
+            return {}
+        variants = list(
+            Variant.objects.select_related(
+                'assigned_student',
+                'source_work',
+                'source_attempt_snapshot',
+                'source_participation__event__work',
+                'source_participation__student',
+                'source_participation__variant',
+                'work',
+            ).filter(pk__in=variant_ids)
+        )
+        if not variants:
+            return {}
+        found_ids = [variant.pk for variant in variants]
+
+        task_results = defaultdict(list)
+        for task_result in AttemptTaskSnapshot.objects.filter(
+            attempt_id__in=[
+                variant.source_attempt_snapshot_id
+                for variant in variants
+                if variant.source_attempt_snapshot_id
+            ],
+        ).order_by('order_snapshot', 'pk'):
+            task_results[task_result.attempt_id].append(task_result)
+        new_tasks = defaultdict(list)
+        for variant_task in VariantTask.objects.filter(
+            variant_id__in=found_ids,
+        ).order_by('order'):
+            new_tasks[variant_task.variant_id].append(variant_task)
+        content_blocks = defaultdict(list)
+        for block in VariantContentBlockSnapshot.objects.filter(
+            variant_id__in=found_ids,
+        ).order_by('order', 'pk'):
+            content_blocks[block.variant_id].append(block)
+
+        sources = {
+            str(variant.pk): self._remedial_sheet_source(
+                variant,
+                task_results=task_results.get(
+                    variant.source_attempt_snapshot_id,
+                    (),
+                ),
+                new_tasks=new_tasks.get(variant.pk, ()),
+                content_blocks=content_blocks.get(variant.pk, ()),
+            )
+            for variant in variants
+        }
+        return {
+            variant_id: sources[variant_id]
+            for variant_id in variant_ids
+            if variant_id in sources
+        }
+
+    def _remedial_sheet_source(
+        self,
+        variant,
+        task_results,
+        new_tasks,
+        content_blocks,
+    ) -> RemedialSheetSource:
         original_ep = variant.source_participation
         attempt = variant.source_attempt_snapshot
         student = (
@@ -101,10 +164,7 @@ class DjangoRemedialSheetRepository(IRemedialSheetRepository):
                 points=self._optional_float(attempt.points),
                 max_points=self._optional_float(attempt.max_points),
             )
-            for task_result in attempt.task_results.order_by(
-                'order_snapshot',
-                'pk',
-            ):
+            for task_result in task_results:
                 captured = captured_task_result_snapshot(task_result)
                 if captured is None or not captured.is_assessable:
                     continue
@@ -118,10 +178,6 @@ class DjangoRemedialSheetRepository(IRemedialSheetRepository):
                     )
                 )
 
-        new_tasks = VariantTask.objects.filter(
-            variant=variant,
-        ).order_by('order')
-
         return RemedialSheetSource(
             variant=RemedialVariantRef(
                 pk=str(variant.pk),
@@ -173,10 +229,7 @@ class DjangoRemedialSheetRepository(IRemedialSheetRepository):
                     title=block.title,
                     content=block.content,
                 )
-                for block in variant.content_block_snapshots.order_by(
-                    'order',
-                    'pk',
-                )
+                for block in content_blocks
             ),
         )
 
@@ -0,0 +1,71 @@
+"""Django adapter for autosaved review drafts."""
+
+from typing import Optional, Sequence
+
+from django.db import transaction
+
+from core_logic.entities.review import ReviewDraft, ReviewDraftTaskScore
+from core_logic.interfaces.review_draft_repo import IReviewDraftRepository
+from events.models import EventParticipation
+from review.models import ReviewDraft as ReviewDraftModel
+
+
+class DjangoReviewDraftRepository(IReviewDraftRepository):
+    def get_draft(self, participation_id: str) -> Optional[ReviewDraft]:
+        draft = ReviewDraftModel.objects.filter(
+            participation_id=participation_id,
+        ).first()
+        return self._to_entity(draft) if draft else None
+
+    def merge_draft(
+        self,
+        participation_id: str,
+        task_scores: Sequence[ReviewDraftTaskScore],
+    ) -> Optional[ReviewDraft]:
+        with transaction.atomic():
+            # Locking the participation keeps it from being deleted under
+            # the draft; a stale review tab may point at a removed one.
+            if not EventParticipation.objects.select_for_update().filter(
+                pk=participation_id,
+            ).exists():
+                return None
+            draft, _ = ReviewDraftModel.objects.select_for_update().get_or_create(
+                participation_id=participation_id,
+            )
+            stored = dict(draft.task_scores or {})
+            for score in task_scores:
+                entry = dict(stored.get(score.score_key) or {})
+                if score.points_cleared:
+                    entry['points'] = None
+                elif score.points is not None:
+                    entry['points'] = score.points
+                if score.comment is not None:
+                    entry['comment'] = score.comment
+                stored[score.score_key] = entry
+            draft.task_scores = stored
+            draft.save(update_fields=['task_scores', 'updated_at'])
+        return self._to_entity(draft)
+
+    def delete_draft(self, participation_id: str) -> None:
+        ReviewDraftModel.objects.filter(
+            participation_id=participation_id,
+        ).delete()
+
+    @staticmethod
+    def _to_entity(draft) -> ReviewDraft:
+        return ReviewDraft(
+            participation_id=str(draft.participation_id),
+            task_scores=tuple(
+                ReviewDraftTaskScore(
+                    score_key=score_key,
+                    points=fields.get('points'),
+                    comment=fields.get('comment'),
+                    points_cleared=(
+                        'points' in fields and fields['points'] is None
+                    ),
+                )
+                for score_key, fields in (draft.task_scores or {}).items()
+                if isinstance(fields, dict)
+            ),
+            updated_at=draft.updated_at,
+        )
@@ -2,12 +2,16 @@
 
 from typing import Optional
 
+from django.db.models import Exists, OuterRef
+
 from core_logic.entities.review import (
     ReviewCommentRef,
     ReviewEventRef,
     ReviewMarkRef,
     ReviewParticipationAbsenceContext,
     ReviewParticipationRef,
+    ReviewQueue,
+    ReviewQueueEntry,
     ReviewSaveNavigation,
 )
 from core_logic.interfaces.review_workflow_repo import IReviewWorkflowRepository
@@ -20,6 +24,14 @@ from infrastructure.repositories.django_review_refs import (
     review_mark_ref,
     review_participation_ref,
 )
+from infrastructure.services.cache_generations import (
+    CACHE_DOMAIN_EVENTS,
+    cache_generations,
+)
+from infrastructure.services.participation_projections import (
+    refresh_participation_projections,
+)
+from infrastructure.services.review_queue_cache import review_queue_cache
 from review.models import ReviewComment
 
 
@@ -109,6 +121,38 @@ class DjangoReviewWorkflowRepository(IReviewWorkflowRepository):
         EventParticipation.objects.filter(pk=participation_id).update(
             status=status,
         )
+        # update() bypasses post_save, so the projection signal never fires.
+        refresh_participation_projections((participation_id,))
+        cache_generations.bump(CACHE_DOMAIN_EVENTS)
+        review_queue_cache.invalidate(
+            *EventParticipation.objects.filter(
+                pk=participation_id,
+            ).values_list('event_id', flat=True)
+        )
+
+    def get_review_queue(self, event_id: str) -> ReviewQueue:
+        rows = EventParticipation.objects.filter(
+            event_id=event_id,
+        ).exclude(
+            status='absent',
+        ).annotate(
+            graded=Exists(
+                Mark.objects.filter(
+                    participation_id=OuterRef('pk'),
+                    score__isnull=False,
+                )
+            ),
+        ).order_by(
+            'student__last_name',
+            'student__first_name',
+        ).values_list('pk', 'graded')
+        return ReviewQueue(
+            event_id=str(event_id),
+            entries=tuple(
+                ReviewQueueEntry(str(participation_id), graded)
+                for participation_id, graded in rows
+            ),
+        )
 
     def get_save_navigation(self, participation_id: str) -> ReviewSaveNavigation:
         participation = EventParticipation.objects.select_related('event').get(
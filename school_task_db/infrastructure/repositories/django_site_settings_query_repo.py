@@ -4,20 +4,25 @@ from core_logic.entities.site_settings import SiteSettingsData
 from core_logic.interfaces.site_settings_query_repo import (
     ISiteSettingsQueryRepository,
 )
+from infrastructure.services.reference_data_cache import reference_data_cache
 from site_settings.models import SiteSettings
 
 
 class DjangoSiteSettingsQueryRepository(ISiteSettingsQueryRepository):
     def get_site_settings(self) -> SiteSettingsData:
-        settings = SiteSettings.get()
-        return SiteSettingsData(
-            school_name=settings.school_name,
-            teacher_name=settings.teacher_name,
-            default_subject=settings.default_subject,
-            points_scale=settings.points_scale,
-            default_variants_count=settings.default_variants_count,
-            logo=settings.logo,
-            pdf_font_size=settings.pdf_font_size,
-            pdf_margin_top=settings.pdf_margin_top,
-            pdf_margin_bottom=settings.pdf_margin_bottom,
-        )
+        return reference_data_cache.get('site_settings', _load_site_settings)
+
+
+def _load_site_settings():
+    settings = SiteSettings.get()
+    return SiteSettingsData(
+        school_name=settings.school_name,
+        teacher_name=settings.teacher_name,
+        default_subject=settings.default_subject,
+        points_scale=settings.points_scale,
+        default_variants_count=settings.default_variants_count,
+        logo=settings.logo,
+        pdf_font_size=settings.pdf_font_size,
+        pdf_margin_top=settings.pdf_margin_top,
+        pdf_margin_bottom=settings.pdf_margin_bottom,
+    )
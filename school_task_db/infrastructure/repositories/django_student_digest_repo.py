@@ -1,4 +1,9 @@
-"""Django read model for printable student grade digests."""
+"""Django read model for printable student grade digests.
+
+Entries are precomputed per participation when attempts are captured (see
+``infrastructure.services.student_digest_entries``), so a digest window is a
+single range scan over ``(student, window_date)``.
+"""
 
 from core_logic.entities.student_digest import (
     StudentDigestEntryFact,
@@ -9,16 +14,7 @@ from core_logic.entities.student_digest import (
     StudentDigestTaskResultFact,
 )
 from core_logic.interfaces.student_digest_repo import IStudentDigestRepository
-from core_logic.value_objects.attempt_status import (
-    resolve_historical_participation_status,
-)
-from events.models import EventParticipation
-from infrastructure.services.django_attempt_snapshot_queries import (
-    latest_attempts_by_participation,
-)
-from infrastructure.services.django_captured_task_result_queries import (
-    captured_task_result_snapshot,
-)
+from reports.models import StudentDigestEntryModel
 from students.models import StudentGroup
 
 
@@ -39,39 +35,14 @@ class DjangoStudentDigestRepository(IStudentDigestRepository):
         students = list(
             group.students.all().order_by('last_name', 'first_name')
         )
-        student_ids = [student.pk for student in students]
-        all_participations = list(
-            EventParticipation.objects.filter(
-                student_id__in=student_ids,
-                event__planned_date__date__gte=start_date,
-                event__planned_date__date__lte=end_date,
-            ).select_related(
-                'student',
-                'event',
-                'event__work',
-                'event__course',
-            ).order_by('event__planned_date')
-        )
-        attempts = latest_attempts_by_participation(
-            participation.pk for participation in all_participations
-        )
-        participations = [
-            participation
-            for participation in all_participations
-            if participation.status == 'absent'
-            or (
-                participation.pk in attempts
-                and attempts[participation.pk].score is not None
-            )
-        ]
         entries_by_student = {student.pk: [] for student in students}
-        for participation in participations:
-            entries_by_student[participation.student_id].append(
-                self._entry(
-                    participation,
-                    attempts.get(participation.pk),
-                )
-            )
+        rows = StudentDigestEntryModel.objects.filter(
+            student_id__in=entries_by_student,
+            window_date__gte=start_date,
+            window_date__lte=end_date,
+        ).order_by('event_planned_at', 'pk')
+        for row in rows:
+            entries_by_student[row.student_id].append(self._entry(row))
         return StudentDigestSource(
             group=StudentDigestGroupRef(pk=str(group.pk), name=group.name),
             students=tuple(
@@ -86,70 +57,24 @@ class DjangoStudentDigestRepository(IStudentDigestRepository):
             ),
         )
 
-    def _entry(self, participation, attempt):
-        task_results = (
-            attempt.captured_task_results if attempt is not None else ()
-        )
-        task_result_facts = []
-        if attempt:
-            for task_result in task_results:
-                captured = captured_task_result_snapshot(task_result)
-                if captured is None:
-                    continue
-                task_result_facts.append(
-                    StudentDigestTaskResultFact(
-                        topic_name=captured.task.topic_name,
-                        subtopic_name=captured.task.subtopic_name,
-                        subject=captured.task.subject,
-                        points=self._number(captured.points),
-                        max_points=self._number(captured.max_points),
-                        comment=captured.comment,
-                        is_assessable=captured.is_assessable,
-                    )
-                )
-
-        event = participation.event
-        subject = next(
-            (
-                result.subject
-                for result in task_result_facts
-                if result.subject
-            ),
-            '',
-        )
-        if not subject and event.course_id:
-            subject = event.course.subject
+    @staticmethod
+    def _entry(row):
         return StudentDigestEntryFact(
-            event_id=str(event.pk),
-            event_name=(
-                attempt.event_name_snapshot if attempt else event.name
-            ),
-            work_name=(
-                attempt.work_name_snapshot if attempt else event.work.name
-            ),
-            subject=subject,
-            planned_date=(
-                attempt.event_date_snapshot.date()
-                if attempt
-                else event.planned_date.date()
+            event_id=str(row.event_id),
+            event_name=row.event_name,
+            work_name=row.work_name,
+            subject=row.subject,
+            planned_date=row.planned_date,
+            status=row.status,
+            score=row.score,
+            points=row.points,
+            max_points=row.max_points,
+            teacher_comment=row.teacher_comment,
+            mistakes_analysis=row.mistakes_analysis,
+            recommendations=row.recommendations,
+            needs_attention=row.needs_attention,
+            task_results=tuple(
+                StudentDigestTaskResultFact(**result)
+                for result in row.task_results
             ),
-            status=resolve_historical_participation_status(
-                participation.status,
-                has_attempt=attempt is not None,
-            ),
-            score=attempt.score if attempt else None,
-            points=self._number(attempt.points) if attempt else None,
-            max_points=self._number(attempt.max_points) if attempt else None,
-            teacher_comment=attempt.teacher_comment if attempt else '',
-            mistakes_analysis=attempt.mistakes_analysis if attempt else '',
-            recommendations=attempt.recommendations if attempt else '',
-            needs_attention=attempt.needs_attention if attempt else False,
-            task_results=tuple(task_result_facts),
         )
-
-    @staticmethod
-    def _number(value):
-        try:
-            return float(value) if value is not None else None
-        except (TypeError, ValueError):
-            return None
@@ -5,17 +5,58 @@ from core_logic.entities.student_import import StudentImportPlan
 from core_logic.interfaces.student_import_command_repo import (
     IStudentImportCommandRepository,
 )
+from infrastructure.services.search_suggestions import (
+    invalidate_search_suggestions,
+)
 from students.models import Student, StudentGroup
 
+# SQLite limits bound parameters per statement.
+BULK_WRITE_BATCH_SIZE = 200
+STUDENT_FIELDS = ('last_name', 'first_name', 'middle_name', 'email')
+
 
 class DjangoStudentImportCommandRepository(
     IStudentImportCommandRepository,
 ):
     def apply_student_import_plan(self, plan: StudentImportPlan) -> None:
+        years_by_name = self._create_years(plan)
+        group_ids = self._create_groups(plan, years_by_name)
+        student_ids = self._write_students(plan)
+
+        Membership = StudentGroup.students.through
+        Membership.objects.bulk_create(
+            [
+                Membership(
+                    studentgroup_id=(
+                        group_ids.get(item.group_token)
+                        or _existing_id(item.group_token)
+                    ),
+                    student_id=(
+                        student_ids.get(item.student_token)
+                        or _existing_id(item.student_token)
+                    ),
+                )
+                for item in plan.memberships_to_create
+            ],
+            batch_size=BULK_WRITE_BATCH_SIZE,
+        )
+        if plan.groups_to_create or plan.student_mutations:
+            # Bulk writes bypass post_save, so refresh suggestions here.
+            invalidate_search_suggestions()
+
+    @staticmethod
+    def _create_years(plan):
+        group_year_names = {
+            item.academic_year_name
+            for item in plan.groups_to_create
+            if item.academic_year_name
+        }
         years_by_name = {
             year.name: year
             for year in AcademicYear.objects.filter(
-                name__in=[item.name for item in plan.academic_years_to_create],
+                name__in=group_year_names | {
+                    item.name for item in plan.academic_years_to_create
+                },
             )
         }
         for item in plan.academic_years_to_create:
@@ -26,53 +67,52 @@ class DjangoStudentImportCommandRepository(
                     end_date=item.end_date,
                     is_active=item.is_active,
                 )
+        return years_by_name
 
-        group_ids = {}
-        for item in plan.groups_to_create:
-            academic_year = (
-                years_by_name.get(item.academic_year_name)
-                or AcademicYear.objects.filter(
-                    name=item.academic_year_name,
-                ).first()
-                if item.academic_year_name
-                else None
-            )
-            group = StudentGroup.objects.create(
+    @staticmethod
+    def _create_groups(plan, years_by_name):
+        groups = {
+            item.token: StudentGroup(
                 name=item.name,
-                academic_year=academic_year,
+                academic_year=years_by_name.get(item.academic_year_name),
             )
-            group_ids[item.token] = str(group.pk)
+            for item in plan.groups_to_create
+        }
+        StudentGroup.objects.bulk_create(
+            groups.values(),
+            batch_size=BULK_WRITE_BATCH_SIZE,
+        )
+        return {token: str(group.pk) for token, group in groups.items()}
 
-        student_ids = {}
+    @staticmethod
+    def _write_students(plan):
+        # A later mutation of the same token carries its final values, so
+        # a student created and renamed in one import is inserted once.
+        created = {}
+        updated = {}
         for item in plan.student_mutations:
+            values = {name: getattr(item, name) for name in STUDENT_FIELDS}
             if item.operation == 'create':
-                student = Student.objects.create(
-                    last_name=item.last_name,
-                    first_name=item.first_name,
-                    middle_name=item.middle_name,
-                    email=item.email,
+                created[item.token] = Student(**values)
+            elif item.token in created:
+                for name, value in values.items():
+                    setattr(created[item.token], name, value)
+            else:
+                updated[item.token] = Student(
+                    pk=_existing_id(item.token),
+                    **values,
                 )
-                student_ids[item.token] = str(student.pk)
-                continue
-
-            student_id = student_ids.get(item.token) or _existing_id(
-                item.token,
-            )
-            Student.objects.filter(pk=student_id).update(
-                last_name=item.last_name,
-                first_name=item.first_name,
-                middle_name=item.middle_name,
-                email=item.email,
-            )
 
-        for item in plan.memberships_to_create:
-            group_id = group_ids.get(item.group_token) or _existing_id(
-                item.group_token,
-            )
-            student_id = student_ids.get(item.student_token) or _existing_id(
-                item.student_token,
-            )
-            StudentGroup.objects.get(pk=group_id).students.add(student_id)
+        Student.objects.bulk_create(
+            created.values(),
+            batch_size=BULK_WRITE_BATCH_SIZE,
+        )
+        Student.objects.bulk_update(
+            updated.values(),
+            STUDENT_FIELDS,
+            batch_size=BULK_WRITE_BATCH_SIZE,
+        )
+        return {token: str(student.pk) for token, student in created.items()}
 
 
 def _existing_id(token: str) -> str:
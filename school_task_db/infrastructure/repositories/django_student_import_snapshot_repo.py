@@ -1,5 +1,7 @@
 """Django snapshot adapter for planning student imports."""
 
+from django.db.models.functions import Lower
+
 from core.models import AcademicYear
 from core_logic.entities.student_import import (
     StudentImportAcademicYearRef,
@@ -13,11 +15,15 @@ from core_logic.interfaces.student_import_snapshot_repo import (
 )
 from students.models import Student, StudentGroup
 
+# Keeps ``IN`` lists well under SQLite's bound-parameter limit.
+LOOKUP_CHUNK_SIZE = 500
+
 
 class DjangoStudentImportSnapshotRepository(
     IStudentImportSnapshotRepository,
 ):
-    def get_student_import_snapshot(self) -> StudentImportSnapshot:
+    def get_student_import_snapshot(self, rows) -> StudentImportSnapshot:
+        students = self._candidate_students(rows)
         return StudentImportSnapshot(
             academic_years=tuple(
                 StudentImportAcademicYearRef(
@@ -49,18 +55,46 @@ class DjangoStudentImportSnapshotRepository(
                     middle_name=student.middle_name,
                     email=student.email,
                 )
-                for student in Student.objects.all()
+                for student in students
             ),
             memberships=tuple(
                 StudentImportMembershipRef(
                     group_id=str(group_id),
                     student_id=str(student_id),
                 )
+                for chunk in _chunks([student.pk for student in students])
                 for group_id, student_id in (
-                    StudentGroup.students.through.objects.values_list(
-                        'studentgroup_id',
-                        'student_id',
-                    )
+                    StudentGroup.students.through.objects.filter(
+                        student_id__in=chunk,
+                    ).values_list('studentgroup_id', 'student_id')
                 )
             ),
         )
+
+    @staticmethod
+    def _candidate_students(rows):
+        """Load students sharing a row's last name or email.
+
+        The planner matches exact names or case-insensitive emails, so
+        this superset is enough; both lookups are indexed.
+        """
+        last_names = sorted({row.last_name for row in rows})
+        emails = sorted({row.email.lower() for row in rows if row.email})
+        students = {}
+        for chunk in _chunks(last_names):
+            for student in Student.objects.filter(last_name__in=chunk):
+                students[student.pk] = student
+        for chunk in _chunks(emails):
+            for student in Student.objects.alias(
+                email_key=Lower('email'),
+            ).filter(email_key__in=chunk):
+                students[student.pk] = student
+        return sorted(
+            students.values(),
+            key=lambda student: (student.last_name, student.first_name),
+        )
+
+
+def _chunks(values):
+    for start in range(0, len(values), LOOKUP_CHUNK_SIZE):
+        yield values[start:start + LOOKUP_CHUNK_SIZE]
@@ -13,6 +13,7 @@ from core_logic.entities.task import (
 from core_logic.interfaces.task_group_catalog_repo import (
     ITaskGroupCatalogRepository,
 )
+from infrastructure.services.reference_data_cache import reference_data_cache
 from task_groups.models import AnalogGroup, TaskGroup
 from tasks.models import Task
 
@@ -182,9 +183,9 @@ class DjangoTaskGroupCatalogRepository(ITaskGroupCatalogRepository):
         )
 
     def get_list_analog_groups(self):
-        return tuple(
-            SelectOption(id=str(group.pk), name=group.name)
-            for group in AnalogGroup.objects.all().order_by('name')
+        return reference_data_cache.get(
+            'analog_group_options',
+            _load_analog_group_options,
         )
 
     def count_analog_groups(self) -> int:
@@ -197,3 +198,10 @@ class DjangoTaskGroupCatalogRepository(ITaskGroupCatalogRepository):
 
     def count_task_group_memberships(self) -> int:
         return TaskGroup.objects.count()
+
+
+def _load_analog_group_options():
+    return tuple(
+        SelectOption(id=str(group.pk), name=group.name)
+        for group in AnalogGroup.objects.all().order_by('name')
+    )
@@ -6,6 +6,10 @@ from core_logic.interfaces.task_group_management_repo import (
     ITaskGroupManagementRepository,
 )
 from core_logic.value_objects.task_print_settings import TASK_BANK_ROLE_CONTROL
+from infrastructure.services.reference_data_cache import reference_data_cache
+from infrastructure.services.search_suggestions import (
+    invalidate_search_suggestions,
+)
 from task_groups.models import AnalogGroup, TaskGroup
 from tasks.models import Task
 
@@ -24,10 +28,16 @@ class DjangoTaskGroupManagementRepository(ITaskGroupManagementRepository):
         name: str,
         description: str = '',
     ) -> bool:
-        return AnalogGroup.objects.filter(pk=group_id).update(
+        updated = AnalogGroup.objects.filter(pk=group_id).update(
             name=name,
             description=description,
         ) > 0
+        if updated:
+            # update() bypasses post_save, which keeps suggestions and
+            # cached analog-group options fresh.
+            invalidate_search_suggestions()
+            reference_data_cache.invalidate()
+        return updated
 
     def get_analog_group_name(self, group_id: str):
         return AnalogGroup.objects.filter(pk=group_id).values_list(
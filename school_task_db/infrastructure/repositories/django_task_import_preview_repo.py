@@ -7,7 +7,11 @@ from core_logic.entities.task_import import (
     TaskImportPreviewLookup,
 )
 from core_logic.interfaces.task_import import ITaskImportPreviewRepository
+from core_logic.value_objects.task_fingerprint import DUPLICATE_TASK_THRESHOLD
 from curriculum.models import SubTopic, Topic
+from infrastructure.repositories.django_task_similarity_repo import (
+    DjangoTaskSimilarityRepository,
+)
 from task_groups.models import AnalogGroup
 from tasks.models import Task
 
@@ -18,6 +22,11 @@ class DjangoTaskImportPreviewRepository(ITaskImportPreviewRepository):
         'requirement': Requirement,
     }
 
+    def __init__(self, similarity_repo=None):
+        self.similarity_repo = (
+            similarity_repo or DjangoTaskSimilarityRepository()
+        )
+
     def get_facts(
         self,
         lookup: TaskImportPreviewLookup,
@@ -38,6 +47,11 @@ class DjangoTaskImportPreviewRepository(ITaskImportPreviewRepository):
             existing_classifications=self._existing_classifications(
                 lookup.classifications,
             ),
+            similar_tasks=self.similarity_repo.get_similar_tasks_for_texts(
+                dict(lookup.task_texts),
+                threshold=DUPLICATE_TASK_THRESHOLD,
+                limit=1,
+            ),
         )
 
     @staticmethod
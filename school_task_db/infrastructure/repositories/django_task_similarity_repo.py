@@ -0,0 +1,71 @@
+"""Django adapter for near-duplicate task lookup."""
+
+from core_logic.entities.task import SimilarTask
+from core_logic.interfaces.task_similarity_repo import (
+    ITaskSimilarityRepository,
+)
+from core_logic.value_objects.task_fingerprint import (
+    TaskTextFingerprint,
+    task_text_fingerprint,
+)
+from infrastructure.services.task_fingerprints import (
+    similar_task_scores,
+    unpack_signature,
+)
+from tasks.models import Task, TaskFingerprint
+
+
+class DjangoTaskSimilarityRepository(ITaskSimilarityRepository):
+    def get_similar_tasks(self, task_id, *, threshold, limit):
+        signature = TaskFingerprint.objects.filter(
+            task_id=task_id,
+        ).values_list('signature', flat=True).first()
+        if signature is None:
+            return ()
+        return self._similar_tasks(
+            {
+                str(task_id): TaskTextFingerprint(
+                    signature=unpack_signature(signature),
+                ),
+            },
+            threshold=threshold,
+            limit=limit,
+        ).get(str(task_id), ())
+
+    def get_similar_tasks_for_texts(self, texts, *, threshold, limit):
+        return self._similar_tasks(
+            {key: task_text_fingerprint(text) for key, text in texts.items()},
+            threshold=threshold,
+            limit=limit,
+        )
+
+    @staticmethod
+    def _similar_tasks(fingerprints, *, threshold, limit):
+        scores = similar_task_scores(
+            fingerprints,
+            threshold=threshold,
+            limit=limit,
+        )
+        tasks = Task.objects.select_related('topic').only(
+            'pk',
+            'text',
+            'topic__name',
+        ).in_bulk({
+            task_id
+            for matches in scores.values()
+            for task_id, _ in matches
+        })
+        return {
+            key: tuple(
+                SimilarTask(
+                    pk=str(task_id),
+                    short_uuid=tasks[task_id].get_short_uuid(),
+                    text=tasks[task_id].text,
+                    similarity=similarity,
+                    topic=tasks[task_id].topic.name,
+                )
+                for task_id, similarity in matches
+                if task_id in tasks
+            )
+            for key, matches in scores.items()
+        }
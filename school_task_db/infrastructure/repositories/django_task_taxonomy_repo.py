@@ -3,50 +3,68 @@
 from core_logic.entities.task import SelectOption
 from core_logic.interfaces.task_taxonomy_repo import ITaskTaxonomyRepository
 from curriculum.models import SubTopic, Topic
+from infrastructure.services.reference_data_cache import reference_data_cache
 from tasks.models import Source, Task
 
 
 class DjangoTaskTaxonomyRepository(ITaskTaxonomyRepository):
     def get_subtopic_topic_id(self, subtopic_id: str):
-        topic_id = SubTopic.objects.filter(pk=subtopic_id).values_list(
-            'topic_id',
-            flat=True,
-        ).first()
-        return str(topic_id) if topic_id else None
+        topic_ids = reference_data_cache.get(
+            'task_subtopic_topic_ids',
+            _load_subtopic_topic_ids,
+        )
+        return topic_ids.get(str(subtopic_id))
 
     def get_list_topics(self):
-        return tuple(
-            SelectOption(id=str(topic.pk), name=topic.name)
-            for topic in Topic.objects.all().order_by('section', 'name')
-        )
+        return reference_data_cache.get('task_list_topics', _load_list_topics)
 
     def get_list_sources(self):
-        return tuple(
-            SelectOption(id=str(source.pk), name=str(source))
-            for source in Source.objects.all().order_by('name')
-        )
+        return reference_data_cache.get('task_list_sources', _load_list_sources)
 
     def get_subtopics_for_topic(self, topic_id: str):
         if not topic_id:
             return ()
-        return tuple(
-            SelectOption(id=str(subtopic.pk), name=subtopic.name)
-            for subtopic in SubTopic.objects.filter(
-                topic_id=topic_id,
-            ).order_by('order', 'name')
+        subtopics = reference_data_cache.get(
+            'task_subtopics_by_topic',
+            _load_subtopics_by_topic,
         )
+        return subtopics.get(str(topic_id), ())
 
     def get_subtopic_options(self, topic_id: str) -> tuple[SelectOption, ...]:
-        if not topic_id:
-            return ()
-        try:
-            topic = Topic.objects.get(pk=topic_id)
-        except (Topic.DoesNotExist, ValueError):
-            return ()
-        return tuple(
-            SelectOption(id=str(subtopic.id), name=subtopic.name)
-            for subtopic in topic.subtopics.all().order_by('order', 'name')
-        )
+        return self.get_subtopics_for_topic(topic_id)
 
     def get_task_type_choices(self):
         return tuple(Task.TASK_TYPES)
+
+
+def _load_subtopic_topic_ids():
+    return {
+        str(subtopic_id): str(topic_id)
+        for subtopic_id, topic_id in SubTopic.objects.values_list(
+            'pk',
+            'topic_id',
+        )
+    }
+
+
+def _load_list_topics():
+    return tuple(
+        SelectOption(id=str(topic.pk), name=topic.name)
+        for topic in Topic.objects.all().order_by('section', 'name')
+    )
+
+
+def _load_list_sources():
+    return tuple(
+        SelectOption(id=str(source.pk), name=str(source))
+        for source in Source.objects.all().order_by('name')
+    )
+
+
+def _load_subtopics_by_topic():
+    subtopics = {}
+    for subtopic in SubTopic.objects.order_by('order', 'name'):
+        subtopics.setdefault(str(subtopic.topic_id), []).append(
+            SelectOption(id=str(subtopic.pk), name=subtopic.name),
+        )
+    return {topic_id: tuple(options) for topic_id, options in subtopics.items()}
@@ -7,7 +7,9 @@ from core_logic.entities.work import (
 from core_logic.interfaces.variant_generation_form_repo import (
     IVariantGenerationFormRepository,
 )
-from task_groups.models import TaskGroup
+from infrastructure.repositories.django_analog_group_memberships import (
+    task_bank_roles_by_group,
+)
 from works.models import Work, WorkAnalogGroup
 
 
@@ -28,26 +30,25 @@ class DjangoVariantGenerationFormRepository(
         )
 
     def get_variant_generation_group_sources(self, work_id: str):
+        work_groups = list(
+            WorkAnalogGroup.objects.filter(
+                work_id=work_id,
+            ).select_related(
+                'analog_group',
+            ).order_by('order', 'pk')
+        )
+        roles_by_group = task_bank_roles_by_group(
+            work_group.analog_group_id for work_group in work_groups
+        )
         return tuple(
             VariantGenerationGroupSource(
                 group_name=work_group.analog_group.name,
                 requested_count=work_group.count,
                 bank_role_filter=work_group.bank_role_filter,
-                task_bank_roles=self._task_bank_roles(
+                task_bank_roles=roles_by_group.get(
                     work_group.analog_group_id,
+                    (),
                 ),
             )
-            for work_group in WorkAnalogGroup.objects.filter(
-                work_id=work_id,
-            ).select_related(
-                'analog_group',
-            ).order_by('order', 'pk')
-        )
-
-    @staticmethod
-    def _task_bank_roles(analog_group_id):
-        return tuple(
-            TaskGroup.objects.filter(
-                group_id=analog_group_id,
-            ).order_by('pk').values_list('bank_role', flat=True)
+            for work_group in work_groups
         )
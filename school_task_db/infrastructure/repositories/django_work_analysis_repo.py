@@ -2,6 +2,9 @@
 
 from collections import defaultdict
 
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
 from core_logic.entities.report_summary import (
     WorkAnalysisItemSource,
     WorkAnalysisSource,
@@ -18,62 +21,85 @@ from infrastructure.repositories.django_report_summary_support import (
 from infrastructure.services.django_attempt_snapshot_queries import (
     latest_attempts_by_participation,
 )
-from works.models import Work
+from infrastructure.services.work_analysis_cache import work_analysis_cache
+from works.models import Variant
 
 
 class DjangoWorkAnalysisRepository(IWorkAnalysisRepository):
+    def __init__(self, source_cache=None):
+        self.source_cache = source_cache or work_analysis_cache
+
     def get_work_analysis_source(self, year):
         events, participations, courses = event_scope(year)
-        scoped_participations = list(
-            participations.select_related('event').only(
-                'pk',
-                'event_id',
-                'event__work_id',
-            )
-        )
-        attempts = latest_attempts_by_participation(
-            (participation.pk for participation in scoped_participations),
-            include_task_results=False,
-        )
-        attempts_by_work = defaultdict(list)
-        for participation in scoped_participations:
-            attempt = attempts.get(participation.pk)
-            if attempt is not None and attempt.score is not None:
-                attempts_by_work[participation.event.work_id].append(attempt)
-
-        work_sources = []
-        for work in Work.objects.all():
-            work_events = list(
-                event_summary_queryset(
-                    events.filter(work=work),
-                ).order_by('-planned_date')
-            )
-            if not work_events:
-                continue
-
-            work_sources.append(
-                WorkAnalysisItemSource(
-                    work=report_work_ref(work),
-                    events_count=len(work_events),
-                    marks=tuple(
-                        ReportMarkFact(
-                            score=attempt.score,
-                            points=attempt.points,
-                            max_points=attempt.max_points,
-                        )
-                        for attempt in attempts_by_work[work.pk]
-                    ),
-                    events=tuple(
-                        report_event_ref(event)
-                        for event in work_events
-                    ),
-                ),
-            )
+        works = self.source_cache.get(year)
+        if works is None:
+            works = self._work_sources(events, participations)
+            self.source_cache.set(year, works)
 
         return WorkAnalysisSource(
-            works=tuple(work_sources),
+            works=works,
             courses=tuple(
                 report_course_ref(course)
                 for course in courses.order_by('grade_level', 'name')
             ),
         )
+
+    def _work_sources(self, events, participations):
+        # Works without events in scope are never loaded: one grouped query
+        # returns every scoped event with its counts and its work's variant
+        # count, ordered by work as Work.objects.all() would list them.
+        variant_counts = Variant.objects.filter(
+            work_id=OuterRef('work_id'),
+        ).order_by().values('work_id').annotate(
+            total=Count('pk'),
+        ).values('total')
+        scoped_events = event_summary_queryset(events).annotate(
+            work_variant_count=Coalesce(
+                Subquery(variant_counts, output_field=IntegerField()),
+                0,
+            ),
+        ).order_by('-work__created_at', 'work_id', '-planned_date')
+
+        events_by_work = {}
+        for event in scoped_events:
+            event.work.variant_count = event.work_variant_count
+            events_by_work.setdefault(event.work_id, []).append(event)
+
+        if not events_by_work:
+            return ()
+
+        marks_by_work = self._marks_by_work(participations)
+        return tuple(
+            WorkAnalysisItemSource(
+                work=report_work_ref(work_events[0].work),
+                events_count=len(work_events),
+                marks=marks_by_work.get(work_id, ()),
+                events=tuple(report_event_ref(event) for event in work_events),
+            )
+            for work_id, work_events in events_by_work.items()
+        )
+
+    @staticmethod
+    def _marks_by_work(participations):
+        scoped_participations = list(
+            participations.values_list('pk', 'event__work_id'),
+        )
+        attempts = latest_attempts_by_participation(
+            (participation_id for participation_id, _ in scoped_participations),
+            include_task_results=False,
+        )
+        marks_by_work = defaultdict(list)
+        for participation_id, work_id in scoped_participations:
+            attempt = attempts.get(participation_id)
+            if attempt is not None and attempt.score is not None:
+                marks_by_work[work_id].append(
+                    ReportMarkFact(
+                        score=attempt.score,
+                        points=attempt.points,
+                        max_points=attempt.max_points,
+                    ),
+                )
+        return {
+            work_id: tuple(marks)
+            for work_id, marks in marks_by_work.items()
+        }
@@ -1,6 +1,7 @@
 """Django read adapter for work list, form, and detail screens."""
 
-from django.db.models import Count, Sum
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
 
 from core_logic.entities.work import (
     WorkDetailAnalogGroup,
@@ -12,7 +13,12 @@ from core_logic.entities.work import (
     WorkListItem,
 )
 from core_logic.interfaces.work_read_repo import IWorkReadRepository
-from task_groups.models import AnalogGroup, TaskGroup
+from events.models import Event
+from infrastructure.repositories.django_analog_group_memberships import (
+    task_bank_roles_by_group,
+)
+from infrastructure.services.reference_data_cache import reference_data_cache
+from task_groups.models import AnalogGroup
 from works.models import Variant, Work, WorkAnalogGroup, WorkContentBlock
 
 
@@ -48,13 +54,16 @@ class DjangoWorkReadRepository(IWorkReadRepository):
         )
 
     def get_work_form_analog_group_options(self):
-        return tuple(
-            WorkAnalogGroupOption(id=str(group.pk), name=group.name)
-            for group in AnalogGroup.objects.all().order_by('name')
+        return reference_data_cache.get(
+            'work_form_analog_group_options',
+            _load_work_form_analog_group_options,
         )
 
     def get_work_detail(self, work_id: str):
-        work = Work.objects.filter(pk=work_id).first()
+        work = Work.objects.annotate(
+            variant_count_value=_count_by_work(Variant),
+            event_count_value=_count_by_work(Event),
+        ).filter(pk=work_id).first()
         if work is None:
             return None
 
@@ -65,11 +74,11 @@ class DjangoWorkReadRepository(IWorkReadRepository):
             work_type_display=work.get_work_type_display(),
             duration=work.duration,
             max_score=work.max_score,
-            variant_count=Variant.objects.filter(work_id=work_id).count(),
+            variant_count=work.variant_count_value,
             created_at=work.created_at,
             updated_at=work.updated_at,
             assessment_mode=work.assessment_mode,
-            event_count=work.event_set.count(),
+            event_count=work.event_count_value,
         )
 
     def get_detail_variants(self, work_id: str):
@@ -107,14 +116,23 @@ class DjangoWorkReadRepository(IWorkReadRepository):
         return tuple(result)
 
     def get_detail_analog_groups(self, work_id: str):
-        return tuple(
-            self._build_work_detail_spec_group(work_group)
-            for work_group in WorkAnalogGroup.objects.filter(
+        work_groups = list(
+            WorkAnalogGroup.objects.filter(
                 work_id=work_id,
             ).select_related(
                 'analog_group',
             ).order_by('order', 'pk')
         )
+        roles_by_group = task_bank_roles_by_group(
+            work_group.analog_group_id for work_group in work_groups
+        )
+        return tuple(
+            self._build_work_detail_spec_group(
+                work_group,
+                roles_by_group.get(work_group.analog_group_id, ()),
+            )
+            for work_group in work_groups
+        )
 
     def get_detail_content_blocks(self, work_id: str):
         return tuple(
@@ -135,15 +153,14 @@ class DjangoWorkReadRepository(IWorkReadRepository):
             ).prefetch_related('topics').order_by('order', 'pk')
         )
 
-    def _build_work_detail_spec_group(self, work_group):
+    @staticmethod
+    def _build_work_detail_spec_group(work_group, task_bank_roles):
         return WorkDetailSpecGroup(
             order=work_group.order,
             analog_group=WorkDetailAnalogGroup(
                 pk=str(work_group.analog_group.pk),
                 name=work_group.analog_group.name,
-                task_count=TaskGroup.objects.filter(
-                    group=work_group.analog_group,
-                ).count(),
+                task_count=len(task_bank_roles),
             ),
             count=work_group.count,
             weight=work_group.weight,
@@ -154,15 +171,21 @@ class DjangoWorkReadRepository(IWorkReadRepository):
             blank_cells_after=work_group.blank_cells_after,
             blank_space_area_cm2=work_group.blank_space_area_cm2,
             page_break_after=work_group.page_break_after,
-            task_bank_roles=self._task_bank_roles(
-                work_group.analog_group_id,
-            ),
+            task_bank_roles=task_bank_roles,
         )
 
-    @staticmethod
-    def _task_bank_roles(analog_group_id):
-        return tuple(
-            TaskGroup.objects.filter(
-                group_id=analog_group_id,
-            ).order_by('pk').values_list('bank_role', flat=True)
-        )
+
+def _count_by_work(model):
+    counts = model.objects.filter(
+        work_id=OuterRef('pk'),
+    ).order_by().values('work_id').annotate(
+        total=Count('pk'),
+    ).values('total')
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def _load_work_form_analog_group_options():
+    return tuple(
+        WorkAnalogGroupOption(id=str(group.pk), name=group.name)
+        for group in AnalogGroup.objects.all().order_by('name')
+    )
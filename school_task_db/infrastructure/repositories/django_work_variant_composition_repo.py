@@ -5,7 +5,6 @@ from typing import Optional
 from django.db import transaction
 
 from core_logic.entities.work_variant_composition import (
-    AvailableVariantTask,
     WorkTheorySubtopicSource,
     WorkTheoryTopicSource,
     WorkVariantCompositionPlan,
@@ -17,10 +16,12 @@ from core_logic.entities.work_variant_composition import (
 from core_logic.interfaces.work_variant_composition_repo import (
     IWorkVariantCompositionRepository,
 )
+from infrastructure.repositories.django_analog_group_memberships import (
+    available_tasks_by_group,
+)
 from infrastructure.repositories.django_variant_content_persistence import (
     persist_variant_content,
 )
-from task_groups.models import TaskGroup
 from works.models import (
     Variant,
     Work,
@@ -51,6 +52,9 @@ class DjangoWorkVariantCompositionRepository(
                 'topics__subtopics',
             ).order_by('order', 'pk')
         )
+        tasks_by_group = available_tasks_by_group(
+            work_group.analog_group_id for work_group in work_groups
+        )
         return WorkVariantCompositionSource(
             work_name=work.name,
             duration=work.duration,
@@ -58,7 +62,10 @@ class DjangoWorkVariantCompositionRepository(
             variant_counter=work.variant_counter,
             assessment_mode=work.assessment_mode,
             spec_rows=tuple(
-                self._variant_composition_spec_source_row(work_group)
+                self._variant_composition_spec_source_row(
+                    work_group,
+                    tasks_by_group.get(work_group.analog_group_id, ()),
+                )
                 for work_group in work_groups
             ),
             content_blocks=tuple(
@@ -99,22 +106,13 @@ class DjangoWorkVariantCompositionRepository(
             return WorkVariantCompositionSaveResult(status='saved')
 
     @staticmethod
-    def _variant_composition_spec_source_row(work_group):
-        task_groups = TaskGroup.objects.filter(
-            group=work_group.analog_group,
-        )
+    def _variant_composition_spec_source_row(work_group, available_tasks):
         return WorkVariantSpecSourceRow(
             spec_row_id=str(work_group.pk),
             count=work_group.count,
             weight=work_group.weight,
             content_order=work_group.order,
-            available_tasks=tuple(
-                AvailableVariantTask(
-                    task_id=str(task_group.task_id),
-                    bank_role=task_group.bank_role,
-                )
-                for task_group in task_groups.order_by('pk')
-            ),
+            available_tasks=available_tasks,
             bank_role_filter=work_group.bank_role_filter,
             render_mode=work_group.render_mode,
             is_assessable=work_group.is_assessable,
@@ -8,6 +8,14 @@ from core_logic.value_objects.task_print_settings import (
     DEFAULT_BLANK_CELLS_ROWS,
 )
 
+# ``compact`` draws the whole notebook grid as one element; ``cells`` keeps
+# one DOM node per cell for renderers that cannot paint background patterns.
+BLANK_CELLS_RENDER_COMPACT = 'compact'
+BLANK_CELLS_RENDER_CELLS = 'cells'
+BLANK_CELLS_RENDER_MODES = frozenset(
+    (BLANK_CELLS_RENDER_COMPACT, BLANK_CELLS_RENDER_CELLS)
+)
+
 PRINTABLE_WIDTH_MM = {
     'A4': 186,
     'A5': 130,
@@ -31,15 +39,24 @@ def build_blank_cells_payload(options, page_format='A4'):
     else:
         columns = _page_columns(page_format)
         rows = ceil(_cell_count(area_cm2) / columns)
+    render_mode = options.get('render_mode')
+    if render_mode not in BLANK_CELLS_RENDER_MODES:
+        render_mode = BLANK_CELLS_RENDER_COMPACT
+    cell_count = rows * columns
     return {
         **options,
         'area_cm2': area_cm2,
         'rows': rows,
         'columns': columns,
         'cell_size_mm': BLANK_CELL_SIZE_MM,
+        'cell_count': cell_count,
+        'render_mode': render_mode,
         'css_max_width_mm': columns * BLANK_CELL_SIZE_MM,
+        'css_height_mm': rows * BLANK_CELL_SIZE_MM,
         'rows_range': range(rows),
-        'cells_range': range(rows * columns),
+        'cells_range': range(
+            cell_count if render_mode == BLANK_CELLS_RENDER_CELLS else 0
+        ),
         'latex_cell_size_mm': f'{BLANK_CELL_SIZE_MM:.1f}',
     }
 
@@ -0,0 +1,93 @@
+"""Cross-process cache generations for O(1) domain invalidation."""
+
+import time
+from typing import Iterable
+
+from django.core.cache import cache
+
+
+CACHE_DOMAIN_TASKS = 'tasks'
+CACHE_DOMAIN_ATTEMPTS = 'attempts'
+CACHE_DOMAIN_WORKS = 'works'
+CACHE_DOMAIN_EVENTS = 'events'
+CACHE_DOMAIN_SEARCH = 'search'
+CACHE_DOMAINS = (
+    CACHE_DOMAIN_TASKS,
+    CACHE_DOMAIN_ATTEMPTS,
+    CACHE_DOMAIN_WORKS,
+    CACHE_DOMAIN_EVENTS,
+    CACHE_DOMAIN_SEARCH,
+)
+
+
+class DjangoCacheGenerations:
+    """Генерации доменов данных в общем Django-кэше.
+
+    Производный ключ включает текущие генерации своих доменов, поэтому
+    инвалидация — это один инкремент счётчика, видимый всем процессам,
+    которые используют тот же backend. Старые записи не удаляются и
+    вытесняются по TIMEOUT самого кэша.
+    """
+
+    KEY_PREFIX = 'cache_generation:'
+
+    def current(self, domain: str) -> int:
+        return self.current_many((domain,))[domain]
+
+    def current_many(self, domains: Iterable[str]) -> dict[str, int]:
+        domains = tuple(dict.fromkeys(domains))
+        for domain in domains:
+            self._validate_domain(domain)
+        keys = {domain: self._key(domain) for domain in domains}
+        stored = cache.get_many(keys.values())
+        generations = {}
+        for domain, key in keys.items():
+            generation = stored.get(key)
+            if generation is None:
+                generation = self._seed(key)
+            generations[domain] = generation
+        return generations
+
+    def bump(self, *domains: str) -> None:
+        for domain in domains:
+            self._validate_domain(domain)
+            key = self._key(domain)
+            try:
+                cache.incr(key)
+            except ValueError:
+                # Счётчик вытеснен или ещё не создан: новое зерно от часов
+                # всегда больше любого ранее выданного значения.
+                cache.set(key, self._new_seed_value(), timeout=None)
+
+    def versioned_key(self, key: str, *domains: str) -> str:
+        if not domains:
+            return key
+        generations = self.current_many(domains)
+        stamp = '.'.join(
+            f'{domain}{generations[domain]}'
+            for domain in sorted(generations)
+        )
+        return f'{key}@{stamp}'
+
+    @classmethod
+    def _key(cls, domain: str) -> str:
+        return f'{cls.KEY_PREFIX}{domain}'
+
+    def _seed(self, key: str) -> int:
+        generation = self._new_seed_value()
+        if cache.add(key, generation, timeout=None):
+            return generation
+        return cache.get(key, generation)
+
+    @staticmethod
+    def _new_seed_value() -> int:
+        return time.time_ns()
+
+    @staticmethod
+    def _validate_domain(domain: str) -> None:
+        if domain not in CACHE_DOMAINS:
+            raise ValueError(f'Неизвестный домен кэша: {domain}')
+
+
+# Shared adapter instance used by caches and signals.
+cache_generations = DjangoCacheGenerations()
@@ -0,0 +1,146 @@
+"""Maintain per-entry and per-requirement task counts of codifiers.
+
+An entry counts the tasks of its subtopic, or of its topic when it is
+bound to a topic only; a leaf is covered once that count is positive.
+Requirements count the tasks linked to them directly. Refreshes recount
+the given rows with grouped queries and replace their rollup rows.
+"""
+
+from django.db import transaction
+from django.db.models import Count, Q
+
+from codifier.models import (
+    ContentEntry,
+    ContentEntryRollup,
+    Requirement,
+    RequirementRollup,
+)
+from tasks.models import Task
+
+BULK_WRITE_BATCH_SIZE = 200
+
+
+def entry_task_count(entry, topic_counts, subtopic_counts) -> int:
+    if entry.subtopic_id:
+        return subtopic_counts.get(entry.subtopic_id, 0)
+    if entry.topic_id:
+        return topic_counts.get(entry.topic_id, 0)
+    return 0
+
+
+def refresh_content_entry_rollups(entry_ids) -> int:
+    """Recount rollups of ``entry_ids``; return rows written."""
+    entry_ids = tuple(dict.fromkeys(entry_ids))
+    if not entry_ids:
+        return 0
+    entries = list(
+        ContentEntry.objects.filter(pk__in=entry_ids).annotate(
+            child_count=Count('children'),
+        ).only('pk', 'codifier_id', 'topic_id', 'subtopic_id'),
+    )
+    topic_counts = _task_counts(
+        'topic_id',
+        {entry.topic_id for entry in entries if not entry.subtopic_id},
+    )
+    subtopic_counts = _task_counts(
+        'subtopic_id',
+        {entry.subtopic_id for entry in entries if entry.subtopic_id},
+    )
+    rows = [
+        ContentEntryRollup(
+            entry_id=entry.pk,
+            codifier_id=entry.codifier_id,
+            is_leaf=not entry.child_count,
+            task_count=entry_task_count(entry, topic_counts, subtopic_counts),
+        )
+        for entry in entries
+    ]
+    with transaction.atomic():
+        ContentEntryRollup.objects.filter(entry_id__in=entry_ids).delete()
+        ContentEntryRollup.objects.bulk_create(
+            rows,
+            batch_size=BULK_WRITE_BATCH_SIZE,
+        )
+    return len(rows)
+
+
+def refresh_requirement_rollups(requirement_ids) -> int:
+    """Recount rollups of ``requirement_ids``; return rows written."""
+    requirement_ids = tuple(dict.fromkeys(requirement_ids))
+    if not requirement_ids:
+        return 0
+    rows = [
+        RequirementRollup(requirement_id=pk, task_count=task_count)
+        for pk, task_count in Requirement.objects.filter(
+            pk__in=requirement_ids,
+        ).annotate(
+            task_count=Count('tasks'),
+        ).values_list('pk', 'task_count')
+    ]
+    with transaction.atomic():
+        RequirementRollup.objects.filter(
+            requirement_id__in=requirement_ids,
+        ).delete()
+        RequirementRollup.objects.bulk_create(
+            rows,
+            batch_size=BULK_WRITE_BATCH_SIZE,
+        )
+    return len(rows)
+
+
+def content_entry_ids_for_curriculum(topic_ids=(), subtopic_ids=()):
+    """Return entries whose task count follows these topics or subtopics."""
+    topic_ids = {pk for pk in topic_ids if pk}
+    subtopic_ids = {pk for pk in subtopic_ids if pk}
+    if not topic_ids and not subtopic_ids:
+        return []
+    return list(
+        ContentEntry.objects.filter(
+            Q(subtopic_id__in=subtopic_ids)
+            | Q(subtopic__isnull=True, topic_id__in=topic_ids),
+        ).values_list('pk', flat=True)
+    )
+
+
+def refresh_curriculum_rollups(topic_ids=(), subtopic_ids=()) -> int:
+    return refresh_content_entry_rollups(
+        content_entry_ids_for_curriculum(topic_ids, subtopic_ids),
+    )
+
+
+def refresh_codifier_rollups(codifier_id) -> dict[str, int]:
+    return {
+        'entries': refresh_content_entry_rollups(
+            ContentEntry.objects.filter(
+                codifier_id=codifier_id,
+            ).values_list('pk', flat=True),
+        ),
+        'requirements': refresh_requirement_rollups(
+            Requirement.objects.filter(
+                codifier_id=codifier_id,
+            ).values_list('pk', flat=True),
+        ),
+    }
+
+
+def rebuild_codifier_rollups(batch_size=500) -> dict[str, int]:
+    """Recount every entry and requirement in batches."""
+    written = {'entries': 0, 'requirements': 0}
+    for key, model, refresh in (
+        ('entries', ContentEntry, refresh_content_entry_rollups),
+        ('requirements', Requirement, refresh_requirement_rollups),
+    ):
+        ids = list(model.objects.order_by('pk').values_list('pk', flat=True))
+        for start in range(0, len(ids), batch_size):
+            written[key] += refresh(ids[start:start + batch_size])
+    return written
+
+
+def _task_counts(field, ids):
+    if not ids:
+        return {}
+    return dict(
+        Task.objects.filter(**{f'{field}__in': ids}).order_by().values(
+            field,
+        ).annotate(total=Count('pk')).values_list(field, 'total')
+    )
@@ -0,0 +1,51 @@
+"""Project latest attempts of graded events into course timeline rows."""
+
+from reports.models import CourseTimelineEntryModel
+
+BULK_WRITE_BATCH_SIZE = 200
+
+
+def course_timeline_entry_values(participation, attempt):
+    """Return timeline row fields, or ``None`` outside graded events.
+
+    ``participation`` needs ``event`` loaded.
+    """
+    event = participation.event
+    if attempt is None or event.status != 'graded':
+        return None
+    return {
+        'student_id': participation.student_id,
+        'work_id': event.work_id,
+        'event_id': event.pk,
+        'event_name': event.name,
+        'event_planned_at': event.planned_date,
+        'points': float(attempt.points or 0),
+        'max_points': float(attempt.max_points or 0),
+    }
+
+
+def replace_course_timeline_entries(
+    participations,
+    attempts,
+    participation_ids,
+) -> int:
+    """Replace timeline rows of ``participation_ids``; return rows written."""
+    rows = []
+    for participation in participations:
+        values = course_timeline_entry_values(
+            participation,
+            attempts.get(participation.pk),
+        )
+        if values is not None:
+            rows.append(CourseTimelineEntryModel(
+                participation_id=participation.pk,
+                **values,
+            ))
+    CourseTimelineEntryModel.objects.filter(
+        participation_id__in=participation_ids,
+    ).delete()
+    CourseTimelineEntryModel.objects.bulk_create(
+        rows,
+        batch_size=BULK_WRITE_BATCH_SIZE,
+    )
+    return len(rows)
@@ -14,14 +14,70 @@ def latest_attempts_by_participation(
     participation_ids = tuple(participation_ids)
     if not participation_ids:
         return {}
+    return _attempts_by_participation(
+        AttemptSnapshot.objects.filter(
+            participation_id__in=participation_ids,
+            is_latest=True,
+        ),
+        include_task_results,
+    )
 
-    latest_revision = AttemptSnapshot.objects.filter(
-        participation_id=OuterRef('participation_id'),
-    ).order_by('-revision').values('revision')[:1]
+
+def latest_attempts_by_revision(
+    participation_ids,
+    *,
+    include_task_results=True,
+):
+    """Resolve latest attempts by revision order, ignoring ``is_latest``.
+
+    This is the reference strategy the flag is maintained against; reports
+    use ``latest_attempts_by_participation``.
+    """
+    participation_ids = tuple(participation_ids)
+    if not participation_ids:
+        return {}
+    return _attempts_by_participation(
+        AttemptSnapshot.objects.filter(
+            participation_id__in=participation_ids,
+            revision=Subquery(_latest_revision()),
+        ),
+        include_task_results,
+    )
+
+
+def refresh_latest_attempt_flags(participation_ids):
+    """Point ``is_latest`` at the newest revision of every participation."""
+    participation_ids = tuple(participation_ids)
+    if not participation_ids:
+        return
     attempts = AttemptSnapshot.objects.filter(
         participation_id__in=participation_ids,
-        revision=Subquery(latest_revision),
     )
+    # Clear first: at most one flagged revision per participation is allowed.
+    attempts.filter(is_latest=True).update(is_latest=False)
+    attempts.filter(
+        revision=Subquery(_latest_revision()),
+    ).update(is_latest=True)
+
+
+def latest_attempt_revisions_for_event(event_id):
+    """Return ``(participation_id, revision)`` of every latest event attempt."""
+    return tuple(
+        (str(participation_id), revision)
+        for participation_id, revision in AttemptSnapshot.objects.filter(
+            participation__event_id=event_id,
+            is_latest=True,
+        ).order_by().values_list('participation_id', 'revision')
+    )
+
+
+def _latest_revision():
+    return AttemptSnapshot.objects.filter(
+        participation_id=OuterRef('participation_id'),
+    ).order_by('-revision').values('revision')[:1]
+
+
+def _attempts_by_participation(attempts, include_task_results):
     if include_task_results:
         attempts = attempts.prefetch_related(
             Prefetch(
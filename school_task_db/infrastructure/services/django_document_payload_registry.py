@@ -116,9 +116,11 @@ def build_work_section_payload_builder_registry(
 def build_remedial_sheet_section_payload_builder_registry(
     get_remedial_sheet_data,
     task_payload_formatter=None,
+    get_remedial_sheet_data_many=None,
 ) -> DocumentSectionPayloadBuilderRegistry:
     sheet_data_provider = RemedialSheetDataProvider(
         get_remedial_sheet_data=get_remedial_sheet_data,
+        get_remedial_sheet_data_many=get_remedial_sheet_data_many,
     )
     registry = DocumentSectionPayloadBuilderRegistry()
     header_builder = RemedialHeaderPayloadBuilder(sheet_data_provider)
@@ -2,12 +2,16 @@
 
 import hashlib
 import mimetypes
+from concurrent.futures import ThreadPoolExecutor
 
 from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
 from django.db import IntegrityError, transaction
 
 from tasks.models import ImageAsset, image_asset_upload_path
 
+BULK_WRITE_BATCH_SIZE = 200
+
 
 class DjangoImageAssetStore:
     """Create or reuse an immutable asset identified by its SHA-256."""
@@ -22,21 +26,11 @@ class DjangoImageAssetStore:
             self._restore_missing_file(existing, uploaded_file)
             return existing
 
-        original_filename = self._filename(uploaded_file)
-        asset = ImageAsset(
-            checksum=checksum,
-            byte_size=byte_size,
-            mime_type=(
-                getattr(uploaded_file, 'content_type', '')
-                or mimetypes.guess_type(original_filename)[0]
-                or 'application/octet-stream'
-            ),
-            original_filename=original_filename,
-        )
+        asset = self._new_asset(uploaded_file, checksum, byte_size)
         asset.file.name = self._store_file(
             asset,
             uploaded_file,
-            original_filename=original_filename,
+            original_filename=asset.original_filename,
         )
         try:
             with transaction.atomic():
@@ -49,6 +43,79 @@ class DjangoImageAssetStore:
             return existing
         return asset
 
+    def get_or_create_many(self, images, max_workers=1) -> list[ImageAsset]:
+        """Return one asset per ingested image, in order.
+
+        ``images`` carry ``filename``, ``content`` and a precomputed
+        ``checksum``. Existing assets are found with one query; only new
+        content is written, ``max_workers`` files at a time, and inserted
+        with one bulk insert.
+        """
+        images = list(images)
+        files = {}
+        for image in images:
+            files.setdefault(
+                image.checksum,
+                ContentFile(image.content, name=image.filename),
+            )
+        assets = {
+            asset.checksum: asset
+            for asset in ImageAsset.objects.filter(checksum__in=files)
+        }
+        for checksum, asset in assets.items():
+            self._restore_missing_file(asset, files[checksum])
+
+        new_assets = [
+            self._new_asset(uploaded_file, checksum, uploaded_file.size)
+            for checksum, uploaded_file in files.items()
+            if checksum not in assets
+        ]
+        if new_assets:
+            self._store_files(new_assets, files, max_workers)
+            ImageAsset.objects.bulk_create(
+                new_assets,
+                batch_size=BULK_WRITE_BATCH_SIZE,
+                ignore_conflicts=True,
+            )
+            # Rows inserted concurrently by another import win the conflict.
+            assets.update(
+                (asset.checksum, asset)
+                for asset in ImageAsset.objects.filter(
+                    checksum__in=[asset.checksum for asset in new_assets],
+                )
+            )
+        return [assets[image.checksum] for image in images]
+
+    def _new_asset(self, uploaded_file, checksum, byte_size):
+        original_filename = self._filename(uploaded_file)
+        return ImageAsset(
+            checksum=checksum,
+            byte_size=byte_size,
+            mime_type=(
+                getattr(uploaded_file, 'content_type', '')
+                or mimetypes.guess_type(original_filename)[0]
+                or 'application/octet-stream'
+            ),
+            original_filename=original_filename,
+        )
+
+    def _store_files(self, assets, files, max_workers):
+        def store(asset):
+            asset.file.name = self._store_file(
+                asset,
+                files[asset.checksum],
+                original_filename=asset.original_filename,
+            )
+
+        if max_workers < 2 or len(assets) < 2:
+            for asset in assets:
+                store(asset)
+            return
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(assets)),
+        ) as executor:
+            list(executor.map(store, assets))
+
     def _store_file(self, asset, uploaded_file, *, original_filename):
         target_name = image_asset_upload_path(asset, original_filename)
         if self.storage.exists(target_name):
@@ -10,6 +10,7 @@ from core_logic.services.document_renderer_registry import (
 )
 from core_logic.value_objects.document_render_plan import DocumentRenderPlan
 from core_logic.value_objects.document_render_requests import DocumentRenderRequest
+from infrastructure.services.request_profiling import request_stage_timer
 
 
 class SectionedDocumentEngine(IDocumentEngine):
@@ -23,6 +24,7 @@ class SectionedDocumentEngine(IDocumentEngine):
     ):
         self.document_builder = document_builder or RecipeDocumentBuilder(
             section_payload_builder_registry=section_payload_builder_registry,
+            stage_timer=request_stage_timer,
         )
         self.document_renderer_registry = (
             document_renderer_registry
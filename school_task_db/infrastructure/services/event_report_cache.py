@@ -0,0 +1,71 @@
+"""Shared cache of built event performance report sources."""
+
+import hashlib
+import time
+from typing import Iterable
+
+from django.core.cache import cache
+
+# Only checked events have stable report input; earlier statuses change with
+# every saved mark and are always rebuilt.
+CACHEABLE_EVENT_REPORT_STATUSES = frozenset(('graded', 'closed'))
+EVENT_REPORT_CACHE_TIMEOUT = 24 * 60 * 60
+
+
+class DjangoEventReportSourceCache:
+    """Собранные источники отчётов по событиям в общем Django-кэше.
+
+    Ключ состоит из события, его поколения и набора последних ревизий
+    попыток: новая ревизия меняет ключ сама, а правки события, участников
+    и пояснений учителя сбрасывают поколение через сигналы.
+    """
+
+    KEY_PREFIX = 'event_report_source:'
+    GENERATION_PREFIX = 'event_report_generation:'
+
+    def get(self, event_id, revisions: Iterable[tuple[str, int]]):
+        return cache.get(self._key(event_id, revisions))
+
+    def set(self, event_id, revisions: Iterable[tuple[str, int]], source):
+        cache.set(
+            self._key(event_id, revisions),
+            source,
+            timeout=EVENT_REPORT_CACHE_TIMEOUT,
+        )
+
+    def invalidate(self, *event_ids) -> None:
+        for event_id in dict.fromkeys(map(str, event_ids)):
+            key = self._generation_key(event_id)
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.set(key, time.time_ns(), timeout=None)
+
+    def _key(self, event_id, revisions):
+        digest = hashlib.sha1(
+            ';'.join(
+                f'{participation_id}:{revision}'
+                for participation_id, revision in sorted(revisions)
+            ).encode(),
+        ).hexdigest()
+        return (
+            f'{self.KEY_PREFIX}{event_id}:'
+            f'{self._generation(str(event_id))}:{digest}'
+        )
+
+    def _generation(self, event_id):
+        key = self._generation_key(event_id)
+        generation = cache.get(key)
+        if generation is None:
+            generation = time.time_ns()
+            if not cache.add(key, generation, timeout=None):
+                generation = cache.get(key, generation)
+        return generation
+
+    @classmethod
+    def _generation_key(cls, event_id):
+        return f'{cls.GENERATION_PREFIX}{event_id}'
+
+
+# Shared adapter instance used by the report repository and signals.
+event_report_source_cache = DjangoEventReportSourceCache()
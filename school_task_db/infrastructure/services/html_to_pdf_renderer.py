@@ -10,11 +10,14 @@ from typing import Any
 from django.conf import settings
 from playwright.async_api import Page, async_playwright
 
+from infrastructure.services.request_profiling import request_stage_timer
+
 logger = logging.getLogger(__name__)
 
 
 class HtmlToPdfRenderer:
-    def __init__(self, **options):
+    def __init__(self, stage_timer=None, **options):
+        self.stage_timer = stage_timer or request_stage_timer
         self.options = self._default_options()
         self.options.update(options)
 
@@ -85,6 +88,10 @@ class HtmlToPdfRenderer:
                 await browser.close()
 
     def generate_pdf(self, html_file_path: Path, output_path: Path) -> Path:
+        with self.stage_timer.measure('document.pdf'):
+            return self._generate_pdf(html_file_path, output_path)
+
+    def _generate_pdf(self, html_file_path: Path, output_path: Path) -> Path:
         try:
             asyncio.get_running_loop()
         except RuntimeError:
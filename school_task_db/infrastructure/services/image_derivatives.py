@@ -0,0 +1,191 @@
+"""Resolution-capped, recompressed derivatives of stored task images."""
+
+import hashlib
+from io import BytesIO
+from math import ceil
+from pathlib import PurePosixPath
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from core_logic.value_objects.task_image_position import task_image_layout
+from infrastructure.services.blank_cells_payload import PRINTABLE_WIDTH_MM
+from tasks.models import TaskImage
+
+# HTML is read on screen and printed as drafts; LaTeX output goes to press.
+IMAGE_DPI_BY_RENDERER = {
+    'html': 150,
+    'latex': 300,
+}
+DEFAULT_IMAGE_DPI = IMAGE_DPI_BY_RENDERER['html']
+# Widths are rounded up so nearby layouts share one derivative file.
+IMAGE_WIDTH_STEP_PX = 64
+JPEG_QUALITY = 82
+IMAGE_ASSET_DIRECTORY = 'image_assets'
+LEGACY_DERIVATIVE_DIRECTORY = 'image_derivatives'
+# Empty marker stored when a derivative would not be smaller than the
+# original, so the resize is not retried on every render.
+KEEP_ORIGINAL_EXTENSION = '.original'
+
+
+def image_target_width_px(width_percent, page_format='A4', renderer_type='html'):
+    """Pixel width that prints ``width_percent`` of the page at target DPI."""
+    printable_width_mm = PRINTABLE_WIDTH_MM.get(
+        str(page_format).upper(),
+        PRINTABLE_WIDTH_MM['A4'],
+    )
+    dpi = IMAGE_DPI_BY_RENDERER.get(renderer_type, DEFAULT_IMAGE_DPI)
+    pixels = printable_width_mm * width_percent / 100 / 25.4 * dpi
+    return ceil(pixels / IMAGE_WIDTH_STEP_PX) * IMAGE_WIDTH_STEP_PX
+
+
+class DjangoImageDerivativeStore:
+    """Create derivatives lazily and store them next to the original.
+
+    Derivative names are derived from the content checksum and the target
+    width, so they are immutable and shared by every task that references the
+    same asset. Images that are already narrow enough, or that Pillow cannot
+    decode (SVG, corrupt files), are served as originals. So are images whose
+    derivative would not be smaller; that decision is stored as an empty
+    marker file keyed by checksum and width.
+    """
+
+    def __init__(self, storage=None):
+        self.storage = storage or default_storage
+
+    def file_name_for_width(self, file_name: str, max_width_px: int) -> str:
+        try:
+            content_key = self._content_key(file_name)
+            keep_original_name = self.derivative_name(
+                file_name,
+                content_key,
+                max_width_px,
+                KEEP_ORIGINAL_EXTENSION,
+            )
+            if self.storage.exists(keep_original_name):
+                return file_name
+            with self.storage.open(file_name, 'rb') as original:
+                with Image.open(original) as image:
+                    if self._oriented_width(image) <= max_width_px:
+                        return file_name
+                    target_name = self.derivative_name(
+                        file_name,
+                        content_key,
+                        max_width_px,
+                        self._output_extension(image),
+                    )
+                    if self.storage.exists(target_name):
+                        return target_name
+                    content = self._render(image, max_width_px)
+        except (OSError, UnidentifiedImageError, Image.DecompressionBombError):
+            return file_name
+        if content.getbuffer().nbytes >= self._size(file_name):
+            self._save(keep_original_name, BytesIO())
+            return file_name
+        return self._save(target_name, content) or file_name
+
+    @staticmethod
+    def derivative_name(file_name, content_key, max_width_px, extension):
+        path = PurePosixPath(file_name)
+        directory = (
+            path.parent
+            if path.parts and path.parts[0] == IMAGE_ASSET_DIRECTORY
+            else PurePosixPath(LEGACY_DERIVATIVE_DIRECTORY, content_key[:2])
+        )
+        return str(directory / f'{content_key}-w{max_width_px}{extension}')
+
+    def _content_key(self, file_name):
+        path = PurePosixPath(file_name)
+        if path.parts and path.parts[0] == IMAGE_ASSET_DIRECTORY:
+            return path.stem
+        digest = hashlib.sha256()
+        with self.storage.open(file_name, 'rb') as stored_file:
+            for chunk in iter(lambda: stored_file.read(64 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _oriented_width(image):
+        orientation = image.getexif().get(0x0112, 1)
+        # EXIF orientations 5-8 rotate by 90 degrees.
+        return image.height if orientation in (5, 6, 7, 8) else image.width
+
+    @staticmethod
+    def _keeps_png(image):
+        return (
+            image.format in ('PNG', 'GIF')
+            or image.mode in ('P', 'LA', 'RGBA', 'PA', '1')
+            or 'transparency' in image.info
+        )
+
+    def _output_extension(self, image):
+        return '.png' if self._keeps_png(image) else '.jpg'
+
+    def _render(self, image, max_width_px):
+        keeps_png = self._keeps_png(image)
+        image = ImageOps.exif_transpose(image)
+        height = max(1, round(image.height * max_width_px / image.width))
+        if keeps_png:
+            if image.mode not in ('RGB', 'RGBA', 'L', 'LA'):
+                image = image.convert('RGBA')
+        elif image.mode != 'RGB':
+            image = image.convert('RGB')
+        image = image.resize((max_width_px, height), Image.LANCZOS)
+        content = BytesIO()
+        if keeps_png:
+            image.save(content, format='PNG', optimize=True)
+        else:
+            image.save(
+                content,
+                format='JPEG',
+                quality=JPEG_QUALITY,
+                optimize=True,
+                progressive=True,
+            )
+        return content
+
+    def _size(self, file_name):
+        try:
+            return self.storage.size(file_name)
+        except (OSError, NotImplementedError):
+            return 0
+
+    def _save(self, target_name, content):
+        stored_name = self.storage.save(
+            target_name,
+            ContentFile(content.getvalue()),
+        )
+        if stored_name == target_name:
+            return stored_name
+        # A concurrent render already stored the same immutable derivative.
+        self.storage.delete(stored_name)
+        return target_name if self.storage.exists(target_name) else ''
+
+
+def build_task_image_derivatives(store=None):
+    """Pre-build derivatives for every task image layout in use.
+
+    Returns ``(checked, derived)``: image/width pairs inspected and pairs
+    served by a derivative instead of the original file.
+    """
+    store = store or DjangoImageDerivativeStore()
+    checked = derived = 0
+    references = TaskImage.objects.exclude(asset__isnull=True).values_list(
+        'asset__file',
+        'position',
+    ).distinct()
+    for file_name, position in references:
+        if not file_name:
+            continue
+        layout = task_image_layout(position)
+        widths = {
+            image_target_width_px(layout.width_percent, page_format, renderer)
+            for page_format in PRINTABLE_WIDTH_MM
+            for renderer in IMAGE_DPI_BY_RENDERER
+        }
+        for width in sorted(widths):
+            checked += 1
+            if store.file_name_for_width(file_name, width) != file_name:
+                derived += 1
+    return checked, derived
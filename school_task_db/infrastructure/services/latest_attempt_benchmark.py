@@ -0,0 +1,172 @@
+"""Compare latest-attempt resolution strategies on many revisions."""
+
+import statistics
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from math import ceil
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from events.models import AttemptSnapshot, Event, EventParticipation, Mark
+from infrastructure.services.django_attempt_snapshot_queries import (
+    latest_attempts_by_participation,
+    latest_attempts_by_revision,
+)
+from students.models import Student
+from works.models import Work
+
+BULK_WRITE_BATCH_SIZE = 200
+LATEST_ATTEMPT_STRATEGIES = {
+    'is_latest': latest_attempts_by_participation,
+    'revision_subquery': latest_attempts_by_revision,
+}
+
+
+@dataclass(frozen=True)
+class LatestAttemptRevisions:
+    """Seeded attempts: participation ids grouped by event."""
+
+    attempts: int
+    revisions: int
+    participation_ids_by_event: tuple[tuple, ...]
+
+    @property
+    def participations(self):
+        return sum(len(ids) for ids in self.participation_ids_by_event)
+
+
+@dataclass(frozen=True)
+class LatestAttemptStrategyResult:
+    name: str
+    seconds: float
+    queries: int
+
+
+def seed_attempt_revisions(attempts, revisions=5, students_per_event=40):
+    """Write ``attempts`` snapshot rows, ``revisions`` per participation."""
+    if attempts < 1 or revisions < 1 or students_per_event < 1:
+        raise ValueError('Объёмы должны быть положительными')
+    participation_count = ceil(attempts / revisions)
+    event_count = ceil(participation_count / students_per_event)
+    planned_at = timezone.now() - timedelta(days=1)
+
+    work = Work.objects.create(name='Замер ревизий')
+    students = Student.objects.bulk_create(
+        [
+            Student(last_name=f'Ученик {index:03d}', first_name='Тест')
+            for index in range(min(students_per_event, participation_count))
+        ],
+        batch_size=BULK_WRITE_BATCH_SIZE,
+    )
+    events = Event.objects.bulk_create(
+        [
+            Event(
+                name=f'Замер ревизий {index + 1}',
+                work=work,
+                planned_date=planned_at,
+                status='graded',
+            )
+            for index in range(event_count)
+        ],
+        batch_size=BULK_WRITE_BATCH_SIZE,
+    )
+    participations = EventParticipation.objects.bulk_create(
+        [
+            EventParticipation(event=event, student=student, status='graded')
+            for event in events
+            for student in students
+        ][:participation_count],
+        batch_size=BULK_WRITE_BATCH_SIZE,
+    )
+    marks = Mark.objects.bulk_create(
+        [
+            Mark(participation=participation, score=4)
+            for participation in participations
+        ],
+        batch_size=BULK_WRITE_BATCH_SIZE,
+    )
+
+    students_by_id = {student.pk: student for student in students}
+    events_by_id = {event.pk: event for event in events}
+    snapshots = []
+    remaining = attempts
+    for participation, mark in zip(participations, marks):
+        event = events_by_id[participation.event_id]
+        student = students_by_id[participation.student_id]
+        latest_revision = min(revisions, remaining)
+        remaining -= latest_revision
+        snapshots.extend(
+            AttemptSnapshot(
+                participation=participation,
+                mark=mark,
+                revision=revision,
+                is_latest=revision == latest_revision,
+                student_id_snapshot=str(student.pk),
+                student_name_snapshot=student.get_full_name(),
+                event_id_snapshot=str(event.pk),
+                event_name_snapshot=event.name,
+                event_date_snapshot=event.planned_date,
+                work_id_snapshot=str(work.pk),
+                work_name_snapshot=work.name,
+                score=min(revision + 1, 5),
+            )
+            for revision in range(1, latest_revision + 1)
+        )
+    AttemptSnapshot.objects.bulk_create(
+        snapshots,
+        batch_size=BULK_WRITE_BATCH_SIZE,
+    )
+
+    participation_ids_by_event = {}
+    for participation in participations:
+        participation_ids_by_event.setdefault(
+            participation.event_id,
+            [],
+        ).append(participation.pk)
+    return LatestAttemptRevisions(
+        attempts=len(snapshots),
+        revisions=revisions,
+        participation_ids_by_event=tuple(
+            tuple(ids) for ids in participation_ids_by_event.values()
+        ),
+    )
+
+
+def measure_latest_attempt_strategies(dataset, repeat=3):
+    """Time every strategy resolving latest attempts event by event.
+
+    Reports resolve one event or group at a time, so each strategy is run
+    once per event batch; task results are not prefetched, leaving only
+    the resolution query. Strategies must agree on every attempt.
+    """
+    expected = None
+    results = []
+    for name, resolve in LATEST_ATTEMPT_STRATEGIES.items():
+        timings = []
+        for _ in range(max(repeat, 1)):
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                resolved = {}
+                for participation_ids in dataset.participation_ids_by_event:
+                    for participation_id, attempt in resolve(
+                        participation_ids,
+                        include_task_results=False,
+                    ).items():
+                        resolved[participation_id] = attempt.pk
+                timings.append(time.perf_counter() - started)
+        if expected is None:
+            expected = resolved
+        elif resolved != expected:
+            raise RuntimeError(
+                f'{name} разошёлся с {results[0].name} '
+                'в выборе последних попыток'
+            )
+        results.append(LatestAttemptStrategyResult(
+            name=name,
+            seconds=round(statistics.median(timings), 4),
+            queries=len(queries),
+        ))
+    return tuple(results)
@@ -0,0 +1,67 @@
+"""Keep per-participation read models in step with captured attempts.
+
+Student digests and course timelines both project a participation's
+latest attempt. They are refreshed together so participations and attempts
+are loaded once per refresh.
+"""
+
+from django.db import transaction
+
+from events.models import EventParticipation
+from infrastructure.services.course_timeline_entries import (
+    replace_course_timeline_entries,
+)
+from infrastructure.services.django_attempt_snapshot_queries import (
+    latest_attempts_by_participation,
+)
+from infrastructure.services.student_digest_entries import (
+    replace_student_digest_entries,
+)
+
+PROJECTIONS = {
+    'digest': replace_student_digest_entries,
+    'timeline': replace_course_timeline_entries,
+}
+
+
+def refresh_participation_projections(participation_ids) -> dict[str, int]:
+    """Rebuild projected rows of the participations; return rows written."""
+    participation_ids = tuple(dict.fromkeys(participation_ids))
+    if not participation_ids:
+        return dict.fromkeys(PROJECTIONS, 0)
+    participations = list(
+        EventParticipation.objects.filter(
+            pk__in=participation_ids,
+        ).select_related('event', 'event__work', 'event__course')
+    )
+    attempts = latest_attempts_by_participation(
+        participation.pk for participation in participations
+    )
+    with transaction.atomic():
+        return {
+            name: replace(participations, attempts, participation_ids)
+            for name, replace in PROJECTIONS.items()
+        }
+
+
+def refresh_event_participation_projections(event_id) -> dict[str, int]:
+    return refresh_participation_projections(
+        EventParticipation.objects.filter(
+            event_id=event_id,
+        ).values_list('pk', flat=True)
+    )
+
+
+def rebuild_participation_projections(batch_size=500) -> dict[str, int]:
+    """Rebuild every projection in participation batches."""
+    participation_ids = list(
+        EventParticipation.objects.order_by('pk').values_list('pk', flat=True)
+    )
+    written = dict.fromkeys(PROJECTIONS, 0)
+    for start in range(0, len(participation_ids), batch_size):
+        batch = refresh_participation_projections(
+            participation_ids[start:start + batch_size],
+        )
+        for name, count in batch.items():
+            written[name] += count
+    return written
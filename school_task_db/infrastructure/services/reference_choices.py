@@ -0,0 +1,68 @@
+"""Cached select choices for reference-data form fields.
+
+Model choice fields query their queryset on every render (the subtopic
+field once more per option for its label). These loaders build the same
+``(value, label)`` pairs once per reference generation; fields keep their
+querysets, so submitted values are still validated against the database.
+"""
+
+from curriculum.models import SubTopic, Topic
+from infrastructure.services.django_task_classification_queries import (
+    task_classification_querysets,
+)
+from infrastructure.services.reference_data_cache import reference_data_cache
+from task_groups.models import AnalogGroup
+from tasks.models import Source
+
+
+def use_cached_choices(field, choices):
+    """Render a model choice field from precomputed choices."""
+    empty_label = getattr(field, 'empty_label', None)
+    if empty_label is not None:
+        choices = (('', empty_label), *choices)
+    field.choices = choices
+
+
+def topic_choices():
+    return reference_data_cache.get(
+        'topic_choices',
+        lambda: _choices(Topic.objects.all()),
+    )
+
+
+def subtopic_choices():
+    return reference_data_cache.get(
+        'subtopic_choices',
+        lambda: _choices(SubTopic.objects.select_related('topic')),
+    )
+
+
+def source_choices():
+    return reference_data_cache.get(
+        'source_choices',
+        lambda: _choices(Source.objects.all()),
+    )
+
+
+def analog_group_choices():
+    return reference_data_cache.get(
+        'analog_group_choices',
+        lambda: _choices(AnalogGroup.objects.all()),
+    )
+
+
+def codifier_choices(subject=None):
+    """Return active content-entry and requirement choices for a subject."""
+
+    def load():
+        topic = Topic(subject=subject) if subject is not None else None
+        content_entries, requirements = task_classification_querysets(
+            topic=topic,
+        )
+        return _choices(content_entries), _choices(requirements)
+
+    return reference_data_cache.get(f'codifier_choices:{subject}', load)
+
+
+def _choices(queryset):
+    return tuple((str(item.pk), str(item)) for item in queryset)
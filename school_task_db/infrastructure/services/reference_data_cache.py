@@ -0,0 +1,100 @@
+"""In-process cache of slow-changing reference data.
+
+Academic years, site settings, taxonomy, analog groups and codifier
+options are read on nearly every page but change rarely. Each entry is
+stamped with the ``ReferenceDataVersion`` row it was loaded under;
+save/delete signals (and bulk writers) increment that row in their own
+transaction, so every process reloads the entry on its next read after
+the edit commits. Entries also expire after ``REFERENCE_DATA_TTL``
+seconds, which bounds staleness from writes that skip invalidation.
+Within a request the version is read once (see ``begin_request``), so
+forms rendering many choice fields cost one version query per page.
+
+Values loaded inside a transaction are stored only once it commits, so a
+rolled-back write never leaves phantom rows behind. Entries are shared
+across threads, so callers must not mutate them.
+"""
+
+import threading
+import time
+from functools import partial
+
+from django.db import connection, transaction
+from django.db.models import F
+
+from core.models import ReferenceDataVersion
+
+REFERENCE_DATA_TTL = 300
+
+
+class ReferenceDataCache:
+    def __init__(self, ttl=REFERENCE_DATA_TTL, clock=time.monotonic):
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._request = threading.local()
+
+    def get(self, key, loader):
+        version = self._request_version()
+        with self._lock:
+            entry = self._entries.get(key)
+        if (
+            entry is not None
+            and entry[0] == version
+            and self._clock() - entry[1] < self.ttl
+        ):
+            return entry[2]
+        # Loading outside the lock keeps a slow loader from blocking
+        # readers of other keys; a concurrent duplicate load is harmless.
+        loaded_at = self._clock()
+        value = loader()
+        store = partial(self._store, key, (version, loaded_at, value))
+        if connection.in_atomic_block:
+            transaction.on_commit(store)
+        else:
+            store()
+        return value
+
+    def current_version(self) -> int:
+        return ReferenceDataVersion.objects.filter(
+            pk=ReferenceDataVersion.SINGLETON_ID,
+        ).values_list('version', flat=True).first() or 0
+
+    def begin_request(self, **kwargs):
+        self._request.active = True
+        self._request.version = None
+
+    def end_request(self, **kwargs):
+        self._request.active = False
+        self._request.version = None
+
+    def invalidate(self):
+        """Move the shared version; other processes see it on commit."""
+        self._request.version = None
+        updated = ReferenceDataVersion.objects.filter(
+            pk=ReferenceDataVersion.SINGLETON_ID,
+        ).update(version=F('version') + 1)
+        if not updated:
+            ReferenceDataVersion.objects.get_or_create(
+                pk=ReferenceDataVersion.SINGLETON_ID,
+                defaults={'version': 1},
+            )
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _request_version(self):
+        if not getattr(self._request, 'active', False):
+            return self.current_version()
+        if self._request.version is None:
+            self._request.version = self.current_version()
+        return self._request.version
+
+    def _store(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+
+
+reference_data_cache = ReferenceDataCache()
@@ -14,19 +14,46 @@ from core_logic.value_objects.short_uuid import format_short_uuid
 
 
 class RemedialSheetDataProvider:
-    def __init__(self, get_remedial_sheet_data=None):
+    """Sheet data per variant, cached for one document build.
+
+    With ``get_remedial_sheet_data_many`` the first miss in a batch document
+    loads every variant named by the recipe sections at once.
+    """
+
+    def __init__(
+        self,
+        get_remedial_sheet_data=None,
+        get_remedial_sheet_data_many=None,
+    ):
         if get_remedial_sheet_data is None:
             raise ValueError('get_remedial_sheet_data is required')
         self.get_remedial_sheet_data = get_remedial_sheet_data
+        self.get_remedial_sheet_data_many = get_remedial_sheet_data_many
 
-    def get(self, variant_id, build_context=None):
+    def get(self, variant_id, build_context=None, recipe=None):
         if build_context is None:
             return self.get_remedial_sheet_data(variant_id)
         cache = build_context.setdefault('remedial_sheet_data_by_variant', {})
+        if variant_id not in cache:
+            self._warm(cache, variant_id, recipe)
         if variant_id not in cache:
             cache[variant_id] = self.get_remedial_sheet_data(variant_id)
         return cache[variant_id]
 
+    def _warm(self, cache, variant_id, recipe):
+        if self.get_remedial_sheet_data_many is None or recipe is None:
+            return
+        variant_ids = [
+            missing_id
+            for missing_id in dict.fromkeys(
+                section.options.get('variant_id')
+                for section in recipe.sections
+            )
+            if missing_id and missing_id not in cache
+        ]
+        if variant_ids and variant_id in variant_ids:
+            cache.update(self.get_remedial_sheet_data_many(variant_ids))
+
 
 class RemedialHeaderPayloadBuilder:
     def __init__(self, sheet_data_provider):
@@ -36,6 +63,7 @@ class RemedialHeaderPayloadBuilder:
         sheet_data = self.sheet_data_provider.get(
             _remedial_variant_id(request),
             request.build_context,
+            recipe=request.recipe,
         )
         return {
             **dict(request.section.options),
@@ -58,6 +86,7 @@ class RemedialOriginalMistakesPayloadBuilder:
         sheet_data = self.sheet_data_provider.get(
             _remedial_variant_id(request),
             request.build_context,
+            recipe=request.recipe,
         )
         return {
             **dict(request.section.options),
@@ -89,6 +118,7 @@ class RemedialVariantSectionPayloadBuilder:
         sheet_data = self.sheet_data_provider.get(
             _remedial_variant_id(request),
             request.build_context,
+            recipe=request.recipe,
         )
         content_payload = build_variant_section_content_payload(
             variant_id=_remedial_variant_id(request),
@@ -0,0 +1,203 @@
+"""Wall time, query count and peak memory of report use cases."""
+
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Callable
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from core_logic.entities.student_digest import StudentDigestRequest
+from core_logic.use_cases.get_heatmap_report import HeatmapReportRequest
+from core_logic.use_cases.get_journal import JournalRequest
+from core_logic.use_cases.get_reports_dashboard import ReportsDashboardRequest
+from core_logic.use_cases.get_student_performance_report import (
+    StudentPerformanceReportRequest,
+)
+from core_logic.use_cases.get_work_analysis_report import (
+    WorkAnalysisReportRequest,
+)
+from infrastructure.repositories.django_academic_year_support import (
+    academic_year_to_ref,
+)
+from infrastructure.services.cache_generations import (
+    CACHE_DOMAINS,
+    cache_generations,
+)
+from infrastructure.services.event_report_cache import (
+    event_report_source_cache,
+)
+
+# Query counts are deterministic for a seed, so any growth is reported;
+# times and memory vary between runs and are compared with a relative
+# tolerance above an absolute noise floor.
+EXACT_METRICS = ('queries', 'warm_queries')
+TOLERANT_METRIC_NOISE = {
+    'cold_seconds': 0.02,
+    'warm_seconds': 0.02,
+    'peak_memory_kib': 64,
+}
+
+
+@dataclass(frozen=True)
+class ReportBenchmarkCase:
+    name: str
+    run: Callable[[], object]
+
+
+@dataclass(frozen=True)
+class ReportBenchmarkResult:
+    name: str
+    cold_seconds: float
+    warm_seconds: float
+    queries: int
+    warm_queries: int
+    peak_memory_kib: float
+
+    def to_mapping(self):
+        values = asdict(self)
+        del values['name']
+        return values
+
+
+def report_benchmark_cases(container, school):
+    """Return one case per report use case over a synthetic school."""
+    year = academic_year_to_ref(school.year)
+    group_id = school.group_ids[0]
+    digest_end = year.end_date - timedelta(weeks=1)
+
+    def heatmap():
+        return container.get_heatmap_report_use_case().execute(
+            HeatmapReportRequest(group_id=group_id),
+        )
+
+    def journal():
+        return container.get_journal_use_case().execute(
+            JournalRequest(
+                course_id=school.course_ids[0],
+                group_id=group_id,
+                year=year,
+            ),
+        )
+
+    def dashboard():
+        return container.get_reports_dashboard_use_case().execute(
+            ReportsDashboardRequest(
+                year=year,
+                current_date=timezone.make_aware(
+                    datetime.combine(year.end_date, datetime.min.time()),
+                ),
+            ),
+        )
+
+    def student_performance():
+        return container.get_student_performance_report_use_case().execute(
+            StudentPerformanceReportRequest(year=year, group_id=group_id),
+        )
+
+    def work_analysis():
+        return container.get_work_analysis_report_use_case().execute(
+            WorkAnalysisReportRequest(year=year),
+        )
+
+    def event_performance():
+        return container.get_event_performance_report_use_case().execute(
+            school.event_ids[-1],
+        )
+
+    def student_digests():
+        return container.get_student_digests_use_case().execute(
+            StudentDigestRequest(
+                group_id=group_id,
+                start_date=digest_end - timedelta(days=6),
+                end_date=digest_end,
+                year=year,
+            ),
+        )
+
+    return tuple(
+        ReportBenchmarkCase(run.__name__, run)
+        for run in (
+            heatmap,
+            journal,
+            dashboard,
+            student_performance,
+            work_analysis,
+            event_performance,
+            student_digests,
+        )
+    )
+
+
+def reset_report_caches(event_ids=()):
+    """Drop derived report data so the next run is measured cold."""
+    cache_generations.bump(*CACHE_DOMAINS)
+    event_report_source_cache.invalidate(*event_ids)
+
+
+def measure_report_case(case, repeat=3, reset=reset_report_caches):
+    reset()
+    with CaptureQueriesContext(connection) as cold_queries:
+        started = time.perf_counter()
+        case.run()
+        cold_seconds = time.perf_counter() - started
+
+    reset()
+    tracemalloc.start()
+    try:
+        case.run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    warm_times = []
+    warm_query_count = 0
+    for _ in range(max(repeat, 1)):
+        with CaptureQueriesContext(connection) as warm_queries:
+            started = time.perf_counter()
+            case.run()
+            warm_times.append(time.perf_counter() - started)
+        warm_query_count = len(warm_queries)
+    return ReportBenchmarkResult(
+        name=case.name,
+        cold_seconds=round(cold_seconds, 4),
+        warm_seconds=round(statistics.median(warm_times), 4),
+        queries=len(cold_queries),
+        warm_queries=warm_query_count,
+        peak_memory_kib=round(peak / 1024, 1),
+    )
+
+
+def compare_report_benchmarks(results, baseline, tolerance=0.5):
+    """Return human-readable regressions of ``results`` against ``baseline``.
+
+    Both arguments map case names to metric mappings as stored in the JSON
+    results file. Cases missing from either side are ignored.
+    """
+    regressions = []
+    for name, metrics in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        for metric in EXACT_METRICS:
+            if metric in previous and metrics[metric] > previous[metric]:
+                regressions.append(
+                    f'{name}.{metric}: {previous[metric]} → {metrics[metric]}'
+                )
+        for metric, noise in TOLERANT_METRIC_NOISE.items():
+            if metric not in previous:
+                continue
+            limit = max(
+                previous[metric] * (1 + tolerance),
+                previous[metric] + noise,
+            )
+            if metrics[metric] > limit:
+                regressions.append(
+                    f'{name}.{metric}: {previous[metric]} → '
+                    f'{metrics[metric]} (> +{tolerance:.0%})'
+                )
+    return tuple(regressions)
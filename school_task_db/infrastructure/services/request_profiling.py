@@ -0,0 +1,262 @@
+"""Opt-in per-request profiling: wall time, SQL, templates and stages.
+
+A profile is active for the duration of one sampled request (see
+``core.middleware.RequestProfilingMiddleware``). Stage timers record into
+the active profile only, so instrumented code costs one context variable
+lookup when profiling is off. Finished profiles are kept in a bounded
+in-process ring buffer shown on the profiling page.
+"""
+
+import heapq
+import statistics
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import count
+
+from django.conf import settings
+from django.db import connection
+from django.template.backends import django as django_template_backend
+from django.utils import timezone
+
+from core_logic.interfaces.stage_timer import IStageTimer
+
+REQUEST_PROFILING_DEFAULTS = {
+    'ENABLED': False,
+    # Share of requests profiled, 0..1.
+    'SAMPLE_RATE': 1.0,
+    'BUFFER_SIZE': 200,
+    'SLOW_QUERY_LIMIT': 5,
+    'SQL_PREVIEW_LENGTH': 500,
+    'EXCLUDE_PREFIXES': ('/static/', '/media/', '/profiling/'),
+}
+TEMPLATE_STAGE = 'template'
+
+_active_profile = ContextVar('request_profile', default=None)
+
+
+def request_profiling_settings():
+    return {
+        **REQUEST_PROFILING_DEFAULTS,
+        **getattr(settings, 'REQUEST_PROFILING', {}),
+    }
+
+
+@dataclass(frozen=True)
+class SqlStatementTiming:
+    sql: str
+    milliseconds: float
+
+
+@dataclass
+class StageTiming:
+    calls: int = 0
+    milliseconds: float = 0.0
+
+
+@dataclass
+class RequestProfile:
+    method: str
+    path: str
+    started_at: datetime
+    status_code: int = 0
+    total_ms: float = 0.0
+    query_count: int = 0
+    query_ms: float = 0.0
+    slow_queries: tuple[SqlStatementTiming, ...] = ()
+    stages: dict[str, StageTiming] = field(default_factory=dict)
+
+    @property
+    def template_ms(self):
+        stage = self.stages.get(TEMPLATE_STAGE)
+        return stage.milliseconds if stage else 0.0
+
+    @property
+    def document_stages(self):
+        return {
+            name: stage
+            for name, stage in sorted(self.stages.items())
+            if name != TEMPLATE_STAGE
+        }
+
+    def add_stage(self, stage, milliseconds):
+        timing = self.stages.setdefault(stage, StageTiming())
+        timing.calls += 1
+        timing.milliseconds += milliseconds
+
+
+@dataclass(frozen=True)
+class RequestProfileSummary:
+    """Aggregate of profiles sharing a method and path."""
+
+    method: str
+    path: str
+    requests: int
+    mean_ms: float
+    max_ms: float
+    mean_queries: float
+    mean_query_ms: float
+    mean_template_ms: float
+
+
+class RequestStageTimer(IStageTimer):
+    """Record stage durations into the active request profile, if any."""
+
+    @contextmanager
+    def measure(self, stage: str):
+        profile = _active_profile.get()
+        if profile is None:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            profile.add_stage(stage, _elapsed_ms(started))
+
+
+request_stage_timer = RequestStageTimer()
+
+
+class RequestProfileStore:
+    """Thread-safe ring buffer of finished request profiles."""
+
+    def __init__(self, size=REQUEST_PROFILING_DEFAULTS['BUFFER_SIZE']):
+        self._lock = threading.Lock()
+        self._profiles = deque(maxlen=size)
+
+    def resize(self, size):
+        with self._lock:
+            if self._profiles.maxlen != size:
+                self._profiles = deque(self._profiles, maxlen=size)
+
+    def add(self, profile: RequestProfile):
+        with self._lock:
+            self._profiles.append(profile)
+
+    def recent(self) -> tuple[RequestProfile, ...]:
+        """Return stored profiles, newest first."""
+        with self._lock:
+            return tuple(reversed(self._profiles))
+
+    def clear(self):
+        with self._lock:
+            self._profiles.clear()
+
+
+request_profile_store = RequestProfileStore()
+
+
+@contextmanager
+def profile_request(method, path, store=None, options=None):
+    """Profile the enclosed block as one request and store the result."""
+    options = options or request_profiling_settings()
+    store = store or request_profile_store
+    profile = RequestProfile(
+        method=method,
+        path=path,
+        started_at=timezone.now(),
+    )
+    recorder = _QueryRecorder(
+        profile,
+        slow_query_limit=options['SLOW_QUERY_LIMIT'],
+        preview_length=options['SQL_PREVIEW_LENGTH'],
+    )
+    token = _active_profile.set(profile)
+    started = time.perf_counter()
+    try:
+        with connection.execute_wrapper(recorder):
+            yield profile
+    finally:
+        profile.total_ms = _elapsed_ms(started)
+        _active_profile.reset(token)
+        profile.slow_queries = recorder.slowest()
+        store.add(profile)
+
+
+class _QueryRecorder:
+    def __init__(self, profile, slow_query_limit, preview_length):
+        self.profile = profile
+        self.slow_query_limit = slow_query_limit
+        self.preview_length = preview_length
+        self._slowest = []
+        self._order = count()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            milliseconds = _elapsed_ms(started)
+            self.profile.query_count += 1
+            self.profile.query_ms += milliseconds
+            self._keep_if_slow(sql, milliseconds)
+
+    def _keep_if_slow(self, sql, milliseconds):
+        if self.slow_query_limit <= 0:
+            return
+        # A min-heap of the slowest statements; the order breaks ties.
+        item = (milliseconds, next(self._order), sql)
+        if len(self._slowest) < self.slow_query_limit:
+            heapq.heappush(self._slowest, item)
+        elif milliseconds > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, item)
+
+    def slowest(self):
+        return tuple(
+            SqlStatementTiming(
+                sql=sql[:self.preview_length],
+                milliseconds=round(milliseconds, 3),
+            )
+            for milliseconds, _, sql in sorted(self._slowest, reverse=True)
+        )
+
+
+def instrument_template_rendering(stage_timer=request_stage_timer):
+    """Time top-level Django template renders as the ``template`` stage.
+
+    Only the backend ``Template.render`` is wrapped, so included templates
+    are counted once as part of the page that includes them.
+    """
+    template_class = django_template_backend.Template
+    if getattr(template_class.render, '_request_profiling', False):
+        return
+    render = template_class.render
+
+    def timed_render(self, context=None, request=None):
+        with stage_timer.measure(TEMPLATE_STAGE):
+            return render(self, context, request)
+
+    timed_render._request_profiling = True
+    template_class.render = timed_render
+
+
+def summarize_request_profiles(profiles):
+    """Group profiles by method and path, slowest mean first."""
+    grouped = {}
+    for profile in profiles:
+        grouped.setdefault((profile.method, profile.path), []).append(profile)
+    summaries = [
+        RequestProfileSummary(
+            method=method,
+            path=path,
+            requests=len(items),
+            mean_ms=statistics.fmean(item.total_ms for item in items),
+            max_ms=max(item.total_ms for item in items),
+            mean_queries=statistics.fmean(item.query_count for item in items),
+            mean_query_ms=statistics.fmean(item.query_ms for item in items),
+            mean_template_ms=statistics.fmean(
+                item.template_ms for item in items
+            ),
+        )
+        for (method, path), items in grouped.items()
+    ]
+    return sorted(summaries, key=lambda summary: -summary.mean_ms)
+
+
+def _elapsed_ms(started):
+    return (time.perf_counter() - started) * 1000
@@ -0,0 +1,66 @@
+"""Shared cache of event review queues for save-and-next navigation."""
+
+from typing import Optional
+
+from django.core.cache import cache
+
+from core_logic.entities.review import ReviewQueue, ReviewQueueEntry
+from core_logic.interfaces.review_queue_cache import IReviewQueueCache
+
+# Long enough for one grading sitting; a stale queue only changes which
+# work "next" opens and is rebuilt when the participant list changes.
+REVIEW_QUEUE_CACHE_TIMEOUT = 4 * 60 * 60
+
+
+class DjangoReviewQueueCache(IReviewQueueCache):
+    """Очередь проверки события в общем Django-кэше.
+
+    Хранит упорядоченные id участий и признак «проверено». Сохранение
+    отметки обновляет признак на месте, а изменение состава участников
+    (добавление, удаление, отсутствие) сбрасывает очередь через сигналы.
+    """
+
+    KEY_PREFIX = 'review_queue:'
+
+    def get(self, event_id: str) -> Optional[ReviewQueue]:
+        entries = cache.get(self._key(event_id))
+        if entries is None:
+            return None
+        return ReviewQueue(
+            event_id=str(event_id),
+            entries=tuple(
+                ReviewQueueEntry(participation_id, graded)
+                for participation_id, graded in entries
+            ),
+        )
+
+    def set(self, queue: ReviewQueue) -> None:
+        cache.set(
+            self._key(queue.event_id),
+            [
+                (entry.participation_id, entry.graded)
+                for entry in queue.entries
+            ],
+            timeout=REVIEW_QUEUE_CACHE_TIMEOUT,
+        )
+
+    def set_graded(self, event_id, participation_id, graded: bool) -> None:
+        """Update one flag of a cached queue; missing queues stay missing."""
+        queue = self.get(event_id)
+        if queue is None or queue.index_of(participation_id) < 0:
+            return
+        self.set(queue.with_graded(participation_id, graded))
+
+    def invalidate(self, *event_ids: str) -> None:
+        cache.delete_many([
+            self._key(event_id)
+            for event_id in dict.fromkeys(map(str, event_ids))
+        ])
+
+    @classmethod
+    def _key(cls, event_id) -> str:
+        return f'{cls.KEY_PREFIX}{event_id}'
+
+
+# Shared adapter instance used by the review container and signals.
+review_queue_cache = DjangoReviewQueueCache()
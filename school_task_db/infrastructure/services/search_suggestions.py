@@ -0,0 +1,361 @@
+"""In-process prefix index of entity titles for search suggestions.
+
+The index is refreshed when the ``search`` cache generation moves
+(save/delete signals and bulk writers bump it) or once it is older than
+``INDEX_MAX_AGE`` seconds. The generation lives in the default Django
+cache: with a shared ``CACHE_BACKEND`` ("file" or "database") every
+process sees an edit on its next lookup; with the per-process "locmem"
+default other workers pick it up only when their index expires.
+
+Only the first lookup builds the index inline. Later refreshes run in a
+background thread while lookups keep serving the previous index, which
+is swapped out once the new one is complete, so a stale lookup answers
+from slightly old titles instead of waiting for the whole task bank to
+load. Lookups are a binary search over the sorted word list plus a
+bounded per-query result cache.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from functools import partial
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from core_logic.entities.core import SearchSuggestion
+from core_logic.interfaces.search_suggestion_index import (
+    ISearchSuggestionIndex,
+)
+from core_logic.value_objects.search_terms import search_terms
+from curriculum.models import Course, Topic
+from events.models import Event
+from infrastructure.services.cache_generations import (
+    CACHE_DOMAIN_SEARCH,
+    cache_generations,
+)
+from students.models import Student, StudentGroup
+from task_groups.models import AnalogGroup
+from tasks.models import Source, Task
+from works.models import Work
+
+# Suggestion order: entities teachers jump to while grading come first,
+# the large task bank last.
+SEARCH_SUGGESTION_KINDS = (
+    'student',
+    'student_group',
+    'event',
+    'work',
+    'analog_group',
+    'topic',
+    'course',
+    'source',
+    'task',
+)
+TASK_TITLE_LENGTH = 80
+QUERY_CACHE_SIZE = 256
+INDEX_MAX_AGE = 300
+
+
+def invalidate_search_suggestions():
+    """Bump the search generation now and again once the write commits.
+
+    A process rebuilding between the two bumps may index pre-commit rows;
+    the second bump makes it rebuild from committed data.
+    """
+    cache_generations.bump(CACHE_DOMAIN_SEARCH)
+    transaction.on_commit(
+        lambda: cache_generations.bump(CACHE_DOMAIN_SEARCH),
+    )
+
+
+def refresh_in_background(refresh):
+    """Run ``refresh`` in a daemon thread with its own DB connection."""
+    def run():
+        try:
+            refresh()
+        finally:
+            connection.close()
+
+    threading.Thread(
+        target=run,
+        name='search-suggestions-refresh',
+        daemon=True,
+    ).start()
+
+
+class SearchSuggestionIndex(ISearchSuggestionIndex):
+    def __init__(
+        self,
+        query_cache_size=QUERY_CACHE_SIZE,
+        max_age=INDEX_MAX_AGE,
+        clock=time.monotonic,
+        start_refresh=refresh_in_background,
+    ):
+        self.query_cache_size = query_cache_size
+        self.max_age = max_age
+        self._clock = clock
+        self._start_refresh = start_refresh
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._generation = None
+        self._built_at = None
+        self._entries = ()
+        self._words = ()
+        self._postings = {}
+        self._results = OrderedDict()
+
+    def suggest(self, prefixes, limit):
+        generation = cache_generations.current(CACHE_DOMAIN_SEARCH)
+        with self._lock:
+            built = self._built_at is not None
+            refresh = (
+                built
+                and not self._refreshing
+                and (generation != self._generation or self._expired())
+            )
+            if refresh:
+                self._refreshing = True
+        if not built:
+            # Nothing to serve yet, so the first lookup waits for the build.
+            self._swap(self._build(generation))
+        elif refresh:
+            self._start_refresh(partial(self._refresh, generation))
+
+        key = (tuple(prefixes), limit)
+        with self._lock:
+            suggestions = self._results.get(key)
+            if suggestions is None:
+                suggestions = self._match(key[0], limit)
+                self._results[key] = suggestions
+                if len(self._results) > self.query_cache_size:
+                    self._results.popitem(last=False)
+            else:
+                self._results.move_to_end(key)
+            return suggestions
+
+    def clear(self):
+        with self._lock:
+            self._generation = None
+            self._built_at = None
+            self._entries = ()
+            self._words = ()
+            self._postings = {}
+            self._results.clear()
+
+    def _expired(self):
+        return (
+            self._built_at is None
+            or self._clock() - self._built_at >= self.max_age
+        )
+
+    def _refresh(self, generation):
+        try:
+            self._swap(self._build(generation))
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def _build(self, generation):
+        """Load every suggestion without holding the lock."""
+        built_at = self._clock()
+        ranked = sorted(
+            (
+                (rank, suggestion.title.casefold(), suggestion)
+                for rank, kind in enumerate(SEARCH_SUGGESTION_KINDS)
+                for suggestion in _SUGGESTION_LOADERS[kind]()
+            ),
+            key=lambda item: item[:2],
+        )
+        entries = []
+        postings = {}
+        for position, (_, _, suggestion) in enumerate(ranked):
+            words = frozenset(search_terms(
+                f'{suggestion.title} {suggestion.subtitle}',
+            ))
+            entries.append((suggestion, words))
+            for word in words:
+                postings.setdefault(word, []).append(position)
+        return (
+            generation,
+            built_at,
+            tuple(entries),
+            tuple(sorted(postings)),
+            postings,
+        )
+
+    def _swap(self, index):
+        with self._lock:
+            # A build started earlier must not replace a newer one.
+            if self._built_at is not None and index[1] < self._built_at:
+                return
+            (
+                self._generation,
+                self._built_at,
+                self._entries,
+                self._words,
+                self._postings,
+            ) = index
+            self._results.clear()
+
+    def _match(self, prefixes, limit):
+        # The longest prefix is the most selective; others filter its hits.
+        prefixes = sorted(set(prefixes), key=len, reverse=True)
+        head, rest = prefixes[0], prefixes[1:]
+        positions = set()
+        index = bisect_left(self._words, head)
+        while index < len(self._words) and self._words[index].startswith(head):
+            positions.update(self._postings[self._words[index]])
+            index += 1
+
+        suggestions = []
+        for position in sorted(positions):
+            suggestion, words = self._entries[position]
+            if all(
+                any(word.startswith(prefix) for word in words)
+                for prefix in rest
+            ):
+                suggestions.append(suggestion)
+                if len(suggestions) == limit:
+                    break
+        return tuple(suggestions)
+
+
+def _student_suggestions():
+    for pk, last_name, first_name, middle_name in Student.objects.values_list(
+        'pk',
+        'last_name',
+        'first_name',
+        'middle_name',
+    ):
+        yield SearchSuggestion(
+            kind='student',
+            pk=str(pk),
+            title=' '.join(
+                part for part in (last_name, first_name, middle_name) if part
+            ),
+        )
+
+
+def _student_group_suggestions():
+    for pk, name, year_name in StudentGroup.objects.values_list(
+        'pk',
+        'name',
+        'academic_year__name',
+    ):
+        yield SearchSuggestion(
+            kind='student_group',
+            pk=str(pk),
+            title=name,
+            subtitle=year_name or '',
+        )
+
+
+def _event_suggestions():
+    for pk, name, planned_date in Event.objects.values_list(
+        'pk',
+        'name',
+        'planned_date',
+    ):
+        yield SearchSuggestion(
+            kind='event',
+            pk=str(pk),
+            title=name,
+            subtitle=timezone.localtime(planned_date).strftime('%d.%m.%Y'),
+        )
+
+
+def _work_suggestions():
+    work_types = dict(Work._meta.get_field('work_type').flatchoices)
+    for pk, name, work_type in Work.objects.values_list(
+        'pk',
+        'name',
+        'work_type',
+    ):
+        yield SearchSuggestion(
+            kind='work',
+            pk=str(pk),
+            title=name,
+            subtitle=str(work_types.get(work_type, work_type)),
+        )
+
+
+def _analog_group_suggestions():
+    for pk, name in AnalogGroup.objects.values_list('pk', 'name'):
+        yield SearchSuggestion(kind='analog_group', pk=str(pk), title=name)
+
+
+def _topic_suggestions():
+    for pk, name, subject in Topic.objects.values_list(
+        'pk',
+        'name',
+        'subject',
+    ):
+        yield SearchSuggestion(
+            kind='topic',
+            pk=str(pk),
+            title=name,
+            subtitle=subject,
+        )
+
+
+def _course_suggestions():
+    for pk, name, subject in Course.objects.values_list(
+        'pk',
+        'name',
+        'subject',
+    ):
+        yield SearchSuggestion(
+            kind='course',
+            pk=str(pk),
+            title=name,
+            subtitle=subject,
+        )
+
+
+def _source_suggestions():
+    for pk, name, short_name in Source.objects.values_list(
+        'pk',
+        'name',
+        'short_name',
+    ):
+        yield SearchSuggestion(
+            kind='source',
+            pk=str(pk),
+            title=name,
+            subtitle=short_name,
+        )
+
+
+def _task_suggestions():
+    # Only the opening of the statement is indexed to bound memory.
+    for pk, text, topic_name in Task.objects.values_list(
+        'pk',
+        'text',
+        'topic__name',
+    ):
+        title = ' '.join(text.split())
+        if len(title) > TASK_TITLE_LENGTH:
+            title = title[:TASK_TITLE_LENGTH - 1].rstrip() + '…'
+        yield SearchSuggestion(
+            kind='task',
+            pk=str(pk),
+            title=title,
+            subtitle=topic_name or '',
+        )
+
+
+_SUGGESTION_LOADERS = {
+    'student': _student_suggestions,
+    'student_group': _student_group_suggestions,
+    'event': _event_suggestions,
+    'work': _work_suggestions,
+    'analog_group': _analog_group_suggestions,
+    'topic': _topic_suggestions,
+    'course': _course_suggestions,
+    'source': _source_suggestions,
+    'task': _task_suggestions,
+}
+
+search_suggestion_index = SearchSuggestionIndex()
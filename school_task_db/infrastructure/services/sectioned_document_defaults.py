@@ -17,6 +17,7 @@ from infrastructure.services.latex_document_payloads import (
     LatexTaskPayloadFormatter,
     RenderTargetTaskPayloadFormatter,
 )
+from infrastructure.services.request_profiling import request_stage_timer
 from infrastructure.services.task_document_images import (
     TaskDocumentImagePayloadFormatter,
 )
@@ -41,6 +42,7 @@ def build_sectioned_html_document_components(
     work_document_repo=None,
     get_work_document_source=None,
     get_remedial_sheet_data=None,
+    get_remedial_sheet_data_many=None,
     get_event_report=None,
     get_student_digests=None,
     template_renderer=None,
@@ -50,6 +52,7 @@ def build_sectioned_html_document_components(
         work_document_repo=work_document_repo,
         get_work_document_source=get_work_document_source,
         get_remedial_sheet_data=get_remedial_sheet_data,
+        get_remedial_sheet_data_many=get_remedial_sheet_data_many,
         get_event_report=get_event_report,
         get_student_digests=get_student_digests,
         task_payload_formatter=task_payload_formatter,
@@ -57,6 +60,7 @@ def build_sectioned_html_document_components(
     return SectionedDocumentComponents(
         document_builder=RecipeDocumentBuilder(
             section_payload_builder_registry=payload_registry,
+            stage_timer=request_stage_timer,
         ),
         document_renderer_registry=(
             build_template_sectioned_text_document_renderer_registry(
@@ -74,6 +78,7 @@ def build_sectioned_html_pdf_document_components(
     work_document_repo=None,
     get_work_document_source=None,
     get_remedial_sheet_data=None,
+    get_remedial_sheet_data_many=None,
     get_event_report=None,
     get_student_digests=None,
     template_renderer=None,
@@ -85,6 +90,7 @@ def build_sectioned_html_pdf_document_components(
         work_document_repo=work_document_repo,
         get_work_document_source=get_work_document_source,
         get_remedial_sheet_data=get_remedial_sheet_data,
+        get_remedial_sheet_data_many=get_remedial_sheet_data_many,
         get_event_report=get_event_report,
         get_student_digests=get_student_digests,
         template_renderer=template_renderer,
@@ -108,6 +114,7 @@ def build_sectioned_document_components(
     work_document_repo=None,
     get_work_document_source=None,
     get_remedial_sheet_data=None,
+    get_remedial_sheet_data_many=None,
     get_event_report=None,
     get_student_digests=None,
     template_renderer=None,
@@ -119,6 +126,7 @@ def build_sectioned_document_components(
         work_document_repo=work_document_repo,
         get_work_document_source=get_work_document_source,
         get_remedial_sheet_data=get_remedial_sheet_data,
+        get_remedial_sheet_data_many=get_remedial_sheet_data_many,
         get_event_report=get_event_report,
         get_student_digests=get_student_digests,
         template_renderer=template_renderer,
@@ -144,6 +152,7 @@ def build_sectioned_document_payload_builder_registry(
     work_document_repo=None,
     get_work_document_source=None,
     get_remedial_sheet_data=None,
+    get_remedial_sheet_data_many=None,
     get_event_report=None,
     get_student_digests=None,
     task_payload_formatter=None,
@@ -161,6 +170,7 @@ def build_sectioned_document_payload_builder_registry(
         payload_registry.extend(
             build_remedial_sheet_section_payload_builder_registry(
                 get_remedial_sheet_data=get_remedial_sheet_data,
+                get_remedial_sheet_data_many=get_remedial_sheet_data_many,
                 task_payload_formatter=task_payload_formatter,
             )
         )
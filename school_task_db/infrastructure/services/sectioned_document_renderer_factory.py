@@ -9,6 +9,7 @@ from core_logic.services.sectioned_document_renderer import (
     WrappedDocumentContentRenderer,
 )
 from core_logic.value_objects.document_render_requests import DocumentRenderRequest
+from infrastructure.services.request_profiling import request_stage_timer
 from infrastructure.services.sectioned_document_file_renderer import (
     SectionedHtmlToPdfDocumentRenderer,
     SectionedDocumentFileRenderer,
@@ -89,6 +90,7 @@ def build_sectioned_document_content_renderer(
     body_renderer = SectionedDocumentContentRenderer(
         section_renderer_registry=section_renderer_registry,
         section_separator=section_separator,
+        stage_timer=request_stage_timer,
     )
     if not document_wrapper:
         return body_renderer
@@ -0,0 +1,116 @@
+"""Project captured attempts into precomputed student digest rows."""
+
+from django.utils import timezone
+
+from core_logic.value_objects.attempt_status import (
+    resolve_historical_participation_status,
+)
+from infrastructure.services.django_captured_task_result_queries import (
+    captured_task_result_snapshot,
+)
+from reports.models import StudentDigestEntryModel
+
+# SQLite limits bound parameters per statement; digest rows are wide.
+BULK_WRITE_BATCH_SIZE = 200
+
+
+def student_digest_entry_values(participation, attempt):
+    """Return digest row fields, or ``None`` when nothing belongs in digests.
+
+    Only absences and scored attempts are shown in digests. ``participation``
+    needs ``event``, ``event.work`` and ``event.course`` loaded; ``attempt``
+    needs ``captured_task_results``.
+    """
+    if participation.status != 'absent' and (
+        attempt is None or attempt.score is None
+    ):
+        return None
+
+    task_results = []
+    for task_result in attempt.captured_task_results if attempt else ():
+        captured = captured_task_result_snapshot(task_result)
+        if captured is None:
+            continue
+        task_results.append({
+            'topic_name': captured.task.topic_name,
+            'subtopic_name': captured.task.subtopic_name,
+            'subject': captured.task.subject,
+            'points': _number(captured.points),
+            'max_points': _number(captured.max_points),
+            'comment': captured.comment,
+            'is_assessable': captured.is_assessable,
+        })
+
+    event = participation.event
+    subject = next(
+        (result['subject'] for result in task_results if result['subject']),
+        '',
+    )
+    if not subject and event.course_id:
+        subject = event.course.subject
+    return {
+        'student_id': participation.student_id,
+        'event_id': event.pk,
+        'window_date': timezone.localdate(event.planned_date),
+        'event_planned_at': event.planned_date,
+        'planned_date': (
+            attempt.event_date_snapshot.date()
+            if attempt
+            else event.planned_date.date()
+        ),
+        'event_name': attempt.event_name_snapshot if attempt else event.name,
+        'work_name': (
+            attempt.work_name_snapshot if attempt else event.work.name
+        ),
+        'subject': subject,
+        'status': resolve_historical_participation_status(
+            participation.status,
+            has_attempt=attempt is not None,
+        ),
+        'score': attempt.score if attempt else None,
+        'points': _number(attempt.points) if attempt else None,
+        'max_points': _number(attempt.max_points) if attempt else None,
+        'teacher_comment': attempt.teacher_comment if attempt else '',
+        'mistakes_analysis': attempt.mistakes_analysis if attempt else '',
+        'recommendations': attempt.recommendations if attempt else '',
+        'needs_attention': attempt.needs_attention if attempt else False,
+        'task_results': task_results,
+    }
+
+
+def replace_student_digest_entries(
+    participations,
+    attempts,
+    participation_ids,
+) -> int:
+    """Replace digest rows of ``participation_ids``; return rows written.
+
+    ``participations`` are the loaded participations among the ids and
+    ``attempts`` maps participation ids to their latest attempts.
+    """
+    rows = []
+    for participation in participations:
+        values = student_digest_entry_values(
+            participation,
+            attempts.get(participation.pk),
+        )
+        if values is not None:
+            rows.append(StudentDigestEntryModel(
+                participation_id=participation.pk,
+                **values,
+            ))
+    StudentDigestEntryModel.objects.filter(
+        participation_id__in=participation_ids,
+    ).delete()
+    StudentDigestEntryModel.objects.bulk_create(
+        rows,
+        batch_size=BULK_WRITE_BATCH_SIZE,
+    )
+    return len(rows)
+
+
+def _number(value):
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,776 @@
+"""Seeded synthetic school data for load tests and report benchmarks."""
+
+import base64
+import random
+import uuid
+from dataclasses import asdict, dataclass, replace
+from datetime import date, datetime, time, timedelta
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.utils import timezone
+from faker import Faker
+from PIL import Image, ImageDraw
+
+from core.models import AcademicYear
+from core_logic.value_objects.task_image_position import (
+    TASK_IMAGE_POSITION_LABELS,
+)
+from curriculum.models import Course, CourseAssignment, SubTopic, Topic
+from events.models import Event, EventParticipation, Mark
+from infrastructure.repositories.django_attempt_snapshot_repo import (
+    DjangoAttemptSnapshotRepository,
+)
+from infrastructure.services.cache_generations import (
+    CACHE_DOMAINS,
+    cache_generations,
+)
+from infrastructure.services.django_image_asset_store import (
+    DjangoImageAssetStore,
+)
+from infrastructure.services.participation_projections import (
+    refresh_participation_projections,
+)
+from infrastructure.services.task_content_snapshots import (
+    build_task_content_snapshots,
+)
+from students.models import Student, StudentGroup
+from task_groups.models import AnalogGroup, TaskGroup
+from tasks.models import Task, TaskImage
+from works.models import Variant, VariantTask, Work, WorkAnalogGroup
+
+# SQLite limits bound parameters per statement.
+BULK_WRITE_BATCH_SIZE = 200
+# Marks are written and captured a slice of events at a time so memory
+# stays flat at production volumes.
+EVENT_BATCH_SIZE = 50
+SNAPSHOT_BATCH_SIZE = 500
+SYNTHETIC_SUBJECT = 'Физика'
+SYNTHETIC_GRADE_LEVEL = 9
+SUBTOPICS_PER_TOPIC = 2
+TASKS_PER_TOPIC = 6
+TOPICS_PER_SECTION = 3
+IMAGE_POOL_SIZE = 16
+TASK_MAX_POINTS = (1, 1, 2, 3)
+TRANSFER_FORMAT_VERSION = '1.5'
+FORMULAS = (
+    r'$F = ma$',
+    r'$v = v_0 + at$',
+    r'$p = \rho g h$',
+    r'$Q = cm\Delta t$',
+    r'$I = \frac{U}{R}$',
+    r'$$E_k = \frac{mv^2}{2}$$',
+    r'$$\frac{1}{R} = \frac{1}{R_1} + \frac{1}{R_2}$$',
+)
+
+
+@dataclass(frozen=True)
+class SyntheticSchoolSpec:
+    """Volumes of a synthetic school; zero volumes are derived from topics
+    and weeks."""
+
+    groups: int = 4
+    students_per_group: int = 25
+    weeks: int = 34
+    topics: int = 12
+    tasks: int = 0
+    analog_groups: int = 0
+    works: int = 0
+    variants_per_work: int = 2
+    tasks_per_work: int = 8
+    image_rate: float = 0.0
+    absence_rate: float = 0.05
+    seed: int = 2026
+    start_date: date = date(2025, 9, 1)
+
+    def __post_init__(self):
+        for name in (
+            'groups',
+            'students_per_group',
+            'weeks',
+            'topics',
+            'variants_per_work',
+        ):
+            if getattr(self, name) < 1:
+                raise ValueError(f'{name} должно быть положительным')
+        for name in ('tasks', 'analog_groups', 'works'):
+            if getattr(self, name) < 0:
+                raise ValueError(f'{name} не может быть отрицательным')
+        if self.task_count < self.topics:
+            raise ValueError('Заданий должно быть не меньше, чем тем')
+        if self.analog_group_count > self.task_count:
+            raise ValueError(
+                f'analog_groups должно быть не больше {self.task_count}'
+            )
+        if not 1 <= self.tasks_per_work <= self.task_count:
+            raise ValueError(
+                f'tasks_per_work должно быть от 1 до {self.task_count}'
+            )
+        for name in ('image_rate', 'absence_rate'):
+            if not 0 <= getattr(self, name) < 1:
+                raise ValueError(f'{name} должна быть в диапазоне [0, 1)')
+
+    @property
+    def task_count(self):
+        return self.tasks or self.topics * TASKS_PER_TOPIC
+
+    @property
+    def analog_group_count(self):
+        return self.analog_groups or self.topics
+
+    @property
+    def work_count(self):
+        return self.works or self.weeks
+
+    @property
+    def year_name(self):
+        return f'synthetic-{self.seed}'
+
+    def to_mapping(self):
+        values = asdict(self)
+        values['start_date'] = self.start_date.isoformat()
+        return values
+
+
+# ``production`` approximates a large school: 50k tasks in 2k analog groups,
+# 500 works with 20k variants, 3k students and about 100k attempts.
+SYNTHETIC_SCHOOL_PRESETS = {
+    'small': SyntheticSchoolSpec(),
+    'production': SyntheticSchoolSpec(
+        groups=120,
+        topics=500,
+        tasks=50_000,
+        analog_groups=2_000,
+        works=500,
+        variants_per_work=40,
+        image_rate=0.2,
+    ),
+}
+
+
+@dataclass(frozen=True)
+class SyntheticSchool:
+    year: AcademicYear
+    group_ids: tuple[str, ...]
+    course_ids: tuple[str, ...]
+    event_ids: tuple[str, ...]
+    counts: dict
+
+
+@dataclass(frozen=True)
+class SyntheticTaskBank:
+    """Unsaved task bank rows; images share a small pool of diagrams."""
+
+    topics: list
+    subtopics: list
+    tasks: list
+    analog_groups: list
+    task_groups: list
+    images: list
+    image_pool: list
+
+    def pooled_images(self):
+        """Yield ``(pool index, image)`` pairs."""
+        for index, image in enumerate(self.images):
+            yield index % len(self.image_pool), image
+
+
+class SyntheticSchoolBuilder:
+    """Build one academic year of graded work for ``spec``.
+
+    Rows are written with ``bulk_create`` and checked attempts are captured
+    per event, so the cost grows with the number of events rather than with
+    the number of marks. The same seed always yields the same primary keys,
+    names, scores and absences.
+    """
+
+    def __init__(self, spec: SyntheticSchoolSpec, asset_store=None):
+        self.spec = spec
+        self.random = random.Random(spec.seed)
+        # Keys have their own stream, so the data does not shift when a
+        # model gains or loses generated rows.
+        self.key_random = random.Random(f'{spec.seed}:keys')
+        self.fake = Faker('ru_RU')
+        self.fake.seed_instance(spec.seed)
+        self.asset_store = asset_store
+        self.counts = {}
+        self._bank = None
+
+    def build(self) -> SyntheticSchool:
+        if AcademicYear.objects.filter(name=self.spec.year_name).exists():
+            raise ValueError(
+                f'Учебный год {self.spec.year_name} уже существует'
+            )
+        with transaction.atomic():
+            year = self._year()
+            bank = self.task_bank()
+            self._save_task_bank(bank)
+            works = self._works(bank)
+            groups = self._groups(year)
+            courses = self._courses(year, groups, works)
+            events = self._events(groups, courses, works)
+        # bulk_create bypasses post_save, so the cache signals never fire.
+        cache_generations.bump(*CACHE_DOMAINS)
+        return SyntheticSchool(
+            year=year,
+            group_ids=tuple(str(group.pk) for group in groups),
+            course_ids=tuple(str(course.pk) for course in courses),
+            event_ids=tuple(str(event.pk) for event in events),
+            counts=dict(self.counts),
+        )
+
+    def task_bank(self) -> SyntheticTaskBank:
+        """Plan the task bank without touching the database."""
+        if self._bank is None:
+            self._bank = self._plan_task_bank()
+        return self._bank
+
+    def transfer_payload(self):
+        """Return the task bank in the ``import_tasks`` JSON format."""
+        bank = self.task_bank()
+        subtopics_by_topic = {}
+        for subtopic in bank.subtopics:
+            subtopics_by_topic.setdefault(subtopic.topic.pk, []).append(
+                subtopic,
+            )
+        group_by_task = {
+            link.task.pk: link.group for link in bank.task_groups
+        }
+        encoded_pool = [
+            base64.b64encode(content).decode('ascii')
+            for content in bank.image_pool
+        ]
+        return {
+            'version': TRANSFER_FORMAT_VERSION,
+            'description': (
+                f'Synthetic task bank, seed {self.spec.seed}: '
+                f'{len(bank.tasks)} tasks'
+            ),
+            'topics': [
+                {
+                    'id': str(topic.pk),
+                    'name': topic.name,
+                    'subject': topic.subject,
+                    'grade_level': topic.grade_level,
+                    'section': topic.section,
+                    'subtopics': [
+                        {
+                            'id': str(subtopic.pk),
+                            'name': subtopic.name,
+                            'order': subtopic.order,
+                        }
+                        for subtopic in subtopics_by_topic[topic.pk]
+                    ],
+                }
+                for topic in bank.topics
+            ],
+            'analog_groups': [
+                {'id': str(group.pk), 'name': group.name}
+                for group in bank.analog_groups
+            ],
+            'tasks': [
+                {
+                    'id': str(task.pk),
+                    'text': task.text,
+                    'answer': task.answer,
+                    'short_solution': task.short_solution,
+                    'task_type': task.task_type,
+                    'difficulty': task.difficulty,
+                    'grade': task.grade,
+                    'topic': {'id': str(task.topic.pk)},
+                    'subtopic': {'id': str(task.subtopic.pk)},
+                    'groups': [{
+                        'id': str(group_by_task[task.pk].pk),
+                        'bank_role': 'control',
+                    }],
+                }
+                for task in bank.tasks
+            ],
+            'task_images': [
+                {
+                    'id': str(image.pk),
+                    'task_id': str(image.task.pk),
+                    'filename': self._diagram_name(pool_index),
+                    'position': image.position,
+                    'caption': image.caption,
+                    'order': image.order,
+                    'base64_data': encoded_pool[pool_index],
+                }
+                for pool_index, image in bank.pooled_images()
+            ],
+        }
+
+    def _plan_task_bank(self):
+        spec = self.spec
+        topics = [
+            Topic(
+                id=self._key(),
+                name=f'{self.fake.word().capitalize()} {index + 1}',
+                subject=SYNTHETIC_SUBJECT,
+                section=(
+                    f'Раздел {index // TOPICS_PER_SECTION + 1} '
+                    f'({spec.year_name})'
+                ),
+                grade_level=SYNTHETIC_GRADE_LEVEL,
+                order=index + 1,
+            )
+            for index in range(spec.topics)
+        ]
+        subtopics = [
+            SubTopic(
+                id=self._key(),
+                topic=topic,
+                name=self.fake.sentence(nb_words=3).rstrip('.'),
+                order=order + 1,
+            )
+            for topic in topics
+            for order in range(SUBTOPICS_PER_TOPIC)
+        ]
+        # Tasks and analog groups are spread over topics in contiguous
+        # blocks, so a group never mixes topics when there are more groups.
+        tasks = []
+        analog_groups = []
+        task_groups = []
+        for index in range(spec.task_count):
+            topic_index = index * spec.topics // spec.task_count
+            topic = topics[topic_index]
+            task = Task(
+                id=self._key(),
+                text=(
+                    f'{self.fake.paragraph(nb_sentences=2)} '
+                    f'{self.random.choice(FORMULAS)}'
+                ),
+                answer=str(self.random.randint(1, 500)),
+                short_solution=self.random.choice(FORMULAS),
+                topic=topic,
+                subtopic=subtopics[
+                    topic_index * SUBTOPICS_PER_TOPIC
+                    + index % SUBTOPICS_PER_TOPIC
+                ],
+                task_type=self.random.choice(Task.TASK_TYPES)[0],
+                difficulty=self.random.randint(1, 5),
+                grade=SYNTHETIC_GRADE_LEVEL,
+            )
+            tasks.append(task)
+            group_index = index * spec.analog_group_count // spec.task_count
+            if group_index == len(analog_groups):
+                analog_groups.append(AnalogGroup(
+                    id=self._key(),
+                    name=f'{topic.name}: аналоги {group_index + 1}',
+                ))
+            task_groups.append(TaskGroup(
+                id=self._key(),
+                task=task,
+                group=analog_groups[group_index],
+            ))
+        positions = tuple(TASK_IMAGE_POSITION_LABELS)
+        images = [
+            TaskImage(
+                id=self._key(),
+                task=task,
+                position=self.random.choice(positions),
+                caption=self.fake.sentence(nb_words=3).rstrip('.'),
+                order=1,
+            )
+            for task in tasks
+            if self.random.random() < spec.image_rate
+        ]
+        return SyntheticTaskBank(
+            topics=topics,
+            subtopics=subtopics,
+            tasks=tasks,
+            analog_groups=analog_groups,
+            task_groups=task_groups,
+            images=images,
+            image_pool=[
+                self._diagram(index)
+                for index in range(min(IMAGE_POOL_SIZE, len(images)))
+            ],
+        )
+
+    def _save_task_bank(self, bank):
+        self._bulk(Topic, bank.topics)
+        self._bulk(SubTopic, bank.subtopics)
+        self._bulk(Task, bank.tasks)
+        self._bulk(AnalogGroup, bank.analog_groups)
+        self._bulk(TaskGroup, bank.task_groups)
+        if not bank.images:
+            return
+        store = self.asset_store or DjangoImageAssetStore()
+        assets = [
+            store.get_or_create(
+                ContentFile(content, name=self._diagram_name(index)),
+            )
+            for index, content in enumerate(bank.image_pool)
+        ]
+        for pool_index, image in bank.pooled_images():
+            image.asset = assets[pool_index]
+        self._bulk(TaskImage, bank.images)
+
+    def _year(self):
+        start = self.spec.start_date
+        return AcademicYear.objects.create(
+            id=self._key(),
+            name=self.spec.year_name,
+            start_date=start,
+            end_date=start + timedelta(weeks=self.spec.weeks + 1),
+        )
+
+    def _works(self, bank):
+        group_by_task = {
+            link.task.pk: link.group for link in bank.task_groups
+        }
+        works = self._bulk(Work, [
+            Work(id=self._key(), name=f'Работа {index + 1}', work_type='test')
+            for index in range(self.spec.work_count)
+        ])
+        plans = []
+        for work in works:
+            picked = self.random.sample(bank.tasks, self.spec.tasks_per_work)
+            max_points = [
+                self.random.choice(TASK_MAX_POINTS) for _ in picked
+            ]
+            plans.append((work, picked, max_points))
+        snapshots = self._task_snapshots({
+            task.pk for _, picked, _ in plans for task in picked
+        })
+
+        selections = []
+        variant_tasks = []
+        variants = []
+        for work, picked, max_points in plans:
+            work_selections = [
+                WorkAnalogGroup(
+                    id=self._key(),
+                    work=work,
+                    analog_group=group_by_task[task.pk],
+                    order=order + 1,
+                    weight=points,
+                )
+                for order, (task, points) in enumerate(zip(picked, max_points))
+            ]
+            selections.extend(work_selections)
+            for number in range(1, self.spec.variants_per_work + 1):
+                variant = Variant(
+                    id=self._key(),
+                    work=work,
+                    number=number,
+                    work_name_snapshot=work.name,
+                    max_score_snapshot=sum(max_points),
+                )
+                variants.append(variant)
+                # Variants differ by task order, as generated ones do.
+                order = list(range(len(picked)))
+                self.random.shuffle(order)
+                for position, index in enumerate(order):
+                    variant_tasks.append(VariantTask(
+                        id=self._key(),
+                        variant=variant,
+                        task=picked[index],
+                        task_snapshot=snapshots[picked[index].pk],
+                        source_selection_id=str(work_selections[index].pk),
+                        content_order=index + 1,
+                        order=position + 1,
+                        max_points=max_points[index],
+                    ))
+        self._bulk(WorkAnalogGroup, selections)
+        self._bulk(Variant, variants)
+        self._bulk(VariantTask, variant_tasks)
+        self.variants_by_work = {}
+        self.variant_tasks_by_variant = {}
+        for variant in variants:
+            self.variants_by_work.setdefault(variant.work_id, []).append(
+                variant,
+            )
+        for variant_task in variant_tasks:
+            self.variant_tasks_by_variant.setdefault(
+                variant_task.variant_id,
+                [],
+            ).append(variant_task)
+        return works
+
+    @staticmethod
+    def _task_snapshots(task_ids):
+        """Return snapshot mappings of the used tasks, keyed by task id."""
+        task_ids = sorted(task_ids)
+        snapshots = {}
+        for start in range(0, len(task_ids), SNAPSHOT_BATCH_SIZE):
+            tasks = Task.objects.filter(
+                pk__in=task_ids[start:start + SNAPSHOT_BATCH_SIZE],
+            ).select_related(
+                'topic',
+                'subtopic',
+                'source',
+            ).prefetch_related(
+                'codifier_content_entries__codifier',
+                'codifier_requirements__codifier',
+                'images',
+            )
+            for task_id, snapshot in build_task_content_snapshots(
+                tasks,
+            ).items():
+                snapshots[uuid.UUID(task_id)] = snapshot.to_mapping()
+        return snapshots
+
+    def _groups(self, year):
+        groups = self._bulk(StudentGroup, [
+            StudentGroup(
+                id=self._key(),
+                name=self._group_name(index),
+                academic_year=year,
+            )
+            for index in range(self.spec.groups)
+        ])
+        students = self._bulk(Student, [
+            self._student()
+            for _ in range(self.spec.groups * self.spec.students_per_group)
+        ])
+        memberships = []
+        self.students_by_group = {}
+        for index, group in enumerate(groups):
+            start = index * self.spec.students_per_group
+            members = students[start:start + self.spec.students_per_group]
+            self.students_by_group[group.pk] = members
+            memberships.extend(
+                StudentGroup.students.through(
+                    studentgroup_id=group.pk,
+                    student_id=student.pk,
+                )
+                for student in members
+            )
+        StudentGroup.students.through.objects.bulk_create(
+            memberships,
+            batch_size=BULK_WRITE_BATCH_SIZE,
+        )
+        return groups
+
+    @staticmethod
+    def _group_name(index):
+        letter = chr(ord('А') + index % 32)
+        suffix = str(index // 32) if index >= 32 else ''
+        return f'{SYNTHETIC_GRADE_LEVEL}{letter}{suffix}'
+
+    def _student(self):
+        if self.random.random() < 0.5:
+            return Student(
+                id=self._key(),
+                last_name=self.fake.last_name_male(),
+                first_name=self.fake.first_name_male(),
+                middle_name=self.fake.middle_name_male(),
+            )
+        return Student(
+            id=self._key(),
+            last_name=self.fake.last_name_female(),
+            first_name=self.fake.first_name_female(),
+            middle_name=self.fake.middle_name_female(),
+        )
+
+    def _courses(self, year, groups, works):
+        courses = self._bulk(Course, [
+            Course(
+                id=self._key(),
+                name=f'{SYNTHETIC_SUBJECT} {group.name}',
+                subject=SYNTHETIC_SUBJECT,
+                grade_level=SYNTHETIC_GRADE_LEVEL,
+                year=year,
+                start_date=year.start_date,
+                end_date=year.end_date,
+            )
+            for group in groups
+        ])
+        Course.student_groups.through.objects.bulk_create(
+            [
+                Course.student_groups.through(
+                    course_id=course.pk,
+                    studentgroup_id=group.pk,
+                )
+                for course, group in zip(courses, groups)
+            ],
+            batch_size=BULK_WRITE_BATCH_SIZE,
+        )
+        self._bulk(CourseAssignment, [
+            CourseAssignment(
+                id=self._key(),
+                course=course,
+                work=self._event_work(works, group_index, week),
+                order=week + 1,
+                planned_date=self._event_date(week, group_index),
+            )
+            for group_index, course in enumerate(courses)
+            for week in range(self.spec.weeks)
+        ])
+        return courses
+
+    def _events(self, groups, courses, works):
+        events = []
+        event_groups = []
+        for group_index, (group, course) in enumerate(zip(groups, courses)):
+            for week in range(self.spec.weeks):
+                work = self._event_work(works, group_index, week)
+                planned_at = timezone.make_aware(datetime.combine(
+                    self._event_date(week, group_index),
+                    time(hour=9),
+                ))
+                events.append(Event(
+                    id=self._key(),
+                    name=f'{work.name} · {group.name}',
+                    work=work,
+                    course=course,
+                    planned_date=planned_at,
+                    actual_start=planned_at,
+                    actual_end=planned_at + timedelta(minutes=45),
+                    status='graded',
+                ))
+                event_groups.append(group)
+        self._bulk(Event, events)
+        for start in range(0, len(events), EVENT_BATCH_SIZE):
+            self._participations(
+                events[start:start + EVENT_BATCH_SIZE],
+                event_groups[start:start + EVENT_BATCH_SIZE],
+            )
+        return events
+
+    def _participations(self, events, groups):
+        participations = []
+        marks = []
+        absent_ids = []
+        checked_after = timedelta(days=2)
+        for event, group in zip(events, groups):
+            variants = self.variants_by_work[event.work_id]
+            for index, student in enumerate(self.students_by_group[group.pk]):
+                variant = variants[index % len(variants)]
+                absent = self.random.random() < self.spec.absence_rate
+                participation = EventParticipation(
+                    id=self._key(),
+                    event=event,
+                    student=student,
+                    variant=variant,
+                    status='absent' if absent else 'graded',
+                    graded_at=(
+                        None if absent else event.planned_date + checked_after
+                    ),
+                )
+                participations.append(participation)
+                if absent:
+                    absent_ids.append(participation.pk)
+                    continue
+                marks.append(self._mark(
+                    participation,
+                    variant,
+                    event.planned_date + checked_after,
+                ))
+        self._bulk(EventParticipation, participations)
+        self._bulk(Mark, marks)
+
+        repository = DjangoAttemptSnapshotRepository()
+        self.counts['attemptsnapshot'] = self.counts.get(
+            'attemptsnapshot', 0,
+        ) + sum(
+            len(repository.capture_event_marks(str(event.pk)))
+            for event in events
+        )
+        refresh_participation_projections(absent_ids)
+
+    def _mark(self, participation, variant, checked_at):
+        task_scores = {}
+        points = max_points = 0
+        # Each student has a steady skill level, so reports show a spread.
+        skill = 0.35 + 0.6 * self.random.random()
+        for variant_task in self.variant_tasks_by_variant[variant.pk]:
+            earned = sum(
+                self.random.random() < skill
+                for _ in range(variant_task.max_points)
+            )
+            task_scores[str(variant_task.pk)] = {
+                'task_id': str(variant_task.task_id),
+                'variant_task_id': str(variant_task.pk),
+                'points': earned,
+                'max_points': variant_task.max_points,
+                'comment': (
+                    '' if earned == variant_task.max_points
+                    else self.fake.sentence(nb_words=4)
+                ),
+            }
+            points += earned
+            max_points += variant_task.max_points
+        percentage = points / max_points * 100 if max_points else 0
+        return Mark(
+            id=self._key(),
+            participation=participation,
+            score=(
+                5 if percentage >= 85
+                else 4 if percentage >= 70
+                else 3 if percentage >= 50
+                else 2
+            ),
+            points=points,
+            max_points=max_points,
+            task_scores=task_scores,
+            checked_at=checked_at,
+            checked_by='Синтетический учитель',
+            needs_attention=percentage < 50,
+            is_excellent=percentage >= 85,
+        )
+
+    def _event_work(self, works, group_index, week):
+        # With one work per week every group writes the same work; extra
+        # works are spread across groups.
+        return works[(group_index * self.spec.weeks + week) % len(works)]
+
+    def _event_date(self, week, group_index):
+        # Groups write on different weekdays.
+        return self.spec.start_date + timedelta(
+            weeks=week,
+            days=group_index % 5,
+        )
+
+    def _diagram(self, index):
+        """Draw a small line chart as PNG bytes."""
+        image = Image.new('RGB', (480, 320), 'white')
+        draw = ImageDraw.Draw(image)
+        draw.line((40, 280, 460, 280), fill='black', width=2)
+        draw.line((40, 280, 40, 20), fill='black', width=2)
+        draw.line(
+            [
+                (40 + step * 42, 280 - self.random.randint(10, 250))
+                for step in range(11)
+            ],
+            fill=(40, 80, 200),
+            width=3,
+        )
+        draw.text((420, 290), f'#{index + 1}', fill='black')
+        content = BytesIO()
+        image.save(content, format='PNG')
+        return content.getvalue()
+
+    @staticmethod
+    def _diagram_name(pool_index):
+        return f'synthetic-diagram-{pool_index + 1}.png'
+
+    def _key(self):
+        return uuid.UUID(int=self.key_random.getrandbits(128), version=4)
+
+    def _bulk(self, model, objects):
+        model.objects.bulk_create(objects, batch_size=BULK_WRITE_BATCH_SIZE)
+        key = model._meta.model_name
+        self.counts[key] = self.counts.get(key, 0) + len(objects)
+        return objects
+
+
+def synthetic_school_spec(preset='small', **overrides) -> SyntheticSchoolSpec:
+    """Return a preset spec with the non-``None`` ``overrides`` applied."""
+    try:
+        spec = SYNTHETIC_SCHOOL_PRESETS[preset]
+    except KeyError as exc:
+        raise ValueError(f'Неизвестный набор параметров: {preset}') from exc
+    return replace(spec, **{
+        name: value for name, value in overrides.items() if value is not None
+    })
+
+
+def build_synthetic_school(
+    spec: SyntheticSchoolSpec,
+    asset_store=None,
+) -> SyntheticSchool:
+    return SyntheticSchoolBuilder(spec, asset_store=asset_store).build()
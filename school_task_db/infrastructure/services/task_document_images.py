@@ -9,6 +9,10 @@ from core_logic.services.task_image_transfer_codec import (
     TaskImageTransferCodec,
 )
 from core_logic.value_objects.task_image_position import task_image_layout
+from infrastructure.services.image_derivatives import (
+    DjangoImageDerivativeStore,
+    image_target_width_px,
+)
 from infrastructure.services.task_snapshot_image_files import (
     TaskSnapshotImageFileResolver,
 )
@@ -23,8 +27,13 @@ class TaskDocumentImagePayloadFormatter:
         transfer_codec=None,
         asset_file_resolver=None,
         snapshot_image_file_resolver=None,
+        derivative_store=None,
     ):
         self.storage = storage or default_storage
+        self.derivative_store = (
+            derivative_store
+            or DjangoImageDerivativeStore(storage=self.storage)
+        )
         self.transfer_codec = transfer_codec or TaskImageTransferCodec()
         self.snapshot_image_file_resolver = (
             snapshot_image_file_resolver
@@ -57,15 +66,20 @@ class TaskDocumentImagePayloadFormatter:
             return None
 
         renderer_type = self._renderer_type(request)
+        layout = task_image_layout(image.get('position', ''))
         render_source = self._cached_render_source(
             file_name,
             renderer_type=renderer_type,
+            max_width_px=image_target_width_px(
+                layout.width_percent,
+                page_format=self._page_format(request),
+                renderer_type=renderer_type,
+            ),
             request=request,
         )
         if not render_source:
             return None
 
-        layout = task_image_layout(image.get('position', ''))
         return {
             **image,
             'file_name': file_name,
@@ -86,16 +100,26 @@ class TaskDocumentImagePayloadFormatter:
             cache=cache,
         )
 
-    def _cached_render_source(self, file_name, *, renderer_type, request):
+    def _cached_render_source(
+        self,
+        file_name,
+        *,
+        renderer_type,
+        max_width_px,
+        request,
+    ):
         build_context = getattr(request, 'build_context', None)
         cache = None
-        cache_key = (renderer_type, file_name)
+        cache_key = (renderer_type, file_name, max_width_px)
         if build_context is not None:
             cache = build_context.setdefault('task_image_render_sources', {})
             if cache_key in cache:
                 return cache[cache_key]
 
-        source = self._render_source(file_name, renderer_type)
+        source = self._render_source(
+            self.derivative_store.file_name_for_width(file_name, max_width_px),
+            renderer_type,
+        )
         if cache is not None:
             cache[cache_key] = source
         return source
@@ -122,6 +146,11 @@ class TaskDocumentImagePayloadFormatter:
         except Exception:
             return False
 
+    @staticmethod
+    def _page_format(request):
+        render_target = getattr(request, 'render_target', None)
+        return getattr(render_target, 'page_format', '') or 'A4'
+
     @staticmethod
     def _renderer_type(request):
         render_target = getattr(request, 'render_target', None)
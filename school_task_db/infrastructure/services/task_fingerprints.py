@@ -0,0 +1,231 @@
+"""Maintain and query the MinHash/LSH index of task texts.
+
+Each fingerprinted task has one packed signature and one bucket row per LSH
+band. Candidates for a text are the tasks sharing any of its buckets, found
+with one indexed query; whole-bank duplicate search groups buckets in SQL
+and compares signatures only within shared buckets.
+"""
+
+import struct
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Count
+
+from core_logic.value_objects.task_fingerprint import (
+    signature_similarity,
+    task_text_fingerprint,
+)
+from task_groups.models import TaskGroup
+from tasks.models import Task, TaskFingerprint, TaskFingerprintBucket
+
+BULK_WRITE_BATCH_SIZE = 200
+# Buckets are looked up in chunks that stay under SQLite's variable limit.
+BUCKET_LOOKUP_CHUNK_SIZE = 500
+# Larger buckets hold many copies of one text: members are compared with the
+# first one only instead of pairwise.
+PAIRWISE_BUCKET_SIZE = 50
+
+
+def pack_signature(signature) -> bytes:
+    return struct.pack(f'<{len(signature)}Q', *signature)
+
+
+def unpack_signature(data) -> tuple[int, ...]:
+    data = bytes(data)
+    return struct.unpack(f'<{len(data) // 8}Q', data)
+
+
+def write_task_fingerprints(task_texts) -> int:
+    """Replace fingerprints of ``(task_id, text)`` pairs; return rows written."""
+    task_texts = dict(task_texts)
+    if not task_texts:
+        return 0
+    fingerprints = []
+    buckets = []
+    for task_id, text in task_texts.items():
+        fingerprint = task_text_fingerprint(text)
+        if fingerprint is None:
+            continue
+        fingerprints.append(
+            TaskFingerprint(
+                task_id=task_id,
+                signature=pack_signature(fingerprint.signature),
+            ),
+        )
+        buckets.extend(
+            TaskFingerprintBucket(task_id=task_id, bucket=bucket)
+            for bucket in fingerprint.buckets
+        )
+    with transaction.atomic():
+        TaskFingerprint.objects.filter(task_id__in=task_texts).delete()
+        TaskFingerprintBucket.objects.filter(task_id__in=task_texts).delete()
+        TaskFingerprint.objects.bulk_create(
+            fingerprints,
+            batch_size=BULK_WRITE_BATCH_SIZE,
+        )
+        TaskFingerprintBucket.objects.bulk_create(
+            buckets,
+            batch_size=BULK_WRITE_BATCH_SIZE,
+        )
+    return len(fingerprints)
+
+
+def refresh_task_fingerprints(task_ids) -> int:
+    task_ids = tuple(dict.fromkeys(task_ids))
+    if not task_ids:
+        return 0
+    return write_task_fingerprints(
+        Task.objects.filter(pk__in=task_ids).values_list('pk', 'text'),
+    )
+
+
+def rebuild_task_fingerprints(batch_size=500) -> int:
+    """Fingerprint every task in batches."""
+    ids = list(Task.objects.order_by('pk').values_list('pk', flat=True))
+    return sum(
+        refresh_task_fingerprints(ids[start:start + batch_size])
+        for start in range(0, len(ids), batch_size)
+    )
+
+
+def similar_task_scores(fingerprints, *, threshold, limit=None):
+    """Return ``{key: [(task_id, similarity), ...]}`` for text fingerprints.
+
+    ``fingerprints`` maps caller keys to fingerprints. A candidate equal to
+    its key (the task itself) is skipped. Scores are sorted best first.
+    """
+    fingerprints = {
+        key: fingerprint
+        for key, fingerprint in fingerprints.items()
+        if fingerprint is not None
+    }
+    keys_by_bucket = defaultdict(set)
+    for key, fingerprint in fingerprints.items():
+        for bucket in fingerprint.buckets:
+            keys_by_bucket[bucket].add(key)
+
+    candidates = defaultdict(set)
+    buckets = list(keys_by_bucket)
+    for start in range(0, len(buckets), BUCKET_LOOKUP_CHUNK_SIZE):
+        for bucket, task_id in TaskFingerprintBucket.objects.filter(
+            bucket__in=buckets[start:start + BUCKET_LOOKUP_CHUNK_SIZE],
+        ).values_list('bucket', 'task_id'):
+            for key in keys_by_bucket[bucket]:
+                if str(task_id) != str(key):
+                    candidates[key].add(task_id)
+
+    signatures = _signatures(
+        {task_id for task_ids in candidates.values() for task_id in task_ids},
+    )
+    scores = {}
+    for key, task_ids in candidates.items():
+        matches = sorted(
+            (
+                (task_id, similarity)
+                for task_id in task_ids
+                if (similarity := signature_similarity(
+                    fingerprints[key].signature,
+                    signatures.get(task_id, ()),
+                )) >= threshold
+            ),
+            key=lambda match: (-match[1], str(match[0])),
+        )
+        if matches:
+            scores[key] = matches[:limit]
+    return scores
+
+
+def find_duplicate_task_groups(*, threshold, include_analogs=False):
+    """Return near-duplicate clusters as ``[(task_ids, best_similarity)]``.
+
+    Pairs already placed in one analog group are intentional variants and
+    are skipped unless ``include_analogs`` is set.
+    """
+    shared_buckets = TaskFingerprintBucket.objects.order_by().values(
+        'bucket',
+    ).annotate(
+        members=Count('pk'),
+    ).filter(members__gt=1).values('bucket')
+    members_by_bucket = defaultdict(list)
+    for bucket, task_id in TaskFingerprintBucket.objects.filter(
+        bucket__in=shared_buckets,
+    ).order_by('bucket', 'task_id').values_list('bucket', 'task_id'):
+        members_by_bucket[bucket].append(task_id)
+
+    pairs = set()
+    for members in members_by_bucket.values():
+        if len(members) > PAIRWISE_BUCKET_SIZE:
+            pairs.update((members[0], other) for other in members[1:])
+            continue
+        pairs.update(
+            (first, second)
+            for index, first in enumerate(members)
+            for second in members[index + 1:]
+        )
+    if not pairs:
+        return []
+
+    task_ids = {task_id for pair in pairs for task_id in pair}
+    signatures = _signatures(task_ids)
+    groups = {} if include_analogs else _analog_groups(task_ids)
+    parents = {}
+    best = defaultdict(float)
+
+    def root(task_id):
+        while parents.get(task_id, task_id) != task_id:
+            task_id = parents[task_id]
+        return task_id
+
+    for first, second in pairs:
+        if groups.get(first, set()) & groups.get(second, set()):
+            continue
+        similarity = signature_similarity(
+            signatures.get(first, ()),
+            signatures.get(second, ()),
+        )
+        if similarity < threshold:
+            continue
+        first_root, second_root = root(first), root(second)
+        if first_root != second_root:
+            parents[second_root] = first_root
+        best[first] = max(best[first], similarity)
+        best[second] = max(best[second], similarity)
+
+    clusters = defaultdict(list)
+    for task_id in best:
+        clusters[root(task_id)].append(task_id)
+    return sorted(
+        (
+            (
+                tuple(sorted(members, key=str)),
+                max(best[task_id] for task_id in members),
+            )
+            for members in clusters.values()
+        ),
+        key=lambda cluster: (-len(cluster[0]), -cluster[1], str(cluster[0][0])),
+    )
+
+
+def _signatures(task_ids):
+    task_ids = list(task_ids)
+    signatures = {}
+    for start in range(0, len(task_ids), BUCKET_LOOKUP_CHUNK_SIZE):
+        signatures.update(
+            (task_id, unpack_signature(signature))
+            for task_id, signature in TaskFingerprint.objects.filter(
+                task_id__in=task_ids[start:start + BUCKET_LOOKUP_CHUNK_SIZE],
+            ).values_list('task_id', 'signature')
+        )
+    return signatures
+
+
+def _analog_groups(task_ids):
+    task_ids = list(task_ids)
+    groups = defaultdict(set)
+    for start in range(0, len(task_ids), BUCKET_LOOKUP_CHUNK_SIZE):
+        for task_id, group_id in TaskGroup.objects.filter(
+            task_id__in=task_ids[start:start + BUCKET_LOOKUP_CHUNK_SIZE],
+        ).values_list('task_id', 'group_id'):
+            groups[task_id].add(group_id)
+    return groups
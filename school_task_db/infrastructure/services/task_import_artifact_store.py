@@ -0,0 +1,82 @@
+"""On-disk store of validated task import uploads."""
+
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+
+from django.conf import settings
+
+from core_logic.entities.task_import import TaskImportArtifact
+from core_logic.interfaces.task_import import ITaskImportArtifactStore
+
+TASK_IMPORT_ARTIFACT_MAX_AGE = 60 * 60
+TASK_IMPORT_ARTIFACT_SUFFIX = '.pickle'
+
+
+class FileTaskImportArtifactStore(ITaskImportArtifactStore):
+    """Артефакты предпросмотра импорта в каталоге на диске.
+
+    Файл называется хешем загруженного JSON и живёт ``max_age`` секунд:
+    повторная загрузка того же файла при импорте берёт разобранные и
+    проверенные данные отсюда. Устаревшие файлы удаляются при записи.
+    """
+
+    def __init__(self, directory=None, max_age=TASK_IMPORT_ARTIFACT_MAX_AGE):
+        self._directory = directory
+        self.max_age = max_age
+
+    @property
+    def directory(self) -> Path:
+        return Path(self._directory or settings.TASK_IMPORT_ARTIFACT_DIR)
+
+    def load(self, content_hash: str) -> TaskImportArtifact | None:
+        path = self._path(content_hash)
+        try:
+            if self._expired(path):
+                path.unlink(missing_ok=True)
+                return None
+            with path.open('rb') as artifact_file:
+                artifact = pickle.load(artifact_file)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        if (
+            not isinstance(artifact, TaskImportArtifact)
+            or artifact.content_hash != content_hash
+        ):
+            return None
+        return artifact
+
+    def save(self, artifact: TaskImportArtifact) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._purge_expired()
+        # Write then rename, so a concurrent load never reads half a file.
+        descriptor, temp_name = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(descriptor, 'wb') as artifact_file:
+                pickle.dump(
+                    artifact,
+                    artifact_file,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(temp_name, self._path(artifact.content_hash))
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+    def _path(self, content_hash: str) -> Path:
+        if not content_hash.isalnum():
+            raise ValueError(f'invalid content hash: {content_hash!r}')
+        return self.directory / f'{content_hash}{TASK_IMPORT_ARTIFACT_SUFFIX}'
+
+    def _expired(self, path: Path) -> bool:
+        return time.time() - path.stat().st_mtime > self.max_age
+
+    def _purge_expired(self) -> None:
+        for path in self.directory.glob(f'*{TASK_IMPORT_ARTIFACT_SUFFIX}'):
+            try:
+                if self._expired(path):
+                    path.unlink(missing_ok=True)
+            except OSError:
+                continue
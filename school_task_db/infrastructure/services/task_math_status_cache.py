@@ -8,6 +8,10 @@ from django.core.cache import cache
 from core_logic.entities.task import TaskMathCacheStats, TaskMathStatusSnapshot
 from core_logic.interfaces.task_math_status_cache import ITaskMathStatusCache
 from core_logic.services.formula_processor import formula_processor
+from infrastructure.services.cache_generations import (
+    CACHE_DOMAIN_TASKS,
+    cache_generations,
+)
 from tasks.models import Task
 
 logger = logging.getLogger(__name__)
@@ -29,14 +33,29 @@ class DjangoTaskMathStatusCache(ITaskMathStatusCache):
     TASK_CACHE_TIMEOUT = 86400
     
     @classmethod
-    def get_task_cache_key(cls, task_id: int) -> str:
-        """Генерирует ключ кэша для отдельного задания"""
-        return f"{cls.CACHE_KEY_TASK_PREFIX}{task_id}"
+    def get_task_cache_key(cls, task_id: int, updated_at=None) -> str:
+        """Генерирует ключ кэша для отдельного задания.
+
+        Метка ``updated_at`` делает ключ самоустаревающим: после сохранения
+        задания старая запись просто перестаёт читаться.
+        """
+        key = f"{cls.CACHE_KEY_TASK_PREFIX}{task_id}"
+        if updated_at is None:
+            return key
+        return f"{key}:{updated_at.timestamp():.6f}"
+
+    @classmethod
+    def get_aggregate_cache_key(cls, key: str) -> str:
+        """Ключ агрегата, привязанный к генерации банка заданий"""
+        return cache_generations.versioned_key(key, CACHE_DOMAIN_TASKS)
     
     @classmethod
     def get_task_math_status(cls, task) -> Dict[str, Any]:
         """Получает статус формул для отдельного задания с кэшированием"""
-        cache_key = cls.get_task_cache_key(task.id)
+        cache_key = cls.get_task_cache_key(
+            task.id,
+            getattr(task, 'updated_at', None),
+        )
         cached_status = cache.get(cache_key)
         
         if cached_status is not None:
@@ -93,8 +112,9 @@ class DjangoTaskMathStatusCache(ITaskMathStatusCache):
     @classmethod
     def get_all_tasks_math_status(cls, force_refresh: bool = False) -> Dict[str, Set[int]]:
         """Получает статус формул для всех заданий с кэшированием"""
+        all_math_key = cls.get_aggregate_cache_key(cls.CACHE_KEY_ALL_MATH)
         if not force_refresh:
-            cached_data = cache.get(cls.CACHE_KEY_ALL_MATH)
+            cached_data = cache.get(all_math_key)
             if cached_data is not None:
                 logger.debug("Используем кэшированные данные статуса формул")
                 return cached_data
@@ -141,18 +161,28 @@ class DjangoTaskMathStatusCache(ITaskMathStatusCache):
         )
         
         # Кэшируем результат
-        cache.set(cls.CACHE_KEY_ALL_MATH, result, cls.CACHE_TIMEOUT)
+        cache.set(all_math_key, result, cls.CACHE_TIMEOUT)
         
         # Также сохраняем отдельные списки для быстрого доступа
-        cache.set(cls.CACHE_KEY_WITH_MATH, result['with_math'], cls.CACHE_TIMEOUT)
-        cache.set(cls.CACHE_KEY_WITH_ERRORS, result['with_errors'], cls.CACHE_TIMEOUT)
+        cache.set(
+            cls.get_aggregate_cache_key(cls.CACHE_KEY_WITH_MATH),
+            result['with_math'],
+            cls.CACHE_TIMEOUT,
+        )
+        cache.set(
+            cls.get_aggregate_cache_key(cls.CACHE_KEY_WITH_ERRORS),
+            result['with_errors'],
+            cls.CACHE_TIMEOUT,
+        )
         
         return result
     
     @classmethod
     def get_tasks_with_math_ids(cls) -> frozenset[str]:
         """Получает ID заданий с формулами"""
-        cached_ids = cache.get(cls.CACHE_KEY_WITH_MATH)
+        cached_ids = cache.get(
+            cls.get_aggregate_cache_key(cls.CACHE_KEY_WITH_MATH)
+        )
         if cached_ids is not None:
             return frozenset(str(task_id) for task_id in cached_ids)
         
@@ -163,7 +193,9 @@ class DjangoTaskMathStatusCache(ITaskMathStatusCache):
     @classmethod
     def get_tasks_with_errors_ids(cls) -> frozenset[str]:
         """Получает ID заданий с ошибками в формулах"""
-        cached_ids = cache.get(cls.CACHE_KEY_WITH_ERRORS)
+        cached_ids = cache.get(
+            cls.get_aggregate_cache_key(cls.CACHE_KEY_WITH_ERRORS)
+        )
         if cached_ids is not None:
             return frozenset(str(task_id) for task_id in cached_ids)
         
@@ -171,23 +203,10 @@ class DjangoTaskMathStatusCache(ITaskMathStatusCache):
         all_status = cls.get_all_tasks_math_status()
         return frozenset(str(task_id) for task_id in all_status['with_errors'])
     
-    @classmethod
-    def invalidate_task_cache(cls, task_id: int):
-        """Инвалидирует кэш для конкретного задания"""
-        cache_key = cls.get_task_cache_key(task_id)
-        cache.delete(cache_key)
-        logger.debug(f"Инвалидирован кэш для задания {task_id}")
-    
     @classmethod
     def invalidate_all_cache(cls):
-        """Инвалидирует весь кэш статуса формул"""
-        keys_to_delete = [
-            cls.CACHE_KEY_ALL_MATH,
-            cls.CACHE_KEY_WITH_MATH,
-            cls.CACHE_KEY_WITH_ERRORS,
-        ]
-        
-        cache.delete_many(keys_to_delete)
+        """Инвалидирует весь кэш статуса формул во всех процессах"""
+        cache_generations.bump(CACHE_DOMAIN_TASKS)
         logger.info("Инвалидирован весь кэш статуса формул")
 
     @classmethod
@@ -224,9 +243,15 @@ class DjangoTaskMathStatusCache(ITaskMathStatusCache):
     @classmethod
     def get_cache_stats(cls) -> TaskMathCacheStats:
         """Получает статистику кэша"""
-        all_status = cache.get(cls.CACHE_KEY_ALL_MATH)
-        with_math = cache.get(cls.CACHE_KEY_WITH_MATH)
-        with_errors = cache.get(cls.CACHE_KEY_WITH_ERRORS)
+        all_status = cache.get(
+            cls.get_aggregate_cache_key(cls.CACHE_KEY_ALL_MATH)
+        )
+        with_math = cache.get(
+            cls.get_aggregate_cache_key(cls.CACHE_KEY_WITH_MATH)
+        )
+        with_errors = cache.get(
+            cls.get_aggregate_cache_key(cls.CACHE_KEY_WITH_ERRORS)
+        )
         
         return TaskMathCacheStats(
             all_status_cached=all_status is not None,
@@ -240,19 +265,19 @@ class DjangoTaskMathStatusCache(ITaskMathStatusCache):
     def get_cache_inventory(cls, sample_size: int = 100) -> Dict[str, int]:
         """Return database and individual-key counts for CLI diagnostics."""
         normalized_sample_size = max(int(sample_size), 0)
-        task_ids = list(
-            Task.objects.order_by('pk').values_list('pk', flat=True)[
+        task_revisions = list(
+            Task.objects.order_by('pk').values_list('pk', 'updated_at')[
                 :normalized_sample_size
             ]
         )
-        cached_count = sum(
-            cache.get(cls.get_task_cache_key(task_id)) is not None
-            for task_id in task_ids
-        )
+        cached = cache.get_many([
+            cls.get_task_cache_key(task_id, updated_at)
+            for task_id, updated_at in task_revisions
+        ])
         return {
             'total_tasks': Task.objects.count(),
-            'sample_size': len(task_ids),
-            'cached_in_sample': cached_count,
+            'sample_size': len(task_revisions),
+            'cached_in_sample': len(cached),
         }
 
 
@@ -0,0 +1,53 @@
+"""Shared cache of built work analysis rows per academic year."""
+
+from django.core.cache import cache
+
+from infrastructure.services.cache_generations import (
+    CACHE_DOMAIN_ATTEMPTS,
+    CACHE_DOMAIN_EVENTS,
+    CACHE_DOMAIN_WORKS,
+    cache_generations,
+)
+
+WORK_ANALYSIS_CACHE_TIMEOUT = 24 * 60 * 60
+WORK_ANALYSIS_CACHE_DOMAINS = (
+    CACHE_DOMAIN_EVENTS,
+    CACHE_DOMAIN_ATTEMPTS,
+    CACHE_DOMAIN_WORKS,
+)
+
+
+class DjangoWorkAnalysisCache:
+    """Строки анализа работ за учебный год в общем Django-кэше.
+
+    Ключ включает границы года и поколения событий, попыток и работ:
+    любое изменение события, участия, снимка попытки или варианта
+    работы делает прежнюю запись недостижимой.
+    """
+
+    KEY_PREFIX = 'work_analysis_source:'
+
+    def get(self, year):
+        return cache.get(self._key(year))
+
+    def set(self, year, works) -> None:
+        cache.set(
+            self._key(year),
+            works,
+            timeout=WORK_ANALYSIS_CACHE_TIMEOUT,
+        )
+
+    def _key(self, year):
+        scope = (
+            f'{year.pk}:{year.start_date}:{year.end_date}'
+            if year
+            else 'all'
+        )
+        return cache_generations.versioned_key(
+            f'{self.KEY_PREFIX}{scope}',
+            *WORK_ANALYSIS_CACHE_DOMAINS,
+        )
+
+
+# Shared adapter instance used by the work analysis repository.
+work_analysis_cache = DjangoWorkAnalysisCache()
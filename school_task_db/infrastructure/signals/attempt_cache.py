@@ -0,0 +1,16 @@
+"""Bump the attempt cache generation after snapshot writes."""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from events.models import AttemptSnapshot
+from infrastructure.services.cache_generations import (
+    CACHE_DOMAIN_ATTEMPTS,
+    cache_generations,
+)
+
+
+@receiver(post_save, sender=AttemptSnapshot)
+@receiver(post_delete, sender=AttemptSnapshot)
+def bump_attempt_cache_generation(sender, instance, **kwargs):
+    cache_generations.bump(CACHE_DOMAIN_ATTEMPTS)
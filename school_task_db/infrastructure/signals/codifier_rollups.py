@@ -0,0 +1,185 @@
+"""Keep codifier rollups in step with tasks and curriculum bindings."""
+
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+
+from codifier.models import ContentEntry, Requirement
+from curriculum.models import SubTopic
+from infrastructure.services.codifier_rollups import (
+    content_entry_ids_for_curriculum,
+    refresh_content_entry_rollups,
+    refresh_curriculum_rollups,
+    refresh_requirement_rollups,
+)
+from tasks.models import Task
+
+CURRICULUM_FIELDS = frozenset(('topic', 'subtopic'))
+
+
+def remember_task_curriculum(sender, instance, **kwargs):
+    update_fields = kwargs.get('update_fields')
+    if instance._state.adding or (
+        update_fields is not None
+        and not CURRICULUM_FIELDS & set(update_fields)
+    ):
+        return
+    instance._rollup_curriculum = Task.objects.filter(
+        pk=instance.pk,
+    ).values_list('topic_id', 'subtopic_id').first()
+
+
+def refresh_rollups_for_task_save(sender, instance, created, **kwargs):
+    previous = instance.__dict__.pop('_rollup_curriculum', None)
+    current = (instance.topic_id, instance.subtopic_id)
+    if not created and (previous is None or previous == current):
+        return
+    previous = previous or (None, None)
+    refresh_curriculum_rollups(
+        topic_ids=(previous[0], current[0]),
+        subtopic_ids=(previous[1], current[1]),
+    )
+
+
+def remember_task_requirements(sender, instance, **kwargs):
+    # Deleting a task drops its requirement links without m2m_changed.
+    instance._rollup_requirement_ids = list(
+        instance.codifier_requirements.values_list('pk', flat=True),
+    )
+
+
+def refresh_rollups_for_task_delete(sender, instance, **kwargs):
+    refresh_curriculum_rollups(
+        topic_ids=(instance.topic_id,),
+        subtopic_ids=(instance.subtopic_id,),
+    )
+    refresh_requirement_rollups(
+        instance.__dict__.pop('_rollup_requirement_ids', ()),
+    )
+
+
+def refresh_rollups_for_requirement_links(
+    sender,
+    instance,
+    action,
+    reverse,
+    pk_set,
+    **kwargs,
+):
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            refresh_requirement_rollups((instance.pk,))
+    elif action == 'pre_clear':
+        remember_task_requirements(sender, instance)
+    elif action == 'post_clear':
+        refresh_requirement_rollups(
+            instance.__dict__.pop('_rollup_requirement_ids', ()),
+        )
+    elif action in ('post_add', 'post_remove'):
+        refresh_requirement_rollups(pk_set or ())
+
+
+def refresh_rollups_for_requirement_save(sender, instance, created, **kwargs):
+    if created:
+        refresh_requirement_rollups((instance.pk,))
+
+
+def remember_entry_parent(sender, instance, **kwargs):
+    if not instance._state.adding:
+        instance._rollup_parent_id = ContentEntry.objects.filter(
+            pk=instance.pk,
+        ).values_list('parent_id', flat=True).first()
+
+
+def refresh_rollups_for_entry_save(sender, instance, **kwargs):
+    # A parent's leaf flag follows its children.
+    refresh_content_entry_rollups(
+        pk
+        for pk in (
+            instance.pk,
+            instance.parent_id,
+            instance.__dict__.pop('_rollup_parent_id', None),
+        )
+        if pk
+    )
+
+
+def refresh_rollups_for_entry_delete(sender, instance, **kwargs):
+    if instance.parent_id:
+        refresh_content_entry_rollups((instance.parent_id,))
+
+
+def remember_subtopic_entries(sender, instance, **kwargs):
+    # SET_NULL moves the subtopic's tasks and entries onto its topic
+    # without signals of their own.
+    instance._rollup_entry_ids = content_entry_ids_for_curriculum(
+        topic_ids=(instance.topic_id,),
+        subtopic_ids=(instance.pk,),
+    )
+
+
+def refresh_rollups_for_subtopic_delete(sender, instance, **kwargs):
+    refresh_content_entry_rollups(
+        instance.__dict__.pop('_rollup_entry_ids', ()),
+    )
+
+
+pre_save.connect(
+    remember_task_curriculum,
+    sender=Task,
+    dispatch_uid='codifier_rollups_pre_save_Task',
+)
+post_save.connect(
+    refresh_rollups_for_task_save,
+    sender=Task,
+    dispatch_uid='codifier_rollups_save_Task',
+)
+pre_delete.connect(
+    remember_task_requirements,
+    sender=Task,
+    dispatch_uid='codifier_rollups_pre_delete_Task',
+)
+post_delete.connect(
+    refresh_rollups_for_task_delete,
+    sender=Task,
+    dispatch_uid='codifier_rollups_delete_Task',
+)
+m2m_changed.connect(
+    refresh_rollups_for_requirement_links,
+    sender=Requirement.tasks.through,
+    dispatch_uid='codifier_rollups_links_Requirement',
+)
+post_save.connect(
+    refresh_rollups_for_requirement_save,
+    sender=Requirement,
+    dispatch_uid='codifier_rollups_save_Requirement',
+)
+pre_save.connect(
+    remember_entry_parent,
+    sender=ContentEntry,
+    dispatch_uid='codifier_rollups_pre_save_ContentEntry',
+)
+post_save.connect(
+    refresh_rollups_for_entry_save,
+    sender=ContentEntry,
+    dispatch_uid='codifier_rollups_save_ContentEntry',
+)
+post_delete.connect(
+    refresh_rollups_for_entry_delete,
+    sender=ContentEntry,
+    dispatch_uid='codifier_rollups_delete_ContentEntry',
+)
+pre_delete.connect(
+    remember_subtopic_entries,
+    sender=SubTopic,
+    dispatch_uid='codifier_rollups_pre_delete_SubTopic',
+)
+post_delete.connect(
+    refresh_rollups_for_subtopic_delete,
+    sender=SubTopic,
+    dispatch_uid='codifier_rollups_delete_SubTopic',
+)
@@ -0,0 +1,29 @@
+"""Bump the event cache generation after event and participation writes."""
+
+from django.db.models.signals import post_delete, post_save
+
+from events.models import Event, EventParticipation
+from infrastructure.services.cache_generations import (
+    CACHE_DOMAIN_EVENTS,
+    cache_generations,
+)
+
+
+EVENT_CACHE_SENDERS = (Event, EventParticipation)
+
+
+def bump_event_cache_generation(sender, instance, **kwargs):
+    cache_generations.bump(CACHE_DOMAIN_EVENTS)
+
+
+for _sender in EVENT_CACHE_SENDERS:
+    post_save.connect(
+        bump_event_cache_generation,
+        sender=_sender,
+        dispatch_uid=f'event_cache_generation_save_{_sender.__name__}',
+    )
+    post_delete.connect(
+        bump_event_cache_generation,
+        sender=_sender,
+        dispatch_uid=f'event_cache_generation_delete_{_sender.__name__}',
+    )
@@ -0,0 +1,41 @@
+"""Reset cached event reports after writes that change their input."""
+
+from django.db.models.signals import post_delete, post_save
+
+from events.models import AttemptSnapshot, Event, EventParticipation
+from infrastructure.services.event_report_cache import (
+    event_report_source_cache,
+)
+from reports.models import EventReportNarrativeModel
+
+
+def invalidate_event_report_for_event(sender, instance, **kwargs):
+    event_report_source_cache.invalidate(instance.pk)
+
+
+def invalidate_event_report_for_related(sender, instance, **kwargs):
+    event_report_source_cache.invalidate(instance.event_id)
+
+
+def invalidate_event_report_for_attempt(sender, instance, **kwargs):
+    event_report_source_cache.invalidate(instance.event_id_snapshot)
+
+
+EVENT_REPORT_INVALIDATORS = (
+    (Event, invalidate_event_report_for_event),
+    (EventParticipation, invalidate_event_report_for_related),
+    (EventReportNarrativeModel, invalidate_event_report_for_related),
+    (AttemptSnapshot, invalidate_event_report_for_attempt),
+)
+
+for _sender, _receiver in EVENT_REPORT_INVALIDATORS:
+    post_save.connect(
+        _receiver,
+        sender=_sender,
+        dispatch_uid=f'event_report_cache_save_{_sender.__name__}',
+    )
+    post_delete.connect(
+        _receiver,
+        sender=_sender,
+        dispatch_uid=f'event_report_cache_delete_{_sender.__name__}',
+    )
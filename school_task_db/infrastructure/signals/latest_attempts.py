@@ -0,0 +1,35 @@
+"""Keep ``AttemptSnapshot.is_latest`` on the newest revision.
+
+Captures flag their own rows; these hooks reconcile snapshots saved or
+removed elsewhere. They are connected before the projection signals,
+which read latest attempts through the flag.
+"""
+
+from django.db.models.signals import post_delete, post_save
+
+from events.models import AttemptSnapshot
+from infrastructure.services.django_attempt_snapshot_queries import (
+    refresh_latest_attempt_flags,
+)
+
+
+def flag_latest_attempt_on_save(sender, instance, created, **kwargs):
+    if created and not instance.is_latest:
+        refresh_latest_attempt_flags((instance.participation_id,))
+
+
+def flag_latest_attempt_on_delete(sender, instance, **kwargs):
+    # The in-memory flag may predate a reconciling update, so always refresh.
+    refresh_latest_attempt_flags((instance.participation_id,))
+
+
+post_save.connect(
+    flag_latest_attempt_on_save,
+    sender=AttemptSnapshot,
+    dispatch_uid='latest_attempts_save_AttemptSnapshot',
+)
+post_delete.connect(
+    flag_latest_attempt_on_delete,
+    sender=AttemptSnapshot,
+    dispatch_uid='latest_attempts_delete_AttemptSnapshot',
+)
@@ -0,0 +1,39 @@
+"""Keep per-participation read models in step with live event edits."""
+
+from django.db.models.signals import post_delete, post_save
+
+from events.models import AttemptSnapshot, Event, EventParticipation
+from infrastructure.services.participation_projections import (
+    refresh_event_participation_projections,
+    refresh_participation_projections,
+)
+
+
+def refresh_projections_for_event(sender, instance, **kwargs):
+    refresh_event_participation_projections(instance.pk)
+
+
+def refresh_projections_for_participation(sender, instance, **kwargs):
+    refresh_participation_projections((instance.pk,))
+
+
+def refresh_projections_for_attempt(sender, instance, **kwargs):
+    refresh_participation_projections((instance.participation_id,))
+
+
+post_save.connect(
+    refresh_projections_for_event,
+    sender=Event,
+    dispatch_uid='participation_projections_save_Event',
+)
+post_save.connect(
+    refresh_projections_for_participation,
+    sender=EventParticipation,
+    dispatch_uid='participation_projections_save_EventParticipation',
+)
+# Captures project themselves once task rows exist; only removals need a hook.
+post_delete.connect(
+    refresh_projections_for_attempt,
+    sender=AttemptSnapshot,
+    dispatch_uid='participation_projections_delete_AttemptSnapshot',
+)
@@ -0,0 +1,51 @@
+"""Move the reference data version after writes to reference data."""
+
+from django.core.signals import request_finished, request_started
+from django.db.models.signals import post_delete, post_save
+
+from codifier.models import CodifierSpec, ContentEntry, Requirement
+from core.models import AcademicYear
+from curriculum.models import SubTopic, Topic
+from infrastructure.services.reference_data_cache import reference_data_cache
+from site_settings.models import SiteSettings
+from task_groups.models import AnalogGroup
+from tasks.models import Source
+
+
+REFERENCE_DATA_SENDERS = (
+    AcademicYear,
+    SiteSettings,
+    Topic,
+    SubTopic,
+    Source,
+    AnalogGroup,
+    CodifierSpec,
+    ContentEntry,
+    Requirement,
+)
+
+
+def invalidate_reference_data(sender, instance, **kwargs):
+    reference_data_cache.invalidate()
+
+
+for _sender in REFERENCE_DATA_SENDERS:
+    post_save.connect(
+        invalidate_reference_data,
+        sender=_sender,
+        dispatch_uid=f'reference_data_save_{_sender.__name__}',
+    )
+    post_delete.connect(
+        invalidate_reference_data,
+        sender=_sender,
+        dispatch_uid=f'reference_data_delete_{_sender.__name__}',
+    )
+
+request_started.connect(
+    reference_data_cache.begin_request,
+    dispatch_uid='reference_data_begin_request',
+)
+request_finished.connect(
+    reference_data_cache.end_request,
+    dispatch_uid='reference_data_end_request',
+)
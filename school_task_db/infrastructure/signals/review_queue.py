@@ -0,0 +1,96 @@
+"""Keep cached review queues in step with marks and participant lists."""
+
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from events.models import EventParticipation, Mark
+from infrastructure.services.review_queue_cache import review_queue_cache
+
+QUEUE_FIELDS = frozenset(('event', 'status'))
+
+
+def remember_participation_queue_state(sender, instance, **kwargs):
+    update_fields = kwargs.get('update_fields')
+    if instance._state.adding or (
+        update_fields is not None
+        and not QUEUE_FIELDS & set(update_fields)
+    ):
+        return
+    instance._review_queue_state = EventParticipation.objects.filter(
+        pk=instance.pk,
+    ).values_list('event_id', 'status').first()
+
+
+def invalidate_queue_for_participation_save(sender, instance, created, **kwargs):
+    previous = instance.__dict__.pop('_review_queue_state', None)
+    if created:
+        review_queue_cache.invalidate(instance.event_id)
+        return
+    if previous is None:
+        return
+    previous_event_id, previous_status = previous
+    if previous_event_id != instance.event_id or (
+        (previous_status == 'absent') != (instance.status == 'absent')
+    ):
+        review_queue_cache.invalidate(previous_event_id, instance.event_id)
+
+
+def invalidate_queue_for_participation_delete(sender, instance, **kwargs):
+    review_queue_cache.invalidate(instance.event_id)
+
+
+def sync_queue_for_mark_save(sender, instance, created, **kwargs):
+    if created and instance.score is None:
+        return
+    event_id = _mark_event_id(instance)
+    if event_id is not None:
+        review_queue_cache.set_graded(
+            event_id,
+            str(instance.participation_id),
+            instance.score is not None,
+        )
+
+
+def sync_queue_for_mark_delete(sender, instance, **kwargs):
+    event_id = _mark_event_id(instance)
+    if event_id is not None:
+        review_queue_cache.set_graded(
+            event_id,
+            str(instance.participation_id),
+            False,
+        )
+
+
+def _mark_event_id(mark):
+    if Mark.participation.is_cached(mark):
+        return mark.participation.event_id
+    # Cascaded deletes arrive after the participation row is gone.
+    return EventParticipation.objects.filter(
+        pk=mark.participation_id,
+    ).values_list('event_id', flat=True).first()
+
+
+pre_save.connect(
+    remember_participation_queue_state,
+    sender=EventParticipation,
+    dispatch_uid='review_queue_pre_save_EventParticipation',
+)
+post_save.connect(
+    invalidate_queue_for_participation_save,
+    sender=EventParticipation,
+    dispatch_uid='review_queue_save_EventParticipation',
+)
+post_delete.connect(
+    invalidate_queue_for_participation_delete,
+    sender=EventParticipation,
+    dispatch_uid='review_queue_delete_EventParticipation',
+)
+post_save.connect(
+    sync_queue_for_mark_save,
+    sender=Mark,
+    dispatch_uid='review_queue_save_Mark',
+)
+post_delete.connect(
+    sync_queue_for_mark_delete,
+    sender=Mark,
+    dispatch_uid='review_queue_delete_Mark',
+)
@@ -0,0 +1,43 @@
+"""Bump the search generation after writes to suggested entities."""
+
+from django.db.models.signals import post_delete, post_save
+
+from curriculum.models import Course, Topic
+from events.models import Event
+from infrastructure.services.search_suggestions import (
+    invalidate_search_suggestions,
+)
+from students.models import Student, StudentGroup
+from task_groups.models import AnalogGroup
+from tasks.models import Source, Task
+from works.models import Work
+
+
+SEARCH_SUGGESTION_SENDERS = (
+    Student,
+    StudentGroup,
+    Event,
+    Work,
+    AnalogGroup,
+    Topic,
+    Course,
+    Source,
+    Task,
+)
+
+
+def bump_search_generation(sender, instance, **kwargs):
+    invalidate_search_suggestions()
+
+
+for _sender in SEARCH_SUGGESTION_SENDERS:
+    post_save.connect(
+        bump_search_generation,
+        sender=_sender,
+        dispatch_uid=f'search_generation_save_{_sender.__name__}',
+    )
+    post_delete.connect(
+        bump_search_generation,
+        sender=_sender,
+        dispatch_uid=f'search_generation_delete_{_sender.__name__}',
+    )
@@ -0,0 +1,36 @@
+"""Keep the near-duplicate fingerprint index in step with task text."""
+
+from django.db.models.signals import post_save, pre_save
+
+from infrastructure.services.task_fingerprints import write_task_fingerprints
+from tasks.models import Task
+
+
+def remember_task_text(sender, instance, **kwargs):
+    update_fields = kwargs.get('update_fields')
+    if instance._state.adding or (
+        update_fields is not None and 'text' not in update_fields
+    ):
+        return
+    instance._fingerprint_text = Task.objects.filter(
+        pk=instance.pk,
+    ).values_list('text', flat=True).first()
+
+
+def refresh_fingerprint_for_task_save(sender, instance, created, **kwargs):
+    previous = instance.__dict__.pop('_fingerprint_text', None)
+    if not created and (previous is None or previous == instance.text):
+        return
+    write_task_fingerprints(((instance.pk, instance.text),))
+
+
+pre_save.connect(
+    remember_task_text,
+    sender=Task,
+    dispatch_uid='task_fingerprints_pre_save_Task',
+)
+post_save.connect(
+    refresh_fingerprint_for_task_save,
+    sender=Task,
+    dispatch_uid='task_fingerprints_save_Task',
+)
@@ -0,0 +1,30 @@
+"""Bump the work cache generation after work and variant writes."""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from infrastructure.services.cache_generations import (
+    CACHE_DOMAIN_WORKS,
+    cache_generations,
+)
+from works.models import Variant, VariantTask, Work, WorkAnalogGroup
+
+
+WORK_CACHE_SENDERS = (Work, WorkAnalogGroup, Variant, VariantTask)
+
+
+def bump_work_cache_generation(sender, instance, **kwargs):
+    cache_generations.bump(CACHE_DOMAIN_WORKS)
+
+
+for _sender in WORK_CACHE_SENDERS:
+    post_save.connect(
+        bump_work_cache_generation,
+        sender=_sender,
+        dispatch_uid=f'work_cache_generation_save_{_sender.__name__}',
+    )
+    post_delete.connect(
+        bump_work_cache_generation,
+        sender=_sender,
+        dispatch_uid=f'work_cache_generation_delete_{_sender.__name__}',
+    )
@@ -1,11 +1,14 @@
 import datetime as dt
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from curriculum.models import Topic
 from events.models import (
     AttemptSnapshot,
+    AttemptTaskSnapshot,
     Event,
     EventParticipation,
     Mark,
@@ -101,6 +104,7 @@ class DjangoAttemptSnapshotRepositoryTests(TestCase):
         first_task = first.task_results.get()
         second_task = second.task_results.get()
         self.assertEqual((first.revision, second.revision), (1, 2))
+        self.assertEqual((first.is_latest, second.is_latest), (False, True))
         self.assertEqual(first.score, 3)
         self.assertEqual(first.recommendations, 'Повторить второй закон Ньютона')
         self.assertEqual(first_task.points, 1)
@@ -180,3 +184,163 @@ class DjangoAttemptSnapshotRepositoryTests(TestCase):
         )
         self.assertEqual(task_result.points, 2)
         self.assertEqual(task_result.comment, 'Верно')
+
+    def test_captures_event_marks_once_until_mark_changes(self):
+        repo = DjangoAttemptSnapshotRepository()
+        event_id = str(self.mark.participation.event_id)
+        Mark.objects.create(
+            participation=EventParticipation.objects.create(
+                event=self.mark.participation.event,
+                student=Student.objects.create(
+                    last_name='Сидоров',
+                    first_name='Семён',
+                ),
+                variant=self.mark.participation.variant,
+                status='assigned',
+            ),
+        )
+
+        first_refs = repo.capture_event_marks(event_id)
+        repeated_refs = repo.capture_event_marks(event_id)
+        self.mark.score = 5
+        self.mark.save()
+        changed_refs = repo.capture_event_marks(event_id)
+
+        self.assertEqual(
+            [(ref.mark_id, ref.revision) for ref in first_refs],
+            [(str(self.mark.pk), 1)],
+        )
+        self.assertEqual(repeated_refs, ())
+        self.assertEqual(
+            [(ref.mark_id, ref.revision) for ref in changed_refs],
+            [(str(self.mark.pk), 2)],
+        )
+        first = AttemptSnapshot.objects.get(pk=first_refs[0].pk)
+        first_task = first.task_results.get()
+        self.assertEqual(first.score, 3)
+        self.assertEqual(first.work_name_snapshot, 'Контрольная по динамике')
+        self.assertEqual(first_task.variant_task, self.variant_task)
+        self.assertEqual(first_task.points, 1)
+        self.assertEqual(first_task.comment, 'Ошибка в формуле')
+        self.assertEqual(
+            AttemptSnapshot.objects.get(pk=changed_refs[0].pk).score,
+            5,
+        )
+
+    def test_event_capture_continues_revisions_of_single_mark_capture(self):
+        repo = DjangoAttemptSnapshotRepository()
+        repo.capture_mark(str(self.mark.pk))
+        self.mark.score = 4
+        self.mark.save()
+
+        refs = repo.capture_event_marks(str(self.mark.participation.event_id))
+
+        self.assertEqual([ref.revision for ref in refs], [2])
+
+
+class DjangoAttemptSnapshotBatchCaptureTests(TestCase):
+    """Finalizing a 200-participant event costs a constant number of queries."""
+
+    PARTICIPANTS = 200
+    TASKS_PER_VARIANT = 3
+
+    def setUp(self):
+        topic = Topic.objects.create(
+            name='Кинематика',
+            subject='Физика',
+            section='Механика',
+            grade_level=9,
+        )
+        work = Work.objects.create(name='Контрольная', work_type='test')
+        variants = [
+            Variant.objects.create(work=work, number=number)
+            for number in (1, 2)
+        ]
+        variant_tasks = {}
+        for variant in variants:
+            variant_tasks[variant.pk] = [
+                create_variant_task(
+                    variant=variant,
+                    task=Task.objects.create(
+                        text=f'Задача {variant.number}.{order}',
+                        answer='1',
+                        topic=topic,
+                        task_type='computational',
+                        difficulty=1,
+                    ),
+                    order=order,
+                    max_points=1,
+                )
+                for order in range(1, self.TASKS_PER_VARIANT + 1)
+            ]
+        self.event = Event.objects.create(
+            name='Контрольная 9Б',
+            work=work,
+            planned_date=timezone.make_aware(
+                dt.datetime(2026, 10, 16, 9, 0),
+            ),
+            status='reviewing',
+        )
+        students = Student.objects.bulk_create([
+            Student(last_name=f'Ученик {index:03d}', first_name='Тест')
+            for index in range(self.PARTICIPANTS)
+        ])
+        participations = EventParticipation.objects.bulk_create([
+            EventParticipation(
+                event=self.event,
+                student=student,
+                variant=variants[index % len(variants)],
+                status='graded',
+            )
+            for index, student in enumerate(students)
+        ])
+        Mark.objects.bulk_create([
+            Mark(
+                participation=participation,
+                score=4,
+                points=2,
+                max_points=self.TASKS_PER_VARIANT,
+                task_scores={
+                    str(variant_task.pk): {
+                        'task_id': str(variant_task.task_id),
+                        'variant_task_id': str(variant_task.pk),
+                        'points': 1,
+                        'max_points': 1,
+                    }
+                    for variant_task in variant_tasks[participation.variant_id]
+                },
+            )
+            for participation in participations
+        ])
+
+    def test_captures_whole_event_with_constant_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            refs = DjangoAttemptSnapshotRepository().capture_event_marks(
+                str(self.event.pk),
+            )
+
+        # Savepoint pair, revisions, marks, the previous is_latest reset,
+        # variant tasks and the bank-group fallback, then the digest and timeline projections (savepoint pair,
+        # participations, attempts, task rows, a delete each); the rest are
+        # insert batches sized by the backend's parameter limit, not one round
+        # trip per participant.
+        inserts = [
+            query for query in queries.captured_queries
+            if query['sql'].startswith('INSERT')
+        ]
+        self.assertEqual(len(queries) - len(inserts), 14)
+        self.assertLess(len(inserts), self.PARTICIPANTS // 5)
+        self.assertEqual(len(refs), self.PARTICIPANTS)
+        self.assertEqual(
+            AttemptSnapshot.objects.filter(
+                participation__event=self.event,
+            ).count(),
+            self.PARTICIPANTS,
+        )
+        self.assertEqual(
+            AttemptTaskSnapshot.objects.filter(
+                attempt__participation__event=self.event,
+                points=1,
+            ).count(),
+            self.PARTICIPANTS * self.TASKS_PER_VARIANT,
+        )
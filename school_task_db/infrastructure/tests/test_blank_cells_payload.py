@@ -1,6 +1,8 @@
 from unittest import TestCase
 
 from infrastructure.services.blank_cells_payload import (
+    BLANK_CELLS_RENDER_CELLS,
+    BLANK_CELLS_RENDER_COMPACT,
     build_blank_cells_payload,
 )
 
@@ -40,3 +42,28 @@ class BlankCellsPayloadTests(TestCase):
         self.assertEqual(payload['columns'], 3)
         self.assertEqual(payload['cell_size_mm'], 5)
         self.assertEqual(payload['css_max_width_mm'], 15)
+
+    def test_compact_mode_keeps_geometry_without_per_cell_range(self):
+        payload = build_blank_cells_payload({'area_cm2': 500})
+
+        self.assertEqual(payload['render_mode'], BLANK_CELLS_RENDER_COMPACT)
+        self.assertEqual(payload['rows'], 55)
+        self.assertEqual(payload['columns'], 37)
+        self.assertEqual(payload['cell_count'], 2035)
+        self.assertEqual(payload['css_height_mm'], 275)
+        self.assertEqual(len(payload['cells_range']), 0)
+
+    def test_cells_mode_keeps_one_range_item_per_cell(self):
+        payload = build_blank_cells_payload({
+            'rows': 2,
+            'columns': 3,
+            'render_mode': BLANK_CELLS_RENDER_CELLS,
+        })
+
+        self.assertEqual(payload['render_mode'], BLANK_CELLS_RENDER_CELLS)
+        self.assertEqual(len(payload['cells_range']), 6)
+
+    def test_unknown_render_mode_falls_back_to_compact(self):
+        payload = build_blank_cells_payload({'render_mode': 'svg'})
+
+        self.assertEqual(payload['render_mode'], BLANK_CELLS_RENDER_COMPACT)
@@ -0,0 +1,83 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from infrastructure.services.cache_generations import (
+    CACHE_DOMAIN_ATTEMPTS,
+    CACHE_DOMAIN_TASKS,
+    CACHE_DOMAIN_WORKS,
+    DjangoCacheGenerations,
+)
+from works.models import Work
+
+
+class DjangoCacheGenerationsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.generations = DjangoCacheGenerations()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_bump_changes_only_requested_domain(self):
+        tasks_before = self.generations.current(CACHE_DOMAIN_TASKS)
+        works_before = self.generations.current(CACHE_DOMAIN_WORKS)
+
+        self.generations.bump(CACHE_DOMAIN_TASKS)
+
+        self.assertEqual(
+            self.generations.current(CACHE_DOMAIN_TASKS),
+            tasks_before + 1,
+        )
+        self.assertEqual(
+            self.generations.current(CACHE_DOMAIN_WORKS),
+            works_before,
+        )
+
+    def test_versioned_key_changes_after_bump_of_any_domain(self):
+        key = self.generations.versioned_key(
+            'report',
+            CACHE_DOMAIN_WORKS,
+            CACHE_DOMAIN_ATTEMPTS,
+        )
+        self.assertEqual(
+            key,
+            self.generations.versioned_key(
+                'report',
+                CACHE_DOMAIN_ATTEMPTS,
+                CACHE_DOMAIN_WORKS,
+            ),
+        )
+
+        self.generations.bump(CACHE_DOMAIN_ATTEMPTS)
+
+        self.assertNotEqual(
+            key,
+            self.generations.versioned_key(
+                'report',
+                CACHE_DOMAIN_WORKS,
+                CACHE_DOMAIN_ATTEMPTS,
+            ),
+        )
+
+    def test_evicted_counter_never_returns_to_previous_value(self):
+        first = self.generations.current(CACHE_DOMAIN_TASKS)
+        self.generations.bump(CACHE_DOMAIN_TASKS)
+        cache.delete(DjangoCacheGenerations._key(CACHE_DOMAIN_TASKS))
+
+        self.generations.bump(CACHE_DOMAIN_TASKS)
+
+        self.assertGreater(
+            self.generations.current(CACHE_DOMAIN_TASKS),
+            first + 1,
+        )
+
+    def test_rejects_unknown_domain(self):
+        with self.assertRaisesMessage(ValueError, 'students'):
+            self.generations.bump('students')
+
+    def test_work_writes_bump_works_generation(self):
+        before = self.generations.current(CACHE_DOMAIN_WORKS)
+
+        Work.objects.create(name='Контрольная')
+
+        self.assertGreater(self.generations.current(CACHE_DOMAIN_WORKS), before)
@@ -0,0 +1,173 @@
+from django.test import TestCase
+
+from codifier.models import (
+    CodifierSpec,
+    ContentEntry,
+    ContentEntryRollup,
+    Requirement,
+    RequirementRollup,
+)
+from curriculum.models import SubTopic, Topic
+from infrastructure.repositories.django_codifier_detail_repo import (
+    DjangoCodifierDetailRepository,
+)
+from infrastructure.services.codifier_rollups import rebuild_codifier_rollups
+from tasks.models import Task
+
+
+class CodifierRollupTests(TestCase):
+    def setUp(self):
+        self.topic = Topic.objects.create(
+            name='Кинематика',
+            subject='Физика',
+            section='Механика',
+            grade_level=9,
+        )
+        self.other_topic = Topic.objects.create(
+            name='Динамика',
+            subject='Физика',
+            section='Механика',
+            grade_level=9,
+        )
+        self.subtopic = SubTopic.objects.create(
+            topic=self.topic,
+            name='Скорость',
+        )
+        self.codifier = CodifierSpec.objects.create(
+            name='ОГЭ 2026 Физика',
+            short_name='ОГЭ 2026',
+            subject='Физика',
+            exam_type='oge',
+            year=2026,
+        )
+        self.root = ContentEntry.objects.create(
+            codifier=self.codifier,
+            code='1',
+            name='Механика',
+        )
+        self.topic_leaf = ContentEntry.objects.create(
+            codifier=self.codifier,
+            parent=self.root,
+            code='1.1',
+            name='Кинематика',
+            topic=self.topic,
+        )
+        self.subtopic_leaf = ContentEntry.objects.create(
+            codifier=self.codifier,
+            parent=self.root,
+            code='1.2',
+            name='Скорость',
+            topic=self.topic,
+            subtopic=self.subtopic,
+        )
+        self.requirement = Requirement.objects.create(
+            codifier=self.codifier,
+            code='1',
+            name='Знать понятия',
+        )
+
+    def _task(self, **fields):
+        return Task.objects.create(
+            text='Задача',
+            answer='Ответ',
+            task_type='computational',
+            difficulty=2,
+            **{'topic': self.topic, **fields},
+        )
+
+    def _entry_count(self, entry):
+        return ContentEntryRollup.objects.get(entry=entry).task_count
+
+    def _requirement_count(self):
+        return RequirementRollup.objects.get(
+            requirement=self.requirement,
+        ).task_count
+
+    def test_entries_track_leaf_flag_and_task_counts(self):
+        self._task()
+        self._task(subtopic=self.subtopic)
+
+        rollups = {
+            rollup.entry_id: rollup
+            for rollup in ContentEntryRollup.objects.all()
+        }
+        self.assertFalse(rollups[self.root.pk].is_leaf)
+        self.assertTrue(rollups[self.topic_leaf.pk].is_leaf)
+        self.assertEqual(rollups[self.topic_leaf.pk].task_count, 2)
+        self.assertEqual(rollups[self.subtopic_leaf.pk].task_count, 1)
+
+    def test_task_reclassification_moves_counts(self):
+        task = self._task(subtopic=self.subtopic)
+
+        task.topic = self.other_topic
+        task.subtopic = None
+        task.save()
+
+        self.assertEqual(self._entry_count(self.topic_leaf), 0)
+        self.assertEqual(self._entry_count(self.subtopic_leaf), 0)
+
+        task.topic = self.topic
+        task.save(update_fields=['topic'])
+        self.assertEqual(self._entry_count(self.topic_leaf), 1)
+
+        task.delete()
+        self.assertEqual(self._entry_count(self.topic_leaf), 0)
+
+    def test_requirement_links_update_counts(self):
+        task = self._task()
+
+        task.codifier_requirements.set([self.requirement])
+        self.assertEqual(self._requirement_count(), 1)
+
+        self.requirement.tasks.clear()
+        self.assertEqual(self._requirement_count(), 0)
+
+        self.requirement.tasks.add(task)
+        task.delete()
+        self.assertEqual(self._requirement_count(), 0)
+
+    def test_subtopic_delete_falls_back_to_topic(self):
+        self._task(subtopic=self.subtopic)
+        self.assertEqual(self._entry_count(self.topic_leaf), 1)
+
+        self.subtopic.delete()
+
+        self.assertEqual(self._entry_count(self.subtopic_leaf), 1)
+
+    def test_entry_moves_update_parent_leaf_flag(self):
+        self.topic_leaf.delete()
+        self.subtopic_leaf.parent = None
+        self.subtopic_leaf.save()
+
+        self.assertTrue(
+            ContentEntryRollup.objects.get(entry=self.root).is_leaf,
+        )
+
+    def test_rebuild_restores_missing_rows(self):
+        self._task()
+        ContentEntryRollup.objects.all().delete()
+        RequirementRollup.objects.all().delete()
+
+        written = rebuild_codifier_rollups(batch_size=2)
+
+        self.assertEqual(written, {'entries': 3, 'requirements': 1})
+        self.assertEqual(self._entry_count(self.topic_leaf), 1)
+
+    def test_detail_reads_counts_and_coverage_from_rollups(self):
+        self._task()
+        task = self._task()
+        task.codifier_requirements.set([self.requirement])
+        repo = DjangoCodifierDetailRepository()
+
+        with self.assertNumQueries(1):
+            coverage = repo.get_coverage(str(self.codifier.pk))
+        with self.assertNumQueries(1):
+            requirements = repo.get_requirements(str(self.codifier.pk))
+        tree = repo.get_content_tree(str(self.codifier.pk))
+
+        self.assertEqual((coverage.total, coverage.covered), (2, 1))
+        self.assertEqual(requirements[0].task_count, 1)
+        self.assertEqual(
+            [child.task_count for child in tree[0].children],
+            [2, 0],
+        )
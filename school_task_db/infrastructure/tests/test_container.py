@@ -581,10 +581,12 @@ class ContainerTests(SimpleTestCase):
     def test_document_engine_uses_sectioned_renderer_factory(self):
         container = Container()
         get_remedial_sheet_data = object()
+        get_remedial_sheet_data_many = object()
         get_event_report = object()
         get_student_digests = object()
         remedial_sheet_data_use_case = SimpleNamespace(
             execute=get_remedial_sheet_data,
+            execute_many=get_remedial_sheet_data_many,
         )
         event_report_use_case = SimpleNamespace(execute=get_event_report)
         student_digests_use_case = SimpleNamespace(
@@ -627,6 +629,7 @@ class ContainerTests(SimpleTestCase):
         factory.assert_called_once_with(
             work_document_repo=container.work_document_repo,
             get_remedial_sheet_data=get_remedial_sheet_data,
+            get_remedial_sheet_data_many=get_remedial_sheet_data_many,
             get_event_report=get_event_report,
             get_student_digests=get_student_digests,
             file_store=container.rendered_document_file_store,
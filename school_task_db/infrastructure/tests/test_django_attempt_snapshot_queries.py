@@ -9,7 +9,9 @@ from events.models import (
     Mark,
 )
 from infrastructure.services.django_attempt_snapshot_queries import (
+    latest_attempt_revisions_for_event,
     latest_attempts_by_participation,
+    latest_attempts_by_revision,
 )
 from students.models import Student
 from works.models import Work
@@ -102,6 +104,54 @@ class DjangoAttemptSnapshotQueryTests(TestCase):
         self.assertEqual(attempt.pk, latest_attempt.pk)
         self.assertFalse(hasattr(attempt, 'captured_task_results'))
 
+    def test_latest_flag_follows_saved_and_deleted_revisions(self):
+        first = self._attempt(self.first_mark, revision=1, score=2)
+        latest = self._attempt(self.first_mark, revision=2, score=4)
+        self._attempt(self.second_mark, revision=1, score=3)
+        participation_ids = (
+            self.first_participation.pk,
+            self.second_participation.pk,
+        )
+
+        self.assertEqual(
+            AttemptSnapshot.objects.filter(is_latest=True).count(),
+            2,
+        )
+        self.assertEqual(
+            sorted(latest_attempt_revisions_for_event(
+                self.first_participation.event_id,
+            )),
+            sorted([
+                (str(self.first_participation.pk), 2),
+                (str(self.second_participation.pk), 1),
+            ]),
+        )
+        self.assertEqual(
+            {
+                participation_id: attempt.pk
+                for participation_id, attempt in (
+                    latest_attempts_by_participation(participation_ids)
+                ).items()
+            },
+            {
+                participation_id: attempt.pk
+                for participation_id, attempt in (
+                    latest_attempts_by_revision(participation_ids)
+                ).items()
+            },
+        )
+
+        latest.delete()
+
+        first.refresh_from_db()
+        self.assertTrue(first.is_latest)
+        self.assertEqual(
+            latest_attempts_by_participation(
+                (self.first_participation.pk,),
+            )[self.first_participation.pk].pk,
+            first.pk,
+        )
+
     def test_empty_input_performs_no_queries(self):
         with self.assertNumQueries(0):
             attempts = latest_attempts_by_participation(iter(()))
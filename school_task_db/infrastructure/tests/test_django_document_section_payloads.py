@@ -726,7 +726,8 @@ class DjangoWorkTechnicalPayloadBuilderTests(TestCase):
         self.assertEqual(payload['columns'], 37)
         self.assertEqual(payload['cell_size_mm'], 5)
         self.assertEqual(payload['css_max_width_mm'], 185)
-        self.assertEqual(len(payload['cells_range']), 185)
+        self.assertEqual(payload['cell_count'], 185)
+        self.assertEqual(payload['render_mode'], 'compact')
 
     def create_task(self, description='Теория темы', **overrides):
         topic = Topic.objects.create(
@@ -1214,6 +1215,45 @@ class DjangoRemedialSectionPayloadBuilderTests(TestCase):
 
         self.assertEqual(calls, ['variant-1', 'variant-1'])
 
+    def test_provider_loads_batch_recipe_variants_at_once(self):
+        single_calls = []
+        many_calls = []
+        sheet_data = RemedialSheetData(
+            variant='variant',
+            student=None,
+            source_work=None,
+            mark=None,
+        )
+        provider = RemedialSheetDataProvider(
+            get_remedial_sheet_data=lambda variant_id:
+                single_calls.append(variant_id) or sheet_data,
+            get_remedial_sheet_data_many=lambda variant_ids:
+                many_calls.append(tuple(variant_ids)) or {
+                    variant_id: sheet_data for variant_id in variant_ids
+                },
+        )
+        recipe = DocumentRecipe(
+            document_type=REMEDIAL_SHEET_DOCUMENT_TYPE,
+            sections=[
+                DocumentSectionSpec(
+                    section_type=section_type,
+                    options={'variant_id': variant_id},
+                )
+                for variant_id in ('variant-1', 'variant-2')
+                for section_type in (HEADER_SECTION, ORIGINAL_MISTAKES_SECTION)
+            ],
+        )
+        build_context = {}
+
+        for variant_id in ('variant-1', 'variant-2', 'variant-1'):
+            self.assertEqual(
+                provider.get(variant_id, build_context, recipe=recipe),
+                sheet_data,
+            )
+
+        self.assertEqual(many_calls, [('variant-1', 'variant-2')])
+        self.assertEqual(single_calls, [])
+
     def test_provider_requires_data_loader(self):
         with self.assertRaisesRegex(
             ValueError,
@@ -9,6 +9,7 @@ from django.test import TestCase
 from infrastructure.services.django_image_asset_store import (
     DjangoImageAssetStore,
 )
+from infrastructure.services.image_ingestion import IngestedImage
 from tasks.models import ImageAsset
 
 
@@ -83,6 +84,52 @@ class DjangoImageAssetStoreTests(TestCase):
                 [f'{checksum}.png'],
             )
 
+    def test_get_or_create_many_reuses_existing_and_writes_only_new(self):
+        with TemporaryDirectory() as media_root, self.settings(
+            MEDIA_ROOT=media_root,
+        ):
+            store = DjangoImageAssetStore()
+            existing = store.get_or_create(self._upload('old.png', b'old'))
+            images = [
+                self._ingested('a.png', b'new'),
+                self._ingested('b.png', b'old'),
+                self._ingested('c.png', b'new'),
+            ]
+
+            # Existing lookup, bulk insert, re-read of inserted rows.
+            with self.assertNumQueries(3):
+                assets = store.get_or_create_many(images, max_workers=2)
+
+            self.assertEqual(assets[1].pk, existing.pk)
+            self.assertEqual(assets[0].pk, assets[2].pk)
+            self.assertEqual(assets[0].original_filename, 'a.png')
+            self.assertEqual(assets[0].byte_size, 3)
+            self.assertEqual(ImageAsset.objects.count(), 2)
+            with assets[0].file.open('rb') as stored_file:
+                self.assertEqual(stored_file.read(), b'new')
+
+    def test_get_or_create_many_with_known_content_skips_writes(self):
+        with TemporaryDirectory() as media_root, self.settings(
+            MEDIA_ROOT=media_root,
+        ):
+            store = DjangoImageAssetStore()
+            existing = store.get_or_create(self._upload('old.png', b'old'))
+
+            with self.assertNumQueries(1):
+                assets = store.get_or_create_many(
+                    [self._ingested('again.png', b'old')],
+                )
+
+            self.assertEqual([asset.pk for asset in assets], [existing.pk])
+
+    @staticmethod
+    def _ingested(name, content):
+        return IngestedImage(
+            filename=name,
+            content=content,
+            checksum=hashlib.sha256(content).hexdigest(),
+        )
+
     @staticmethod
     def _upload(name, content):
         return SimpleUploadedFile(
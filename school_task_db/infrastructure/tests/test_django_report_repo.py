@@ -1,6 +1,9 @@
 from datetime import timedelta
 
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from curriculum.models import Course, CourseAssignment, SubTopic, Topic
@@ -12,6 +15,9 @@ from infrastructure.repositories.django_heatmap_overview_repo import (
 from infrastructure.repositories.django_heatmap_matrix_repo import (
     DjangoHeatmapMatrixRepository,
 )
+from infrastructure.repositories.django_event_write_repo import (
+    DjangoEventWriteRepository,
+)
 from infrastructure.repositories.django_events_status_repo import (
     DjangoEventsStatusRepository,
 )
@@ -70,6 +76,72 @@ from works.models import Variant, Work
 
 
 class DjangoReportRepositoriesTests(TestCase):
+    def test_course_timeline_reads_projected_latest_graded_attempts(self):
+        students = [
+            Student.objects.create(last_name=name, first_name='Ученик')
+            for name in ('Иванов', 'Петров', 'Сидоров')
+        ]
+        work = Work.objects.create(name='Контрольная')
+        other_work = Work.objects.create(name='Самостоятельная')
+        now = timezone.now()
+        first = Event.objects.create(
+            name='КР-1',
+            work=work,
+            status='graded',
+            planned_date=now - timedelta(days=7),
+        )
+        second = Event.objects.create(
+            name='КР-2',
+            work=work,
+            status='reviewing',
+            planned_date=now,
+        )
+        other = Event.objects.create(
+            name='СР',
+            work=other_work,
+            status='graded',
+            planned_date=now,
+        )
+
+        def checked(event, student, points):
+            participation, _ = EventParticipation.objects.get_or_create(
+                event=event,
+                student=student,
+                defaults={'status': 'graded'},
+            )
+            mark, _ = Mark.objects.update_or_create(
+                participation=participation,
+                defaults={'score': 4, 'points': points, 'max_points': 10},
+            )
+            capture_attempt_snapshot(mark)
+
+        checked(first, students[0], 4)
+        checked(first, students[0], 8)  # Rechecked: the latest counts.
+        checked(first, students[1], 6)
+        checked(first, students[2], 0)  # Outside the selected students.
+        checked(second, students[0], 10)
+        checked(other, students[0], 10)
+        DjangoEventWriteRepository().set_event_status(str(second.pk), 'graded')
+        first.name = 'КР-1 (переписана)'
+        first.save()
+
+        with CaptureQueriesContext(connection) as queries:
+            source = DjangoHeatmapMatrixRepository(
+            ).get_heatmap_course_timeline_source(
+                student_ids=(str(students[0].pk), str(students[1].pk)),
+                work_ids=(str(work.pk),),
+            )
+
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(
+            [(event.pk, event.name) for event in source.events],
+            [(str(first.pk), 'КР-1 (переписана)'), (str(second.pk), 'КР-2')],
+        )
+        self.assertEqual(
+            [(mark.points, mark.max_points) for mark in source.marks],
+            [(14, 20), (10, 10)],
+        )
+
     def test_get_heatmap_drilldown_overview_returns_topic_scope(self):
         selected_student = Student.objects.create(
             last_name='Иванов',
@@ -923,6 +995,86 @@ class DjangoReportRepositoriesTests(TestCase):
         self.assertEqual(data.summary_stats.avg_score, 4)
         self.assertEqual(data.active_report, 'work-analysis')
 
+    def test_work_analysis_loads_only_works_with_events_in_one_pass(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        now = timezone.now()
+        student = Student.objects.create(last_name='Петров', first_name='Пётр')
+        older = Work.objects.create(name='Старая работа')
+        newer = Work.objects.create(name='Новая работа')
+        Variant.objects.create(work=newer, number=1)
+        Variant.objects.create(work=newer, number=2)
+        for index in range(5):
+            Work.objects.create(name=f'Без событий {index}')
+        for work, days_ago in ((older, 3), (newer, 2), (newer, 1)):
+            event = Event.objects.create(
+                name=f'{work.name} {days_ago}',
+                work=work,
+                status='graded',
+                planned_date=now - timedelta(days=days_ago),
+            )
+            participation = EventParticipation.objects.create(
+                event=event,
+                student=student,
+                status='graded',
+            )
+            capture_attempt_snapshot(
+                Mark.objects.create(participation=participation, score=5),
+            )
+        repo = DjangoWorkAnalysisRepository()
+
+        # Scoped events, participations, latest attempts, courses.
+        with self.assertNumQueries(4):
+            source = repo.get_work_analysis_source(None)
+        with self.assertNumQueries(1):
+            cached = repo.get_work_analysis_source(None)
+
+        self.assertEqual(cached, source)
+        self.assertEqual(
+            [
+                (item.work.name, item.work.variant_count, item.events_count)
+                for item in source.works
+            ],
+            [('Новая работа', 2, 2), ('Старая работа', 0, 1)],
+        )
+        self.assertEqual(
+            [event.name for event in source.works[0].events],
+            ['Новая работа 1', 'Новая работа 2'],
+        )
+        self.assertEqual(source.works[0].events[0].work.variant_count, 2)
+        self.assertEqual(len(source.works[0].marks), 2)
+
+    def test_work_analysis_cache_follows_event_and_attempt_writes(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        now = timezone.now()
+        work = Work.objects.create(name='Контрольная')
+        student = Student.objects.create(last_name='Петров', first_name='Пётр')
+        event = Event.objects.create(
+            name='КР',
+            work=work,
+            status='graded',
+            planned_date=now,
+        )
+        participation = EventParticipation.objects.create(
+            event=event,
+            student=student,
+            status='graded',
+        )
+        repo = DjangoWorkAnalysisRepository()
+        self.assertEqual(repo.get_work_analysis_source(None).works[0].marks, ())
+
+        mark = Mark.objects.create(participation=participation, score=3)
+        capture_attempt_snapshot(mark)
+        marks = repo.get_work_analysis_source(None).works[0].marks
+        self.assertEqual([fact.score for fact in marks], [3])
+
+        DjangoEventWriteRepository().set_event_status(str(event.pk), 'closed')
+        self.assertEqual(
+            repo.get_work_analysis_source(None).works[0].events[0].status,
+            'closed',
+        )
+
     def test_get_student_performance_report_returns_group_stats(self):
         now = timezone.now()
         work = Work.objects.create(name='Контрольная')
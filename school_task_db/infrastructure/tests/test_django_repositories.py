@@ -1628,6 +1628,48 @@ class DjangoRemedialRepositoryTests(TestCase):
 
         self.assertIsNone(sheet_data)
 
+    def test_remedial_sheet_sources_load_batch_in_fixed_queries(self):
+        attempt = self.participation.attempt_snapshots.get(revision=1)
+        variants = [
+            Variant.objects.create(
+                number=number,
+                variant_type='remedial',
+                assigned_student=self.student,
+                source_work=self.source_work,
+                source_participation=self.participation,
+                source_attempt_snapshot=attempt,
+            )
+            for number in (1, 2, 3)
+        ]
+        create_variant_task(
+            variant=variants[1],
+            task=self.original_ok,
+            order=1,
+            max_points=1,
+        )
+        variant_ids = [str(variant.pk) for variant in reversed(variants)]
+        missing_id = '00000000-0000-0000-0000-000000000000'
+
+        with self.assertNumQueries(4):
+            sources = DjangoRemedialSheetRepository().get_remedial_sheet_sources(
+                [*variant_ids, missing_id],
+            )
+
+        self.assertEqual(list(sources), variant_ids)
+        single = DjangoRemedialSheetRepository().get_remedial_sheet_source(
+            variant_ids[1],
+        )
+        batched = sources[variant_ids[1]]
+        self.assertEqual(
+            [row.task.pk for row in batched.original_tasks],
+            [row.task.pk for row in single.original_tasks],
+        )
+        self.assertEqual(
+            [task.task_id for task in batched.new_tasks],
+            [str(self.original_ok.pk)],
+        )
+        self.assertEqual(sources[variant_ids[0]].new_tasks, ())
+
     def test_remedial_sheet_reads_original_tasks_from_attempt_snapshot(self):
         attempt = self.participation.attempt_snapshots.get(revision=1)
         task_result = attempt.task_results.get(
@@ -3118,6 +3160,57 @@ class DjangoRemedialRepositoryTests(TestCase):
         self.assertEqual(status, 'graded')
         self.assertEqual(self.event.status, 'reviewing')
 
+    def test_participation_repository_assigns_variants_in_bulk(self):
+        participation_repo = DjangoEventParticipationRepository()
+        students = [
+            Student.objects.create(last_name=f'Ученик {index}', first_name='Имя')
+            for index in range(5)
+        ]
+        second_variant = Variant.objects.create(
+            work=self.source_work,
+            number=2,
+            work_name_snapshot=self.source_work.name,
+        )
+        foreign_work = Work.objects.create(name='Чужая работа')
+        foreign_variant = Variant.objects.create(
+            work=foreign_work,
+            number=1,
+            work_name_snapshot=foreign_work.name,
+        )
+
+        with self.assertNumQueries(4):
+            created_count = participation_repo.add_participants(
+                event_id=str(self.event.pk),
+                student_ids=[str(student.pk) for student in students],
+            )
+        participations = list(EventParticipation.objects.filter(
+            event=self.event,
+            student__in=students,
+        ))
+        assignments = {
+            str(participation.pk): str(second_variant.pk)
+            for participation in participations
+        }
+        assignments[str(participations[0].pk)] = str(foreign_variant.pk)
+        with self.assertNumQueries(5):
+            assigned_count = participation_repo.assign_variants(
+                event_id=str(self.event.pk),
+                assignments=assignments,
+            )
+
+        self.assertEqual(created_count, 5)
+        self.assertEqual(assigned_count, 4)
+        self.assertEqual(
+            EventParticipation.objects.filter(
+                event=self.event,
+                variant=second_variant,
+            ).count(),
+            4,
+        )
+        self.assertFalse(
+            EventParticipation.objects.filter(variant=foreign_variant).exists()
+        )
+
     def test_review_repository_returns_participation_review_data(self):
         ReviewComment.objects.create(
             text='Аккуратнее с единицами',
@@ -0,0 +1,79 @@
+from django.test import TestCase
+from django.utils import timezone
+
+from core_logic.entities.review import ReviewDraftTaskScore
+from events.models import Event, EventParticipation
+from infrastructure.repositories.django_review_draft_repo import (
+    DjangoReviewDraftRepository,
+)
+from review.models import ReviewDraft
+from students.models import Student
+from works.models import Work
+
+
+class DjangoReviewDraftRepositoryTests(TestCase):
+    def setUp(self):
+        event = Event.objects.create(
+            name='КР 9А',
+            work=Work.objects.create(name='Контрольная', work_type='test'),
+            planned_date=timezone.now(),
+            status='completed',
+        )
+        self.participation = EventParticipation.objects.create(
+            event=event,
+            student=Student.objects.create(last_name='Иванов', first_name='Иван'),
+            status='completed',
+        )
+        self.participation_id = str(self.participation.pk)
+        self.repo = DjangoReviewDraftRepository()
+
+    def test_merge_draft_keeps_fields_from_earlier_patches(self):
+        self.repo.merge_draft(
+            self.participation_id,
+            (
+                ReviewDraftTaskScore(score_key='vt-1', points=1, comment='Было'),
+                ReviewDraftTaskScore(score_key='vt-2', points=3),
+            ),
+        )
+
+        draft = self.repo.merge_draft(
+            self.participation_id,
+            (ReviewDraftTaskScore(score_key='vt-1', points=2),),
+        )
+
+        self.assertEqual(
+            ReviewDraft.objects.get(participation=self.participation).task_scores,
+            {
+                'vt-1': {'points': 2, 'comment': 'Было'},
+                'vt-2': {'points': 3},
+            },
+        )
+        self.assertEqual(draft.task_score('vt-1').points, 2)
+        self.assertEqual(draft.task_score('vt-1').comment, 'Было')
+        self.assertIsNone(draft.task_score('vt-2').comment)
+        self.assertIsNotNone(draft.updated_at)
+
+    def test_merge_draft_skips_missing_participation(self):
+        draft = self.repo.merge_draft(
+            '00000000-0000-0000-0000-000000000000',
+            (ReviewDraftTaskScore(score_key='vt-1', points=1),),
+        )
+
+        self.assertIsNone(draft)
+        self.assertFalse(ReviewDraft.objects.exists())
+
+    def test_get_and_delete_draft(self):
+        self.assertIsNone(self.repo.get_draft(self.participation_id))
+        self.repo.merge_draft(
+            self.participation_id,
+            (ReviewDraftTaskScore(score_key='vt-1', comment='Черновик'),),
+        )
+
+        self.assertEqual(
+            self.repo.get_draft(self.participation_id).task_score('vt-1').comment,
+            'Черновик',
+        )
+
+        self.repo.delete_draft(self.participation_id)
+
+        self.assertIsNone(self.repo.get_draft(self.participation_id))
@@ -0,0 +1,167 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from core_logic.value_objects.task_print_settings import (
+    TASK_BANK_ROLE_CONTROL,
+    TASK_BANK_ROLE_DEMO,
+)
+from curriculum.models import Topic
+from infrastructure.container import container
+from infrastructure.repositories.django_variant_generation_form_repo import (
+    DjangoVariantGenerationFormRepository,
+)
+from infrastructure.repositories.django_work_read_repo import (
+    DjangoWorkReadRepository,
+)
+from infrastructure.repositories.django_work_variant_composition_repo import (
+    DjangoWorkVariantCompositionRepository,
+)
+from infrastructure.services.reference_data_cache import reference_data_cache
+from task_groups.models import AnalogGroup, TaskGroup
+from tasks.models import Task
+from works.models import Variant, Work, WorkAnalogGroup
+
+
+class DjangoWorkDetailQueryBudgetTests(TestCase):
+    def setUp(self):
+        reference_data_cache.clear()
+        self.addCleanup(reference_data_cache.clear)
+        self.topic = Topic.objects.create(
+            name='Кинематика',
+            subject='Физика',
+            section='Механика',
+            grade_level=9,
+        )
+        self.work = Work.objects.create(name='Контрольная по кинематике')
+        Variant.objects.create(
+            work=self.work,
+            number=1,
+            work_name_snapshot=self.work.name,
+        )
+        self._add_spec_rows(2)
+
+    def _add_spec_rows(self, count):
+        start = WorkAnalogGroup.objects.filter(work=self.work).count()
+        for order in range(start, start + count):
+            group = AnalogGroup.objects.create(name=f'Группа {order}')
+            for bank_role in (
+                TASK_BANK_ROLE_DEMO,
+                TASK_BANK_ROLE_CONTROL,
+                TASK_BANK_ROLE_CONTROL,
+            ):
+                TaskGroup.objects.create(
+                    task=Task.objects.create(
+                        topic=self.topic,
+                        text=f'Задача {order}',
+                        answer='5 м/с',
+                        task_type='computational',
+                        difficulty=2,
+                    ),
+                    group=group,
+                    bank_role=bank_role,
+                )
+            WorkAnalogGroup.objects.create(
+                work=self.work,
+                analog_group=group,
+                order=order,
+                count=1,
+                bank_role_filter=TASK_BANK_ROLE_CONTROL,
+            )
+
+    def _assert_budget_ignores_spec_rows(self, num_queries, load):
+        with self.assertNumQueries(num_queries):
+            small = load()
+        self._add_spec_rows(23)
+        with self.assertNumQueries(num_queries):
+            large = load()
+        return small, large
+
+    def test_work_detail_loads_spec_rows_in_fixed_queries(self):
+        work_id = str(self.work.pk)
+        repo = DjangoWorkReadRepository()
+
+        def load():
+            return (
+                repo.get_work_detail(work_id),
+                repo.get_detail_variants(work_id),
+                repo.get_detail_analog_groups(work_id),
+            )
+
+        _, (work, variants, groups) = self._assert_budget_ignores_spec_rows(
+            4,
+            load,
+        )
+
+        self.assertEqual((work.variant_count, work.event_count), (1, 0))
+        self.assertEqual(len(variants), 1)
+        self.assertEqual(len(groups), 25)
+        self.assertEqual(groups[0].analog_group.task_count, 3)
+        self.assertEqual(
+            sorted(groups[0].task_bank_roles),
+            [TASK_BANK_ROLE_CONTROL, TASK_BANK_ROLE_CONTROL, TASK_BANK_ROLE_DEMO],
+        )
+
+    def test_variant_generation_form_loads_groups_in_fixed_queries(self):
+        use_case = container.get_variant_generation_form_use_case()
+
+        _, form_data = self._assert_budget_ignores_spec_rows(
+            3,
+            lambda: use_case.execute(str(self.work.pk)),
+        )
+
+        self.assertEqual(len(form_data.work_groups), 25)
+        self.assertEqual(form_data.work_groups[0].available_count, 2)
+
+    def test_composition_source_loads_tasks_in_fixed_queries(self):
+        repo = DjangoWorkVariantCompositionRepository()
+
+        _, source = self._assert_budget_ignores_spec_rows(
+            4,
+            lambda: repo.get_variant_composition_source(str(self.work.pk)),
+        )
+
+        self.assertEqual(len(source.spec_rows), 25)
+        available_tasks = source.spec_rows[0].available_tasks
+        self.assertEqual(
+            [task.task_id for task in available_tasks],
+            [
+                str(task_id)
+                for task_id in TaskGroup.objects.filter(
+                    group=WorkAnalogGroup.objects.get(
+                        work=self.work,
+                        order=0,
+                    ).analog_group,
+                ).order_by('pk').values_list('task_id', flat=True)
+            ],
+        )
+
+    def test_generation_group_sources_match_detail_groups(self):
+        detail_groups = DjangoWorkReadRepository().get_detail_analog_groups(
+            str(self.work.pk),
+        )
+        sources = DjangoVariantGenerationFormRepository(
+        ).get_variant_generation_group_sources(str(self.work.pk))
+
+        self.assertEqual(
+            [source.task_bank_roles for source in sources],
+            [group.task_bank_roles for group in detail_groups],
+        )
+
+    def test_work_pages_do_not_grow_with_spec_rows(self):
+        for name in ('works:detail', 'works:update', 'works:compose-variants'):
+            with self.subTest(page=name):
+                url = reverse(name, args=[self.work.pk])
+                before = self._count_page_queries(url)
+                self._add_spec_rows(5)
+                self.assertEqual(self._count_page_queries(url), before)
+
+    def _count_page_queries(self, url):
+        # The first render also reloads reference data that the new
+        # analog groups invalidated; it is cached once the render commits.
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.get(url)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(url).status_code, 200)
+        return len(queries)
@@ -26,6 +26,7 @@ from core_logic.entities.work import (
     WorkListItem,
 )
 from core_logic.entities.report_summary import ReportsDashboardData
+from core_logic.entities.review import ReviewGradingRules
 from core_logic.entities.student import StudentRemedialWorkData
 from core_logic.services.analytics_service import (
     ScoreTimelinePoint,
@@ -1008,6 +1009,8 @@ class ReviewFormAdapterTests(SimpleTestCase):
             current_position=2,
             total_positions=5,
             navigation_progress=40,
+            grading_rules=None,
+            draft=None,
         )
         result = SimpleNamespace(score=4, percentage=75.0)
         adapter = ReviewFormAdapter()
@@ -1025,6 +1028,25 @@ class ReviewFormAdapterTests(SimpleTestCase):
         self.assertEqual(context['total_positions'], 5)
         self.assertEqual(context['navigation_progress'], 40)
         self.assertEqual(payload, {'score': 4, 'percentage': 75.0})
+        self.assertIsNone(context['grading_rules'])
+
+    def test_serializes_grading_rules_for_local_scoring(self):
+        rules = ReviewGradingRules(
+            score_thresholds=((85, 5), (50, 3)),
+            fallback_score=2,
+            task_max_points=(('variant-task-1', 2), ('task-2', 3)),
+        )
+
+        payload = ReviewFormAdapter().grading_rules_payload(rules)
+
+        self.assertEqual(payload, {
+            'scale': [
+                {'min_percentage': 85, 'score': 5},
+                {'min_percentage': 50, 'score': 3},
+            ],
+            'fallback_score': 2,
+            'task_max_points': {'variant-task-1': 2, 'task-2': 3},
+        })
 
 
 class SettingsFormAdapterTests(SimpleTestCase):
@@ -1323,11 +1345,16 @@ class TaskFormAdapterTests(SimpleTestCase):
         detail_data = SimpleNamespace(
             task='task-1',
             task_groups=['group-1'],
+            similar_tasks=['task-2'],
         )
 
         self.assertEqual(
             adapter.task_detail_context(detail_data),
-            {'task': 'task-1', 'task_groups': ['group-1']},
+            {
+                'task': 'task-1',
+                'task_groups': ['group-1'],
+                'similar_tasks': ['task-2'],
+            },
         )
         self.assertEqual(
             adapter.task_create_context(form, image_formset),
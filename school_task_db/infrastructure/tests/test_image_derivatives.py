@@ -0,0 +1,209 @@
+from io import BytesIO, StringIO
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from PIL import Image
+
+from core_logic.value_objects.document_render_options import RenderTarget
+from curriculum.models import Topic
+from infrastructure.services.image_derivatives import (
+    DjangoImageDerivativeStore,
+    image_target_width_px,
+)
+from infrastructure.services.task_document_images import (
+    TaskDocumentImagePayloadFormatter,
+)
+from tasks.models import ImageAsset, Task, TaskImage
+
+
+def image_bytes(size, image_format='JPEG', mode='RGB', exif=None):
+    image = Image.effect_noise(size, 64).convert(mode)
+    content = BytesIO()
+    options = {'quality': 95} if image_format == 'JPEG' else {}
+    if exif is not None:
+        options['exif'] = exif
+    image.save(content, format=image_format, **options)
+    return content.getvalue()
+
+
+ASSET_NAME = f'image_assets/ab/{"ab" * 32}.jpg'
+
+
+class ImageTargetWidthTests(SimpleTestCase):
+    def test_caps_width_by_page_share_and_renderer_dpi(self):
+        self.assertEqual(image_target_width_px(100, 'A4', 'latex'), 2240)
+        self.assertEqual(image_target_width_px(100, 'A4', 'html'), 1152)
+        self.assertEqual(image_target_width_px(40, 'A4', 'html'), 448)
+        self.assertEqual(image_target_width_px(100, 'A5', 'latex'), 1536)
+
+
+class DjangoImageDerivativeStoreTests(SimpleTestCase):
+    def setUp(self):
+        self.media_root = TemporaryDirectory()
+        self.storage = FileSystemStorage(location=self.media_root.name)
+        self.store = DjangoImageDerivativeStore(storage=self.storage)
+
+    def tearDown(self):
+        self.media_root.cleanup()
+
+    def test_stores_recompressed_derivative_next_to_asset(self):
+        self.storage.save(ASSET_NAME, ContentFile(image_bytes((2400, 1600))))
+
+        derivative = self.store.file_name_for_width(ASSET_NAME, 1152)
+
+        self.assertEqual(derivative, f'image_assets/ab/{"ab" * 32}-w1152.jpg')
+        with self.storage.open(derivative, 'rb') as stored:
+            with Image.open(stored) as image:
+                self.assertEqual(image.size, (1152, 768))
+        self.assertLess(
+            self.storage.size(derivative),
+            self.storage.size(ASSET_NAME),
+        )
+
+    def test_reuses_existing_derivative(self):
+        self.storage.save(ASSET_NAME, ContentFile(image_bytes((2400, 1600))))
+        first = self.store.file_name_for_width(ASSET_NAME, 1152)
+        modified = self.storage.get_modified_time(first)
+
+        second = self.store.file_name_for_width(ASSET_NAME, 1152)
+
+        self.assertEqual(second, first)
+        self.assertEqual(self.storage.get_modified_time(second), modified)
+
+    def test_keeps_narrow_and_undecodable_originals(self):
+        self.storage.save(ASSET_NAME, ContentFile(image_bytes((800, 600))))
+        self.storage.save('task_images/scheme.svg', ContentFile(b'<svg/>'))
+
+        self.assertEqual(
+            self.store.file_name_for_width(ASSET_NAME, 1152),
+            ASSET_NAME,
+        )
+        self.assertEqual(
+            self.store.file_name_for_width('task_images/scheme.svg', 448),
+            'task_images/scheme.svg',
+        )
+
+    def test_remembers_when_original_is_smaller_than_derivative(self):
+        content = BytesIO()
+        # Barely wider than the target and compressed harder than
+        # JPEG_QUALITY, so the derivative comes out larger.
+        Image.effect_noise((1200, 800), 64).convert('RGB').save(
+            content,
+            format='JPEG',
+            quality=30,
+        )
+        self.storage.save(ASSET_NAME, ContentFile(content.getvalue()))
+
+        self.assertEqual(
+            self.store.file_name_for_width(ASSET_NAME, 1152),
+            ASSET_NAME,
+        )
+        with patch.object(self.store, '_render') as render:
+            self.assertEqual(
+                self.store.file_name_for_width(ASSET_NAME, 1152),
+                ASSET_NAME,
+            )
+
+        render.assert_not_called()
+        self.assertTrue(self.storage.exists(
+            f'image_assets/ab/{"ab" * 32}-w1152.original',
+        ))
+
+    def test_applies_exif_orientation_before_resizing(self):
+        exif = Image.Exif()
+        exif[0x0112] = 6
+        self.storage.save(
+            ASSET_NAME,
+            ContentFile(image_bytes((2400, 1600), exif=exif)),
+        )
+
+        derivative = self.store.file_name_for_width(ASSET_NAME, 1152)
+
+        with self.storage.open(derivative, 'rb') as stored:
+            with Image.open(stored) as image:
+                self.assertEqual(image.size, (1152, 1728))
+
+    def test_legacy_png_is_content_addressed_and_stays_png(self):
+        self.storage.save(
+            'task_images/diagram.png',
+            ContentFile(image_bytes((2400, 1200), 'PNG', mode='L')),
+        )
+
+        derivative = self.store.file_name_for_width(
+            'task_images/diagram.png',
+            1152,
+        )
+
+        self.assertTrue(derivative.startswith('image_derivatives/'))
+        self.assertTrue(derivative.endswith('-w1152.png'))
+
+    def test_document_payload_embeds_derivative_for_html(self):
+        self.storage.save(ASSET_NAME, ContentFile(image_bytes((2400, 1600))))
+        original_size = self.storage.size(ASSET_NAME)
+
+        formatted = TaskDocumentImagePayloadFormatter(
+            storage=self.storage,
+        ).format_task_payload(
+            {
+                'images': ({
+                    'file_name': ASSET_NAME,
+                    'position': 'right_40',
+                },),
+            },
+            request=SimpleNamespace(
+                render_target=RenderTarget(renderer_type='html'),
+                build_context={},
+            ),
+        )
+
+        image = formatted['images'][0]
+        self.assertEqual(image['file_name'], ASSET_NAME)
+        self.assertTrue(
+            image['render_source'].startswith('data:image/jpeg;base64,'),
+        )
+        self.assertLess(len(image['render_source']), original_size / 4)
+
+
+class BuildImageDerivativesCommandTests(TestCase):
+    def test_builds_derivatives_for_task_image_layouts(self):
+        with TemporaryDirectory() as media_root, override_settings(
+            MEDIA_ROOT=media_root,
+        ):
+            asset = ImageAsset(
+                checksum='cd' * 32,
+                byte_size=1,
+                mime_type='image/jpeg',
+                original_filename='photo.jpg',
+            )
+            asset.file.save(
+                'photo.jpg',
+                ContentFile(image_bytes((2400, 1600))),
+                save=False,
+            )
+            asset.save()
+            TaskImage.objects.create(
+                task=Task.objects.create(
+                    text='Опишите опыт по фотографии',
+                    answer='Ответ',
+                    topic=Topic.objects.create(
+                        name='Оптика',
+                        subject='Физика',
+                        grade_level=8,
+                    ),
+                    difficulty=2,
+                    task_type='computational',
+                ),
+                asset=asset,
+                position='bottom_100',
+            )
+            stdout = StringIO()
+
+            call_command('build_image_derivatives', stdout=stdout)
+
+            self.assertIn('Проверено размеров: 4', stdout.getvalue())
+            self.assertIn('уменьшенную копию: 4', stdout.getvalue())
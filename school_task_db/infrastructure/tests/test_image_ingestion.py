@@ -0,0 +1,65 @@
+import base64
+import hashlib
+from io import BytesIO
+
+from django.test import SimpleTestCase
+from PIL import Image
+
+from infrastructure.services.image_ingestion import ingest_image, ingest_images
+
+
+def png_bytes():
+    content = BytesIO()
+    Image.new('RGB', (8, 8), 'white').save(content, format='PNG')
+    return content.getvalue()
+
+
+def encoded(content):
+    return base64.b64encode(content).decode('ascii')
+
+
+class ImageIngestionTests(SimpleTestCase):
+    def test_decodes_and_hashes_verified_image(self):
+        content = png_bytes()
+
+        image = ingest_image(f'data:image/png;base64,{encoded(content)}', 'a.png')
+
+        self.assertEqual(image.error, '')
+        self.assertEqual(image.content, content)
+        self.assertEqual(image.checksum, hashlib.sha256(content).hexdigest())
+        self.assertEqual(image.byte_size, len(content))
+
+    def test_rejects_truncated_raster_image(self):
+        for length in (40, len(png_bytes()) - 12):
+            with self.subTest(length=length):
+                image = ingest_image(
+                    encoded(png_bytes()[:length]),
+                    'broken.png',
+                )
+
+                self.assertIn('Повреждённое изображение broken.png', image.error)
+                self.assertEqual(image.checksum, '')
+
+    def test_accepts_content_pillow_does_not_recognise(self):
+        svg = b'<svg xmlns="http://www.w3.org/2000/svg"/>'
+
+        image = ingest_image(encoded(svg), 'figure.svg')
+
+        self.assertEqual(image.error, '')
+        self.assertEqual(image.content, svg)
+
+    def test_reports_invalid_base64(self):
+        image = ingest_image('not-base64!', 'a.png')
+
+        self.assertTrue(image.error.startswith('Ошибка декодирования base64'))
+
+    def test_pool_keeps_input_order(self):
+        items = [(encoded(bytes([index]) * 4), f'{index}.bin') for index in range(6)]
+
+        images = ingest_images(items, max_workers=3)
+
+        self.assertEqual(
+            [image.filename for image in images],
+            [filename for _, filename in items],
+        )
+        self.assertEqual(images[5].content, b'\x05' * 4)
@@ -0,0 +1,270 @@
+import re
+from datetime import date
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from codifier.models import CodifierSpec, ContentEntry, Requirement
+from core.models import AcademicYear, ReferenceDataVersion
+from curriculum.models import SubTopic, Topic
+from infrastructure.repositories.django_academic_year_activation_repo import (
+    DjangoAcademicYearActivationRepository,
+)
+from infrastructure.repositories.django_academic_year_catalog_repo import (
+    DjangoAcademicYearCatalogRepository,
+)
+from infrastructure.repositories.django_task_group_management_repo import (
+    DjangoTaskGroupManagementRepository,
+)
+from infrastructure.services.reference_data_cache import (
+    ReferenceDataCache,
+    reference_data_cache,
+)
+from task_groups.models import AnalogGroup
+from tasks.models import Source, Task
+from works.models import Work, WorkAnalogGroup, WorkContentBlock
+
+REFERENCE_TABLES = (
+    AcademicYear._meta.db_table,
+    Topic._meta.db_table,
+    SubTopic._meta.db_table,
+    Source._meta.db_table,
+    AnalogGroup._meta.db_table,
+    CodifierSpec._meta.db_table,
+    ContentEntry._meta.db_table,
+    Requirement._meta.db_table,
+)
+
+
+def _reference_queries(queries):
+    return [
+        query['sql']
+        for query in queries.captured_queries
+        if _reads_only_reference_tables(query['sql'])
+    ]
+
+
+def _reads_only_reference_tables(sql):
+    # Rows linked to the rendered object (say, a block's selected topics)
+    # join a non-reference table and are page data, not option lists.
+    source = re.search(r'FROM "(\w+)"', sql)
+    if source is None:
+        return False
+    tables = {source.group(1), *re.findall(r'JOIN "(\w+)"', sql)}
+    return tables <= set(REFERENCE_TABLES)
+
+
+class ReferenceDataCacheTests(TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.cache = ReferenceDataCache(ttl=60, clock=lambda: self.now)
+        self.loads = 0
+
+    def _load(self):
+        self.loads += 1
+        return self.loads
+
+    def _get(self):
+        # Tests run inside a transaction: entries are stored on commit.
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.cache.get('years', self._load)
+
+    def test_reuses_entry_until_reference_version_moves(self):
+        self.assertEqual(self._get(), 1)
+        self.assertEqual(self._get(), 1)
+
+        self.cache.invalidate()
+
+        self.assertEqual(self._get(), 2)
+        self.assertEqual(self.loads, 2)
+
+    def test_version_lives_in_database_row(self):
+        version = self.cache.current_version()
+
+        ReferenceDataCache().invalidate()
+
+        self.assertEqual(self.cache.current_version(), version + 1)
+        self.assertEqual(
+            ReferenceDataVersion.objects.get(
+                pk=ReferenceDataVersion.SINGLETON_ID,
+            ).version,
+            version + 1,
+        )
+
+    def test_request_reads_version_once(self):
+        self.cache.begin_request()
+        self.addCleanup(self.cache.end_request)
+        self._get()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self._get(), 1)
+        self.cache.invalidate()
+        self.assertEqual(self._get(), 2)
+
+    def test_entries_expire_after_ttl(self):
+        self._get()
+        self.now = 59
+        self.assertEqual(self._get(), 1)
+
+        self.now = 60
+
+        self.assertEqual(self._get(), 2)
+
+    def test_uncommitted_load_is_not_cached(self):
+        self.assertEqual(self.cache.get('years', self._load), 1)
+
+        self.assertEqual(self._get(), 2)
+        self.assertEqual(self._get(), 2)
+
+    def test_clear_drops_entries(self):
+        self._get()
+        self.cache.clear()
+
+        self.assertEqual(self._get(), 2)
+
+    def test_reference_writes_move_version(self):
+        self._get()
+
+        year = AcademicYear.objects.create(
+            name='2025-2026',
+            start_date=date(2025, 9, 1),
+            end_date=date(2026, 5, 31),
+        )
+        self.assertEqual(self._get(), 2)
+
+        year.delete()
+        self.assertEqual(self._get(), 3)
+
+
+class ReferenceDataInvalidationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        # Entries stored by executed on-commit callbacks outlive the
+        # rolled-back test transaction.
+        reference_data_cache.clear()
+        self.addCleanup(reference_data_cache.clear)
+
+    def test_active_year_follows_activation(self):
+        repo = DjangoAcademicYearCatalogRepository()
+        first = AcademicYear.objects.create(
+            name='2024-2025',
+            start_date=date(2024, 9, 1),
+            end_date=date(2025, 5, 31),
+            is_active=True,
+        )
+        second = AcademicYear.objects.create(
+            name='2025-2026',
+            start_date=date(2025, 9, 1),
+            end_date=date(2026, 5, 31),
+        )
+        self.assertEqual(repo.get_active_academic_year().pk, str(first.pk))
+        self.assertEqual(repo.get_academic_year(str(second.pk)).name, '2025-2026')
+        self.assertIsNone(repo.get_academic_year('not-a-uuid'))
+
+        DjangoAcademicYearActivationRepository().activate_academic_year(
+            str(second.pk),
+        )
+
+        self.assertEqual(repo.get_active_academic_year().pk, str(second.pk))
+
+    def test_analog_group_rename_refreshes_options(self):
+        group = AnalogGroup.objects.create(name='Старое имя')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.get(reverse('tasks:list'))
+
+        DjangoTaskGroupManagementRepository().update_analog_group(
+            str(group.pk),
+            'Новое имя',
+        )
+        response = self.client.get(reverse('tasks:list'))
+
+        self.assertEqual(
+            [option.name for option in response.context['analog_groups']],
+            ['Новое имя'],
+        )
+
+
+class ReferenceDataPageQueryTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        # Entries stored by executed on-commit callbacks outlive the
+        # rolled-back test transaction.
+        reference_data_cache.clear()
+        self.addCleanup(reference_data_cache.clear)
+        AcademicYear.objects.create(
+            name='2025-2026',
+            start_date=date(2025, 9, 1),
+            end_date=date(2026, 5, 31),
+            is_active=True,
+        )
+        self.topic = Topic.objects.create(
+            name='Кинематика',
+            subject='Физика',
+            section='Механика',
+            grade_level=9,
+        )
+        subtopic = SubTopic.objects.create(topic=self.topic, name='Скорость')
+        Source.objects.create(name='Сборник задач', short_name='СЗ')
+        group = AnalogGroup.objects.create(name='Скорость тела')
+        Task.objects.create(
+            topic=self.topic,
+            subtopic=subtopic,
+            text='Найдите скорость тела',
+            answer='5 м/с',
+            task_type='computational',
+            difficulty=2,
+        )
+        self.work = Work.objects.create(name='Кинематика')
+        WorkAnalogGroup.objects.create(work=self.work, analog_group=group)
+        block = WorkContentBlock.objects.create(
+            work=self.work,
+            content_type='theory',
+        )
+        block.topics.add(self.topic)
+
+    def _assert_warm_render_skips_reference_data(self, url):
+        self.client.get(url)
+        reference_data_cache.clear()
+        with CaptureQueriesContext(connection) as cold:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.assertEqual(self.client.get(url).status_code, 200)
+        with CaptureQueriesContext(connection) as warm:
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+        self.assertTrue(_reference_queries(cold))
+        self.assertEqual(_reference_queries(warm), [])
+        self.assertEqual(
+            len(warm),
+            len(cold) - len(_reference_queries(cold)),
+        )
+
+    def test_task_list_reads_reference_data_from_cache(self):
+        self._assert_warm_render_skips_reference_data(reverse('tasks:list'))
+
+    def test_work_edit_reads_reference_data_from_cache(self):
+        self._assert_warm_render_skips_reference_data(
+            reverse('works:update', args=[self.work.pk]),
+        )
+
+    def test_reference_write_is_visible_on_next_render(self):
+        url = reverse('tasks:list')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.get(url)
+
+        Topic.objects.create(
+            name='Динамика',
+            subject='Физика',
+            section='Механика',
+            grade_level=9,
+        )
+        response = self.client.get(url)
+
+        self.assertIn(
+            'Динамика',
+            [option.name for option in response.context['topics']],
+        )
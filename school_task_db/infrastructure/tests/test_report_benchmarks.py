@@ -0,0 +1,263 @@
+from tempfile import TemporaryDirectory
+
+from django.db import transaction
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from events.models import AttemptSnapshot, EventParticipation
+from infrastructure.container import container
+from infrastructure.services.latest_attempt_benchmark import (
+    measure_latest_attempt_strategies,
+    seed_attempt_revisions,
+)
+from infrastructure.services.report_benchmarks import (
+    ReportBenchmarkCase,
+    compare_report_benchmarks,
+    measure_report_case,
+    report_benchmark_cases,
+)
+from infrastructure.services.synthetic_school import (
+    SyntheticSchoolBuilder,
+    SyntheticSchoolSpec,
+    build_synthetic_school,
+    synthetic_school_spec,
+)
+from reports.models import StudentDigestEntryModel
+from students.models import Student
+from task_groups.models import AnalogGroup
+from tasks.models import ImageAsset, Task, TaskImage
+from works.models import Variant
+
+
+class SyntheticSchoolTests(TestCase):
+    SPEC = SyntheticSchoolSpec(
+        groups=2,
+        students_per_group=5,
+        weeks=3,
+        topics=3,
+        tasks_per_work=4,
+        absence_rate=0.2,
+    )
+
+    def test_builds_graded_year_with_captured_attempts(self):
+        school = build_synthetic_school(self.SPEC)
+
+        self.assertEqual(len(school.group_ids), 2)
+        self.assertEqual(len(school.event_ids), 2 * 3)
+        self.assertEqual(school.counts['eventparticipation'], 2 * 5 * 3)
+        self.assertEqual(
+            AttemptSnapshot.objects.count(),
+            school.counts['mark'],
+        )
+        self.assertEqual(
+            school.counts['mark']
+            + EventParticipation.objects.filter(status='absent').count(),
+            school.counts['eventparticipation'],
+        )
+        self.assertEqual(
+            StudentDigestEntryModel.objects.count(),
+            school.counts['eventparticipation'],
+        )
+
+    def test_same_seed_builds_same_school(self):
+        with transaction.atomic():
+            build_synthetic_school(self.SPEC)
+            first = self._student_names()
+            transaction.set_rollback(True)
+
+        build_synthetic_school(self.SPEC)
+
+        self.assertEqual(self._student_names(), first)
+        with self.assertRaisesMessage(ValueError, 'уже существует'):
+            build_synthetic_school(self.SPEC)
+
+    def test_explicit_volumes_spread_works_and_images(self):
+        spec = SyntheticSchoolSpec(
+            groups=2,
+            students_per_group=2,
+            weeks=2,
+            topics=2,
+            tasks=10,
+            analog_groups=5,
+            works=4,
+            variants_per_work=3,
+            tasks_per_work=2,
+            image_rate=0.5,
+        )
+
+        with TemporaryDirectory() as media_root:
+            with override_settings(MEDIA_ROOT=media_root):
+                school = build_synthetic_school(spec)
+
+        self.assertEqual(Task.objects.count(), 10)
+        self.assertEqual(AnalogGroup.objects.count(), 5)
+        self.assertEqual(Variant.objects.count(), 4 * 3)
+        # Each group writes its own works when there are more works than
+        # weeks.
+        self.assertEqual(
+            EventParticipation.objects.values('event__work').distinct().count(),
+            4,
+        )
+        images = TaskImage.objects.count()
+        self.assertEqual(images, school.counts['taskimage'])
+        self.assertGreater(images, 0)
+        self.assertLessEqual(ImageAsset.objects.count(), images)
+
+    def test_transfer_payload_is_deterministic_import_json(self):
+        spec = SyntheticSchoolSpec(
+            topics=2,
+            tasks=6,
+            tasks_per_work=2,
+            image_rate=0.5,
+        )
+
+        payload = SyntheticSchoolBuilder(spec).transfer_payload()
+
+        self.assertEqual(payload, SyntheticSchoolBuilder(spec).transfer_payload())
+        self.assertEqual(len(payload['tasks']), 6)
+        self.assertEqual(len(payload['analog_groups']), 2)
+        self.assertEqual(
+            {task['topic']['id'] for task in payload['tasks']},
+            {topic['id'] for topic in payload['topics']},
+        )
+        self.assertTrue(payload['task_images'])
+        self.assertTrue(
+            all(image['base64_data'] for image in payload['task_images'])
+        )
+        self.assertFalse(Task.objects.exists())
+
+    def test_presets_accept_overrides_and_reject_unknown_names(self):
+        spec = synthetic_school_spec('production', groups=2, seed=None)
+
+        self.assertEqual(spec.groups, 2)
+        self.assertEqual(spec.task_count, 50_000)
+        self.assertEqual(spec.seed, 2026)
+        with self.assertRaisesMessage(ValueError, 'huge'):
+            synthetic_school_spec('huge')
+        with self.assertRaisesMessage(ValueError, 'analog_groups'):
+            SyntheticSchoolSpec(tasks=12, analog_groups=13)
+
+    @staticmethod
+    def _student_names():
+        return list(
+            Student.objects.order_by('last_name', 'first_name').values_list(
+                'pk',
+                'last_name',
+                'first_name',
+                'middle_name',
+            )
+        )
+
+    def test_every_report_case_runs_on_synthetic_school(self):
+        school = build_synthetic_school(self.SPEC)
+
+        results = [
+            measure_report_case(case, repeat=1)
+            for case in report_benchmark_cases(container, school)
+        ]
+
+        self.assertEqual(
+            [result.name for result in results],
+            [
+                'heatmap',
+                'journal',
+                'dashboard',
+                'student_performance',
+                'work_analysis',
+                'event_performance',
+                'student_digests',
+            ],
+        )
+        for result in results:
+            self.assertGreater(result.queries, 0, result.name)
+            self.assertGreater(result.peak_memory_kib, 0, result.name)
+
+
+class LatestAttemptBenchmarkTests(TestCase):
+    def test_strategies_agree_on_seeded_revisions(self):
+        dataset = seed_attempt_revisions(11, revisions=3, students_per_event=2)
+
+        results = measure_latest_attempt_strategies(dataset, repeat=1)
+
+        self.assertEqual(dataset.attempts, 11)
+        self.assertEqual(dataset.participations, 4)
+        self.assertEqual(len(dataset.participation_ids_by_event), 2)
+        self.assertEqual(
+            AttemptSnapshot.objects.filter(is_latest=True).count(),
+            4,
+        )
+        self.assertEqual(
+            [(result.name, result.queries) for result in results],
+            [('is_latest', 2), ('revision_subquery', 2)],
+        )
+
+
+class MeasureReportCaseTests(SimpleTestCase):
+    def test_resets_caches_before_cold_and_memory_runs(self):
+        resets = []
+        runs = []
+        case = ReportBenchmarkCase('noop', lambda: runs.append(len(resets)))
+
+        result = measure_report_case(
+            case,
+            repeat=2,
+            reset=lambda: resets.append(True),
+        )
+
+        self.assertEqual(runs, [1, 2, 2, 2])
+        self.assertEqual(result.queries, 0)
+        self.assertEqual(result.warm_queries, 0)
+
+
+class CompareReportBenchmarksTests(SimpleTestCase):
+    BASELINE = {
+        'journal': {
+            'cold_seconds': 0.2,
+            'warm_seconds': 0.1,
+            'queries': 10,
+            'warm_queries': 4,
+            'peak_memory_kib': 1000,
+        },
+    }
+
+    def test_any_query_growth_is_a_regression(self):
+        results = {'journal': {**self.BASELINE['journal'], 'queries': 11}}
+
+        self.assertEqual(
+            compare_report_benchmarks(results, self.BASELINE),
+            ('journal.queries: 10 → 11',),
+        )
+
+    def test_time_and_memory_growth_is_compared_with_tolerance(self):
+        results = {
+            'journal': {
+                **self.BASELINE['journal'],
+                'cold_seconds': 0.29,
+                'warm_seconds': 0.2,
+                'peak_memory_kib': 1600,
+            },
+            'heatmap': {'queries': 99},
+        }
+
+        regressions = compare_report_benchmarks(
+            results,
+            self.BASELINE,
+            tolerance=0.5,
+        )
+
+        self.assertEqual(
+            regressions,
+            (
+                'journal.warm_seconds: 0.1 → 0.2 (> +50%)',
+                'journal.peak_memory_kib: 1000 → 1600 (> +50%)',
+            ),
+        )
+
+    def test_small_absolute_changes_are_noise(self):
+        baseline = {
+            'journal': {**self.BASELINE['journal'], 'warm_seconds': 0.002},
+        }
+        results = {
+            'journal': {**self.BASELINE['journal'], 'warm_seconds': 0.01},
+        }
+
+        self.assertEqual(compare_report_benchmarks(results, baseline), ())
@@ -0,0 +1,138 @@
+from django.template import engines
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from core.models import AcademicYear
+from infrastructure.container import container
+from infrastructure.services.request_profiling import (
+    REQUEST_PROFILING_DEFAULTS,
+    RequestProfileStore,
+    instrument_template_rendering,
+    profile_request,
+    request_stage_timer,
+    summarize_request_profiles,
+)
+
+PROFILING_ON = {**REQUEST_PROFILING_DEFAULTS, 'ENABLED': True}
+
+
+class ProfileRequestTests(TestCase):
+    def test_records_queries_slowest_statements_and_stages(self):
+        store = RequestProfileStore(size=5)
+
+        with profile_request(
+            'GET',
+            '/reports/',
+            store=store,
+            options={**PROFILING_ON, 'SLOW_QUERY_LIMIT': 2},
+        ):
+            for _ in range(3):
+                list(AcademicYear.objects.all())
+            with request_stage_timer.measure('document.pdf'):
+                pass
+            with request_stage_timer.measure('document.pdf'):
+                pass
+
+        (profile,) = store.recent()
+        self.assertEqual(profile.path, '/reports/')
+        self.assertEqual(profile.query_count, 3)
+        self.assertEqual(len(profile.slow_queries), 2)
+        self.assertIn('core_academicyear', profile.slow_queries[0].sql)
+        self.assertGreaterEqual(
+            profile.slow_queries[0].milliseconds,
+            profile.slow_queries[1].milliseconds,
+        )
+        self.assertEqual(profile.stages['document.pdf'].calls, 2)
+        self.assertGreater(profile.total_ms, 0)
+
+    def test_stage_timer_is_inert_outside_a_profile(self):
+        store = RequestProfileStore()
+
+        with request_stage_timer.measure('document.payload'):
+            pass
+
+        self.assertEqual(store.recent(), ())
+
+    def test_times_top_level_template_renders(self):
+        instrument_template_rendering()
+        instrument_template_rendering()
+        store = RequestProfileStore()
+        template = engines['django'].from_string(
+            '{% for item in items %}{{ item }}{% endfor %}',
+        )
+
+        with profile_request('GET', '/', store=store, options=PROFILING_ON):
+            template.render({'items': range(3)})
+
+        (profile,) = store.recent()
+        self.assertEqual(profile.stages['template'].calls, 1)
+        self.assertEqual(profile.document_stages, {})
+
+
+class RequestProfileStoreTests(SimpleTestCase):
+    def test_keeps_newest_profiles_within_buffer_size(self):
+        store = RequestProfileStore(size=2)
+        for path in ('/a/', '/b/', '/c/'):
+            with profile_request('GET', path, store=store, options=PROFILING_ON):
+                pass
+
+        self.assertEqual(
+            [profile.path for profile in store.recent()],
+            ['/c/', '/b/'],
+        )
+        store.resize(1)
+        self.assertEqual([profile.path for profile in store.recent()], ['/c/'])
+
+    def test_summarizes_by_path_slowest_first(self):
+        store = RequestProfileStore()
+        for path in ('/fast/', '/slow/', '/slow/'):
+            with profile_request('GET', path, store=store, options=PROFILING_ON):
+                pass
+        profiles = store.recent()
+        for profile in profiles:
+            profile.total_ms = 100 if profile.path == '/slow/' else 1
+
+        summaries = summarize_request_profiles(profiles)
+
+        self.assertEqual(
+            [(summary.path, summary.requests) for summary in summaries],
+            [('/slow/', 2), ('/fast/', 1)],
+        )
+
+
+class RequestProfilingMiddlewareTests(TestCase):
+    def setUp(self):
+        container.request_profile_store.clear()
+        self.addCleanup(container.request_profile_store.clear)
+
+    @override_settings(REQUEST_PROFILING={'ENABLED': True})
+    def test_profiles_requests_and_shows_them_on_dashboard(self):
+        self.client.get(reverse('core:search'), {'q': 'задача'})
+
+        (profile,) = container.request_profile_store.recent()
+        self.assertEqual(profile.path, reverse('core:search'))
+        self.assertEqual(profile.status_code, 200)
+        self.assertGreater(profile.query_count, 0)
+        self.assertGreater(profile.template_ms, 0)
+
+        response = self.client.get(reverse('core:request-profiles'))
+
+        self.assertContains(response, reverse('core:search'))
+        # The dashboard itself is excluded from profiling.
+        self.assertEqual(len(container.request_profile_store.recent()), 1)
+
+        self.client.post(reverse('core:request-profiles'))
+        self.assertEqual(container.request_profile_store.recent(), ())
+
+    @override_settings(REQUEST_PROFILING={'ENABLED': True, 'SAMPLE_RATE': 0})
+    def test_skips_unsampled_requests(self):
+        self.client.get(reverse('core:index'))
+
+        self.assertEqual(container.request_profile_store.recent(), ())
+
+    def test_is_disabled_by_default(self):
+        self.client.get(reverse('core:index'))
+
+        self.assertEqual(container.request_profile_store.recent(), ())
+        response = self.client.get(reverse('core:request-profiles'))
+        self.assertContains(response, 'Профилирование выключено')
@@ -0,0 +1,125 @@
+from django.test import TestCase
+from django.utils import timezone
+
+from events.models import Event, EventParticipation, Mark
+from infrastructure.repositories.django_event_participation_repo import (
+    DjangoEventParticipationRepository,
+)
+from infrastructure.repositories.django_review_workflow_repo import (
+    DjangoReviewWorkflowRepository,
+)
+from infrastructure.services.review_queue_cache import review_queue_cache
+from students.models import Student
+from works.models import Work
+
+
+class ReviewQueueCacheTests(TestCase):
+    def setUp(self):
+        work = Work.objects.create(name='Контрольная', work_type='test')
+        self.event = Event.objects.create(
+            name='КР 9А',
+            work=work,
+            planned_date=timezone.now(),
+            status='completed',
+        )
+        self.participations = [
+            EventParticipation.objects.create(
+                event=self.event,
+                student=Student.objects.create(
+                    last_name=last_name,
+                    first_name='Иван',
+                ),
+                status='completed',
+            )
+            for last_name in ('Сидоров', 'Андреев', 'Петров')
+        ]
+        Mark.objects.create(participation=self.participations[2], score=4)
+        self.repo = DjangoReviewWorkflowRepository()
+        self.event_id = str(self.event.pk)
+
+    def tearDown(self):
+        review_queue_cache.invalidate(self.event_id)
+
+    def test_repository_builds_ordered_queue_with_graded_flags_in_one_query(self):
+        with self.assertNumQueries(1):
+            queue = self.repo.get_review_queue(self.event_id)
+
+        self.assertEqual(
+            [
+                (entry.participation_id, entry.graded)
+                for entry in queue.entries
+            ],
+            [
+                (str(self.participations[1].pk), False),
+                (str(self.participations[2].pk), True),
+                (str(self.participations[0].pk), False),
+            ],
+        )
+
+    def test_mark_save_updates_cached_flag_in_place(self):
+        review_queue_cache.set(self.repo.get_review_queue(self.event_id))
+        participation = self.participations[0]
+
+        Mark.objects.create(participation=participation, score=5)
+
+        queue = review_queue_cache.get(self.event_id)
+        self.assertTrue(queue.entries[queue.index_of(participation.pk)].graded)
+
+        Mark.objects.filter(participation=participation).delete()
+
+        queue = review_queue_cache.get(self.event_id)
+        self.assertFalse(queue.entries[queue.index_of(participation.pk)].graded)
+
+    def test_graded_status_save_keeps_queue(self):
+        review_queue_cache.set(self.repo.get_review_queue(self.event_id))
+        participation = self.participations[0]
+
+        participation.status = 'graded'
+        participation.save()
+
+        self.assertIsNotNone(review_queue_cache.get(self.event_id))
+
+    def test_participant_list_changes_drop_queue(self):
+        changes = (
+            lambda: self.repo.set_participation_status(
+                str(self.participations[0].pk),
+                'absent',
+            ),
+            lambda: EventParticipation.objects.create(
+                event=self.event,
+                student=Student.objects.create(
+                    last_name='Новиков',
+                    first_name='Олег',
+                ),
+            ),
+            lambda: self.participations[1].delete(),
+        )
+        for change in changes:
+            review_queue_cache.set(self.repo.get_review_queue(self.event_id))
+
+            change()
+
+            self.assertIsNone(review_queue_cache.get(self.event_id))
+
+    def test_bulk_added_participants_drop_queue(self):
+        review_queue_cache.set(self.repo.get_review_queue(self.event_id))
+        student = Student.objects.create(last_name='Борисов', first_name='Иван')
+
+        added = DjangoEventParticipationRepository().add_participants(
+            self.event_id,
+            [str(student.pk)],
+        )
+
+        self.assertEqual(added, 1)
+        self.assertIsNone(review_queue_cache.get(self.event_id))
+        navigation_queue = self.repo.get_review_queue(self.event_id)
+        self.assertEqual(len(navigation_queue.entries), 4)
+
+    def test_absent_status_save_drops_queue(self):
+        review_queue_cache.set(self.repo.get_review_queue(self.event_id))
+        participation = self.participations[0]
+
+        participation.status = 'absent'
+        participation.save(update_fields=['status'])
+
+        self.assertIsNone(review_queue_cache.get(self.event_id))
@@ -0,0 +1,212 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from curriculum.models import Topic
+from events.models import Event
+from infrastructure.container import container
+from infrastructure.repositories.django_task_group_management_repo import (
+    DjangoTaskGroupManagementRepository,
+)
+from infrastructure.services.cache_generations import (
+    CACHE_DOMAIN_SEARCH,
+    cache_generations,
+)
+from core_logic.entities.core import SearchSuggestion
+from infrastructure.services.search_suggestions import (
+    _SUGGESTION_LOADERS,
+    SearchSuggestionIndex,
+)
+from students.models import Student
+from task_groups.models import AnalogGroup
+from tasks.models import Task
+from works.models import Work
+
+BANK_SIZE = 50_000
+
+
+def refresh_inline(refresh):
+    refresh()
+
+
+class SearchSuggestionIndexTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.index = SearchSuggestionIndex(start_refresh=refresh_inline)
+        self.topic = Topic.objects.create(
+            name='Кинематика',
+            subject='Физика',
+            grade_level=9,
+        )
+        self.student = Student.objects.create(
+            last_name='Кириллова',
+            first_name='Анна',
+        )
+        self.work = Work.objects.create(name='Кинематика: контрольная')
+        Task.objects.create(
+            topic=self.topic,
+            text='Кинематика    точки:\nнайдите скорость тела ' + 'x' * 100,
+            answer='Ответ',
+            task_type='computational',
+            difficulty=2,
+        )
+
+    def test_matches_word_prefixes_across_entities_in_kind_order(self):
+        suggestions = self.index.suggest(('ки',), 10)
+
+        self.assertEqual(
+            [suggestion.kind for suggestion in suggestions],
+            ['student', 'work', 'topic', 'task'],
+        )
+        task = suggestions[-1]
+        self.assertTrue(task.title.startswith('Кинематика точки: найдите'))
+        self.assertLessEqual(len(task.title), 80)
+        self.assertEqual(task.subtitle, 'Кинематика')
+
+        self.assertEqual(
+            [s.kind for s in self.index.suggest(('кин', 'контр'), 10)],
+            ['work'],
+        )
+        self.assertEqual(len(self.index.suggest(('ки',), 2)), 2)
+
+    def test_caches_queries_until_a_suggested_entity_changes(self):
+        self.index.suggest(('кир',), 10)
+
+        with self.assertNumQueries(0):
+            cached = self.index.suggest(('кир',), 10)
+        self.assertEqual(cached[0].title, 'Кириллова Анна')
+
+        self.student.first_name = 'Мария'
+        self.student.save()
+        self.assertEqual(
+            self.index.suggest(('кир',), 10)[0].title,
+            'Кириллова Мария',
+        )
+
+        group = AnalogGroup.objects.create(name='Скорость')
+        DjangoTaskGroupManagementRepository().update_analog_group(
+            str(group.pk),
+            'Кирхгоф',
+        )
+        self.assertEqual(
+            [s.kind for s in self.index.suggest(('кир',), 10)],
+            ['student', 'analog_group'],
+        )
+
+        self.student.delete()
+        self.assertEqual(
+            [s.kind for s in self.index.suggest(('кир',), 10)],
+            ['analog_group'],
+        )
+
+    def test_write_bumps_generation_again_on_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.student.save()
+        generation = cache_generations.current(CACHE_DOMAIN_SEARCH)
+
+        for callback in callbacks:
+            callback()
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertGreater(
+            cache_generations.current(CACHE_DOMAIN_SEARCH),
+            generation,
+        )
+
+    def test_index_is_rebuilt_after_max_age(self):
+        now = [0.0]
+        index = SearchSuggestionIndex(
+            max_age=60,
+            clock=lambda: now[0],
+            start_refresh=refresh_inline,
+        )
+        index.suggest(('кир',), 10)
+        # An edit bypassing every bump, as seen by another process.
+        Student.objects.filter(pk=self.student.pk).update(first_name='Мария')
+
+        with self.assertNumQueries(0):
+            self.assertEqual(index.suggest(('кир',), 10)[0].title, 'Кириллова Анна')
+        now[0] = 60
+
+        self.assertEqual(index.suggest(('кир',), 10)[0].title, 'Кириллова Мария')
+
+    def test_stale_lookups_serve_old_bank_while_one_refresh_runs(self):
+        # Bank scale: the task loader yields as many titles as a full bank.
+        bank = [
+            SearchSuggestion(kind='task', pk=str(number), title=f'Задача {number}')
+            for number in range(BANK_SIZE)
+        ]
+        loads = []
+
+        def load_bank():
+            loads.append(len(bank))
+            return iter(bank)
+
+        pending = []
+        index = SearchSuggestionIndex(start_refresh=pending.append)
+        with mock.patch.dict(_SUGGESTION_LOADERS, task=load_bank):
+            self.assertEqual(len(index.suggest(('задача',), 5)), 5)
+            bank.append(SearchSuggestion(kind='task', pk='new', title='Кирпич'))
+            Student.objects.filter(pk=self.student.pk).update(first_name='Мария')
+            cache_generations.bump(CACHE_DOMAIN_SEARCH)
+
+            with self.assertNumQueries(0):
+                for _ in range(3):
+                    stale = index.suggest(('кир',), 10)
+            self.assertEqual(
+                [s.title for s in stale],
+                ['Кириллова Анна'],
+            )
+            self.assertEqual(loads, [BANK_SIZE])
+            self.assertEqual(len(pending), 1)
+
+            pending.pop()()
+
+            self.assertEqual(
+                [s.title for s in index.suggest(('кир',), 10)],
+                ['Кириллова Мария', 'Кирпич'],
+            )
+        self.assertEqual(loads, [BANK_SIZE, BANK_SIZE + 1])
+        self.assertEqual(pending, [])
+
+
+class SearchSuggestionsViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        container.search_suggestion_index.clear()
+        self.addCleanup(container.search_suggestion_index.clear)
+
+    def test_returns_json_suggestions_with_links(self):
+        work = Work.objects.create(name='Диагностика')
+        event = Event.objects.create(
+            name='Диагностика 8А',
+            work=work,
+            planned_date=timezone.now(),
+        )
+
+        response = self.client.get(
+            reverse('core:search-suggestions'),
+            {'q': 'диаг'},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['query'], 'диаг')
+        self.assertEqual(
+            [(item['kind_label'], item['url']) for item in data['suggestions']],
+            [
+                ('Событие', reverse('events:detail', args=[event.pk])),
+                ('Работа', reverse('works:detail', args=[work.pk])),
+            ],
+        )
+        self.assertEqual(
+            self.client.get(
+                reverse('core:search-suggestions'),
+                {'q': 'д'},
+            ).json()['suggestions'],
+            [],
+        )
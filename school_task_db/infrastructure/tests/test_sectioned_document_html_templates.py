@@ -63,6 +63,7 @@ class SectionedDocumentHtmlTemplateTests(SimpleTestCase):
                         section_type=BLANK_CELLS_SECTION,
                         payload={
                             'title': 'Черновик',
+                            'rows': 2,
                             'columns': 3,
                             'cell_size_mm': 5,
                             'css_max_width_mm': 15,
@@ -202,6 +203,9 @@ class SectionedDocumentHtmlTemplateTests(SimpleTestCase):
             self.assertIn('--grid-columns: 3', html)
             self.assertIn('--grid-cell-size: 5mm', html)
             self.assertIn('--grid-max-width: 15mm', html)
+            self.assertIn('--grid-rows: 2', html)
+            self.assertIn('blank-cells-grid-compact', html)
+            self.assertNotIn('<span></span>', html)
             self.assertIn('width: var(--grid-cell-size)', html)
             self.assertIn('height: var(--grid-cell-size)', html)
             self.assertIn('box-sizing: border-box', html)
@@ -51,7 +51,7 @@ class DjangoStudentImportRepositoryTests(TestCase):
 
         snapshot = (
             DjangoStudentImportSnapshotRepository()
-            .get_student_import_snapshot()
+            .get_student_import_snapshot((_row(),))
         )
 
         self.assertEqual(snapshot.academic_years[0].name, '2026-2027')
@@ -84,6 +84,76 @@ class DjangoStudentImportRepositoryTests(TestCase):
         self.assertEqual(group.academic_year, year)
         self.assertEqual(list(group.students.all()), [student])
 
+    def test_snapshot_loads_only_students_matching_rows(self):
+        by_name = Student.objects.create(last_name='Иванов', first_name='Олег')
+        by_email = Student.objects.create(
+            last_name='Смирнов',
+            first_name='Иван',
+            email='IVANOV@example.test',
+        )
+        other = Student.objects.create(last_name='Петров', first_name='Пётр')
+        group = StudentGroup.objects.create(name='8Б')
+        group.students.add(by_name, other)
+
+        snapshot = (
+            DjangoStudentImportSnapshotRepository()
+            .get_student_import_snapshot((_row(),))
+        )
+
+        self.assertEqual(
+            {student.pk for student in snapshot.students},
+            {str(by_name.pk), str(by_email.pk)},
+        )
+        self.assertEqual(
+            [item.student_id for item in snapshot.memberships],
+            [str(by_name.pk)],
+        )
+        self.assertEqual(snapshot.groups[0].name, '8Б')
+
+    def test_applies_roster_with_constant_queries(self):
+        existing = Student.objects.create(
+            last_name='Ученик 000',
+            first_name='Иван',
+            middle_name='Петрович',
+        )
+        rows = tuple(
+            StudentImportRow(
+                row_number=index + 2,
+                group_name=f'{5 + index % 3}А',
+                academic_year_name='2026-2027',
+                academic_year_start=dt.date(2026, 9, 1),
+                academic_year_end=dt.date(2027, 8, 31),
+                last_name=f'Ученик {index:03d}',
+                first_name='Иван',
+                middle_name='Петрович',
+                email=f'student{index}@example.test',
+            )
+            for index in range(60)
+        )
+        container = Container()
+
+        # Savepoint pair, two candidate lookups, years, groups, memberships,
+        # the year check, the reference version bump for the new year, then
+        # one statement per kind of write.
+        with self.assertNumQueries(14):
+            result = container.import_students_use_case().execute(
+                ImportStudentsRequest(rows=rows),
+            )
+
+        self.assertEqual(result.stats.students_created, 59)
+        self.assertEqual(result.stats.students_updated, 1)
+        self.assertEqual(result.stats.memberships_created, 60)
+        existing.refresh_from_db()
+        self.assertEqual(existing.email, 'student0@example.test')
+        self.assertEqual(Student.objects.count(), 60)
+        self.assertEqual(
+            sorted(
+                (group.name, group.students.count())
+                for group in StudentGroup.objects.all()
+            ),
+            [('5А', 20), ('6А', 20), ('7А', 20)],
+        )
+
     def test_container_wires_separate_snapshot_and_command_adapters(self):
         container = Container()
         use_case = container.import_students_use_case()
@@ -33,7 +33,7 @@ class TaskDocumentImagePayloadFormatterTests(SimpleTestCase):
         self.assertEqual(formatted['right_images'], (image,))
         self.assertEqual(formatted['bottom_images'], ())
         self.assertIn(
-            ('html', 'task_images/diagram.png'),
+            ('html', 'task_images/diagram.png', 448),
             request.build_context['task_image_render_sources'],
         )
 
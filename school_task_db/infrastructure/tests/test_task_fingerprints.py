@@ -0,0 +1,153 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from core_logic.entities.task_import import TaskImportPreviewLookup
+from curriculum.models import Topic
+from infrastructure.repositories.django_task_import_preview_repo import (
+    DjangoTaskImportPreviewRepository,
+)
+from infrastructure.repositories.django_task_similarity_repo import (
+    DjangoTaskSimilarityRepository,
+)
+from infrastructure.services.task_fingerprints import (
+    find_duplicate_task_groups,
+    rebuild_task_fingerprints,
+)
+from task_groups.models import AnalogGroup, TaskGroup
+from tasks.models import Task, TaskFingerprint, TaskFingerprintBucket
+
+ENERGY_TEXT = (
+    'Тело массой $m = 2\\,кг$ движется со скоростью 3,5 м/с. '
+    'Найдите кинетическую энергию тела $E = \\frac{mv^2}{2}$.'
+)
+ENERGY_RETYPED = (
+    'Тело массой $m=2$ кг движется со скоростью 3.5 м/с. '
+    'Найдите кинетическую энергию тела $E=\\frac{m v^2}{2}$'
+)
+RESISTANCE_TEXT = (
+    'Определите сопротивление проводника, если напряжение на нём 12 В, '
+    'а сила тока 2 А.'
+)
+
+
+class TaskFingerprintIndexTests(TestCase):
+    def setUp(self):
+        self.topic = Topic.objects.create(
+            name='Энергия',
+            subject='Физика',
+            section='Механика',
+            grade_level=9,
+        )
+
+    def test_index_follows_task_text_changes(self):
+        task = self._task(ENERGY_TEXT)
+        fingerprint = TaskFingerprint.objects.get(task=task)
+        self.assertEqual(
+            TaskFingerprintBucket.objects.filter(task=task).count(),
+            16,
+        )
+
+        task.difficulty = 3
+        task.save(update_fields=['difficulty'])
+        task.answer = '12,25 Дж'
+        task.save()
+        self.assertEqual(
+            TaskFingerprint.objects.get(task=task).pk,
+            fingerprint.pk,
+        )
+
+        task.text = RESISTANCE_TEXT
+        task.save()
+        self.assertNotEqual(
+            bytes(TaskFingerprint.objects.get(task=task).signature),
+            bytes(fingerprint.signature),
+        )
+
+        task.text = 'См. рисунок'
+        task.save()
+        self.assertFalse(TaskFingerprint.objects.filter(task=task).exists())
+        self.assertFalse(
+            TaskFingerprintBucket.objects.filter(task=task).exists(),
+        )
+
+    def test_similar_tasks_exclude_the_task_itself(self):
+        original = self._task(ENERGY_TEXT)
+        retyped = self._task(ENERGY_RETYPED)
+        self._task(RESISTANCE_TEXT)
+        repo = DjangoTaskSimilarityRepository()
+
+        with self.assertNumQueries(4):
+            similar = repo.get_similar_tasks(
+                original.pk,
+                threshold=0.5,
+                limit=5,
+            )
+
+        self.assertEqual([task.pk for task in similar], [str(retyped.pk)])
+        self.assertEqual(similar[0].topic, 'Энергия')
+        self.assertGreaterEqual(similar[0].similarity, 0.8)
+
+    def test_import_preview_reports_likely_duplicates(self):
+        existing = self._task(ENERGY_TEXT)
+        lookup = TaskImportPreviewLookup(task_texts=(
+            ('#1', ENERGY_RETYPED),
+            ('#2', RESISTANCE_TEXT),
+            (str(existing.pk), ENERGY_TEXT),
+        ))
+
+        facts = DjangoTaskImportPreviewRepository().get_facts(lookup)
+
+        self.assertEqual(list(facts.similar_tasks), ['#1'])
+        self.assertEqual(facts.similar_tasks['#1'][0].pk, str(existing.pk))
+
+    def test_duplicate_groups_skip_analog_variants_by_default(self):
+        original = self._task(ENERGY_TEXT)
+        retyped = self._task(ENERGY_RETYPED)
+        variant = self._task(ENERGY_TEXT.replace('3,5', '7'))
+        self._task(RESISTANCE_TEXT)
+        group = AnalogGroup.objects.create(name='Кинетическая энергия')
+        TaskGroup.objects.create(task=original, group=group)
+        TaskGroup.objects.create(task=variant, group=group)
+
+        clusters = find_duplicate_task_groups(threshold=0.8)
+
+        self.assertEqual(len(clusters), 1)
+        task_ids, similarity = clusters[0]
+        self.assertIn(original.pk, task_ids)
+        self.assertIn(retyped.pk, task_ids)
+        self.assertGreaterEqual(similarity, 0.8)
+
+        with_analogs = find_duplicate_task_groups(
+            threshold=0.5,
+            include_analogs=True,
+        )
+        self.assertEqual(
+            set(with_analogs[0][0]),
+            {original.pk, retyped.pk, variant.pk},
+        )
+
+    def test_rebuild_and_command_report_duplicate_groups(self):
+        original = self._task(ENERGY_TEXT)
+        self._task(ENERGY_RETYPED)
+        TaskFingerprint.objects.all().delete()
+        TaskFingerprintBucket.objects.all().delete()
+
+        self.assertEqual(rebuild_task_fingerprints(batch_size=1), 2)
+        stdout = StringIO()
+        call_command('find_duplicate_tasks', stdout=stdout)
+
+        output = stdout.getvalue()
+        self.assertIn('Группа 1: заданий 2', output)
+        self.assertIn(f'[{original.get_short_uuid()}] Энергия', output)
+        self.assertIn('Групп дубликатов: 1, заданий в них: 2', output)
+
+    def _task(self, text):
+        return Task.objects.create(
+            text=text,
+            answer='Ответ',
+            topic=self.topic,
+            task_type='computational',
+            difficulty=2,
+        )
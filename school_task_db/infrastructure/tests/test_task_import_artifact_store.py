@@ -0,0 +1,70 @@
+import os
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from core_logic.entities.core import ImportJsonValidationData
+from core_logic.entities.task_import import TaskImportArtifact
+from infrastructure.services.task_import_artifact_store import (
+    FileTaskImportArtifactStore,
+)
+
+
+class FileTaskImportArtifactStoreTests(TestCase):
+    def setUp(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.directory = Path(temp_dir.name)
+        self.store = FileTaskImportArtifactStore(
+            directory=self.directory,
+            max_age=60,
+        )
+
+    def _artifact(self, content_hash='a1b2'):
+        return TaskImportArtifact(
+            content_hash=content_hash,
+            data={'tasks': [{'text': 'Задание'}]},
+            validation=ImportJsonValidationData(
+                warnings=['Задание #1: нет ответа'],
+                summary={'tasks_total': 1},
+            ),
+        )
+
+    def _age(self, content_hash, seconds):
+        path = self.directory / f'{content_hash}.pickle'
+        stamp = time.time() - seconds
+        os.utime(path, (stamp, stamp))
+
+    def test_round_trips_artifact_by_content_hash(self):
+        self.store.save(self._artifact())
+
+        self.assertEqual(self.store.load('a1b2'), self._artifact())
+        self.assertIsNone(self.store.load('c3d4'))
+
+    def test_expired_artifact_is_dropped(self):
+        self.store.save(self._artifact())
+        self._age('a1b2', 61)
+
+        self.assertIsNone(self.store.load('a1b2'))
+        self.assertEqual(list(self.directory.iterdir()), [])
+
+    def test_save_purges_other_expired_artifacts(self):
+        self.store.save(self._artifact('old'))
+        self._age('old', 61)
+
+        self.store.save(self._artifact('new'))
+
+        self.assertEqual(
+            sorted(path.name for path in self.directory.iterdir()),
+            ['new.pickle'],
+        )
+
+    def test_corrupt_artifact_reads_as_missing(self):
+        (self.directory / 'a1b2.pickle').write_bytes(b'not a pickle')
+
+        self.assertIsNone(self.store.load('a1b2'))
+
+    def test_rejects_hash_that_is_not_a_file_name(self):
+        with self.assertRaises(ValueError):
+            self.store.load('../a1b2')
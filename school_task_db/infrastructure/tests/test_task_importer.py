@@ -1,7 +1,9 @@
 import base64
+from io import BytesIO
 from tempfile import TemporaryDirectory
 
 from django.test import TestCase
+from PIL import Image
 
 from codifier.models import CodifierSpec, ContentEntry, Requirement
 from core_logic.entities.task import TaskExportFilters
@@ -20,7 +22,7 @@ from infrastructure.services.django_transaction_manager import (
     DjangoTransactionManager,
 )
 from task_groups.models import AnalogGroup, TaskGroup
-from tasks.models import Source, Task, TaskImage
+from tasks.models import ImageAsset, Source, Task, TaskImage
 
 
 class TaskImporterTests(TestCase):
@@ -305,6 +307,88 @@ class TaskImporterTests(TestCase):
             with image.asset.file.open('rb') as imported_file:
                 self.assertEqual(imported_file.read(), b'original')
 
+    def test_identical_images_share_asset_and_corrupt_image_is_skipped(self):
+        task_id = '550e8400-e29b-41d4-a716-446655440001'
+        payload = self._task_payload(
+            task_id=task_id,
+            group_id='770e8400-e29b-41d4-a716-446655440001',
+        )
+        content = BytesIO()
+        Image.new('RGB', (4, 4), 'white').save(content, format='PNG')
+        png = content.getvalue()
+        payload['task_images'] = [
+            {
+                'id': f'990e8400-e29b-41d4-a716-44665544000{index}',
+                'task_id': task_id,
+                'filename': f'figure-{index}.png',
+                'base64_data': base64.b64encode(data).decode('ascii'),
+                'position': 'bottom_70',
+            }
+            for index, data in enumerate((png, png, png[:40]), start=1)
+        ]
+
+        with TemporaryDirectory() as media_root, self.settings(MEDIA_ROOT=media_root):
+            result = self._import(payload)
+
+            images = TaskImage.objects.filter(task_id=task_id)
+            self.assertEqual(images.count(), 2)
+            self.assertEqual(len({image.asset_id for image in images}), 1)
+            self.assertEqual(ImageAsset.objects.count(), 1)
+            self.assertTrue(any(
+                'Повреждённое изображение figure-3.png' in message
+                for message in result.error_messages
+            ))
+
+    def test_images_are_ingested_and_stored_in_bounded_chunks(self):
+        task_id = '550e8400-e29b-41d4-a716-446655440001'
+        payload = self._task_payload(
+            task_id=task_id,
+            group_id='770e8400-e29b-41d4-a716-446655440001',
+        )
+        payload['task_images'] = [
+            {
+                'id': f'990e8400-e29b-41d4-a716-44665544000{index}',
+                'task_id': task_id,
+                'filename': f'figure-{index}.bin',
+                'base64_data': base64.b64encode(
+                    f'image-{index}'.encode('ascii'),
+                ).decode('ascii'),
+            }
+            for index in range(1, 6)
+        ]
+        session = DjangoTaskImportWriteSession(
+            mode='update',
+            create_missing=True,
+            output=lambda _message: None,
+        )
+        image_importer = session.image_importer
+        image_importer.chunk_size = 2
+        store_many = image_importer.asset_store.get_or_create_many
+        stored_batches = []
+
+        def record_batch(images, **kwargs):
+            images = list(images)
+            stored_batches.append(len(images))
+            return store_many(images, **kwargs)
+
+        image_importer.asset_store.get_or_create_many = record_batch
+
+        with TemporaryDirectory() as media_root, self.settings(MEDIA_ROOT=media_root):
+            ApplyTaskImportUseCase(
+                write_session=session,
+                transaction_manager=DjangoTransactionManager(),
+            ).execute(TaskImportRequest(
+                data=payload,
+                filename='test-task-bank.json',
+                file_size=0,
+                mode='update',
+                create_missing=True,
+            ))
+
+            self.assertEqual(stored_batches, [2, 2, 1])
+            self.assertEqual(TaskImage.objects.filter(task_id=task_id).count(), 5)
+            self.assertEqual(ImageAsset.objects.count(), 5)
+
     def test_catalog_source_is_resolved_and_updated_for_task(self):
         task_id = '550e8400-e29b-41d4-a716-446655440001'
         source_id = '880e8400-e29b-41d4-a716-446655440001'
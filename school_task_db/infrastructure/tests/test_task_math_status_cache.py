@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from types import SimpleNamespace
 from unittest.mock import patch
 
@@ -19,8 +20,18 @@ class DjangoTaskMathStatusCacheTests(TestCase):
         cache.clear()
 
     def test_cache_stats_returns_typed_aggregate(self):
-        cache.set(DjangoTaskMathStatusCache.CACHE_KEY_WITH_MATH, {'task-1'})
-        cache.set(DjangoTaskMathStatusCache.CACHE_KEY_WITH_ERRORS, set())
+        cache.set(
+            DjangoTaskMathStatusCache.get_aggregate_cache_key(
+                DjangoTaskMathStatusCache.CACHE_KEY_WITH_MATH
+            ),
+            {'task-1'},
+        )
+        cache.set(
+            DjangoTaskMathStatusCache.get_aggregate_cache_key(
+                DjangoTaskMathStatusCache.CACHE_KEY_WITH_ERRORS
+            ),
+            set(),
+        )
 
         stats = DjangoTaskMathStatusCache.get_cache_stats()
 
@@ -85,22 +96,41 @@ class DjangoTaskMathStatusCacheTests(TestCase):
         self.assertEqual(math_task_ids, frozenset({str(formula_task.id)}))
         self.assertEqual(error_task_ids, frozenset())
 
-    def test_invalidates_single_and_aggregate_cache_separately(self):
-        task_key = DjangoTaskMathStatusCache.get_task_cache_key('task-1')
-        cache.set(task_key, {'has_math': True})
-        cache.set(DjangoTaskMathStatusCache.CACHE_KEY_ALL_MATH, {'cached': True})
-
-        DjangoTaskMathStatusCache.invalidate_task_cache('task-1')
+    @patch(
+        'infrastructure.services.task_math_status_cache.formula_processor'
+    )
+    def test_task_key_follows_task_revision(self, formula_processor):
+        formula_processor.has_math.return_value = False
+        first_revision = datetime(2025, 9, 1, tzinfo=timezone.utc)
+        second_revision = datetime(2025, 9, 2, tzinfo=timezone.utc)
+        task = SimpleNamespace(id='task-1', text='x', updated_at=first_revision)
+
+        DjangoTaskMathStatusCache.get_task_math_status(task)
+        task.updated_at = second_revision
+        DjangoTaskMathStatusCache.get_task_math_status(task)
+
+        self.assertEqual(formula_processor.has_math.call_count, 2)
+        self.assertNotEqual(
+            DjangoTaskMathStatusCache.get_task_cache_key('task-1', first_revision),
+            DjangoTaskMathStatusCache.get_task_cache_key('task-1', second_revision),
+        )
 
-        self.assertIsNone(cache.get(task_key))
-        self.assertIsNotNone(
-            cache.get(DjangoTaskMathStatusCache.CACHE_KEY_ALL_MATH)
+    def test_invalidate_all_cache_switches_aggregate_generation(self):
+        all_math_key = DjangoTaskMathStatusCache.get_aggregate_cache_key(
+            DjangoTaskMathStatusCache.CACHE_KEY_ALL_MATH
         )
+        cache.set(all_math_key, {'cached': True})
 
         DjangoTaskMathStatusCache.invalidate_all_cache()
 
-        self.assertIsNone(
-            cache.get(DjangoTaskMathStatusCache.CACHE_KEY_ALL_MATH)
+        self.assertNotEqual(
+            all_math_key,
+            DjangoTaskMathStatusCache.get_aggregate_cache_key(
+                DjangoTaskMathStatusCache.CACHE_KEY_ALL_MATH
+            ),
+        )
+        self.assertFalse(
+            DjangoTaskMathStatusCache.get_cache_stats().all_status_cached
         )
 
     @patch(
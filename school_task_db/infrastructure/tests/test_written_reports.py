@@ -1,5 +1,7 @@
 import datetime as dt
+from io import StringIO
 
+from django.core.management import call_command
 from django.test import TestCase
 from django.urls import reverse
 from django.utils import timezone
@@ -38,6 +40,7 @@ from infrastructure.tests.variant_task_factory import (
     capture_attempt_snapshot,
     create_variant_task,
 )
+from reports.models import CourseTimelineEntryModel, StudentDigestEntryModel
 from students.models import Student, StudentGroup
 from tasks.models import Task
 from works.models import Variant, Work
@@ -389,6 +392,64 @@ class WrittenReportRepositoryTests(TestCase):
         self.assertEqual(result.status, 'saved')
         self.assertEqual(source.narrative.planned_actions, 'Консультация')
 
+    def test_graded_event_report_source_is_served_from_cache(self):
+        repo = DjangoEventPerformanceReportQueryRepository()
+        first = repo.get_event_report_source(str(self.event.pk))
+
+        # Event lookup and latest revision set only.
+        with self.assertNumQueries(2):
+            cached = repo.get_event_report_source(str(self.event.pk))
+
+        self.assertEqual(cached, first)
+
+    def test_cached_event_report_follows_new_attempt_revision(self):
+        repo = DjangoEventPerformanceReportQueryRepository()
+        repo.get_event_report_source(str(self.event.pk))
+        self.mark.score = 4
+        self.mark.save()
+        capture_attempt_snapshot(self.mark)
+
+        source = repo.get_event_report_source(str(self.event.pk))
+
+        self.assertEqual(source.participants[0].score, 4)
+
+    def test_cached_event_report_is_reset_by_narrative_and_event_saves(self):
+        repo = DjangoEventPerformanceReportQueryRepository()
+        repo.get_event_report_source(str(self.event.pk))
+        DjangoEventReportNarrativeCommandRepository().save_event_report_narrative(
+            SaveEventReportNarrativeParams(
+                event_id=str(self.event.pk),
+                narrative=EventReportNarrative(planned_actions='Консультация'),
+            )
+        )
+
+        after_narrative = repo.get_event_report_source(str(self.event.pk))
+        self.event.status = 'closed'
+        self.event.save()
+        after_close = repo.get_event_report_source(str(self.event.pk))
+
+        self.assertEqual(
+            after_narrative.narrative.planned_actions,
+            'Консультация',
+        )
+        self.assertEqual(after_close.event.status, 'closed')
+
+    def test_event_report_under_review_is_always_rebuilt(self):
+        self.event.status = 'reviewing'
+        self.event.save()
+        repo = DjangoEventPerformanceReportQueryRepository()
+        repo.get_event_report_source(str(self.event.pk))
+        EventParticipation.objects.filter(
+            pk=self.absent_participation.pk,
+        ).update(status='graded')
+
+        source = repo.get_event_report_source(str(self.event.pk))
+
+        self.assertEqual(
+            [participant.status for participant in source.participants],
+            ['graded', 'graded'],
+        )
+
     def test_event_report_uses_variant_task_metadata_snapshot(self):
         self.requirement.code = '9.7'
         self.requirement.save(update_fields=['code'])
@@ -509,6 +570,89 @@ class WrittenReportRepositoryTests(TestCase):
         self.assertEqual(graded.task_comments, ('Ошибка в формуле',))
         self.assertEqual(absent.status, 'absent')
 
+    def test_student_digest_window_reads_precomputed_entries(self):
+        repo = DjangoStudentDigestRepository()
+
+        # Group, its students and one range scan over digest rows.
+        with self.assertNumQueries(3):
+            source = repo.get_student_digest_source(
+                str(self.group.pk),
+                start_date=dt.date(2026, 10, 13),
+                end_date=dt.date(2026, 10, 19),
+            )
+
+        self.assertEqual(
+            StudentDigestEntryModel.objects.filter(
+                event=self.event,
+            ).count(),
+            2,
+        )
+        self.assertEqual(source.students[0].entries[0].score, 2)
+        self.assertEqual(source.students[1].entries[0].status, 'absent')
+
+    def test_student_digest_entries_follow_event_and_status_edits(self):
+        repo = DjangoStudentDigestRepository()
+        self.event.planned_date += dt.timedelta(days=7)
+        self.event.save(update_fields=['planned_date'])
+        self.absent_participation.status = 'assigned'
+        self.absent_participation.save(update_fields=['status'])
+
+        old_week = repo.get_student_digest_source(
+            str(self.group.pk),
+            start_date=dt.date(2026, 10, 13),
+            end_date=dt.date(2026, 10, 19),
+        )
+        new_week = repo.get_student_digest_source(
+            str(self.group.pk),
+            start_date=dt.date(2026, 10, 20),
+            end_date=dt.date(2026, 10, 26),
+        )
+
+        self.assertEqual(old_week.students[0].entries, ())
+        self.assertEqual(len(new_week.students[0].entries), 1)
+        self.assertEqual(
+            new_week.students[0].entries[0].planned_date,
+            self.attempt.event_date_snapshot.date(),
+        )
+        self.assertEqual(new_week.students[1].entries, ())
+
+    def test_render_student_digests_command_renders_each_group(self):
+        StudentGroup.objects.create(name='9Б', academic_year=self.year)
+        StudentDigestEntryModel.objects.all().delete()
+        stdout = StringIO()
+
+        call_command(
+            'render_student_digests',
+            start=dt.date(2026, 10, 13),
+            end=dt.date(2026, 10, 19),
+            renderer='html',
+            rebuild_entries=True,
+            stdout=stdout,
+        )
+
+        output = stdout.getvalue()
+        self.assertIn('Rebuilt 2 digest entries', output)
+        self.assertIn('Created html document for 9А', output)
+        self.assertIn('Skipped 9Б: no entries', output)
+        self.assertIn('Rendered 1 of 2 groups', output)
+
+    def test_rebuild_report_projections_command_refills_projected_rows(self):
+        digests = StudentDigestEntryModel.objects.count()
+        timeline = CourseTimelineEntryModel.objects.count()
+        StudentDigestEntryModel.objects.all().delete()
+        CourseTimelineEntryModel.objects.all().delete()
+        stdout = StringIO()
+
+        call_command('rebuild_report_projections', batch_size=1, stdout=stdout)
+
+        self.assertEqual(StudentDigestEntryModel.objects.count(), digests)
+        self.assertEqual(CourseTimelineEntryModel.objects.count(), timeline)
+        self.assertGreater(timeline, 0)
+        self.assertIn(
+            f'Строк дайджестов: {digests}, точек динамики: {timeline}',
+            stdout.getvalue(),
+        )
+
     def test_event_report_view_renders_and_saves_written_sections(self):
         response = self.client.get(
             reverse('reports:event-performance', args=[self.event.pk]),
@@ -0,0 +1,33 @@
+"""Команда пересчёта строк дайджестов и динамики курса по участиям"""
+
+from django.core.management.base import BaseCommand
+
+from infrastructure.services.participation_projections import (
+    rebuild_participation_projections,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Пересчёт строк дайджестов учеников и точек динамики курса '
+        'по последним попыткам всех участий'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Сколько участий пересчитывать за один проход',
+        )
+
+    def handle(self, *args, **options):
+        written = rebuild_participation_projections(
+            batch_size=options['batch_size'],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'✅ Строк дайджестов: {written["digest"]}, '
+                f'точек динамики: {written["timeline"]}'
+            )
+        )
@@ -0,0 +1,105 @@
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core_logic.entities.document_rendering import (
+    DOCUMENT_RENDER_STATUS_EMPTY,
+    DOCUMENT_RENDER_STATUS_GENERATED,
+)
+from core_logic.entities.student_digest import StudentDigestRequest
+from core_logic.use_cases.render_student_digest_document import (
+    RenderStudentDigestDocumentRequest,
+)
+from core_logic.value_objects.document_render_options import RenderTarget
+from infrastructure.container import container
+from infrastructure.services.participation_projections import (
+    rebuild_participation_projections,
+)
+from works.management.commands._document_rendering import (
+    write_work_document_render_result,
+)
+
+
+class Command(BaseCommand):
+    help = 'Render weekly student digests for every group in one batch'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--start',
+            type=date.fromisoformat,
+            help='First day of the period (default: six days before --end)',
+        )
+        parser.add_argument(
+            '--end',
+            type=date.fromisoformat,
+            help='Last day of the period (default: today)',
+        )
+        parser.add_argument(
+            '--group',
+            action='append',
+            default=[],
+            help='Render only this group ID (may be repeated)',
+        )
+        parser.add_argument(
+            '--renderer',
+            choices=['html', 'latex', 'pdf'],
+            default='pdf',
+        )
+        parser.add_argument(
+            '--rebuild-entries',
+            action='store_true',
+            help='Recompute precomputed digest rows before rendering',
+        )
+
+    def handle(self, *args, **options):
+        end_date = options['end'] or date.today()
+        start_date = options['start'] or end_date - timedelta(days=6)
+        if start_date > end_date:
+            raise CommandError('--start must not be later than --end')
+        if options['rebuild_entries']:
+            written = rebuild_participation_projections()
+            self.stdout.write(
+                f'Rebuilt {written["digest"]} digest entries and '
+                f'{written["timeline"]} timeline entries'
+            )
+
+        groups = container.get_student_digests_use_case().execute(
+            StudentDigestRequest(start_date=start_date, end_date=end_date),
+        ).groups
+        if options['group']:
+            requested = set(options['group'])
+            groups = [group for group in groups if group.pk in requested]
+            missing = requested - {group.pk for group in groups}
+            if missing:
+                raise CommandError(
+                    f'Group not found: {", ".join(sorted(missing))}'
+                )
+
+        render_use_case = container.render_student_digest_document_use_case()
+        rendered = 0
+        for group in groups:
+            result = render_use_case.execute(
+                RenderStudentDigestDocumentRequest(
+                    digest_request=StudentDigestRequest(
+                        group_id=group.pk,
+                        start_date=start_date,
+                        end_date=end_date,
+                    ),
+                    render_target=RenderTarget(
+                        renderer_type=options['renderer'],
+                    ),
+                )
+            )
+            if result.status == DOCUMENT_RENDER_STATUS_EMPTY:
+                self.stdout.write(f'Skipped {group.name}: no entries')
+                continue
+            if result.status != DOCUMENT_RENDER_STATUS_GENERATED:
+                raise CommandError(
+                    f'Digest render failed for {group.name}: {result.status}'
+                )
+            write_work_document_render_result(self, result)
+            rendered += 1
+        self.stdout.write(
+            f'Rendered {rendered} of {len(groups)} groups '
+            f'for {start_date:%d.%m.%Y}–{end_date:%d.%m.%Y}'
+        )
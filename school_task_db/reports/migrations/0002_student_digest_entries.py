@@ -0,0 +1,51 @@
+# Generated by Django 5.2.3 on 2026-10-19 17:10
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+# Schema only: digest rows are projected by the live snapshot rules, so
+# existing participations are filled with `manage.py rebuild_report_projections`.
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0008_attempttasksnapshot_source_selection_name_snapshot'),
+        ('reports', '0001_initial'),
+        ('students', '0006_delete_studenttasklog'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StudentDigestEntryModel',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Создано')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Обновлено')),
+                ('window_date', models.DateField(verbose_name='Дата события для выборки периода')),
+                ('event_planned_at', models.DateTimeField(verbose_name='Плановое время события')),
+                ('planned_date', models.DateField(verbose_name='Дата события (снимок)')),
+                ('event_name', models.CharField(max_length=200, verbose_name='Событие (снимок)')),
+                ('work_name', models.CharField(max_length=200, verbose_name='Работа (снимок)')),
+                ('subject', models.CharField(blank=True, max_length=100, verbose_name='Предмет')),
+                ('status', models.CharField(max_length=20, verbose_name='Статус')),
+                ('score', models.PositiveIntegerField(blank=True, null=True, verbose_name='Оценка')),
+                ('points', models.FloatField(blank=True, null=True, verbose_name='Баллы')),
+                ('max_points', models.FloatField(blank=True, null=True, verbose_name='Максимум баллов')),
+                ('teacher_comment', models.TextField(blank=True, verbose_name='Комментарий учителя')),
+                ('mistakes_analysis', models.TextField(blank=True, verbose_name='Анализ ошибок')),
+                ('recommendations', models.TextField(blank=True, verbose_name='Рекомендации')),
+                ('needs_attention', models.BooleanField(default=False, verbose_name='Требует внимания')),
+                ('task_results', models.JSONField(blank=True, default=list, verbose_name='Результаты по заданиям')),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='digest_entries', to='events.event', verbose_name='Событие')),
+                ('participation', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='digest_entry', to='events.eventparticipation', verbose_name='Участие')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='digest_entries', to='students.student', verbose_name='Ученик')),
+            ],
+            options={
+                'verbose_name': 'Строка дайджеста ученика',
+                'verbose_name_plural': 'Строки дайджестов учеников',
+                'indexes': [models.Index(fields=['student', 'window_date'], name='digest_entry_student_window')],
+            },
+        ),
+    ]
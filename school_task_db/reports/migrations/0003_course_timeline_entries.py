@@ -0,0 +1,42 @@
+# Generated by Django 5.2.3 on 2026-10-19 17:36
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+# Schema only: timeline rows are projected by the live snapshot rules, so
+# existing participations are filled with `manage.py rebuild_report_projections`.
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0008_attempttasksnapshot_source_selection_name_snapshot'),
+        ('reports', '0002_student_digest_entries'),
+        ('students', '0006_delete_studenttasklog'),
+        ('works', '0018_replace_blank_rows_with_area'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CourseTimelineEntryModel',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Создано')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Обновлено')),
+                ('event_name', models.CharField(max_length=200, verbose_name='Событие')),
+                ('event_planned_at', models.DateTimeField(verbose_name='Плановое время события')),
+                ('points', models.FloatField(default=0, verbose_name='Баллы')),
+                ('max_points', models.FloatField(default=0, verbose_name='Максимум баллов')),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='timeline_entries', to='events.event', verbose_name='Событие')),
+                ('participation', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='timeline_entry', to='events.eventparticipation', verbose_name='Участие')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='timeline_entries', to='students.student', verbose_name='Ученик')),
+                ('work', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='timeline_entries', to='works.work', verbose_name='Работа')),
+            ],
+            options={
+                'verbose_name': 'Точка динамики курса',
+                'verbose_name_plural': 'Точки динамики курса',
+                'indexes': [models.Index(fields=['student', 'work'], name='timeline_entry_student_work')],
+            },
+        ),
+    ]
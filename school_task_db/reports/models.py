@@ -23,3 +23,114 @@ class EventReportNarrativeModel(BaseModel):
 
     def __str__(self):
         return f'Отчёт: {self.event.name}'
+
+
+class StudentDigestEntryModel(BaseModel):
+    """Precomputed digest row for one participation's latest checked attempt.
+
+    Rows are rebuilt whenever an attempt is captured or the participation or
+    its event changes, so a digest window is a range scan over
+    ``(student, window_date)`` without decoding attempt snapshots.
+    """
+
+    participation = models.OneToOneField(
+        'events.EventParticipation',
+        on_delete=models.CASCADE,
+        related_name='digest_entry',
+        verbose_name='Участие',
+    )
+    student = models.ForeignKey(
+        'students.Student',
+        on_delete=models.CASCADE,
+        related_name='digest_entries',
+        verbose_name='Ученик',
+    )
+    event = models.ForeignKey(
+        'events.Event',
+        on_delete=models.CASCADE,
+        related_name='digest_entries',
+        verbose_name='Событие',
+    )
+    window_date = models.DateField('Дата события для выборки периода')
+    event_planned_at = models.DateTimeField('Плановое время события')
+    planned_date = models.DateField('Дата события (снимок)')
+    event_name = models.CharField('Событие (снимок)', max_length=200)
+    work_name = models.CharField('Работа (снимок)', max_length=200)
+    subject = models.CharField('Предмет', max_length=100, blank=True)
+    status = models.CharField('Статус', max_length=20)
+    score = models.PositiveIntegerField('Оценка', null=True, blank=True)
+    points = models.FloatField('Баллы', null=True, blank=True)
+    max_points = models.FloatField('Максимум баллов', null=True, blank=True)
+    teacher_comment = models.TextField('Комментарий учителя', blank=True)
+    mistakes_analysis = models.TextField('Анализ ошибок', blank=True)
+    recommendations = models.TextField('Рекомендации', blank=True)
+    needs_attention = models.BooleanField('Требует внимания', default=False)
+    task_results = models.JSONField(
+        'Результаты по заданиям',
+        default=list,
+        blank=True,
+    )
+
+    class Meta:
+        verbose_name = 'Строка дайджеста ученика'
+        verbose_name_plural = 'Строки дайджестов учеников'
+        indexes = [
+            models.Index(
+                fields=['student', 'window_date'],
+                name='digest_entry_student_window',
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.event_name} · {self.planned_date}'
+
+
+class CourseTimelineEntryModel(BaseModel):
+    """Points of one participation's latest attempt in a graded event.
+
+    Rows are maintained together with digest rows, so a course timeline is
+    one grouped query over ``(student, work)`` instead of resolving the
+    latest attempt of every participation on each view.
+    """
+
+    participation = models.OneToOneField(
+        'events.EventParticipation',
+        on_delete=models.CASCADE,
+        related_name='timeline_entry',
+        verbose_name='Участие',
+    )
+    student = models.ForeignKey(
+        'students.Student',
+        on_delete=models.CASCADE,
+        related_name='timeline_entries',
+        verbose_name='Ученик',
+    )
+    work = models.ForeignKey(
+        'works.Work',
+        on_delete=models.CASCADE,
+        related_name='timeline_entries',
+        verbose_name='Работа',
+    )
+    event = models.ForeignKey(
+        'events.Event',
+        on_delete=models.CASCADE,
+        related_name='timeline_entries',
+        verbose_name='Событие',
+    )
+    event_name = models.CharField('Событие', max_length=200)
+    event_planned_at = models.DateTimeField('Плановое время события')
+    points = models.FloatField('Баллы', default=0)
+    max_points = models.FloatField('Максимум баллов', default=0)
+
+    class Meta:
+        verbose_name = 'Точка динамики курса'
+        verbose_name_plural = 'Точки динамики курса'
+        indexes = [
+            models.Index(
+                fields=['student', 'work'],
+                name='timeline_entry_student_work',
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.event_name}: {self.points}/{self.max_points}'
@@ -37,38 +37,44 @@ def _merge_layout(base, custom):
 
 # ─── Heatmap ──────────────────────────────────────────────────
 
+def _heatmap_grade_text(val):
+    if val >= 4.5:
+        return '⭐ Отлично'
+    if val >= 3.5:
+        return '✅ Хорошо'
+    if val >= 2.5:
+        return '⚠️ Удовл.'
+    return '❌ Неудовл.'
+
+
+def _heatmap_hover(student, group, val):
+    if val is None:
+        return f'<b>{student}</b><br>{group}<br>Нет данных'
+    return (
+        f'<b>{student}</b><br>{group}'
+        f'<br>Балл: <b>{val:.1f}</b>'
+        f'<br>{_heatmap_grade_text(val)}'
+    )
+
+
 def heatmap_config(students, groups, matrix, title=''):
-    """Тепловая карта: X — ученики, Y — темы"""
-    t_matrix = []
-    t_hover = []
-
-    for j in range(len(groups)):
-        z_row = []
-        hover_row = []
-        for i in range(len(students)):
-            val = matrix[i][j]
-            if val is None:
-                z_row.append(0)
-                hover_row.append(
-                    f'<b>{students[i]}</b><br>{groups[j]}<br>Нет данных'
-                )
-            else:
-                z_row.append(val)
-                if val >= 4.5:
-                    grade_text = '⭐ Отлично'
-                elif val >= 3.5:
-                    grade_text = '✅ Хорошо'
-                elif val >= 2.5:
-                    grade_text = '⚠️ Удовл.'
-                else:
-                    grade_text = '❌ Неудовл.'
-                hover_row.append(
-                    f'<b>{students[i]}</b><br>{groups[j]}'
-                    f'<br>Балл: <b>{val:.1f}</b>'
-                    f'<br>{grade_text}'
-                )
-        t_matrix.append(z_row)
-        t_hover.append(hover_row)
+    """Тепловая карта: X — ученики, Y — темы.
+
+    ``matrix`` задаётся по ученикам (строка на ученика) и транспонируется
+    одним проходом через ``zip``.
+    """
+    columns = list(zip(*matrix)) or [() for _ in groups]
+    t_matrix = [
+        [0 if val is None else val for val in column]
+        for column in columns
+    ]
+    t_hover = [
+        [
+            _heatmap_hover(student, group, val)
+            for student, val in zip(students, column)
+        ]
+        for group, column in zip(groups, columns)
+    ]
 
     return {
         'data': [{
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.3 on 2026-10-19 18:44
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0009_attemptsnapshot_is_latest'),
+        ('review', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReviewDraft',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Создано')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Обновлено')),
+                ('task_scores', models.JSONField(blank=True, default=dict, help_text='{"score_key": {"points": 2, "comment": "..."}}', verbose_name='Баллы по заданиям')),
+                ('participation', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='review_draft', to='events.eventparticipation', verbose_name='Участие в событии')),
+            ],
+            options={
+                'verbose_name': 'Черновик проверки',
+                'verbose_name_plural': 'Черновики проверки',
+            },
+        ),
+    ]
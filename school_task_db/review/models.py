@@ -41,3 +41,26 @@ class ReviewComment(BaseModel):
     
     def __str__(self):
         return f"[{self.get_category_display()}] {self.text[:50]}..."
+
+
+class ReviewDraft(BaseModel):
+    """Автосохранённые баллы по заданиям до сохранения проверки"""
+    participation = models.OneToOneField(
+        'events.EventParticipation',
+        on_delete=models.CASCADE,
+        related_name='review_draft',
+        verbose_name='Участие в событии',
+    )
+    task_scores = models.JSONField(
+        'Баллы по заданиям',
+        default=dict,
+        blank=True,
+        help_text='{"score_key": {"points": 2, "comment": "..."}}',
+    )
+
+    class Meta:
+        verbose_name = 'Черновик проверки'
+        verbose_name_plural = 'Черновики проверки'
+
+    def __str__(self):
+        return f"Черновик проверки {self.participation_id}"
@@ -7,7 +7,8 @@ from django.utils import timezone
 from curriculum.models import Topic
 from events.models import AttemptSnapshot, Event, EventParticipation, Mark
 from infrastructure.tests.variant_task_factory import create_variant_task
-from review.models import ReviewComment, ReviewSession
+from infrastructure.services.review_queue_cache import review_queue_cache
+from review.models import ReviewComment, ReviewDraft, ReviewSession
 from students.models import Student
 from task_groups.models import AnalogGroup, TaskGroup
 from tasks.models import Task
@@ -125,6 +126,13 @@ class ParticipationReviewViewTests(TestCase):
         self.assertEqual(response.context['current_position'], 1)
         self.assertEqual(response.context['total_positions'], 2)
         self.assertEqual(response.context['navigation_progress'], 50)
+        self.assertEqual(
+            response.context['grading_rules']['task_max_points'],
+            {
+                response.context['tasks_with_scores'][0].score_key: 2,
+            },
+        )
+        self.assertContains(response, 'id="grading-rules"')
 
     def test_dashboard_uses_review_summary_from_clean_use_case(self):
         ReviewSession.objects.create(
@@ -359,6 +367,166 @@ class ParticipationReviewViewTests(TestCase):
             fetch_redirect_response=False,
         )
 
+    def test_save_and_next_keeps_review_queue_between_saves(self):
+        event_id = str(self.event.pk)
+        form = {
+            'score': '4',
+            f'task_{self.variant_task.pk}': '2',
+            f'task_{self.variant_task.pk}_task_id': str(self.task.pk),
+            f'task_{self.variant_task.pk}_variant_task_id': str(
+                self.variant_task.pk,
+            ),
+            'save_and_next': '1',
+        }
+        self.addCleanup(review_queue_cache.invalidate, event_id)
+
+        self.client.post(
+            reverse('review:participation-review', args=[self.participation.pk]),
+            form,
+        )
+        queue = review_queue_cache.get(event_id)
+        response = self.client.post(
+            reverse(
+                'review:participation-review',
+                args=[self.next_participation.pk],
+            ),
+            form,
+        )
+
+        self.assertEqual(
+            [entry.participation_id for entry in queue.entries],
+            [str(self.participation.pk), str(self.next_participation.pk)],
+        )
+        self.assertTrue(queue.entries[0].graded)
+        self.assertRedirects(
+            response,
+            reverse('review:event-review', args=[self.event.pk]),
+            fetch_redirect_response=False,
+        )
+        self.assertTrue(
+            all(entry.graded for entry in review_queue_cache.get(event_id).entries),
+        )
+
+    def test_autosave_draft_is_restored_and_cleared_on_save(self):
+        url = reverse('review:participation-draft', args=[self.participation.pk])
+        score_key = str(self.variant_task.pk)
+
+        first = self.client.patch(
+            url,
+            {'task_scores': {score_key: {'points': 1}}},
+            content_type='application/json',
+        )
+        second = self.client.patch(
+            url,
+            {'task_scores': {score_key: {'comment': 'Нет единиц'}}},
+            content_type='application/json',
+        )
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.json()['status'], 'saved')
+        self.assertEqual(
+            ReviewDraft.objects.get(participation=self.participation).task_scores,
+            {score_key: {'points': 1, 'comment': 'Нет единиц'}},
+        )
+        self.assertFalse(Mark.objects.filter(score__isnull=False).exists())
+
+        response = self.client.get(
+            reverse('review:participation-review', args=[self.participation.pk])
+        )
+
+        self.assertEqual(response.context['tasks_with_scores'][0].points, 1)
+        self.assertEqual(
+            response.context['tasks_with_scores'][0].comment,
+            'Нет единиц',
+        )
+        self.assertContains(response, 'Восстановлен черновик')
+
+        self.client.post(
+            reverse('review:participation-review', args=[self.participation.pk]),
+            {
+                'score': '3',
+                f'task_{score_key}': '1',
+                f'task_{score_key}_task_id': str(self.task.pk),
+                f'task_{score_key}_variant_task_id': score_key,
+            },
+        )
+
+        self.assertFalse(ReviewDraft.objects.exists())
+
+    def test_autosave_draft_keeps_cleared_points_on_reload(self):
+        url = reverse('review:participation-draft', args=[self.participation.pk])
+        score_key = str(self.variant_task.pk)
+        self.client.patch(
+            url,
+            {'task_scores': {score_key: {'points': 1, 'comment': 'Нет единиц'}}},
+            content_type='application/json',
+        )
+
+        cleared = self.client.patch(
+            url,
+            {'task_scores': {score_key: {'points': ''}}},
+            content_type='application/json',
+        )
+
+        self.assertEqual(cleared.status_code, 200)
+        self.assertEqual(
+            ReviewDraft.objects.get(participation=self.participation).task_scores,
+            {score_key: {'points': None, 'comment': 'Нет единиц'}},
+        )
+        response = self.client.get(
+            reverse('review:participation-review', args=[self.participation.pk])
+        )
+        self.assertIsNone(response.context['tasks_with_scores'][0].points)
+        self.assertEqual(
+            response.context['tasks_with_scores'][0].comment,
+            'Нет единиц',
+        )
+        self.assertContains(response, f'name="task_{score_key}"')
+        self.assertNotContains(response, 'value="None"')
+
+    def test_autosave_draft_rejects_invalid_payload(self):
+        url = reverse('review:participation-draft', args=[self.participation.pk])
+
+        bad_json = self.client.patch(
+            url,
+            'not json',
+            content_type='application/json',
+        )
+        bad_encoding = self.client.patch(
+            url,
+            b'{"task_scores": "\xff"}',
+            content_type='application/json',
+        )
+        bad_points = self.client.patch(
+            url,
+            {'task_scores': {str(self.variant_task.pk): {'points': -2}}},
+            content_type='application/json',
+        )
+        wrong_method = self.client.post(url, {})
+
+        self.assertEqual(bad_json.status_code, 400)
+        self.assertEqual(bad_encoding.status_code, 400)
+        self.assertEqual(bad_points.status_code, 400)
+        self.assertIn('error', bad_points.json())
+        self.assertEqual(wrong_method.status_code, 405)
+        self.assertFalse(ReviewDraft.objects.exists())
+
+    def test_autosave_draft_returns_404_for_missing_participation(self):
+        url = reverse(
+            'review:participation-draft',
+            args=['00000000-0000-0000-0000-000000000000'],
+        )
+
+        response = self.client.patch(
+            url,
+            {'task_scores': {str(self.variant_task.pk): {'points': 1}}},
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 404)
+        self.assertIn('error', response.json())
+        self.assertFalse(ReviewDraft.objects.exists())
+
     def test_post_rejects_invalid_scan_through_clean_validation(self):
         response = self.client.post(
             reverse('review:participation-review', args=[self.participation.pk]),
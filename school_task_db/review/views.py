@@ -1,8 +1,10 @@
+import json
+
 from django.shortcuts import redirect
 from django.views.generic import TemplateView
 from django.contrib import messages
 from django.http import Http404, JsonResponse
-from django.views.decorators.http import require_POST
+from django.views.decorators.http import require_http_methods, require_POST
 
 from core_logic.use_cases.calculate_review_score import (
     CalculateReviewScoreRequest,
@@ -20,6 +22,7 @@ from core_logic.use_cases.grade_student_work import GradeStudentWorkRequest
 from core_logic.use_cases.prepare_participation_review_submission import (
     PrepareParticipationReviewSubmissionRequest,
 )
+from core_logic.use_cases.save_review_draft import SaveReviewDraftRequest
 from core_logic.use_cases.sync_review_session import (
     SyncReviewSessionRequest,
 )
@@ -180,12 +183,16 @@ class ParticipationReviewView(TemplateView):
 
         if 'save_and_next' in request.POST:
             navigation = container.get_review_save_navigation_use_case().execute(
-                GetReviewSaveNavigationRequest(participation_id=participation_id),
+                GetReviewSaveNavigationRequest(
+                    participation_id=participation_id,
+                    event_id=grade.event_id,
+                    graded=grade.score is not None,
+                ),
             )
-            if navigation.next_participation:
+            if navigation.next_participation_id:
                 return redirect(
                     'review:participation-review',
-                    pk=navigation.next_participation.pk,
+                    pk=navigation.next_participation_id,
                 )
             if navigation.all_checked:
                 messages.info(request, '✅ Все работы проверены!')
@@ -194,6 +201,24 @@ class ParticipationReviewView(TemplateView):
         return redirect('review:event-review', pk=grade.event_id)
 
 
+@require_http_methods(['PATCH'])
+def autosave_draft(request, pk):
+    """Автосохранение баллов и комментариев по заданиям в черновик"""
+    try:
+        body = json.loads(request.body)
+    except ValueError:
+        # JSONDecodeError and UnicodeDecodeError of a non-UTF-8 body.
+        return JsonResponse({'error': 'Невалидный JSON'}, status=400)
+
+    result = container.save_review_draft_use_case().execute(
+        SaveReviewDraftRequest(participation_id=str(pk), data=body),
+    )
+    if result.status == 'invalid':
+        return JsonResponse({'error': '; '.join(result.errors)}, status=400)
+    if result.status == 'not_found':
+        return JsonResponse({'error': '; '.join(result.errors)}, status=404)
+    return JsonResponse(container.review_form_adapter.draft_payload(result.draft))
+
 
 def ajax_calculate_score(request):
     """AJAX расчёт оценки по баллам"""
@@ -1,6 +1,8 @@
 import os
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -50,7 +52,17 @@ DOCUMENT_ENGINE_PDF_SETTINGS = {
     'ALLOW_NETWORK_REQUESTS': False,
 }
 
+# Профилирование запросов (страница /profiling/). Выключено по умолчанию;
+# для включения: REQUEST_PROFILING=1 в окружении.
+REQUEST_PROFILING = {
+    'ENABLED': os.environ.get('REQUEST_PROFILING', '') == '1',
+    'SAMPLE_RATE': float(os.environ.get('REQUEST_PROFILING_SAMPLE_RATE', '1')),
+    'BUFFER_SIZE': 200,
+    'SLOW_QUERY_LIMIT': 5,
+}
+
 MIDDLEWARE = [
+    'core.middleware.RequestProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -147,6 +159,9 @@ CRISPY_TEMPLATE_PACK = "bootstrap5"
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Проверенные при предпросмотре файлы импорта заданий (хранятся час)
+TASK_IMPORT_ARTIFACT_DIR = BASE_DIR / 'import_artifacts'
+
 
 # Максимальный размер загружаемых файлов (10MB)
 FILE_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024
@@ -162,14 +177,43 @@ DATA_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024
 #    }
 #}
 
-# Настройки кеша локально
+# Настройки кеша.
+# CACHE_BACKEND выбирает хранилище без внешних сервисов:
+#   "locmem"   — память процесса; у каждого воркера gunicorn свой кеш;
+#   "file"     — общий каталог CACHE_LOCATION, запись атомарна (tmp + rename);
+#   "database" — таблица в основной SQLite-базе, перед запуском нужен
+#                manage.py createcachetable.
+# Для "file" и "database" инвалидация через генерации доменов
+# (infrastructure/services/cache_generations.py) видна всем процессам.
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'locmem').strip().lower()
+_CACHE_BACKENDS = {
+    'locmem': (
+        'django.core.cache.backends.locmem.LocMemCache',
+        'unique-snowflake',
+    ),
+    'file': (
+        'django.core.cache.backends.filebased.FileBasedCache',
+        str(BASE_DIR / 'cache'),
+    ),
+    'database': (
+        'django.core.cache.backends.db.DatabaseCache',
+        'django_cache',
+    ),
+}
+if CACHE_BACKEND not in _CACHE_BACKENDS:
+    raise ImproperlyConfigured(
+        f'CACHE_BACKEND={CACHE_BACKEND!r}; '
+        f'ожидается одно из: {", ".join(_CACHE_BACKENDS)}'
+    )
+_cache_engine, _cache_location = _CACHE_BACKENDS[CACHE_BACKEND]
+
 CACHES = {
     'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'unique-snowflake',
+        'BACKEND': _cache_engine,
+        'LOCATION': os.environ.get('CACHE_LOCATION', _cache_location),
         'TIMEOUT': 300,
         'OPTIONS': {
-            'MAX_ENTRIES': 1000,
+            'MAX_ENTRIES': 1000 if CACHE_BACKEND == 'locmem' else 20000,
         }
     }
 }
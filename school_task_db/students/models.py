@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 from django.urls import reverse
 from core.models import BaseModel
 
@@ -13,6 +14,14 @@ class Student(BaseModel):
         verbose_name = 'Ученик'
         verbose_name_plural = 'Ученики'
         ordering = ['last_name', 'first_name']
+        indexes = [
+            # Roster imports look up candidates by name and by email.
+            models.Index(
+                fields=['last_name', 'first_name', 'middle_name'],
+                name='student_full_name',
+            ),
+            models.Index(Lower('email'), name='student_email_lower'),
+        ]
     
     def __str__(self):
         return f"[{self.get_short_uuid()}] {self.get_full_name()}"
@@ -7,3 +7,4 @@ class TasksConfig(AppConfig):
 
     def ready(self):
         from infrastructure.signals import task_cache  # noqa: F401
+        from infrastructure.signals import task_fingerprints  # noqa: F401
@@ -0,0 +1,23 @@
+"""Команда предварительной подготовки облегчённых копий изображений"""
+
+from django.core.management.base import BaseCommand
+
+from infrastructure.services.image_derivatives import (
+    build_task_image_derivatives,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Подготовка уменьшенных копий изображений заданий для печати '
+        'и HTML (иначе они создаются при первом рендеринге)'
+    )
+
+    def handle(self, *args, **options):
+        checked, derived = build_task_image_derivatives()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'✅ Проверено размеров: {checked}, '
+                f'используют уменьшенную копию: {derived}'
+            )
+        )
@@ -0,0 +1,76 @@
+"""Команда поиска почти дубликатов в банке заданий"""
+
+from django.core.management.base import BaseCommand
+
+from core_logic.value_objects.task_fingerprint import DUPLICATE_TASK_THRESHOLD
+from infrastructure.services.task_fingerprints import (
+    find_duplicate_task_groups,
+    rebuild_task_fingerprints,
+)
+from tasks.models import Task
+
+
+class Command(BaseCommand):
+    help = (
+        'Поиск заданий с почти совпадающим текстом по индексу '
+        'MinHash-отпечатков'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=DUPLICATE_TASK_THRESHOLD,
+            help='Минимальная оценка сходства текстов (0–1)',
+        )
+        parser.add_argument(
+            '--include-analogs',
+            action='store_true',
+            help='Показывать и задания из одной группы аналогов',
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=50,
+            help='Сколько групп дубликатов вывести',
+        )
+        parser.add_argument(
+            '--rebuild',
+            action='store_true',
+            help='Пересчитать отпечатки всех заданий перед поиском',
+        )
+
+    def handle(self, *args, **options):
+        if options['rebuild']:
+            written = rebuild_task_fingerprints()
+            self.stdout.write(f'🔄 Пересчитано отпечатков: {written}')
+
+        clusters = find_duplicate_task_groups(
+            threshold=options['threshold'],
+            include_analogs=options['include_analogs'],
+        )
+        shown = clusters[:options['limit']]
+        tasks = Task.objects.select_related('topic').only(
+            'pk',
+            'text',
+            'topic__name',
+        ).in_bulk({task_id for task_ids, _ in shown for task_id in task_ids})
+        for number, (task_ids, similarity) in enumerate(shown, start=1):
+            self.stdout.write(
+                f'\n♻️ Группа {number}: заданий {len(task_ids)}, '
+                f'сходство до {round(similarity * 100)}%'
+            )
+            for task_id in task_ids:
+                task = tasks[task_id]
+                text = ' '.join(task.text.split())
+                self.stdout.write(
+                    f'  [{task.get_short_uuid()}] {task.topic.name} — '
+                    f'{text[:80]}'
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'\n✅ Групп дубликатов: {len(clusters)}, '
+                f'заданий в них: {sum(len(ids) for ids, _ in clusters)}'
+            )
+        )
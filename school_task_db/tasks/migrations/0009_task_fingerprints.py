@@ -0,0 +1,47 @@
+# Generated by Django 5.2.3 on 2026-10-19 18:31
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+# Schema only: fingerprints depend on the live hashing code, so existing
+# tasks are fingerprinted with `manage.py find_duplicate_tasks --rebuild`.
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0008_require_task_image_asset'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskFingerprint',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Создано')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Обновлено')),
+                ('signature', models.BinaryField(verbose_name='Сигнатура MinHash')),
+                ('task', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='fingerprint', to='tasks.task', verbose_name='Задание')),
+            ],
+            options={
+                'verbose_name': 'Отпечаток задания',
+                'verbose_name_plural': 'Отпечатки заданий',
+            },
+        ),
+        migrations.CreateModel(
+            name='TaskFingerprintBucket',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Создано')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Обновлено')),
+                ('bucket', models.BigIntegerField(verbose_name='Корзина')),
+                ('task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='fingerprint_buckets', to='tasks.task', verbose_name='Задание')),
+            ],
+            options={
+                'verbose_name': 'Корзина отпечатка задания',
+                'verbose_name_plural': 'Корзины отпечатков заданий',
+                'indexes': [models.Index(fields=['bucket', 'task'], name='task_fingerprint_bucket')],
+            },
+        ),
+    ]
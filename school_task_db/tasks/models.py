@@ -235,3 +235,42 @@ class TaskImage(BaseModel):
     def __str__(self):
         position_display = self.get_position_display() if self.position else 'Позиция не задана'
         return f"Изображение для {self.task.topic.name} ({position_display})"
+
+
+class TaskFingerprint(BaseModel):
+    """MinHash-отпечаток текста задания для поиска почти дубликатов.
+
+    Строка поддерживается сигналом при сохранении задания; корзины LSH
+    лежат в TaskFingerprintBucket, поэтому похожие задания находятся по
+    индексу, а не попарным сравнением всего банка.
+    """
+    task = models.OneToOneField(
+        Task, on_delete=models.CASCADE,
+        related_name='fingerprint',
+        verbose_name='Задание',
+    )
+    signature = models.BinaryField('Сигнатура MinHash')
+
+    class Meta:
+        verbose_name = 'Отпечаток задания'
+        verbose_name_plural = 'Отпечатки заданий'
+
+
+class TaskFingerprintBucket(BaseModel):
+    """Корзина LSH: задания с общей корзиной — кандидаты в дубликаты."""
+    task = models.ForeignKey(
+        Task, on_delete=models.CASCADE,
+        related_name='fingerprint_buckets',
+        verbose_name='Задание',
+    )
+    bucket = models.BigIntegerField('Корзина')
+
+    class Meta:
+        verbose_name = 'Корзина отпечатка задания'
+        verbose_name_plural = 'Корзины отпечатков заданий'
+        indexes = [
+            models.Index(
+                fields=['bucket', 'task'],
+                name='task_fingerprint_bucket',
+            ),
+        ]
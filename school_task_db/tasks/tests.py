@@ -289,6 +289,33 @@ class TaskBulkGroupAjaxTests(TestCase):
         self.assertEqual(response.context['task_groups'][0].pk, str(self.group.pk))
         self.assertEqual(response.context['task_groups'][0].name, self.group.name)
 
+    def test_task_detail_lists_similar_tasks(self):
+        text = (
+            'Автомобиль за 2 часа проехал 150 км. '
+            'Найдите среднюю скорость автомобиля.'
+        )
+        self.first_task.text = text
+        self.first_task.save()
+        copy = Task.objects.create(
+            text=text.replace('150 км.', '150 км,'),
+            answer='75 км/ч',
+            topic=self.topic,
+            task_type='computational',
+            difficulty=2,
+        )
+
+        response = self.client.get(
+            reverse('tasks:detail', kwargs={'pk': self.first_task.pk}),
+        )
+
+        similar = response.context['similar_tasks']
+        self.assertEqual([task.pk for task in similar], [str(copy.pk)])
+        self.assertContains(response, 'Похожие задания')
+        self.assertContains(
+            response,
+            reverse('tasks:detail', kwargs={'pk': copy.pk}),
+        )
+
     def test_task_detail_returns_404_for_missing_task(self):
         response = self.client.get(
             reverse(
@@ -129,10 +129,12 @@ class WorkUpdateView(TemplateView):
     template_name = 'works/form.html'
 
     def _get_work(self):
-        detail = container.get_work_detail_use_case().execute(str(self.kwargs['pk']))
-        if detail.work is None:
+        form_data = container.get_work_form_data_use_case().execute(
+            str(self.kwargs['pk']),
+        )
+        if form_data.work is None:
             raise Http404('Работа не найдена')
-        return detail.work
+        return form_data.work
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)